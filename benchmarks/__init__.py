@@ -0,0 +1,3 @@
+"""
+Local benchmarks for the blueprint transfer and load paths. Run with `python -m benchmarks`.
+"""
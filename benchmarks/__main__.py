@@ -0,0 +1,74 @@
+import argparse
+import os
+import sys
+import tempfile
+from datetime import datetime
+
+from benchmarks import suites  # noqa: F401 registers the suites
+from benchmarks.harness import SUITES, Bench, compare, run_suites, save_results
+
+RESULTS_FOLDER = os.path.join(os.path.dirname(__file__), "results")
+
+
+def get_args():
+    parser = argparse.ArgumentParser(
+        description="Benchmarks blueprint transfer and load paths against local stand-ins"
+    )
+    parser.add_argument(
+        "--suites",
+        default=",".join(SUITES),
+        help=f"Comma separated suites to run. Available: {', '.join(SUITES)}",
+    )
+    parser.add_argument(
+        "--sizes",
+        default="10000,100000",
+        help="Comma separated row counts of the generated datasets",
+    )
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument(
+        "--output",
+        default=None,
+        help="Where to write the results. Defaults to benchmarks/results/<timestamp>.json",
+    )
+    parser.add_argument(
+        "--baseline",
+        default=None,
+        help="A previous results file. Exits with 1 if any benchmark regressed.",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="The fraction of rows/sec a benchmark may lose before it is a regression",
+    )
+    return parser.parse_args()
+
+
+def main():
+    args = get_args()
+    names = [name.strip() for name in args.suites.split(",") if name.strip()]
+    unknown = [name for name in names if name not in SUITES]
+    if unknown:
+        sys.exit(f"Unknown suites: {', '.join(unknown)}")
+    sizes = [int(size) for size in args.sizes.split(",")]
+
+    with tempfile.TemporaryDirectory(prefix="shipyard-bench-") as workdir:
+        bench = Bench(sizes, workdir, repeat=args.repeat)
+        skipped = run_suites(names, bench)
+
+    output = args.output or os.path.join(
+        RESULTS_FOLDER, f"{datetime.now():%Y%m%d-%H%M%S}.json"
+    )
+    save_results(output, bench.results, skipped)
+    print(f"Results written to {output}")
+
+    if args.baseline:
+        regressions = compare(bench.results, args.baseline, args.threshold)
+        for key, previous, current in regressions:
+            print(f"REGRESSION {key}: {previous:,.0f} -> {current:,.0f} rows/s")
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
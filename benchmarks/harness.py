@@ -0,0 +1,181 @@
+import csv
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from typing import Callable, Dict, List, Optional
+
+SUITES: Dict[str, Callable] = {}
+
+
+class SuiteSkipped(Exception):
+    """Raised by a suite when a stand-in or client package it needs is unavailable"""
+
+
+@dataclass
+class BenchmarkResult:
+    suite: str
+    name: str
+    rows: int
+    bytes: int
+    seconds: float
+    runs: List[float] = field(default_factory=list)
+
+    @property
+    def key(self) -> str:
+        return f"{self.suite}/{self.name}/{self.rows}"
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.seconds if self.seconds else 0.0
+
+    @property
+    def mb_per_second(self) -> float:
+        return self.bytes / (1024 * 1024) / self.seconds if self.seconds else 0.0
+
+    def to_dict(self) -> dict:
+        return {
+            **asdict(self),
+            "rows_per_second": round(self.rows_per_second, 1),
+            "mb_per_second": round(self.mb_per_second, 3),
+        }
+
+
+def suite(name: str):
+    """
+    Registers a benchmark suite. A suite is called with a `Bench` and yields nothing; it
+    records results with `bench.measure` and raises SuiteSkipped when it cannot run.
+    """
+
+    def register(func):
+        SUITES[name] = func
+        return func
+
+    return register
+
+
+class Bench:
+    """The state handed to each suite: the row counts to test, a scratch folder and the results"""
+
+    def __init__(self, sizes: List[int], workdir: str, repeat: int = 3) -> None:
+        self.sizes = sizes
+        self.workdir = workdir
+        self.repeat = repeat
+        self.results: List[BenchmarkResult] = []
+        self._datasets: Dict[int, str] = {}
+
+    def dataset(self, rows: int) -> str:
+        """Returns the path of a generated CSV with `rows` rows, creating it on first use"""
+        if rows not in self._datasets:
+            path = os.path.join(self.workdir, f"rows_{rows}.csv")
+            make_csv(path, rows)
+            self._datasets[rows] = path
+        return self._datasets[rows]
+
+    def measure(
+        self,
+        suite_name: str,
+        name: str,
+        func: Callable[[], None],
+        rows: int,
+        size: int,
+        setup: Optional[Callable[[], None]] = None,
+    ) -> BenchmarkResult:
+        """
+        Runs `func` `repeat` times, calling `setup` untimed before each run, and records the
+        median duration.
+        """
+        runs = []
+        for _ in range(self.repeat):
+            if setup:
+                setup()
+            started = time.perf_counter()
+            func()
+            runs.append(time.perf_counter() - started)
+        result = BenchmarkResult(
+            suite_name, name, rows, size, statistics.median(runs), runs
+        )
+        self.results.append(result)
+        print(
+            f"{result.key:<50} {result.rows_per_second:>14,.0f} rows/s "
+            f"{result.mb_per_second:>9.2f} MB/s"
+        )
+        return result
+
+
+def make_csv(path: str, rows: int) -> None:
+    """Writes a deterministic CSV of mixed column types, about 60 bytes per row"""
+    with open(path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["id", "name", "amount", "is_active", "created_at"])
+        for i in range(rows):
+            writer.writerow(
+                [
+                    i,
+                    f"customer_{i % 9973}",
+                    f"{(i * 37) % 100000 / 100:.2f}",
+                    i % 3 == 0,
+                    f"2024-{i % 12 + 1:02d}-{i % 28 + 1:02d} 12:{i % 60:02d}:00",
+                ]
+            )
+
+
+def run_suites(names: List[str], bench: Bench) -> Dict[str, str]:
+    """Runs each suite and returns the reason every skipped suite could not run"""
+    skipped = {}
+    for name in names:
+        print(f"== {name}")
+        try:
+            SUITES[name](bench)
+        except SuiteSkipped as reason:
+            print(f"   skipped: {reason}")
+            skipped[name] = str(reason)
+    return skipped
+
+
+def save_results(
+    path: str, results: List[BenchmarkResult], skipped: Dict[str, str]
+) -> None:
+    document = {
+        "created": datetime.now(timezone.utc).isoformat(),
+        "commit": _git_commit(),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "results": [result.to_dict() for result in results],
+        "skipped": skipped,
+    }
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, "w") as f:
+        json.dump(document, f, indent=2)
+
+
+def compare(current: List[BenchmarkResult], baseline_path: str, threshold: float):
+    """
+    Compares rows/sec against a previous results file and returns the (key, baseline, current)
+    of every benchmark that got slower by more than `threshold`.
+    """
+    with open(baseline_path) as f:
+        baseline = {
+            f"{r['suite']}/{r['name']}/{r['rows']}": r["rows_per_second"]
+            for r in json.load(f)["results"]
+        }
+    regressions = []
+    for result in current:
+        previous = baseline.get(result.key)
+        if previous and result.rows_per_second < previous * (1 - threshold):
+            regressions.append((result.key, previous, result.rows_per_second))
+    return regressions
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
@@ -0,0 +1,333 @@
+"""
+Local stand-ins for the services the blueprints talk to. Each one is a context manager that
+starts the service, yields its connection details and tears it down afterwards.
+
+In-process stand-ins need only Python packages (moto for S3, pyftpdlib for FTP). The
+database, SFTP and GCS stand-ins run in Docker. Set the matching BENCH_*_URL variable to use
+an already running service instead.
+"""
+
+import json
+import logging
+import os
+import shutil
+import socket
+import subprocess
+import threading
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, Iterator, Optional
+from urllib.parse import parse_qs, urlsplit
+
+from benchmarks.harness import SuiteSkipped
+
+READY_TIMEOUT = 90
+CHUNK_SIZE = 64 * 1024
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+@contextmanager
+def environment(**variables: str) -> Iterator[None]:
+    """Sets environment variables for the duration of the block"""
+    previous = {name: os.environ.get(name) for name in variables}
+    os.environ.update(variables)
+    try:
+        yield
+    finally:
+        for name, value in previous.items():
+            if value is None:
+                os.environ.pop(name, None)
+            else:
+                os.environ[name] = value
+
+
+class _StubApiHandler(BaseHTTPRequestHandler):
+    """
+    GET /rows?page=1&page_size=500&pages=10  a page of JSON records and the next page number
+    GET /files/<bytes>                        a binary body of that size
+    POST or PUT /upload                       reads and discards the body
+    """
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        if url.path == "/rows":
+            query = {key: int(value[0]) for key, value in parse_qs(url.query).items()}
+            page, page_size = query.get("page", 1), query.get("page_size", 500)
+            start = (page - 1) * page_size
+            body = json.dumps(
+                {
+                    "data": [
+                        {"id": i, "name": f"record_{i}", "amount": i * 1.5}
+                        for i in range(start, start + page_size)
+                    ],
+                    "next_page": page + 1 if page < query.get("pages", 1) else None,
+                }
+            ).encode()
+            self._respond(body, "application/json")
+        elif url.path.startswith("/files/"):
+            size = int(url.path.rsplit("/", 1)[1])
+            self.send_response(200)
+            self.send_header("Content-Type", "application/octet-stream")
+            self.send_header("Content-Length", str(size))
+            self.end_headers()
+            chunk = b"x" * CHUNK_SIZE
+            while size > 0:
+                self.wfile.write(chunk[: min(size, CHUNK_SIZE)])
+                size -= CHUNK_SIZE
+        else:
+            self.send_error(404)
+
+    def do_POST(self):
+        remaining = int(self.headers.get("Content-Length", 0))
+        while remaining > 0:
+            remaining -= len(self.rfile.read(min(remaining, CHUNK_SIZE)))
+        self._respond(b'{"status": "ok"}', "application/json")
+
+    do_PUT = do_POST
+
+    def _respond(self, body: bytes, content_type: str) -> None:
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@contextmanager
+def stub_http_api() -> Iterator[str]:
+    """An in-process HTTP API. Yields its base url."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StubApiHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_port}"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+@contextmanager
+def s3() -> Iterator[str]:
+    """
+    An S3 endpoint, from BENCH_S3_URL or an in-process moto server. boto3 clients created
+    inside the block use it through AWS_ENDPOINT_URL. Yields the endpoint url.
+    """
+    credentials = {
+        "AWS_ACCESS_KEY_ID": "bench",
+        "AWS_SECRET_ACCESS_KEY": "bench",
+        "AWS_DEFAULT_REGION": "us-east-1",
+    }
+    if os.getenv("BENCH_S3_URL"):
+        with environment(AWS_ENDPOINT_URL=os.environ["BENCH_S3_URL"], **credentials):
+            yield os.environ["BENCH_S3_URL"]
+        return
+
+    try:
+        from moto.server import ThreadedMotoServer
+    except ImportError:
+        raise SuiteSkipped("install moto[server] or set BENCH_S3_URL")
+    logging.getLogger("werkzeug").setLevel(logging.ERROR)
+    port = free_port()
+    server = ThreadedMotoServer(ip_address="127.0.0.1", port=port, verbose=False)
+    server.start()
+    endpoint = f"http://127.0.0.1:{port}"
+    try:
+        with environment(AWS_ENDPOINT_URL=endpoint, **credentials):
+            yield endpoint
+    finally:
+        server.stop()
+
+
+@contextmanager
+def ftp_server(root: str) -> Iterator[Dict]:
+    """An in-process FTP server serving `root`. Yields host, port, user and pwd."""
+    try:
+        from pyftpdlib.authorizers import DummyAuthorizer
+        from pyftpdlib.handlers import FTPHandler
+        from pyftpdlib.log import config_logging
+        from pyftpdlib.servers import ThreadedFTPServer
+    except ImportError:
+        raise SuiteSkipped("install pyftpdlib")
+
+    config_logging(level=logging.WARNING)
+    os.makedirs(root, exist_ok=True)
+    authorizer = DummyAuthorizer()
+    authorizer.add_user("bench", "bench", root, perm="elradfmwMT")
+    handler = type("BenchFTPHandler", (FTPHandler,), {"authorizer": authorizer})
+    server = ThreadedFTPServer(("127.0.0.1", 0), handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield {
+            "host": "127.0.0.1",
+            "port": server.address[1],
+            "user": "bench",
+            "pwd": "bench",
+        }
+    finally:
+        server.close_all()
+
+
+@contextmanager
+def docker_service(
+    image: str,
+    container_port: int,
+    env: Optional[Dict[str, str]] = None,
+    command: Optional[list] = None,
+    ready: Optional[Callable[[str, int], bool]] = None,
+) -> Iterator[int]:
+    """
+    Runs `image` with `container_port` published on a free local port, waits until `ready`
+    (or a TCP connect) succeeds and yields that port. The container is removed afterwards.
+    """
+    if not shutil.which("docker"):
+        raise SuiteSkipped(f"docker is needed to run {image}")
+    port = free_port()
+    arguments = [
+        "docker",
+        "run",
+        "-d",
+        "--rm",
+        "-p",
+        f"127.0.0.1:{port}:{container_port}",
+    ]
+    for name, value in (env or {}).items():
+        arguments += ["-e", f"{name}={value}"]
+    started = subprocess.run(
+        arguments + [image] + (command or []), capture_output=True, text=True
+    )
+    if started.returncode != 0:
+        raise SuiteSkipped(f"could not start {image}: {started.stderr.strip()}")
+    container_id = started.stdout.strip()
+    try:
+        _wait_until(lambda: (ready or _accepts_connections)("127.0.0.1", port), image)
+        yield port
+    finally:
+        subprocess.run(["docker", "rm", "-f", container_id], capture_output=True)
+
+
+@contextmanager
+def postgres() -> Iterator[Dict]:
+    """A PostgreSQL database. Yields the PostgresClient connection arguments."""
+    if os.getenv("BENCH_POSTGRES_URL"):
+        yield _connection_from_url(os.environ["BENCH_POSTGRES_URL"], 5432)
+        return
+    with docker_service(
+        "postgres:16",
+        5432,
+        env={"POSTGRES_USER": "bench", "POSTGRES_PASSWORD": "bench"},
+        ready=lambda host, port: _sql_ready(
+            f"postgresql://bench:bench@{host}:{port}/bench"
+        ),
+    ) as port:
+        yield {
+            "host": "127.0.0.1",
+            "port": port,
+            "user": "bench",
+            "pwd": "bench",
+            "database": "bench",
+        }
+
+
+@contextmanager
+def mysql() -> Iterator[Dict]:
+    """A MySQL database with LOAD DATA LOCAL enabled. Yields the connection arguments."""
+    if os.getenv("BENCH_MYSQL_URL"):
+        yield _connection_from_url(os.environ["BENCH_MYSQL_URL"], 3306)
+        return
+    with docker_service(
+        "mysql:8",
+        3306,
+        env={"MYSQL_ROOT_PASSWORD": "bench", "MYSQL_DATABASE": "bench"},
+        command=["--local-infile=1"],
+        ready=lambda host, port: _sql_ready(
+            f"mysql+mysqlconnector://root:bench@{host}:{port}/bench"
+        ),
+    ) as port:
+        yield {
+            "host": "127.0.0.1",
+            "port": port,
+            "user": "root",
+            "pwd": "bench",
+            "database": "bench",
+        }
+
+
+@contextmanager
+def sftp_server() -> Iterator[Dict]:
+    """An SFTP server with a writable `upload` folder. Yields host, port, user and pwd."""
+    if os.getenv("BENCH_SFTP_URL"):
+        yield _connection_from_url(os.environ["BENCH_SFTP_URL"], 22)
+        return
+    with docker_service("atmoz/sftp", 22, command=["bench:bench:::upload"]) as port:
+        yield {"host": "127.0.0.1", "port": port, "user": "bench", "pwd": "bench"}
+
+
+@contextmanager
+def gcs() -> Iterator[str]:
+    """
+    A fake GCS server. google-cloud-storage clients created inside the block use it through
+    STORAGE_EMULATOR_HOST. Yields the endpoint url.
+    """
+    if os.getenv("BENCH_GCS_URL"):
+        with environment(STORAGE_EMULATOR_HOST=os.environ["BENCH_GCS_URL"]):
+            yield os.environ["BENCH_GCS_URL"]
+        return
+    with docker_service(
+        "fsouza/fake-gcs-server", 4443, command=["-scheme", "http", "-port", "4443"]
+    ) as port:
+        endpoint = f"http://127.0.0.1:{port}"
+        with environment(STORAGE_EMULATOR_HOST=endpoint):
+            yield endpoint
+
+
+def _connection_from_url(url: str, default_port: int) -> Dict:
+    parts = urlsplit(url)
+    return {
+        "host": parts.hostname,
+        "port": parts.port or default_port,
+        "user": parts.username,
+        "pwd": parts.password,
+        "database": parts.path.lstrip("/") or None,
+    }
+
+
+def _accepts_connections(host: str, port: int) -> bool:
+    try:
+        with socket.create_connection((host, port), timeout=1):
+            return True
+    except OSError:
+        return False
+
+
+def _sql_ready(url: str) -> bool:
+    from sqlalchemy import create_engine, text
+
+    engine = create_engine(url)
+    try:
+        with engine.connect() as connection:
+            connection.execute(text("SELECT 1"))
+        return True
+    except Exception:
+        return False
+    finally:
+        engine.dispose()
+
+
+def _wait_until(check: Callable[[], bool], description: str) -> None:
+    deadline = time.monotonic() + READY_TIMEOUT
+    while not check():
+        if time.monotonic() > deadline:
+            raise SuiteSkipped(f"{description} was not ready after {READY_TIMEOUT}s")
+        time.sleep(1)
@@ -0,0 +1,279 @@
+"""
+Benchmark suites for the transfer and load paths of the blueprints. Each suite runs the
+blueprint client against a local stand-in for every row count, so throughput can be compared
+between commits without credentials.
+"""
+
+import os
+import uuid
+
+from benchmarks import standins
+from benchmarks.harness import Bench, SuiteSkipped, suite
+
+# The stub API returns this many records per page
+PAGE_SIZE = 500
+
+
+def _require(module_name: str):
+    try:
+        return __import__(module_name, fromlist=["_"])
+    except ImportError:
+        raise SuiteSkipped(f"{module_name} is not installed")
+
+
+def _scratch(bench: Bench, name: str) -> str:
+    path = os.path.join(bench.workdir, name)
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+@suite("files")
+def files_suite(bench: Bench):
+    files = _require("shipyard_bp_utils.files")
+    artifacts = _require("shipyard_bp_utils.artifacts")
+    scratch = _scratch(bench, "files")
+
+    for rows in bench.sizes:
+        names = [f"folder_{i % 100}/export_{i}.csv" for i in range(rows)]
+        bench.measure(
+            "files",
+            "find_all_file_matches",
+            lambda: files.find_all_file_matches(names, r"export_\d*7\.csv$"),
+            rows,
+            sum(map(len, names)),
+        )
+
+        dataset = bench.dataset(rows)
+        archive = os.path.join(scratch, "archive")
+        bench.measure(
+            "files",
+            "compress_zip",
+            lambda: files.compress_files([dataset], archive, "zip"),
+            rows,
+            os.path.getsize(dataset),
+        )
+
+        folder = artifacts.Artifact.SubFolder(_scratch(bench, f"artifacts_{rows}"))
+        records = [{"id": i, "status": "success", "rows": i * 10} for i in range(rows)]
+        bench.measure(
+            "files",
+            "artifact_write_json",
+            lambda: folder.write_json("responses", records),
+            rows,
+            len(artifacts.get_serializer("json").dumps(records)),
+        )
+
+
+@suite("http")
+def http_suite(bench: Bench):
+    http_client = _require("shipyard_templates.http_client")
+    scratch = _scratch(bench, "http")
+
+    with standins.stub_http_api() as base_url, http_client.HttpClient() as client:
+
+        def download(size):
+            response = client.get(f"{base_url}/files/{size}", stream=True)
+            with open(os.path.join(scratch, "download.bin"), "wb") as f:
+                for chunk in response.iter_content(chunk_size=1024 * 1024):
+                    f.write(chunk)
+
+        def paginate(pages):
+            page = 1
+            while page:
+                page = client.get(
+                    f"{base_url}/rows",
+                    params={"page": page, "page_size": PAGE_SIZE, "pages": pages},
+                ).json()["next_page"]
+
+        def upload(path):
+            with open(path, "rb") as f:
+                client.post(f"{base_url}/upload", data=f)
+
+        for rows in bench.sizes:
+            dataset = bench.dataset(rows)
+            size = os.path.getsize(dataset)
+            bench.measure("http", "download", lambda: download(size), rows, size)
+            bench.measure("http", "upload", lambda: upload(dataset), rows, size)
+            pages = max(rows // PAGE_SIZE, 1)
+            bench.measure(
+                "http",
+                "paginated_get",
+                lambda: paginate(pages),
+                pages * PAGE_SIZE,
+                pages * PAGE_SIZE * 50,
+            )
+
+
+@suite("s3")
+def s3_suite(bench: Bench):
+    shipyard_s3 = _require("shipyard_s3")
+    scratch = _scratch(bench, "s3")
+
+    with standins.s3():
+        client = shipyard_s3.S3Client("bench", "bench", region="us-east-1")
+        bucket = f"bench-{uuid.uuid4().hex[:8]}"
+        client.s3_conn.create_bucket(Bucket=bucket)
+        for rows in bench.sizes:
+            dataset = bench.dataset(rows)
+            size = os.path.getsize(dataset)
+            key = f"bench/rows_{rows}.csv"
+            bench.measure(
+                "s3", "upload", lambda: client.upload(bucket, dataset, key), rows, size
+            )
+            destination = os.path.join(scratch, f"rows_{rows}.csv")
+            bench.measure(
+                "s3",
+                "download",
+                lambda: client.download(bucket, key, destination),
+                rows,
+                size,
+            )
+
+
+@suite("gcs")
+def gcs_suite(bench: Bench):
+    _require("shipyard_googlecloud")
+    storage = _require("google.cloud.storage")
+    transfers = _require("shipyard_googlecloud.transfers")
+    gcs_utils = _require("shipyard_googlecloud.utils")
+    credentials = _require("google.auth.credentials")
+    scratch = _scratch(bench, "gcs")
+
+    with standins.gcs():
+        client = storage.Client(
+            project="bench", credentials=credentials.AnonymousCredentials()
+        )
+        bucket = client.create_bucket(f"bench-{uuid.uuid4().hex[:8]}")
+        for rows in bench.sizes:
+            dataset = bench.dataset(rows)
+            size = os.path.getsize(dataset)
+            name = f"bench/rows_{rows}.csv"
+            bench.measure(
+                "gcs",
+                "upload",
+                lambda: gcs_utils.upload_file(bucket, dataset, name),
+                rows,
+                size,
+            )
+            blob = bucket.get_blob(name)
+            destination = os.path.join(scratch, f"rows_{rows}.csv")
+            bench.measure(
+                "gcs",
+                "download",
+                lambda: transfers.download_blob(blob, destination),
+                rows,
+                size,
+            )
+
+
+@suite("ftp")
+def ftp_suite(bench: Bench):
+    shipyard_ftp = _require("shipyard_ftp")
+    scratch = _scratch(bench, "ftp")
+
+    with standins.ftp_server(_scratch(bench, "ftp_root")) as server:
+        client = shipyard_ftp.FtpClient(
+            server["host"], server["user"], server["pwd"], port=server["port"]
+        )
+        for rows in bench.sizes:
+            dataset = bench.dataset(rows)
+            size = os.path.getsize(dataset)
+            remote = f"rows_{rows}.csv"
+            bench.measure(
+                "ftp", "upload", lambda: client.upload(dataset, remote), rows, size
+            )
+            destination = os.path.join(scratch, remote)
+            bench.measure(
+                "ftp",
+                "download",
+                lambda: client.download(remote, destination),
+                rows,
+                size,
+            )
+
+
+@suite("sftp")
+def sftp_suite(bench: Bench):
+    shipyard_sftp = _require("shipyard_sftp")
+    scratch = _scratch(bench, "sftp")
+
+    with standins.sftp_server() as server:
+        client = shipyard_sftp.SftpClient(
+            server["host"], server["port"], user=server["user"], pwd=server["pwd"]
+        )
+        try:
+            for rows in bench.sizes:
+                dataset = bench.dataset(rows)
+                size = os.path.getsize(dataset)
+                remote = f"upload/rows_{rows}.csv"
+                bench.measure(
+                    "sftp", "upload", lambda: client.upload(dataset, remote), rows, size
+                )
+                destination = os.path.join(scratch, f"rows_{rows}.csv")
+                bench.measure(
+                    "sftp",
+                    "download",
+                    lambda: client.download(remote, destination),
+                    rows,
+                    size,
+                )
+        finally:
+            client.close()
+
+
+def _database_suite(bench: Bench, name: str, service, make_client):
+    sqlalchemy = _require("sqlalchemy")
+    scratch = _scratch(bench, name)
+
+    with service() as connection:
+        client = make_client(connection)
+        try:
+            for rows in bench.sizes:
+                dataset = bench.dataset(rows)
+                size = os.path.getsize(dataset)
+                table = f"bench_rows_{rows}"
+                bench.measure(
+                    name,
+                    "upload",
+                    lambda: client.upload(dataset, table, insert_method="replace"),
+                    rows,
+                    size,
+                )
+                destination = os.path.join(scratch, f"{table}.csv")
+                bench.measure(
+                    name,
+                    "fetch_to_file",
+                    lambda: client.read_chunks(
+                        sqlalchemy.text(f"SELECT * FROM {table}"), destination
+                    ),
+                    rows,
+                    size,
+                )
+        finally:
+            client.close()
+
+
+@suite("postgres")
+def postgres_suite(bench: Bench):
+    shipyard_postgresql = _require("shipyard_postgresql")
+    _database_suite(
+        bench,
+        "postgres",
+        standins.postgres,
+        lambda c: shipyard_postgresql.PostgresClient(
+            c["user"], c["pwd"], c["host"], c["database"], port=c["port"]
+        ),
+    )
+
+
+@suite("mysql")
+def mysql_suite(bench: Bench):
+    shipyard_mysql = _require("shipyard_mysql")
+    _database_suite(
+        bench,
+        "mysql",
+        standins.mysql,
+        lambda c: shipyard_mysql.MySqlClient(
+            c["user"], c["pwd"], c["host"], c["database"], port=c["port"]
+        ),
+    )
@@ -1,11 +1,14 @@
 from .cloudstorage import CloudStorage
 from .database import Database, GoogleDatabase, DatabricksDatabase
 from .datavisualization import DataVisualization
-from .etl import Etl
+from .etl import Etl, JobWaiter, JobTimeoutError
+from .http_client import HttpClient
 from .messaging import Messaging
+from .metrics import Metrics
 from .notebooks import Notebooks
-from .shipyard_logger import ShipyardLogger
+from .shipyard_logger import ShipyardLogger, JsonFormatter, truncate
 from .spreadsheets import Spreadsheets
+from .token_cache import IdCache, acquire_msal_token
 from .projectmanagement import ProjectManagement, ExitCodeError
 from .exit_code_exception import ExitCodeException, standardize_errors
 from .crm import Crm
@@ -1,5 +1,14 @@
+import random
+import time
 from abc import ABC, abstractmethod
+from typing import Any, Callable, Dict, Hashable, Optional
+
 from .exit_code_exception import ExitCodeException
+from .metrics import Metrics
+from .shipyard_logger import ShipyardLogger
+
+logger = ShipyardLogger.get_logger()
+metrics = Metrics.get_metrics()
 
 
 class UnauthorizedError(ExitCodeException):
@@ -38,6 +47,136 @@ class UnknownError(ExitCodeException):
         self.exit_code = Etl.EXIT_CODE_UNKNOWN_ERROR
 
 
+class JobTimeoutError(ExitCodeException):
+    def __init__(self, message: str):
+        super().__init__(message, Etl.EXIT_CODE_FINAL_STATUS_INCOMPLETE)
+
+
+class JobWaiter:
+    """
+    Polls a job until it finishes.
+
+    The first poll waits `initial_interval` seconds and every following wait grows by
+    `backoff` up to `max_interval`, so short jobs are noticed within seconds while long ones
+    are polled rarely. When `eta` returns the server's estimate of the seconds remaining,
+    the next poll is scheduled for then, within the same bounds. The total wait is capped
+    by `timeout`, after which JobTimeoutError is raised. Polls and seconds spent waiting
+    are recorded in `Metrics`.
+    """
+
+    DEFAULT_INITIAL_INTERVAL = 5
+    DEFAULT_MAX_INTERVAL = 60
+    DEFAULT_BACKOFF = 1.5
+    JITTER = 0.1
+
+    def __init__(
+        self,
+        initial_interval: float = DEFAULT_INITIAL_INTERVAL,
+        max_interval: float = DEFAULT_MAX_INTERVAL,
+        backoff: float = DEFAULT_BACKOFF,
+        timeout: Optional[float] = None,
+    ) -> None:
+        self.initial_interval = min(initial_interval, max_interval)
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self.timeout = timeout
+
+    def wait(
+        self,
+        check: Callable[[], Any],
+        is_done: Callable[[Any], bool],
+        eta: Optional[Callable[[Any], Optional[float]]] = None,
+        description: str = "job",
+    ) -> Any:
+        """
+        Calls `check` until `is_done` accepts its result and returns that result. Errors
+        raised by either callable stop the wait.
+        """
+        deadline = self._deadline()
+        interval = self.initial_interval
+        while True:
+            result = check()
+            metrics.increment("job_polls_total")
+            if is_done(result):
+                return result
+            time.sleep(self._next_delay(interval, result, eta, deadline, description))
+            interval = min(interval * self.backoff, self.max_interval)
+
+    async def wait_async(
+        self,
+        check: Callable[[], Any],
+        is_done: Callable[[Any], bool],
+        eta: Optional[Callable[[Any], Optional[float]]] = None,
+        description: str = "job",
+    ) -> Any:
+        """
+        The asyncio version of `wait`. The blocking `check` runs in a worker thread so many
+        jobs can be awaited at once.
+        """
+        import asyncio
+
+        deadline = self._deadline()
+        interval = self.initial_interval
+        while True:
+            result = await asyncio.to_thread(check)
+            metrics.increment("job_polls_total")
+            if is_done(result):
+                return result
+            await asyncio.sleep(
+                self._next_delay(interval, result, eta, deadline, description)
+            )
+            interval = min(interval * self.backoff, self.max_interval)
+
+    def wait_many(
+        self,
+        checks: Dict[Hashable, Callable[[], Any]],
+        is_done: Callable[[Any], bool],
+        eta: Optional[Callable[[Any], Optional[float]]] = None,
+    ) -> Dict[Hashable, Any]:
+        """
+        Waits for several jobs concurrently and returns the final result of each, keyed like
+        `checks`. The first error raised by any job stops the wait.
+        """
+        import asyncio
+
+        async def wait_all():
+            results = await asyncio.gather(
+                *(
+                    self.wait_async(check, is_done, eta, description=str(key))
+                    for key, check in checks.items()
+                )
+            )
+            return dict(zip(checks, results))
+
+        return asyncio.run(wait_all())
+
+    def _deadline(self) -> Optional[float]:
+        return None if self.timeout is None else time.monotonic() + self.timeout
+
+    def _next_delay(
+        self,
+        interval: float,
+        result: Any,
+        eta: Optional[Callable[[Any], Optional[float]]],
+        deadline: Optional[float],
+        description: str,
+    ) -> float:
+        hint = eta(result) if eta else None
+        if hint is not None:
+            interval = min(max(hint, self.initial_interval), self.max_interval)
+        delay = interval * random.uniform(1 - self.JITTER, 1 + self.JITTER)
+        if deadline is not None:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise JobTimeoutError(
+                    f"Timed out after {self.timeout} seconds waiting for {description} to finish"
+                )
+            delay = min(delay, remaining)
+        logger.info(f"{description} is still running. Checking again in {delay:.0f}s")
+        metrics.increment("job_wait_seconds_total", delay)
+        return delay
+
+
 class Etl(ABC):
     # Class level exit codes
     # general exit codes
@@ -70,6 +209,32 @@ class Etl(ABC):
     def trigger_sync(self, **kwargs):
         pass
 
+    def wait_for_job(
+        self,
+        check: Callable[[], Any],
+        is_done: Callable[[Any], bool],
+        eta: Optional[Callable[[Any], Optional[float]]] = None,
+        description: str = "job",
+        **waiter_options,
+    ) -> Any:
+        """
+        Polls `check` with adaptive backoff until `is_done` accepts its result. See JobWaiter
+        for the available `waiter_options`.
+        """
+        return JobWaiter(**waiter_options).wait(check, is_done, eta, description)
+
+    def wait_for_jobs(
+        self,
+        checks: Dict[Hashable, Callable[[], Any]],
+        is_done: Callable[[Any], bool],
+        eta: Optional[Callable[[Any], Optional[float]]] = None,
+        **waiter_options,
+    ) -> Dict[Hashable, Any]:
+        """
+        Waits for several jobs concurrently with asyncio and returns the final result of each.
+        """
+        return JobWaiter(**waiter_options).wait_many(checks, is_done, eta)
+
     @abstractmethod
     def determine_sync_status(self, **kwargs):
         pass
@@ -0,0 +1,313 @@
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Callable, Dict, Iterable, List, Optional
+from urllib.parse import urljoin, urlsplit
+
+from .metrics import Metrics
+from .shipyard_logger import ShipyardLogger
+
+logger = ShipyardLogger.get_logger()
+metrics = Metrics.get_metrics()
+
+DEFAULT_TIMEOUT = 30
+DEFAULT_MAX_RETRIES = 3
+DEFAULT_BACKOFF_FACTOR = 0.5
+DEFAULT_MAX_BACKOFF = 60
+DEFAULT_POOL_SIZE = 10
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+# A request that failed with one of these methods can be sent again without side effects
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+
+class TokenBucket:
+    """
+    Allows `rate` requests per second on average, with bursts of up to `capacity`.
+    `acquire` blocks until a token is available.
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None) -> None:
+        self.rate = rate
+        self.capacity = capacity or max(rate, 1)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self.tokens = min(
+                    self.capacity, self.tokens + (now - self.updated) * self.rate
+                )
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+
+class HttpClient:
+    """
+    A pooled HTTP client for API blueprints, built on a `requests.Session`.
+
+    Connections are kept alive and reused across calls. Requests that fail with a connection
+    error or one of `retry_statuses` are retried with jittered exponential backoff, waiting
+    for the `Retry-After` header instead when the server sends one. A 429 is retried for any
+    method; other failures are only retried for `retry_methods`, so a POST that may have been
+    processed is not sent twice. With `rate_limit`, requests to each host are throttled to that
+    many per second. Every hook in `hooks` is called after each attempt with the method, url,
+    response (None on a connection error) and elapsed seconds. Requests, retries, time spent
+    backing off or throttled and response bytes are recorded per host in `Metrics`.
+    """
+
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        headers: Optional[Dict[str, str]] = None,
+        auth=None,
+        timeout: Optional[float] = DEFAULT_TIMEOUT,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        backoff_factor: float = DEFAULT_BACKOFF_FACTOR,
+        max_backoff: float = DEFAULT_MAX_BACKOFF,
+        retry_statuses: Iterable[int] = RETRY_STATUSES,
+        retry_methods: Iterable[str] = IDEMPOTENT_METHODS,
+        rate_limit: Optional[float] = None,
+        burst: Optional[float] = None,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        hooks: Optional[List[Callable]] = None,
+    ) -> None:
+        self.base_url = base_url
+        self.headers = {"Accept-Encoding": "gzip, deflate", **(headers or {})}
+        self.auth = auth
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.retry_statuses = frozenset(retry_statuses)
+        self.retry_methods = frozenset(method.upper() for method in retry_methods)
+        self.rate_limit = rate_limit
+        self.burst = burst
+        self.pool_size = pool_size
+        self.hooks = list(hooks or [])
+        self._session = None
+        self._buckets = {}
+        self._validated = {}
+        self._lock = threading.Lock()
+
+    @property
+    def session(self):
+        if self._session is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+
+            session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=self.pool_size, pool_maxsize=self.pool_size
+            )
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            session.headers.update(self.headers)
+            session.auth = self.auth
+            self._session = session
+        return self._session
+
+    def request(self, method: str, url: str, **kwargs):
+        """
+        Sends a request, retrying it as configured, and returns the final `requests.Response`.
+        Unsuccessful responses are returned rather than raised so callers keep their own
+        status code handling. A connection error is raised once the retries are exhausted.
+        """
+        import requests
+
+        method = method.upper()
+        if self.base_url:
+            url = urljoin(self.base_url, url)
+        kwargs.setdefault("timeout", self.timeout)
+        streams = _body_streams(kwargs)
+        positions = [_stream_position(stream) for stream in streams]
+        retries = self.max_retries
+        if None in positions:
+            # A streamed body that cannot be rewound can only be sent once
+            retries = 0
+        attempt = 0
+        while True:
+            if attempt:
+                for stream, position in zip(streams, positions):
+                    stream.seek(position)
+            self._throttle(url)
+            started = time.monotonic()
+            try:
+                response = self.session.request(method, url, **kwargs)
+            except (requests.ConnectionError, requests.Timeout) as error:
+                elapsed = time.monotonic() - started
+                self._record(method, url, None, elapsed)
+                self._run_hooks(method, url, None, elapsed)
+                if attempt >= retries or method not in self.retry_methods:
+                    raise
+                delay = self._backoff(attempt)
+                logger.debug(
+                    f"{method} {url} failed with {error}. Retrying in {delay:.1f}s"
+                )
+            else:
+                elapsed = time.monotonic() - started
+                self._record(method, url, response, elapsed)
+                self._run_hooks(method, url, response, elapsed)
+                if attempt >= retries or not self._should_retry(method, response):
+                    return response
+                delay = self._retry_after(response)
+                if delay is None:
+                    delay = self._backoff(attempt)
+                logger.debug(
+                    f"{method} {url} returned {response.status_code}. Retrying in {delay:.1f}s"
+                )
+                response.close()
+            host = urlsplit(url).netloc
+            metrics.increment("http_retries_total", host=host)
+            metrics.increment("http_backoff_seconds_total", delay, host=host)
+            time.sleep(delay)
+            attempt += 1
+
+    def get(self, url: str, **kwargs):
+        return self.request("GET", url, **kwargs)
+
+    def poll(self, url: str, **kwargs):
+        """
+        A conditional GET for status endpoints that are requested repeatedly. The ETag and
+        Last-Modified validators of the previous response from the same URL are sent back,
+        and when the server answers 304 Not Modified that previous response is returned, so
+        unchanged polls transfer no body.
+        """
+        key = (url, repr(kwargs.get("params")))
+        previous = self._validated.get(key)
+        if previous is not None:
+            headers = dict(kwargs.get("headers") or {})
+            if previous.headers.get("ETag"):
+                headers.setdefault("If-None-Match", previous.headers["ETag"])
+            if previous.headers.get("Last-Modified"):
+                headers.setdefault(
+                    "If-Modified-Since", previous.headers["Last-Modified"]
+                )
+            kwargs["headers"] = headers
+
+        response = self.get(url, **kwargs)
+        if response.status_code == 304 and previous is not None:
+            return previous
+        if response.ok and (
+            response.headers.get("ETag") or response.headers.get("Last-Modified")
+        ):
+            # Read the body now so the response can be returned again later
+            response.content
+            self._validated[key] = response
+        return response
+
+    def post(self, url: str, **kwargs):
+        return self.request("POST", url, **kwargs)
+
+    def put(self, url: str, **kwargs):
+        return self.request("PUT", url, **kwargs)
+
+    def patch(self, url: str, **kwargs):
+        return self.request("PATCH", url, **kwargs)
+
+    def delete(self, url: str, **kwargs):
+        return self.request("DELETE", url, **kwargs)
+
+    def close(self) -> None:
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def _should_retry(self, method: str, response) -> bool:
+        if response.status_code == 429:
+            return True
+        return (
+            response.status_code in self.retry_statuses and method in self.retry_methods
+        )
+
+    def _backoff(self, attempt: int) -> float:
+        """Full jitter: a random delay up to the exponential backoff for this attempt"""
+        return random.uniform(
+            0, min(self.max_backoff, self.backoff_factor * 2**attempt)
+        )
+
+    @staticmethod
+    def _retry_after(response) -> Optional[float]:
+        """Returns the delay requested by a Retry-After header in seconds or as an HTTP date"""
+        value = response.headers.get("Retry-After")
+        if not value:
+            return None
+        try:
+            return max(float(value), 0)
+        except ValueError:
+            pass
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0)
+
+    def _throttle(self, url: str) -> None:
+        if not self.rate_limit:
+            return
+        host = urlsplit(url).netloc
+        with self._lock:
+            bucket = self._buckets.get(host)
+            if bucket is None:
+                bucket = self._buckets[host] = TokenBucket(self.rate_limit, self.burst)
+        started = time.monotonic()
+        bucket.acquire()
+        metrics.increment(
+            "http_throttle_seconds_total", time.monotonic() - started, host=host
+        )
+
+    @staticmethod
+    def _record(method: str, url: str, response, elapsed: float) -> None:
+        host = urlsplit(url).netloc
+        status = str(response.status_code) if response is not None else "error"
+        metrics.increment(
+            "http_requests_total", method=method, host=host, status=status
+        )
+        metrics.observe("http_request_seconds", elapsed, host=host)
+        # Streamed bodies are not read here, so only a declared length is counted
+        length = (
+            response.headers.get("Content-Length") if response is not None else None
+        )
+        if length and length.isdigit():
+            metrics.increment("http_response_bytes_total", int(length), host=host)
+
+    def _run_hooks(self, method: str, url: str, response, elapsed: float) -> None:
+        for hook in self.hooks:
+            try:
+                hook(method, url, response, elapsed)
+            except Exception as error:
+                logger.warning(f"HTTP hook {hook} failed: {error}")
+
+
+def _body_streams(kwargs: Dict) -> List:
+    """Returns the file-like objects that will be read to build the request body"""
+    candidates = [kwargs.get("data")]
+    files = kwargs.get("files") or {}
+    for value in files.values() if isinstance(files, dict) else files:
+        if isinstance(value, tuple) and len(value) == 2 and isinstance(value[1], tuple):
+            value = value[1]
+        candidates.append(value[1] if isinstance(value, tuple) else value)
+    return [candidate for candidate in candidates if hasattr(candidate, "read")]
+
+
+def _stream_position(stream) -> Optional[int]:
+    try:
+        return stream.tell() if stream.seekable() else None
+    except (AttributeError, OSError, ValueError):
+        return None
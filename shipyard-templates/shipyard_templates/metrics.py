@@ -0,0 +1,230 @@
+import atexit
+import json
+import math
+import os
+import threading
+import time
+from contextlib import ContextDecorator
+from typing import Dict, Iterable, Optional, Tuple
+
+# Upper bounds in seconds, suited to API calls and file transfers
+DEFAULT_BUCKETS = (0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 300)
+SUMMARY_FILE_NAME = "metrics.json"
+OPENMETRICS_FILE_NAME = "metrics.prom"
+
+_LabelKey = Tuple[str, Tuple[Tuple[str, str], ...]]
+
+
+class Histogram:
+    """Counts observations into cumulative buckets and tracks their count, sum, min and max"""
+
+    def __init__(self, buckets: Iterable[float] = DEFAULT_BUCKETS) -> None:
+        self.buckets = tuple(sorted(buckets))
+        self.bucket_counts = [0] * len(self.buckets)
+        self.count = 0
+        self.sum = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def observe(self, value: float) -> None:
+        self.count += 1
+        self.sum += value
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.bucket_counts[i] += 1
+                break
+
+    def cumulative_counts(self):
+        total = 0
+        for bound, count in zip(self.buckets, self.bucket_counts):
+            total += count
+            yield bound, total
+
+    def to_dict(self) -> dict:
+        return {
+            "count": self.count,
+            "sum": round(self.sum, 6),
+            "min": self.min if self.count else None,
+            "max": self.max if self.count else None,
+            "mean": round(self.sum / self.count, 6) if self.count else None,
+            "buckets": {str(bound): total for bound, total in self.cumulative_counts()},
+        }
+
+
+class Timer(ContextDecorator):
+    """Records the seconds spent in a block or function call into a histogram"""
+
+    def __init__(self, metrics: "Metrics", name: str, labels: Dict[str, str]) -> None:
+        self.metrics = metrics
+        self.name = name
+        self.labels = labels
+        self.started = None
+
+    def _recreate_cm(self):
+        # Each decorated call gets its own start time so threaded calls don't clash
+        return Timer(self.metrics, self.name, self.labels)
+
+    def __enter__(self):
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *args) -> bool:
+        self.metrics.observe(
+            self.name, time.perf_counter() - self.started, **self.labels
+        )
+        return False
+
+
+class Metrics:
+    """
+    Collects the counters and histograms of a blueprint run, such as bytes transferred, rows
+    loaded, API calls, retries and time spent waiting on jobs:
+
+        metrics = Metrics.get_metrics()
+        metrics.increment("transfer_bytes_total", size, vendor="s3", direction="upload")
+        with metrics.timer("upload_seconds", vendor="s3"):
+            ...
+
+    Labels should have few distinct values (a host or vendor, not a url or file name).
+    The summary also records the wall clock and CPU seconds of the process, which tell an
+    API-bound run (mostly waiting) from a CPU-bound one.
+
+    When SHIPYARD_ARTIFACTS_DIRECTORY is set, the shared collector writes its summary to
+    `metrics.json` in that folder as the process exits, and `metrics.prom` in the
+    OpenMetrics text format as well when SHIPYARD_METRICS_OPENMETRICS is true.
+    """
+
+    _metrics = None
+
+    def __init__(self) -> None:
+        self.counters: Dict[_LabelKey, float] = {}
+        self.histograms: Dict[_LabelKey, Histogram] = {}
+        self.started = time.monotonic()
+        self.cpu_started = time.process_time()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def get_metrics(cls) -> "Metrics":
+        """Returns the collector shared by the templates and vendor clients of this process"""
+        if cls._metrics is None:
+            cls._metrics = cls()
+            atexit.register(cls._metrics._write_on_exit)
+        return cls._metrics
+
+    def increment(self, name: str, value: float = 1, **labels: str) -> None:
+        key = _key(name, labels)
+        with self._lock:
+            self.counters[key] = self.counters.get(key, 0) + value
+
+    def observe(
+        self,
+        name: str,
+        value: float,
+        buckets: Optional[Iterable[float]] = None,
+        **labels: str,
+    ) -> None:
+        """Adds `value` to a histogram. `buckets` only applies when the histogram is new."""
+        key = _key(name, labels)
+        with self._lock:
+            histogram = self.histograms.get(key)
+            if histogram is None:
+                histogram = self.histograms[key] = Histogram(buckets or DEFAULT_BUCKETS)
+            histogram.observe(value)
+
+    def timer(self, name: str, **labels: str) -> Timer:
+        """Returns a context manager and decorator that observes its duration in seconds"""
+        return Timer(self, name, labels)
+
+    def summary(self) -> dict:
+        with self._lock:
+            counters = [
+                {"name": name, "labels": dict(labels), "value": value}
+                for (name, labels), value in sorted(self.counters.items())
+            ]
+            histograms = [
+                {"name": name, "labels": dict(labels), **histogram.to_dict()}
+                for (name, labels), histogram in sorted(self.histograms.items())
+            ]
+        return {
+            "wall_seconds": round(time.monotonic() - self.started, 3),
+            "cpu_seconds": round(time.process_time() - self.cpu_started, 3),
+            "counters": counters,
+            "histograms": histograms,
+        }
+
+    def to_openmetrics(self) -> str:
+        lines = []
+        with self._lock:
+            counters = sorted(self.counters.items())
+            histograms = sorted(self.histograms.items())
+        typed = set()
+        for (name, labels), value in counters:
+            family = name[: -len("_total")] if name.endswith("_total") else name
+            if family not in typed:
+                lines.append(f"# TYPE {family} counter")
+                typed.add(family)
+            lines.append(f"{family}_total{_render_labels(labels)} {value}")
+        for (name, labels), histogram in histograms:
+            if name not in typed:
+                lines.append(f"# TYPE {name} histogram")
+                typed.add(name)
+            for bound, total in histogram.cumulative_counts():
+                bucket_labels = labels + (("le", str(bound)),)
+                lines.append(f"{name}_bucket{_render_labels(bucket_labels)} {total}")
+            inf_labels = labels + (("le", "+Inf"),)
+            lines.append(f"{name}_bucket{_render_labels(inf_labels)} {histogram.count}")
+            lines.append(f"{name}_count{_render_labels(labels)} {histogram.count}")
+            lines.append(f"{name}_sum{_render_labels(labels)} {histogram.sum}")
+        lines.append("# EOF")
+        return "\n".join(lines) + "\n"
+
+    def write(self, folder: str, openmetrics: bool = False) -> str:
+        """Writes the JSON summary, and the OpenMetrics text if asked, to `folder`"""
+        os.makedirs(folder, exist_ok=True)
+        path = os.path.join(folder, SUMMARY_FILE_NAME)
+        with open(path, "w") as f:
+            json.dump(self.summary(), f, indent=2)
+        if openmetrics:
+            with open(os.path.join(folder, OPENMETRICS_FILE_NAME), "w") as f:
+                f.write(self.to_openmetrics())
+        return path
+
+    def reset(self) -> None:
+        with self._lock:
+            self.counters.clear()
+            self.histograms.clear()
+            self.started = time.monotonic()
+            self.cpu_started = time.process_time()
+
+    def _write_on_exit(self) -> None:
+        folder = os.getenv("SHIPYARD_ARTIFACTS_DIRECTORY")
+        if not folder or not (self.counters or self.histograms):
+            return
+        openmetrics = os.getenv("SHIPYARD_METRICS_OPENMETRICS", "").lower() in (
+            "1",
+            "true",
+            "yes",
+        )
+        try:
+            self.write(folder, openmetrics=openmetrics)
+        except OSError:
+            # Metrics must never fail a run that otherwise succeeded
+            pass
+
+
+def _key(name: str, labels: Dict[str, str]) -> _LabelKey:
+    return name, tuple(sorted((key, str(value)) for key, value in labels.items()))
+
+
+def _render_labels(labels) -> str:
+    if not labels:
+        return ""
+    rendered = ",".join(
+        '{}="{}"'.format(
+            key, value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+        )
+        for key, value in labels
+    )
+    return f"{{{rendered}}}"
@@ -1,5 +1,15 @@
-import os
+import functools
+import json
 import logging
+import os
+import reprlib
+import time
+import types
+from contextlib import ContextDecorator
+from datetime import datetime, timezone
+
+# Longest rendering of a payload passed through `truncate`, in characters
+DEFAULT_PAYLOAD_LIMIT = 1000
 
 
 def add_logging_level(level_name, level_num, method_name=None):
@@ -27,6 +37,135 @@ def add_logging_level(level_name, level_num, method_name=None):
         setattr(logging, method_name, log_to_root)
 
 
+def truncate(value, limit: int = DEFAULT_PAYLOAD_LIMIT):
+    """
+    Wraps a payload passed as a log argument so that at most `limit` characters of it are
+    rendered, and only if the record is emitted. Containers are rendered element by element
+    and stop early, so a large list or response body is never formatted in full:
+
+        logger.debug("Files found: %s", truncate(file_names))
+    """
+    return _Truncated(value, limit)
+
+
+class _Truncated:
+    __slots__ = ("value", "limit")
+
+    _repr = reprlib.Repr()
+    _repr.maxlevel = 3
+    _repr.maxlist = _repr.maxtuple = _repr.maxset = _repr.maxfrozenset = 50
+    _repr.maxdict = 50
+    _repr.maxstring = _repr.maxother = DEFAULT_PAYLOAD_LIMIT
+
+    def __init__(self, value, limit: int) -> None:
+        self.value = value
+        self.limit = limit
+
+    def __str__(self) -> str:
+        if isinstance(self.value, str):
+            if len(self.value) <= self.limit:
+                return self.value
+            omitted = len(self.value) - self.limit
+            return f"{self.value[:self.limit]}... [{omitted} more characters]"
+        text = self._repr.repr(self.value)
+        if len(text) > self.limit:
+            text = f"{text[:self.limit]}... [truncated]"
+        return text
+
+    __repr__ = __str__
+
+
+class _LazyArgumentFilter(logging.Filter):
+    """
+    Calls function and lambda arguments of a record so that expensive values are only
+    computed for records that pass the level check:
+
+        logger.debug("Matches: %s", lambda: ", ".join(sorted(matches)))
+    """
+
+    LAZY_TYPES = (types.FunctionType, functools.partial)
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if isinstance(record.msg, self.LAZY_TYPES):
+            record.msg = record.msg()
+        if isinstance(record.args, tuple) and any(
+            isinstance(arg, self.LAZY_TYPES) for arg in record.args
+        ):
+            record.args = tuple(
+                arg() if isinstance(arg, self.LAZY_TYPES) else arg
+                for arg in record.args
+            )
+        return True
+
+
+class JsonFormatter(logging.Formatter):
+    """
+    Formats each record as a single JSON object. Fields passed with `extra=` are included,
+    so records can be filtered and aggregated without parsing the message.
+    """
+
+    _STANDARD_ATTRIBUTES = frozenset(
+        vars(logging.LogRecord("", 0, "", 0, "", (), None))
+    ) | {"message", "asctime"}
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "timestamp": datetime.fromtimestamp(
+                record.created, timezone.utc
+            ).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "module": record.module,
+            "line": record.lineno,
+            "message": record.getMessage(),
+        }
+        entry.update(
+            (key, value)
+            for key, value in vars(record).items()
+            if key not in self._STANDARD_ATTRIBUTES
+        )
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str)
+
+
+class LogSpan(ContextDecorator):
+    """
+    Times a block or function call and logs its duration at `level` when it ends. Nothing is
+    timed when `level` is disabled. Usable as `with ShipyardLogger.span("Upload"):` or as a
+    decorator.
+    """
+
+    def __init__(self, description: str, level: int = logging.DEBUG) -> None:
+        self.description = description
+        self.level = level
+        self.started = None
+
+    def _recreate_cm(self):
+        # Each decorated call gets its own timer so recursive and threaded calls don't clash
+        return LogSpan(self.description, self.level)
+
+    def __enter__(self):
+        if ShipyardLogger.get_logger().isEnabledFor(self.level):
+            self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, traceback) -> bool:
+        if self.started is not None:
+            duration = time.perf_counter() - self.started
+            outcome = "failed after" if exc_type else "took"
+            ShipyardLogger.get_logger().log(
+                self.level,
+                "%s %s %.3fs",
+                self.description,
+                outcome,
+                duration,
+                extra={"span": self.description, "duration": duration},
+                stacklevel=2,
+            )
+        return False
+
+
 class ShipyardLogger:
     _logger = None
     AUTHTEST_LEVEL = 100
@@ -40,11 +179,15 @@ class ShipyardLogger:
             add_logging_level("AUTHTEST", cls.AUTHTEST_LEVEL)
 
             console = logging.StreamHandler()
-            formatter = logging.Formatter(
-                "%(asctime)s - %(name)s - %(levelname)s -%(lineno)d: %(message)s"
-            )
+            if os.getenv("LOG_FORMAT", "").lower() == "json":
+                formatter = JsonFormatter()
+            else:
+                formatter = logging.Formatter(
+                    "%(asctime)s - %(name)s - %(levelname)s -%(lineno)d: %(message)s"
+                )
             console.setFormatter(formatter)
             cls._logger.addHandler(console)
+            cls._logger.addFilter(_LazyArgumentFilter())
 
             try:
                 cls._logger.setLevel(log_level)
@@ -56,3 +199,8 @@ class ShipyardLogger:
             else:
                 cls._logger.debug(f"Log level set to {log_level}")
         return cls._logger
+
+    @staticmethod
+    def span(description: str, level: int = logging.DEBUG) -> LogSpan:
+        """Returns a context manager and decorator that logs how long its block took"""
+        return LogSpan(description, level)
@@ -0,0 +1,223 @@
+import base64
+import hashlib
+import json
+import os
+import pickle
+import tempfile
+import threading
+import time
+from typing import Callable, Dict, List, Optional
+
+from .shipyard_logger import ShipyardLogger
+
+logger = ShipyardLogger.get_logger()
+
+AUTHORITY_URL = "https://login.microsoftonline.com"
+DEFAULT_ID_TTL = 24 * 60 * 60
+# Slows down guessing the password of a stolen username/password cache file
+KEY_DERIVATION_ITERATIONS = 100_000
+
+
+def cache_directory() -> str:
+    """
+    The folder that holds token and ID caches, shared by every vessel on the machine.
+    Set SHIPYARD_TOKEN_CACHE_DIRECTORY to change it, or to an empty string to disable caching.
+    """
+    folder = os.getenv("SHIPYARD_TOKEN_CACHE_DIRECTORY")
+    if folder is None:
+        folder = os.path.join(tempfile.gettempdir(), "shipyard-token-cache")
+    return folder
+
+
+def _write_private(path: str, raw: bytes) -> None:
+    """Atomically replaces `path` with `raw`, readable by the current user only"""
+    os.makedirs(os.path.dirname(path), mode=0o700, exist_ok=True)
+    descriptor, temp_path = tempfile.mkstemp(dir=os.path.dirname(path), prefix=".tmp-")
+    try:
+        with os.fdopen(descriptor, "wb") as f:
+            f.write(raw)
+        os.replace(temp_path, path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+
+def _scope_name(*parts: Optional[str]) -> str:
+    return hashlib.sha256("|".join(part or "" for part in parts).encode()).hexdigest()[
+        :32
+    ]
+
+
+class MsalTokenCache:
+    """
+    A file-backed msal token and authority metadata cache for one tenant and client, and
+    for one user when signing in with a username and password.
+
+    The file is encrypted with a key derived from the client secret or password, so it can
+    only be read by a process that already holds the credential, and a rotated credential
+    simply starts a new cache. Reads happen once when the cache is created and writes only
+    when msal changed the cache, each replacing the file atomically.
+    """
+
+    def __init__(
+        self,
+        tenant: str,
+        client_id: str,
+        secret: str,
+        username: Optional[str] = None,
+    ) -> None:
+        import msal
+
+        scope = (tenant, client_id, username) if username else (tenant, client_id)
+        self.path = None
+        folder = cache_directory()
+        if folder:
+            self.path = os.path.join(folder, f"msal-{_scope_name(*scope)}")
+        self._fernet = self._make_fernet(tenant, client_id, secret, username)
+        self.token_cache = msal.SerializableTokenCache()
+        self.http_cache: Dict = {}
+        self._load()
+
+    @staticmethod
+    def _make_fernet(
+        tenant: str, client_id: str, secret: str, username: Optional[str] = None
+    ):
+        from cryptography.fernet import Fernet
+
+        salt = f"{tenant}|{client_id}"
+        if username:
+            salt = f"{salt}|{username}"
+        key = hashlib.pbkdf2_hmac(
+            "sha256",
+            secret.encode(),
+            salt.encode(),
+            KEY_DERIVATION_ITERATIONS,
+        )
+        return Fernet(base64.urlsafe_b64encode(key))
+
+    def _load(self) -> None:
+        from cryptography.fernet import InvalidToken
+
+        if not self.path or not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, "rb") as f:
+                # The data is authenticated by the decryption, so it is safe to unpickle
+                state = pickle.loads(self._fernet.decrypt(f.read()))
+            self.token_cache.deserialize(state["tokens"])
+            self.http_cache.update(state["http_cache"])
+            logger.debug("Loaded the cached Microsoft tokens")
+        except (InvalidToken, OSError, pickle.UnpicklingError, KeyError, ValueError):
+            logger.debug("Ignoring an unreadable Microsoft token cache")
+
+    def save(self) -> None:
+        if not self.path or not self.token_cache.has_state_changed:
+            return
+        state = {"tokens": self.token_cache.serialize(), "http_cache": self.http_cache}
+        try:
+            _write_private(self.path, self._fernet.encrypt(pickle.dumps(state)))
+            self.token_cache.has_state_changed = False
+        except OSError as e:
+            # Losing the cache only costs a new token on the next run
+            logger.debug(f"Could not save the Microsoft token cache: {e}")
+
+
+def acquire_msal_token(
+    tenant: str,
+    client_id: str,
+    scopes: List[str],
+    client_secret: Optional[str] = None,
+    username: Optional[str] = None,
+    password: Optional[str] = None,
+) -> dict:
+    """
+    Returns an msal token result for the client credentials, or for the username and
+    password when no client secret is given. A cached token is returned while it is valid,
+    so only the first of many vessels using the same credential calls Azure AD.
+    """
+    import msal
+
+    if client_secret:
+        cache = MsalTokenCache(tenant, client_id, client_secret)
+    else:
+        # Each user signing in to the same app gets a cache of their own
+        cache = MsalTokenCache(tenant, client_id, password, username=username)
+    options = {
+        "client_id": client_id,
+        "authority": f"{AUTHORITY_URL}/{tenant}",
+        "token_cache": cache.token_cache,
+        "http_cache": cache.http_cache,
+    }
+    try:
+        if client_secret:
+            app = msal.ConfidentialClientApplication(
+                client_credential=client_secret, **options
+            )
+            # Client credential tokens are looked up in the cache before calling AAD
+            return app.acquire_token_for_client(scopes=scopes)
+
+        app = msal.PublicClientApplication(**options)
+        for account in app.get_accounts(username=username):
+            result = app.acquire_token_silent(scopes, account=account)
+            if result and "access_token" in result:
+                return result
+        return app.acquire_token_by_username_password(
+            username=username, password=password, scopes=scopes
+        )
+    finally:
+        cache.save()
+
+
+class IdCache:
+    """
+    Remembers IDs that are looked up by name, such as a SharePoint site or a OneDrive user,
+    for `ttl` seconds. Entries are kept per `scope` (e.g. a tenant) in a JSON file next to
+    the token caches, so later runs skip the lookup request.
+    """
+
+    _lock = threading.Lock()
+
+    def __init__(self, scope: str, ttl: float = DEFAULT_ID_TTL) -> None:
+        self.ttl = ttl
+        folder = cache_directory()
+        self.path = (
+            os.path.join(folder, f"ids-{_scope_name(scope)}.json") if folder else None
+        )
+
+    def get_or_resolve(self, kind: str, name: str, resolve: Callable[[], str]) -> str:
+        """Returns the cached ID of `kind` named `name`, or calls `resolve` and caches it"""
+        key = f"{kind}:{name}"
+        entry = self._read().get(key)
+        if entry and time.time() - entry["resolved_at"] < self.ttl:
+            logger.debug(f"Using the cached {kind} ID for {name}")
+            return entry["id"]
+
+        value = resolve()
+        if value and self.path:
+            with self._lock:
+                entries = self._read()
+                entries[key] = {"id": value, "resolved_at": time.time()}
+                try:
+                    _write_private(self.path, json.dumps(entries).encode())
+                except OSError as e:
+                    logger.debug(f"Could not save the ID cache: {e}")
+        return value
+
+    def forget(self, kind: str, name: str) -> None:
+        """Drops a cached ID, e.g. after a request using it returned 404"""
+        if not self.path:
+            return
+        with self._lock:
+            entries = self._read()
+            if entries.pop(f"{kind}:{name}", None) is not None:
+                _write_private(self.path, json.dumps(entries).encode())
+
+    def _read(self) -> Dict[str, Dict]:
+        if not self.path:
+            return {}
+        try:
+            with open(self.path, "rb") as f:
+                return json.loads(f.read())
+        except (OSError, ValueError):
+            return {}
@@ -0,0 +1,211 @@
+import io
+from unittest.mock import MagicMock
+
+import pytest
+import requests
+
+from shipyard_templates import HttpClient
+from shipyard_templates import http_client
+
+
+def make_response(status_code=200, headers=None):
+    response = requests.Response()
+    response.status_code = status_code
+    response.headers.update(headers or {})
+    response.raw = io.BytesIO(b"")
+    return response
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    sleeps = []
+    monkeypatch.setattr(http_client.time, "sleep", sleeps.append)
+    return sleeps
+
+
+def client_with_responses(*responses, **kwargs):
+    client = HttpClient(**kwargs)
+    client._session = MagicMock()
+    client._session.request.side_effect = list(responses)
+    return client
+
+
+def test_returns_first_successful_response(sleeps):
+    client = client_with_responses(make_response(200))
+
+    assert client.get("https://api.example.com/items").status_code == 200
+    assert sleeps == []
+
+
+def test_retries_server_errors_with_backoff(sleeps):
+    client = client_with_responses(
+        make_response(503), make_response(502), make_response(200)
+    )
+
+    assert client.get("https://api.example.com/items").status_code == 200
+    assert len(sleeps) == 2
+    assert 0 <= sleeps[0] <= 0.5 and 0 <= sleeps[1] <= 1
+
+
+def test_honors_retry_after_seconds(sleeps):
+    client = client_with_responses(
+        make_response(429, {"Retry-After": "7"}), make_response(200)
+    )
+
+    client.get("https://api.example.com/items")
+    assert sleeps == [7.0]
+
+
+def test_honors_retry_after_http_date():
+    response = make_response(429, {"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"})
+
+    assert HttpClient._retry_after(response) == 0
+
+
+def test_rate_limited_post_is_retried(sleeps):
+    client = client_with_responses(make_response(429), make_response(201))
+
+    assert client.post("https://api.example.com/jobs").status_code == 201
+
+
+def test_failed_post_is_not_retried(sleeps):
+    client = client_with_responses(make_response(500), make_response(201))
+
+    assert client.post("https://api.example.com/jobs").status_code == 500
+    assert sleeps == []
+
+
+def test_gives_up_after_max_retries(sleeps):
+    client = client_with_responses(*[make_response(503)] * 3, max_retries=2)
+
+    assert client.get("https://api.example.com/items").status_code == 503
+    assert len(sleeps) == 2
+
+
+def test_connection_errors_are_raised_after_retries(sleeps):
+    client = client_with_responses(
+        requests.ConnectionError("reset"), requests.ConnectionError("reset")
+    )
+    client.max_retries = 1
+
+    with pytest.raises(requests.ConnectionError):
+        client.get("https://api.example.com/items")
+    assert len(sleeps) == 1
+
+
+def test_rewinds_seekable_body_before_retrying(sleeps):
+    body = io.BytesIO(b"payload")
+    positions = []
+
+    def request(method, url, **kwargs):
+        positions.append(kwargs["data"].tell())
+        kwargs["data"].read()
+        return make_response(503 if len(positions) == 1 else 200)
+
+    client = HttpClient()
+    client._session = MagicMock()
+    client._session.request.side_effect = request
+
+    client.put("https://api.example.com/upload", data=body)
+    assert positions == [0, 0]
+
+
+def test_base_url_timeout_and_hooks(sleeps):
+    timings = []
+    client = client_with_responses(
+        make_response(200),
+        base_url="https://api.example.com/v1/",
+        hooks=[lambda method, url, response, elapsed: timings.append((method, url))],
+    )
+
+    client.get("items")
+
+    client._session.request.assert_called_once_with(
+        "GET", "https://api.example.com/v1/items", timeout=30
+    )
+    assert timings == [("GET", "https://api.example.com/v1/items")]
+
+
+def test_token_bucket_throttles_after_burst(sleeps, monkeypatch):
+    now = [0.0]
+    monkeypatch.setattr(http_client.time, "monotonic", lambda: now[0])
+
+    def sleep(seconds):
+        sleeps.append(seconds)
+        now[0] += seconds
+
+    monkeypatch.setattr(http_client.time, "sleep", sleep)
+    bucket = http_client.TokenBucket(rate=2, capacity=2)
+
+    for _ in range(3):
+        bucket.acquire()
+    assert sleeps == [0.5]
+
+
+def test_rewinds_uploaded_files_before_retrying(sleeps):
+    upload = io.BytesIO(b"a,b\n1,2\n")
+    positions = []
+
+    def request(method, url, **kwargs):
+        file = kwargs["files"]["files"][1]
+        positions.append(file.tell())
+        file.read()
+        return make_response(429 if len(positions) == 1 else 200)
+
+    client = HttpClient()
+    client._session = MagicMock()
+    client._session.request.side_effect = request
+
+    client.post(
+        "https://api.example.com/imports",
+        files={"files": ("data.csv", upload, "text/csv"), "meta": (None, "{}")},
+    )
+    assert positions == [0, 0]
+
+
+def test_unseekable_body_is_sent_once(sleeps):
+    class Stream:
+        def read(self, *args):
+            return b""
+
+        def seekable(self):
+            return False
+
+    client = client_with_responses(make_response(503), make_response(200))
+
+    assert (
+        client.put("https://api.example.com/upload", data=Stream()).status_code == 503
+    )
+
+
+def test_poll_revalidates_with_etag(sleeps):
+    first = make_response(200, {"ETag": '"v1"'})
+    first._content = b'{"status": "running"}'
+    client = client_with_responses(first, make_response(304))
+
+    assert client.poll("https://api.example.com/runs/1").json() == {"status": "running"}
+    assert client.poll("https://api.example.com/runs/1") is first
+
+    second_call = client._session.request.call_args_list[1]
+    assert second_call.kwargs["headers"] == {"If-None-Match": '"v1"'}
+
+
+def test_records_requests_and_retries_in_metrics(sleeps, monkeypatch):
+    metrics = http_client.Metrics()
+    monkeypatch.setattr(http_client, "metrics", metrics)
+    client = client_with_responses(
+        make_response(429, {"Retry-After": "2"}),
+        make_response(200, {"Content-Length": "128"}),
+    )
+
+    client.get("https://api.example.com/items")
+
+    counters = {
+        (c["name"], c["labels"].get("status")): c["value"]
+        for c in metrics.summary()["counters"]
+    }
+    assert counters[("http_requests_total", "429")] == 1
+    assert counters[("http_requests_total", "200")] == 1
+    assert counters[("http_retries_total", None)] == 1
+    assert counters[("http_backoff_seconds_total", None)] == 2.0
+    assert counters[("http_response_bytes_total", None)] == 128
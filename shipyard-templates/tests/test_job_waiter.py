@@ -0,0 +1,76 @@
+import asyncio
+
+import pytest
+
+from shipyard_templates import Etl, JobTimeoutError, JobWaiter
+from shipyard_templates import etl
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Replaces sleeping with a fake clock and records every delay"""
+    clock = {"now": 0.0, "sleeps": []}
+
+    def sleep(seconds):
+        clock["sleeps"].append(seconds)
+        clock["now"] += seconds
+
+    async def async_sleep(seconds):
+        sleep(seconds)
+
+    monkeypatch.setattr(etl.time, "monotonic", lambda: clock["now"])
+    monkeypatch.setattr(etl.time, "sleep", sleep)
+    monkeypatch.setattr(asyncio, "sleep", async_sleep)
+    monkeypatch.setattr(JobWaiter, "JITTER", 0)
+    return clock
+
+
+def statuses(*values):
+    iterator = iter(values)
+    return lambda: next(iterator)
+
+
+def test_polls_fast_then_backs_off(clock):
+    waiter = JobWaiter(initial_interval=2, max_interval=10, backoff=2)
+    check = statuses(*["running"] * 5, "success")
+
+    assert waiter.wait(check, lambda status: status == "success") == "success"
+    assert clock["sleeps"] == [2, 4, 8, 10, 10]
+
+
+def test_server_eta_schedules_next_poll(clock):
+    waiter = JobWaiter(initial_interval=2, max_interval=60)
+    check = statuses({"eta": 30}, {"eta": 1}, {"eta": None, "done": True})
+
+    waiter.wait(check, lambda job: job.get("done"), eta=lambda job: job["eta"])
+    assert clock["sleeps"] == [30, 2]
+
+
+def test_timeout_raises_incomplete(clock):
+    waiter = JobWaiter(initial_interval=5, max_interval=5, timeout=12)
+
+    with pytest.raises(JobTimeoutError) as e:
+        waiter.wait(lambda: "running", lambda status: False, description="Run 1")
+    assert e.value.exit_code == Etl.EXIT_CODE_FINAL_STATUS_INCOMPLETE
+    assert clock["sleeps"] == [5, 5, 2]
+
+
+def test_wait_many_waits_for_every_job(clock):
+    waiter = JobWaiter(initial_interval=1, max_interval=1)
+    checks = {
+        "short": statuses("done"),
+        "long": statuses("running", "running", "done"),
+    }
+
+    results = waiter.wait_many(checks, lambda status: status == "done")
+    assert results == {"short": "done", "long": "done"}
+
+
+def test_errors_stop_the_wait(clock):
+    def check():
+        raise RuntimeError("job failed")
+
+    with pytest.raises(RuntimeError):
+        JobWaiter().wait(check, lambda status: True)
+    with pytest.raises(RuntimeError):
+        asyncio.run(JobWaiter().wait_async(check, lambda status: True))
@@ -0,0 +1,88 @@
+import json
+
+import pytest
+
+from shipyard_templates import Metrics
+
+
+@pytest.fixture
+def metrics():
+    return Metrics()
+
+
+def test_counters_are_kept_per_label_set(metrics):
+    metrics.increment("rows_total", 10, vendor="a")
+    metrics.increment("rows_total", 5, vendor="a")
+    metrics.increment("rows_total", vendor="b")
+
+    counters = metrics.summary()["counters"]
+    assert counters == [
+        {"name": "rows_total", "labels": {"vendor": "a"}, "value": 15},
+        {"name": "rows_total", "labels": {"vendor": "b"}, "value": 1},
+    ]
+
+
+def test_histogram_summary(metrics):
+    for value in (0.02, 0.2, 3):
+        metrics.observe("request_seconds", value, host="api")
+
+    (histogram,) = metrics.summary()["histograms"]
+    assert histogram["count"] == 3
+    assert histogram["min"] == 0.02
+    assert histogram["max"] == 3
+    assert histogram["buckets"]["0.05"] == 1
+    assert histogram["buckets"]["5"] == 3
+
+
+def test_timer_observes_each_call(metrics):
+    @metrics.timer("work_seconds")
+    def work():
+        pass
+
+    work()
+    work()
+    with metrics.timer("work_seconds"):
+        pass
+
+    assert metrics.summary()["histograms"][0]["count"] == 3
+
+
+def test_openmetrics_text(metrics):
+    metrics.increment("http_requests_total", host="api", status="200")
+    metrics.observe("http_request_seconds", 0.3, buckets=(0.1, 1), host="api")
+
+    text = metrics.to_openmetrics()
+    assert text.splitlines() == [
+        "# TYPE http_requests counter",
+        'http_requests_total{host="api",status="200"} 1',
+        "# TYPE http_request_seconds histogram",
+        'http_request_seconds_bucket{host="api",le="0.1"} 0',
+        'http_request_seconds_bucket{host="api",le="1"} 1',
+        'http_request_seconds_bucket{host="api",le="+Inf"} 1',
+        'http_request_seconds_count{host="api"} 1',
+        'http_request_seconds_sum{host="api"} 0.3',
+        "# EOF",
+    ]
+
+
+def test_written_on_exit_to_artifacts_folder(metrics, tmp_path, monkeypatch):
+    monkeypatch.setenv("SHIPYARD_ARTIFACTS_DIRECTORY", str(tmp_path))
+    monkeypatch.setenv("SHIPYARD_METRICS_OPENMETRICS", "true")
+    metrics.increment("files_total")
+
+    metrics._write_on_exit()
+
+    summary = json.loads((tmp_path / "metrics.json").read_text())
+    assert summary["counters"][0]["value"] == 1
+    assert {"wall_seconds", "cpu_seconds"} <= set(summary)
+    assert (tmp_path / "metrics.prom").read_text().endswith("# EOF\n")
+
+
+def test_nothing_written_without_artifacts_folder(metrics, tmp_path, monkeypatch):
+    monkeypatch.delenv("SHIPYARD_ARTIFACTS_DIRECTORY", raising=False)
+    monkeypatch.chdir(tmp_path)
+    metrics.increment("files_total")
+
+    metrics._write_on_exit()
+
+    assert list(tmp_path.iterdir()) == []
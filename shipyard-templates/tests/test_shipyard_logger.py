@@ -0,0 +1,76 @@
+import json
+import logging
+
+import pytest
+
+from shipyard_templates import JsonFormatter, ShipyardLogger, truncate
+
+
+@pytest.fixture
+def records():
+    """Captures the records emitted by the Shipyard logger at INFO"""
+    logger = ShipyardLogger.get_logger()
+    records = []
+    handler = logging.Handler()
+    handler.emit = records.append
+    logger.addHandler(handler)
+    level = logger.level
+    logger.setLevel(logging.INFO)
+    yield records
+    logger.setLevel(level)
+    logger.removeHandler(handler)
+
+
+def test_lazy_arguments_only_run_for_emitted_records(records):
+    calls = []
+
+    def expensive():
+        calls.append(1)
+        return "rendered"
+
+    logger = ShipyardLogger.get_logger()
+    logger.debug("Skipped: %s", expensive)
+    logger.info("Kept: %s", expensive)
+
+    assert calls == [1]
+    assert [record.getMessage() for record in records] == ["Kept: rendered"]
+
+
+def test_truncate_caps_long_strings():
+    assert str(truncate("abcdef", limit=4)) == "abcd... [2 more characters]"
+    assert str(truncate("abc", limit=4)) == "abc"
+
+
+def test_truncate_renders_only_part_of_large_containers():
+    rendered = str(truncate([f"file_{i}.csv" for i in range(100_000)]))
+
+    assert len(rendered) <= 1000
+    assert rendered.startswith("['file_0.csv', 'file_1.csv'")
+
+
+def test_json_formatter_includes_extra_fields():
+    record = logging.LogRecord(
+        "Shipyard", logging.INFO, "x.py", 7, "Hi %s", ("you",), None
+    )
+    record.duration = 1.5
+
+    entry = json.loads(JsonFormatter().format(record))
+
+    assert entry["message"] == "Hi you"
+    assert entry["level"] == "INFO"
+    assert entry["line"] == 7
+    assert entry["duration"] == 1.5
+
+
+def test_span_logs_duration(records):
+    @ShipyardLogger.span("Upload", level=logging.INFO)
+    def upload():
+        return "done"
+
+    assert upload() == "done"
+    with ShipyardLogger.span("Skipped"):
+        pass
+
+    assert len(records) == 1
+    assert records[0].span == "Upload"
+    assert records[0].getMessage().startswith("Upload took ")
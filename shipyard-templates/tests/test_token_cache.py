@@ -0,0 +1,93 @@
+import pytest
+
+from shipyard_templates import IdCache
+from shipyard_templates import token_cache
+
+msal = pytest.importorskip("msal")
+
+
+@pytest.fixture(autouse=True)
+def cache_directory(tmp_path, monkeypatch):
+    monkeypatch.setenv("SHIPYARD_TOKEN_CACHE_DIRECTORY", str(tmp_path))
+    return tmp_path
+
+
+def add_token(cache):
+    cache.token_cache.add(
+        {
+            "client_id": "client",
+            "scope": ["https://graph.microsoft.com/.default"],
+            "token_endpoint": "https://login.microsoftonline.com/tenant/oauth2/v2.0/token",
+            "response": {"access_token": "secret-token", "expires_in": 3600},
+        }
+    )
+
+
+def test_tokens_persist_encrypted_between_processes(cache_directory):
+    cache = token_cache.MsalTokenCache("tenant", "client", "client-secret")
+    add_token(cache)
+    cache.save()
+
+    (path,) = cache_directory.iterdir()
+    assert b"secret-token" not in path.read_bytes()
+    reloaded = token_cache.MsalTokenCache("tenant", "client", "client-secret")
+    assert "secret-token" in reloaded.token_cache.serialize()
+
+
+def test_a_different_secret_starts_an_empty_cache():
+    cache = token_cache.MsalTokenCache("tenant", "client", "client-secret")
+    add_token(cache)
+    cache.save()
+
+    rotated = token_cache.MsalTokenCache("tenant", "client", "rotated-secret")
+    assert "secret-token" not in rotated.token_cache.serialize()
+
+
+def test_caching_can_be_disabled(cache_directory, monkeypatch):
+    monkeypatch.setenv("SHIPYARD_TOKEN_CACHE_DIRECTORY", "")
+    cache = token_cache.MsalTokenCache("tenant", "client", "client-secret")
+    add_token(cache)
+    cache.save()
+
+    assert list(cache_directory.iterdir()) == []
+
+
+def test_id_cache_resolves_once_until_expired(monkeypatch):
+    calls = []
+
+    def resolve():
+        calls.append(1)
+        return "site-id"
+
+    assert IdCache("tenant").get_or_resolve("site", "Finance", resolve) == "site-id"
+    assert IdCache("tenant").get_or_resolve("site", "Finance", resolve) == "site-id"
+    assert len(calls) == 1
+
+    assert IdCache("tenant", ttl=0).get_or_resolve("site", "Finance", resolve)
+    assert len(calls) == 2
+
+
+def test_id_cache_is_scoped_and_can_forget():
+    IdCache("tenant").get_or_resolve("site", "Finance", lambda: "a")
+
+    assert IdCache("other").get_or_resolve("site", "Finance", lambda: "b") == "b"
+    IdCache("tenant").forget("site", "Finance")
+    assert IdCache("tenant").get_or_resolve("site", "Finance", lambda: "c") == "c"
+
+
+def test_username_password_caches_are_kept_per_user(cache_directory):
+    cache = token_cache.MsalTokenCache(
+        "tenant", "client", "password", username="ada@example.com"
+    )
+    add_token(cache)
+    cache.save()
+
+    other_user = token_cache.MsalTokenCache(
+        "tenant", "client", "password", username="bob@example.com"
+    )
+    assert other_user.path != cache.path
+    assert "secret-token" not in other_user.token_cache.serialize()
+    same_user = token_cache.MsalTokenCache(
+        "tenant", "client", "password", username="ada@example.com"
+    )
+    assert "secret-token" in same_user.token_cache.serialize()
@@ -1,3 +1,10 @@
+import csv
+import json
+import tempfile
+import time
+from itertools import islice
+from typing import Iterable, Iterator, List, Optional
+
 from pyairtable import Api
 from requests.exceptions import HTTPError
 from shipyard_templates import Spreadsheets, ShipyardLogger, ExitCodeException
@@ -12,8 +19,29 @@ class AirtableClient(Spreadsheets):
     EXIT_CODE_INVALID_VIEW = 103
     EXIT_CODE_RESOURCE_NOT_FOUND = 104
 
+    # Airtable allows 5 requests per second per base and 10 records per write request
+    MAX_REQUESTS_PER_SECOND = 5
+    MAX_RECORDS_PER_REQUEST = 10
+    PAGE_SIZE = 100
+
     def __init__(self, api_key: str) -> None:
         self.api = Api(api_key)
+        self._last_request_time = 0.0
+
+    def _throttle(self) -> None:
+        """Sleep just long enough to stay under the Airtable per-base rate limit."""
+        min_interval = 1 / self.MAX_REQUESTS_PER_SECOND
+        elapsed = time.monotonic() - self._last_request_time
+        if elapsed < min_interval:
+            time.sleep(min_interval - elapsed)
+        self._last_request_time = time.monotonic()
+
+    def _chunked(self, records: Iterable, size: int = None) -> Iterator[list]:
+        """Yield lists of at most `size` items from any iterable without materializing it."""
+        size = size or self.MAX_RECORDS_PER_REQUEST
+        iterator = iter(records)
+        while chunk := list(islice(iterator, size)):
+            yield chunk
 
     def _handle_error(self, error: HTTPError) -> None:
         """Handle HTTPError and raise ExitCodeException with appropriate message and exit code.
@@ -127,7 +155,48 @@ class AirtableClient(Spreadsheets):
             logger.authtest("Success")
             return 0
 
-    def fetch(self, base: str, table: str, view: str = None) -> list:
+    def iter_records(
+        self,
+        base: str,
+        table: str,
+        view: str = None,
+        fields: List[str] = None,
+        page_size: int = None,
+    ) -> Iterator[List[dict]]:
+        """
+        Lazily iterate over the records of a table one page at a time.
+
+        Args:
+            base (str): The base ID.
+            table (str): The table name.
+            view (str, optional): The view name. Defaults to None.
+            fields (list, optional): Only return these fields. Defaults to all fields.
+            page_size (int, optional): The number of records per page. Defaults to 100.
+
+        Yields:
+            list: A page of records.
+        """
+        options = {"page_size": page_size or self.PAGE_SIZE}
+        if view:
+            options["view"] = view
+        if fields:
+            options["fields"] = fields
+
+        try:
+            pages = self.api.table(base, table).iterate(**options)
+            while True:
+                self._throttle()
+                page = next(pages, None)
+                if page is None:
+                    break
+                logger.debug(f"Fetched page of {len(page)} record(s)")
+                yield page
+        except HTTPError as err:
+            self._handle_error(err)
+
+    def fetch(
+        self, base: str, table: str, view: str = None, fields: List[str] = None
+    ) -> list:
         """
         Fetch data from Airtable.
 
@@ -135,26 +204,110 @@ class AirtableClient(Spreadsheets):
             base (str): The base ID.
             table (str): The table name.
             view (str, optional): The view name. Defaults to None.
+            fields (list, optional): Only return these fields. Defaults to all fields.
 
         Returns:
             list: The list of records.
         """
         logger.debug("Fetching data from Airtable...")
-        try:
-            table = self.api.table(base, table)
-            records = table.all(view=view) if view else table.all()
-        except HTTPError as err:
-            self._handle_error(err)
+        records = [
+            record
+            for page in self.iter_records(base, table, view, fields)
+            for record in page
+        ]
+        logger.debug(f"Returned {len(records)} record(s)")
+        return records
+
+    def export(
+        self,
+        base: str,
+        table: str,
+        destination_full_path: str,
+        view: str = None,
+        fields: List[str] = None,
+        include_record_id: bool = True,
+        file_format: str = "csv",
+    ) -> int:
+        """
+        Stream the records of a table to a CSV or JSONL file as pages arrive.
+
+        Airtable omits empty fields from records, so the CSV header is only known once
+        every page has been read. Pages are therefore spooled to a temporary JSONL file
+        while the header is collected, keeping memory usage bounded to a single page.
+
+        Args:
+            base (str): The base ID.
+            table (str): The table name.
+            destination_full_path (str): The file to write the records to.
+            view (str, optional): The view name. Defaults to None.
+            fields (list, optional): Only export these fields. Defaults to all fields.
+            include_record_id (bool, optional): Add an airtable_record_id column. Defaults to True.
+            file_format (str, optional): Either 'csv' or 'jsonl'. Defaults to 'csv'.
+
+        Returns:
+            int: The number of records written.
+        """
+        file_format = file_format.lower()
+        if file_format not in {"csv", "jsonl"}:
+            raise ExitCodeException(
+                f"Invalid file format {file_format}. Please choose from 'csv' or 'jsonl'",
+                self.EXIT_CODE_INVALID_INPUT,
+            )
+
+        logger.debug(f"Exporting data from Airtable to {destination_full_path}...")
+        if file_format == "jsonl":
+            with open(destination_full_path, "w") as f:
+                record_count = self._write_jsonl(
+                    f, self.iter_records(base, table, view, fields), include_record_id
+                )
         else:
-            logger.debug(f"Returned {len(records)} record(s)")
-            return records
+            columns = dict.fromkeys(fields or [])
+            with tempfile.TemporaryFile("w+") as spool:
+                record_count = self._write_jsonl(
+                    spool,
+                    self.iter_records(base, table, view, fields),
+                    include_record_id,
+                    columns,
+                )
+                spool.seek(0)
+                if include_record_id:
+                    columns.pop("airtable_record_id", None)
+                    columns["airtable_record_id"] = None
+                with open(destination_full_path, "w", newline="") as f:
+                    writer = csv.DictWriter(f, fieldnames=list(columns))
+                    writer.writeheader()
+                    for line in spool:
+                        writer.writerow(json.loads(line))
+
+        logger.debug(f"Exported {record_count} record(s)")
+        return record_count
+
+    @staticmethod
+    def _write_jsonl(
+        file,
+        pages: Iterable[List[dict]],
+        include_record_id: bool,
+        columns: Optional[dict] = None,
+    ) -> int:
+        """Write the fields of each record as one JSON line, collecting column names as they appear."""
+        record_count = 0
+        for page in pages:
+            for record in page:
+                row = record["fields"]
+                if include_record_id:
+                    row = {**row, "airtable_record_id": record["id"]}
+                if columns is not None:
+                    columns.update(dict.fromkeys(row))
+                file.write(json.dumps(row, default=str) + "\n")
+                record_count += 1
+        return record_count
 
     def upload(
         self,
         upload_method: str,
         base: str,
         table: str,
-        data: list,
+        data: Iterable,
         key_fields: list = None,
         typecast: bool = True,
     ) -> dict:
@@ -165,12 +318,12 @@ class AirtableClient(Spreadsheets):
             upload_method (str): The method to use for uploading the data. Choose from 'append', 'upsert', or 'replace'.
             base (str): The base ID.
             table (str): The table name.
-            data (list): The list of records to upload.
+            data (Iterable): The records to upload. Generators are consumed lazily.
             key_fields (list, optional): The list of fields to use as keys. Defaults to None.
             typecast (bool, optional): Whether to typecast the data. Defaults to True.
 
         Returns:
-            dict: The response from the API.
+            list: The response from the API.
         """
 
         upload_method = upload_method.lower()
@@ -188,53 +341,66 @@ class AirtableClient(Spreadsheets):
         return response
 
     def batch_create_records(
-        self, base: str, table: str, data: list, typecast: bool = True
-    ) -> dict:
+        self, base: str, table: str, data: Iterable, typecast: bool = True
+    ) -> list:
         """
-        Create records in Airtable.
+        Create records in Airtable, sending at most 10 records per request under the rate limit.
 
         Args:
             base (str): The base ID.
             table (str): The table name.
-            data (list): The list of records to create.
+            data (Iterable): The records to create.
             typecast (bool, optional): Whether to typecast the data. Defaults to True.
 
         Returns:
-            dict: The response from the API.
+            list: The created records returned by the API.
         """
         logger.debug("Inserting data to Airtable...")
+        response = []
         try:
             table = self.api.table(base, table)
-            response = table.batch_create(records=data, typecast=typecast)
+            for chunk in self._chunked(data):
+                self._throttle()
+                response.extend(table.batch_create(records=chunk, typecast=typecast))
         except HTTPError as err:
             self._handle_error(err)
         else:
-            logger.debug("Data inserted successfully")
+            logger.debug(f"{len(response)} record(s) inserted successfully")
             return response
 
     def batch_upsert_records(
-        self, base: str, table: str, data: list, key_fields: list, typecast: bool = True
+        self,
+        base: str,
+        table: str,
+        data: Iterable,
+        key_fields: list,
+        typecast: bool = True,
     ) -> dict:
         """
-        Upsert data to Airtable.
+        Upsert data to Airtable, sending at most 10 records per request under the rate limit.
 
         Args:
             base (str): The base ID.
             table (str): The table name.
-            data (list): The list of records to upsert.
+            data (Iterable): The records to upsert.
             key_fields (list): The list of fields to use as keys.
             typecast (bool, optional): Whether to typecast the data. Defaults to True.
 
         Returns:
-            dict: The response from the API.
+            dict: The created and updated record IDs along with the upserted records.
         """
 
         logger.debug("Upserting data to Airtable...")
+        response = {"createdRecords": [], "updatedRecords": [], "records": []}
         try:
             table = self.api.table(base, table)
-            response = table.batch_upsert(
-                records=data, key_fields=key_fields, typecast=typecast
-            )
+            for chunk in self._chunked(data):
+                self._throttle()
+                result = table.batch_upsert(
+                    records=chunk, key_fields=key_fields, typecast=typecast
+                )
+                for key in response:
+                    response[key].extend(result.get(key, []))
 
         except HTTPError as err:
             self._handle_error(err)
@@ -242,23 +408,35 @@ class AirtableClient(Spreadsheets):
             logger.debug("Data uploaded successfully")
             return response
 
-    def clear_table(self, base: str, table: str) -> dict:
+    def clear_table(self, base: str, table: str) -> list:
         """
         Delete all records from a table.
 
+        Rather than loading every record up front, the first page of record IDs is
+        read and deleted in chunks of 10 before the next page is requested. Always
+        re-reading the first page avoids relying on a pagination offset that the
+        deletes would invalidate.
+
         Args:
             base (str): The base ID.
             table (str): The table name.
 
         Returns:
-            dict: The response from the API.
+            list: The deleted records returned by the API.
         """
         logger.debug("Clearing table...")
+        response = []
         try:
             table = self.api.table(base, table)
-            records = table.all()
-            record_ids = [record["id"] for record in records]
-            response = table.batch_delete(record_ids)
+            while True:
+                self._throttle()
+                page = next(table.iterate(page_size=self.PAGE_SIZE), [])
+                if not page:
+                    break
+                for chunk in self._chunked(record["id"] for record in page):
+                    self._throttle()
+                    response.extend(table.batch_delete(chunk))
+                logger.debug(f"Deleted {len(response)} record(s) so far")
 
         except HTTPError as err:
             self._handle_error(err)
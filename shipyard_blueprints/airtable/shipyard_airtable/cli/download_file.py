@@ -1,6 +1,7 @@
+import os
+import shutil
 import sys
 import argparse
-import pandas as pd
 
 from shipyard_airtable import AirtableClient
 from shipyard_bp_utils.artifacts import Artifact
@@ -39,6 +40,10 @@ def get_args():
         default="TRUE",
         required=False,
     )
+    parser.add_argument("--fields", dest="fields", default=None, required=False)
+    parser.add_argument(
+        "--file-format", dest="file_format", default="csv", required=False
+    )
     return parser.parse_args()
 
 
@@ -52,6 +57,11 @@ def main():
         base_id = args.base_id
         view_name = args.view_name
         include_record_id = convert_to_boolean(args.include_record_id)
+        fields = (
+            [field.strip() for field in args.fields.split(",") if field.strip()]
+            if args.fields
+            else None
+        )
 
         destination_file_name = clean_folder_name(args.destination_file_name)
         destination_folder_name = clean_folder_name(args.destination_folder_name)
@@ -63,16 +73,21 @@ def main():
         if destination_folder_name:
             create_folder_if_dne(destination_folder_name)
         airtable_client = AirtableClient(api_key)
-        records = airtable_client.fetch(base_id, table_name, view_name)
-
-        df = pd.DataFrame.from_records(row["fields"] for row in records)
-        if include_record_id:
-            for index, row in enumerate(records):
-                df.at[index, "airtable_record_id"] = row["id"]
-        df.to_csv(destination_full_path, index=False)
+        record_count = airtable_client.export(
+            base_id,
+            table_name,
+            destination_full_path,
+            view=view_name,
+            fields=fields,
+            include_record_id=include_record_id,
+            file_format=args.file_format,
+        )
 
         # Redundant but used for consistency so that future blueprints can easily access the data
-        artifact.variables.write_csv(destination_file_name, df)
+        shutil.copyfile(
+            destination_full_path,
+            os.path.join(artifact.variables.path, destination_file_name),
+        )
     except ExitCodeException as err:
         logger.error(err)
         sys.exit(err.exit_code)
@@ -81,7 +96,7 @@ def main():
         sys.exit(1)
     else:
         logger.info(
-            f"Successfully stored the contents of Base:{base_id} "
+            f"Successfully stored {record_count} record(s) from Base:{base_id} "
             f"Table:{table_name} View:{view_name} as {destination_full_path}"
         )
 
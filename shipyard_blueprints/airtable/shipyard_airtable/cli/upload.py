@@ -10,6 +10,8 @@ from shipyard_templates import ExitCodeException, ShipyardLogger
 
 logger = ShipyardLogger.get_logger()
 
+CSV_CHUNK_SIZE = 1000
+
 
 def get_args():
     parser = argparse.ArgumentParser()
@@ -34,18 +36,16 @@ def get_args():
     return parser.parse_args()
 
 
-def prepare_data_from_csv(file):
+def prepare_data_from_csv(file, upsert: bool = False):
+    """Lazily yield the rows of a CSV as Airtable records, reading it in chunks."""
     logger.debug(f"Preparing data from file: {file}")
-    records = []
-    df = pandas.read_csv(file)
-
-    for index, row in df.iterrows():
-        record = {"fields": row.to_dict()}
-        if "id" in record["fields"]:
-            del record["fields"]["id"]
-        records.append(record)
-    logger.debug(f"Following records are prepared: \n {records}")
-    return records
+    for chunk in pandas.read_csv(file, chunksize=CSV_CHUNK_SIZE):
+        for row in chunk.to_dict(orient="records"):
+            if not upsert:
+                yield row
+                continue
+            row.pop("id", None)
+            yield {"fields": row}
 
 
 def main():
@@ -108,11 +108,9 @@ def main():
                 }
                 if upload_method == "upsert":
                     upload_args["key_fields"] = key_fields
-                    upload_args["data"] = prepare_data_from_csv(file)
-                else:
-                    upload_args["data"] = pandas.read_csv(file).to_dict(
-                        orient="records"
-                    )
+                upload_args["data"] = prepare_data_from_csv(
+                    file, upsert=upload_method == "upsert"
+                )
                 responses.append(client.upload(**upload_args))
 
             except Exception as e:
@@ -0,0 +1,74 @@
+import csv
+import json
+from copy import deepcopy
+
+import pytest
+
+from shipyard_airtable import AirtableClient
+
+PAGES = [
+    [
+        {"id": "rec1", "fields": {"Name": "a", "Count": 1}},
+        {"id": "rec2", "fields": {"Name": "b"}},
+    ],
+    [{"id": "rec3", "fields": {"Name": "c", "Notes": "late column"}}],
+]
+
+
+class FakeTable:
+    def __init__(self, pages):
+        self.pages = pages
+        self.deleted = []
+
+    def iterate(self, **options):
+        yield from deepcopy(self.pages)
+
+    def batch_delete(self, record_ids):
+        self.deleted.extend(record_ids)
+        self.pages = [
+            [record for record in page if record["id"] not in record_ids]
+            for page in self.pages
+        ]
+        self.pages = [page for page in self.pages if page]
+        return [{"id": record_id, "deleted": True} for record_id in record_ids]
+
+
+@pytest.fixture
+def client(monkeypatch):
+    client = AirtableClient("fake_key")
+    client.MAX_REQUESTS_PER_SECOND = 10_000
+    table = FakeTable(PAGES)
+    monkeypatch.setattr(client.api, "table", lambda base, name: table)
+    client.fake_table = table
+    return client
+
+
+def test_export_csv_collects_late_columns(client, tmp_path):
+    destination = tmp_path / "out.csv"
+    assert client.export("base", "table", str(destination)) == 3
+
+    with open(destination) as f:
+        rows = list(csv.DictReader(f))
+
+    assert list(rows[0]) == ["Name", "Count", "Notes", "airtable_record_id"]
+    assert [row["airtable_record_id"] for row in rows] == ["rec1", "rec2", "rec3"]
+    assert rows[2]["Notes"] == "late column"
+    assert rows[1]["Count"] == ""
+
+
+def test_export_jsonl(client, tmp_path):
+    destination = tmp_path / "out.jsonl"
+    client.export(
+        "base", "table", str(destination), include_record_id=False, file_format="jsonl"
+    )
+
+    with open(destination) as f:
+        rows = [json.loads(line) for line in f]
+
+    assert rows == [record["fields"] for page in PAGES for record in page]
+
+
+def test_clear_table_deletes_every_page(client):
+    deleted = client.clear_table("base", "table")
+    assert [record["id"] for record in deleted] == ["rec1", "rec2", "rec3"]
+    assert client.fake_table.pages == []
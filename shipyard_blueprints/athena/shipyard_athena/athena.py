@@ -1,7 +1,11 @@
 import boto3
 import sys
-import time
-from shipyard_templates import Database, ShipyardLogger, ExitCodeException
+from shipyard_templates import (
+    Database,
+    ExitCodeException,
+    JobWaiter,
+    ShipyardLogger,
+)
 from shipyard_athena.errors import exceptions as errs
 from typing import Dict, Optional
 
@@ -117,15 +121,7 @@ class AthenaClient(Database):
         logger.debug("Started query execution")
         job_id = job["QueryExecutionId"]
         logger.debug(f"Fetched job ID {job_id}")
-        status = self._fetch_query_execution_status(job_id)
-        logger.debug(f"Query status is {status}")
-        while status in self.active:
-            time.sleep(5)
-            logger.debug("Waiting another 5 seconds to check query status")
-            status = self._fetch_query_execution_status(job_id)
-            logger.debug(f"Query status is {status}")
-            if status == "SUCCEEDED":
-                break
+        status = self._wait_for_query(job_id)
         return status
 
     def fetch(
@@ -156,15 +152,7 @@ class AthenaClient(Database):
                 query=query, database=database, log_folder=log_folder
             )
             job_id = job["QueryExecutionId"]
-            status = self._fetch_query_execution_status(job_id)
-            logger.debug(f"Query status is {status}")
-            while status in self.active:
-                time.sleep(5)
-                logger.debug("Waiting another 5 seconds to check query status")
-                status = self._fetch_query_execution_status(job_id)
-                logger.debug(f"Query status is {status}")
-                if status == "SUCCEEDED":
-                    break
+            self._wait_for_query(job_id)
             response = self.s3.Bucket(self.bucket).download_file(
                 f'{log_folder}{"/" if log_folder else ""}{job_id}.csv', dest_path
             )
@@ -195,6 +183,23 @@ class AthenaClient(Database):
         elif state == "CANCELLED":
             raise errs.QueryCancelled
 
+    def _wait_for_query(self, job_id: str):
+        """Polls the query until it leaves the active statuses, quickly at first so short
+        queries return promptly, then backing off to every 5 seconds
+
+        Args:
+            job_id: The ID of the associated query to wait for
+        """
+
+        def check():
+            status = self._fetch_query_execution_status(job_id)
+            logger.debug(f"Query status is {status}")
+            return status
+
+        return JobWaiter(initial_interval=0.5, max_interval=5).wait(
+            check, lambda status: status not in self.active, description="Query"
+        )
+
     def _execute_query(
         self,
         query: str,
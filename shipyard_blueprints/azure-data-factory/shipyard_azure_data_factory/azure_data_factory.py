@@ -1,5 +1,3 @@
-import time
-
 from azure.identity import ClientSecretCredential
 from azure.mgmt.datafactory import DataFactoryManagementClient
 from shipyard_templates import Etl, ShipyardLogger, ExitCodeException
@@ -80,7 +78,7 @@ class AzureDataFactoryClient(Etl):
         :param data_factory_name: Data factory name
         :param pipeline_name: Pipeline name to be triggered
         :param wait_for_completion: If True, waits for the pipeline run to complete
-        :param wait_time: Time interval to wait before checking pipeline run status
+        :param wait_time: Longest interval, in minutes, between pipeline run status checks
         """
         try:
             run_response = self.adf_client.pipelines.create_run(
@@ -88,22 +86,15 @@ class AzureDataFactoryClient(Etl):
             )
             logger.info(f"Triggered pipeline run with ID: {run_response.run_id}")
             if wait_for_completion:
-                run_status = self.determine_sync_status(
-                    resource_group, data_factory_name, run_response.run_id
-                )
-                while run_status not in {
-                    "Succeeded",
-                    "Failed",
-                    "Cancelled",
-                    "Canceling",
-                }:
-                    logger.info(
-                        f"Waiting {wait_time} minute(s) before checking pipeline run status..."
-                    )
-                    time.sleep(wait_time * 60)
-                    run_status = self.determine_sync_status(
+                self.wait_for_job(
+                    lambda: self.determine_sync_status(
                         resource_group, data_factory_name, run_response.run_id
-                    )
+                    ),
+                    lambda run_status: run_status
+                    in {"Succeeded", "Failed", "Cancelled", "Canceling"},
+                    description=f"Pipeline run {run_response.run_id}",
+                    max_interval=wait_time * 60,
+                )
         except ExitCodeException as e:
             raise e
         except Exception as e:
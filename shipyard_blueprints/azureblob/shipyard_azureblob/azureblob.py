@@ -1,13 +1,28 @@
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Tuple
 
-from azure.core.exceptions import ResourceNotFoundError, ResourceExistsError
-from azure.storage.blob import BlobServiceClient, ContainerClient
+from azure.core.exceptions import HttpResponseError, ResourceNotFoundError
+from azure.storage.blob import BlobServiceClient, ContainerClient, ContentSettings
 from shipyard_templates import CloudStorage, ShipyardLogger, ExitCodeException
 
 from shipyard_azureblob import exceptions
 
 logger = ShipyardLogger().get_logger()
 
+# Number of blobs copied, deleted, uploaded or downloaded at the same time by the *_many methods
+DEFAULT_MAX_WORKERS = 16
+# Number of parallel block uploads / ranged reads used for a single large blob
+TRANSFER_MAX_CONCURRENCY = 4
+MAX_BLOCK_SIZE = 8 * 1024 * 1024
+MAX_SINGLE_PUT_SIZE = 64 * 1024 * 1024
+MAX_CHUNK_GET_SIZE = 8 * 1024 * 1024
+# The Blob Batch API accepts at most 256 sub-requests per batch
+DELETE_BATCH_SIZE = 256
+COPY_POLL_INTERVAL_SECONDS = 1
+COPY_TIMEOUT_SECONDS = 60 * 60
+
 
 class AzureBlobClient(CloudStorage):
     def __init__(self, connection_string: str, container_name: str = None) -> None:
@@ -31,7 +46,10 @@ class AzureBlobClient(CloudStorage):
             )
             try:
                 self._service_account = BlobServiceClient.from_connection_string(
-                    conn_str=self.connection_string
+                    conn_str=self.connection_string,
+                    max_block_size=MAX_BLOCK_SIZE,
+                    max_single_put_size=MAX_SINGLE_PUT_SIZE,
+                    max_chunk_get_size=MAX_CHUNK_GET_SIZE,
                 )
                 logger.debug("Successfully connected to Azure service account")
             except Exception as e:
@@ -93,7 +111,9 @@ class AzureBlobClient(CloudStorage):
     def move(self, source_full_path: str, destination_full_path: str) -> None:
         """
         Moves a single blob inside the same Azure Storage Blob Container.
-        Since there's no move function, this function is a combination of copy and delete
+        Since there's no move function, this function is a combination of copy and delete.
+        The copy is performed server side; copies within the same storage account usually
+        complete immediately, otherwise the copy status is polled until it finishes.
 
         Args:
             source_full_path (str): The full path of the blob to be moved
@@ -108,25 +128,60 @@ class AzureBlobClient(CloudStorage):
         source = self.container.get_blob_client(source_full_path)
         destination = self.container.get_blob_client(destination_full_path)
 
-        destination.start_copy_from_url(source.url, requires_sync=True)
-        copy_job = destination.get_blob_properties().copy
+        copy_job = destination.start_copy_from_url(source.url)
+        copy_status = copy_job["copy_status"]
+        deadline = time.monotonic() + COPY_TIMEOUT_SECONDS
+        while copy_status == "pending" and time.monotonic() < deadline:
+            time.sleep(COPY_POLL_INTERVAL_SECONDS)
+            copy_status = destination.get_blob_properties().copy.status
 
-        logger.debug(f"Copy status: {copy_job.status}")
-        if copy_job.status != "success":
-            destination.abort_copy(copy_job.id)
+        logger.debug(f"Copy status: {copy_status}")
+        if copy_status != "success":
+            if copy_status == "pending":
+                destination.abort_copy(copy_job["copy_id"])
             raise exceptions.MoveError(
-                f"Copy blob from {source_full_path} failed with status {copy_job.status}"
+                f"Copy blob from {source_full_path} failed with status {copy_status}"
             )
         source.delete_blob()
         logger.info(f"Successfully moved {source.blob_name} to {destination.blob_name}")
 
-    def upload(self, source_full_path: str, destination_full_path: str) -> None:
+    def move_many(
+        self, moves: List[Tuple[str, str]], max_workers: int = DEFAULT_MAX_WORKERS
+    ) -> None:
         """
-        Uploads a single file to Azure Storage Blob.
+        Moves many blobs inside the container concurrently.
+
+        Args:
+            moves: (source_full_path, destination_full_path) pairs
+            max_workers: The number of blobs moved at the same time
+
+        Raises:
+            exceptions.MoveError: If any of the moves fail
+        """
+        failures = _run_concurrently(
+            lambda move: self.move(*move), moves, max_workers, "Moved"
+        )
+        if failures:
+            raise exceptions.MoveError(
+                f"Failed to move {len(failures)} of {len(moves)} blobs. "
+                f"First failure: {failures[0][0][0]}: {failures[0][1]}"
+            )
+
+    def upload(
+        self,
+        source_full_path: str,
+        destination_full_path: str,
+        content_md5: Optional[str] = None,
+    ) -> None:
+        """
+        Uploads a single file to Azure Storage Blob, overwriting the blob if it already exists.
+        Large files are streamed in blocks that are uploaded in parallel.
 
         Args:
             source_full_path (str): The full path of the file to be uploaded
             destination_full_path (str): The full path of the file to be uploaded to
+            content_md5 (str, optional): The hex MD5 of the file, recorded as the blob's
+                Content-MD5. Azure only sets it itself for files sent in a single request.
 
         Raises:
             exceptions.UploadError: If the upload operation fails
@@ -134,24 +189,20 @@ class AzureBlobClient(CloudStorage):
         try:
             blob = self.container.get_blob_client(destination_full_path)
 
+            options = {}
+            if content_md5:
+                options["content_settings"] = ContentSettings(
+                    content_md5=bytearray.fromhex(content_md5)
+                )
             with open(source_full_path, "rb") as data:
-                blob.upload_blob(data)
+                blob.upload_blob(
+                    data,
+                    overwrite=True,
+                    max_concurrency=TRANSFER_MAX_CONCURRENCY,
+                    **options,
+                )
         except ExitCodeException:
             raise
-        except ResourceExistsError:
-            logger.info(
-                f'File "{destination_full_path}" already exists in the container. Overwriting...'
-            )
-            try:
-                blob.delete_blob()
-                with open(source_full_path, "rb") as data:
-                    blob.upload_blob(data)
-            except Exception as e:
-                raise exceptions.UploadError(
-                    f"Failed to upload {source_full_path} to {self.container_name}/{destination_full_path}. "
-                    f"Response from Azure: {e}"
-                ) from e
-
         except Exception as e:
             raise exceptions.UploadError(
                 f"Failed to upload {source_full_path} to {self.container_name}/{destination_full_path}. "
@@ -162,10 +213,33 @@ class AzureBlobClient(CloudStorage):
             f"{source_full_path} successfully uploaded to {self.container_name}/{destination_full_path}"
         )
 
+    def upload_many(
+        self, uploads: List[Tuple[str, ...]], max_workers: int = DEFAULT_MAX_WORKERS
+    ) -> None:
+        """
+        Uploads many files concurrently.
+
+        Args:
+            uploads: (source_full_path, destination_full_path) pairs, optionally followed by
+                the content_md5 to record on the blob
+            max_workers: The number of files uploaded at the same time
+
+        Raises:
+            exceptions.UploadError: If any of the uploads fail
+        """
+        failures = _run_concurrently(
+            lambda upload: self.upload(*upload), uploads, max_workers, "Uploaded"
+        )
+        if failures:
+            raise exceptions.UploadError(
+                f"Failed to upload {len(failures)} of {len(uploads)} files. "
+                f"First failure: {failures[0][0][0]}: {failures[0][1]}"
+            )
+
     def download(self, file_name: str, destination_file_name: str) -> None:
         """
-        Download a selected file from Google Cloud Storage to local storage in
-        the current working directory.
+        Download a selected file from Azure Storage Blob to local storage in
+        the current working directory. Large blobs are fetched with parallel ranged reads.
 
         Args:
             file_name (str): The name of the file to be downloaded
@@ -175,7 +249,7 @@ class AzureBlobClient(CloudStorage):
         local_path = os.path.normpath(f"{os.getcwd()}/{destination_file_name}")
         blob = self.container.get_blob_client(file_name)
         try:
-            blob_data = blob.download_blob()
+            blob_data = blob.download_blob(max_concurrency=TRANSFER_MAX_CONCURRENCY)
         except ResourceNotFoundError as e:
             raise exceptions.NoFilesFoundError(
                 f"File {file_name} not found in {self.container_name}"
@@ -187,6 +261,44 @@ class AzureBlobClient(CloudStorage):
             f"{self.container_name}/{file_name} successfully downloaded to {local_path}"
         )
 
+    def download_many(
+        self, downloads: List[Tuple[str, str]], max_workers: int = DEFAULT_MAX_WORKERS
+    ) -> None:
+        """
+        Downloads many blobs concurrently.
+
+        Args:
+            downloads: (file_name, destination_file_name) pairs
+            max_workers: The number of blobs downloaded at the same time
+
+        Raises:
+            exceptions.NoFilesFoundError: If any of the blobs no longer exist
+            exceptions.UnknownException: If any of the downloads fail for another reason
+        """
+        failures = _run_concurrently(
+            lambda download: self.download(*download),
+            downloads,
+            max_workers,
+            "Downloaded",
+        )
+        for _, error in failures:
+            if isinstance(error, ExitCodeException):
+                raise error
+        if failures:
+            raise exceptions.UnknownException(failures[0][1])
+
+    def blob_md5(self, file_name: str) -> Optional[str]:
+        """
+        Returns the Content-MD5 of a blob as hex, for comparison with a local file, or None
+        when the blob does not exist or has no Content-MD5.
+        """
+        try:
+            properties = self.container.get_blob_client(file_name).get_blob_properties()
+        except ResourceNotFoundError:
+            return None
+        content_md5 = properties.content_settings.content_md5
+        return bytes(content_md5).hex() if content_md5 else None
+
     def find_blob_file_names(self, prefix="") -> list[str]:
         """
         Fetched all the files in the bucket which are returned in a list as
@@ -232,3 +344,86 @@ class AzureBlobClient(CloudStorage):
             raise exceptions.DeleteError(
                 f"Failed to delete {file_name} from {self.container_name}. Response from Azure: {e}"
             ) from e
+
+    def remove_many(self, file_names: List[str]) -> None:
+        """
+        Deletes many blobs using the Blob Batch API, which deletes up to 256 blobs per request.
+        Storage accounts and emulators that reject batch requests (e.g. Azurite) fall back to
+        deleting each blob concurrently.
+
+        Args:
+            file_names: The names of the blobs to be deleted
+
+        Raises:
+            exceptions.DeleteError: If any of the blobs could not be deleted
+        """
+        failures: Dict[str, str] = {}
+        for start in range(0, len(file_names), DELETE_BATCH_SIZE):
+            batch = file_names[start : start + DELETE_BATCH_SIZE]
+            try:
+                responses = list(
+                    self.container.delete_blobs(*batch, raise_on_any_failure=False)
+                )
+            except HttpResponseError as e:
+                logger.warning(
+                    f"The Blob Batch API is not available for {self.container_name} "
+                    f"({e.status_code} {e.reason}). Deleting blobs one at a time instead."
+                )
+                failures.update(self._remove_each(file_names[start:]))
+                break
+            except ExitCodeException:
+                raise
+            except Exception as e:
+                raise exceptions.DeleteError(
+                    f"Failed to delete blobs from {self.container_name}. Response from Azure: {e}"
+                ) from e
+            for file_name, response in zip(batch, responses):
+                if response.status_code not in (200, 202):
+                    failures[file_name] = f"{response.status_code} {response.reason}"
+            logger.info(
+                f"Deleted {start + len(batch) - len(failures)} of {len(file_names)} blobs"
+            )
+
+        if failures:
+            for file_name, reason in failures.items():
+                logger.error(f"Failed to delete {file_name}: {reason}")
+            raise exceptions.DeleteError(
+                f"Failed to delete {len(failures)} of {len(file_names)} blobs from {self.container_name}"
+            )
+
+    def _remove_each(
+        self, file_names: List[str], max_workers: int = DEFAULT_MAX_WORKERS
+    ) -> Dict[str, str]:
+        """Deletes each blob with its own request, returning the error of each one that failed"""
+        failures = _run_concurrently(
+            lambda job: self.container.delete_blob(job[0]),
+            [(file_name,) for file_name in file_names],
+            max_workers,
+            "Deleted",
+        )
+        return {job[0]: str(e) for job, e in failures}
+
+
+def _run_concurrently(
+    operation: Callable, jobs: List, max_workers: int, verb: str
+) -> List[Tuple]:
+    """
+    Runs `operation` for every job on a bounded pool of threads, logging progress.
+    Every job is attempted; the (job, exception) pairs of the ones that failed are returned.
+    """
+
+    def run(job):
+        try:
+            operation(job)
+        except Exception as e:
+            logger.error(f"{job[0]}: {e}")
+            return job, e
+
+    failures = []
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for completed, failure in enumerate(executor.map(run, jobs), start=1):
+            if failure:
+                failures.append(failure)
+            if completed % 100 == 0 or completed == len(jobs):
+                logger.info(f"{verb} {completed - len(failures)} of {len(jobs)} blobs")
+    return failures
@@ -5,6 +5,7 @@ from shipyard_bp_utils import files as shipyard
 from shipyard_templates import ShipyardLogger, ExitCodeException
 
 from shipyard_azureblob import AzureBlobClient, exceptions
+from shipyard_azureblob.azureblob import DEFAULT_MAX_WORKERS
 
 logger = ShipyardLogger().get_logger()
 
@@ -38,6 +39,13 @@ def get_args():
     parser.add_argument(
         "--connection-string", dest="connection_string", default=None, required=True
     )
+    parser.add_argument(
+        "--max-workers",
+        dest="max_workers",
+        type=int,
+        default=DEFAULT_MAX_WORKERS,
+        required=False,
+    )
     return parser.parse_args()
 
 
@@ -78,26 +86,26 @@ def main():
                 file_names, args.source_file_name
             )
 
-            if number_of_matches := len(matching_file_names) == 0:
+            number_of_matches = len(matching_file_names)
+            if number_of_matches == 0:
                 raise exceptions.NoFilesFoundError(
                     f"No files found matching the regex {args.source_file_name}"
                 )
 
             logger.info(f"{number_of_matches} files found. Preparing to download...")
-
-            for index, file_name in enumerate(matching_file_names, start=1):
-                destination_name = shipyard.determine_destination_full_path(
-                    destination_folder_name=destination_folder_name,
-                    destination_file_name=args.destination_file_name,
-                    source_full_path=file_name,
-                    file_number=index if number_of_matches > 1 else None,
-                )
-
-                logger.info(f"Downloading file {index} of {number_of_matches}")
-                client.download(
-                    file_name=file_name,
-                    destination_file_name=destination_name,
+            downloads = [
+                (
+                    file_name,
+                    shipyard.determine_destination_full_path(
+                        destination_folder_name=destination_folder_name,
+                        destination_file_name=args.destination_file_name,
+                        source_full_path=file_name,
+                        file_number=index if number_of_matches > 1 else None,
+                    ),
                 )
+                for index, file_name in enumerate(matching_file_names, start=1)
+            ]
+            client.download_many(downloads, max_workers=args.max_workers)
     except ExitCodeException as e:
         logger.error(e)
         sys.exit(e.exit_code)
@@ -6,6 +6,7 @@ from shipyard_bp_utils import files as shipyard
 from shipyard_templates import ShipyardLogger, ExitCodeException
 
 from shipyard_azureblob import AzureBlobClient, exceptions
+from shipyard_azureblob.azureblob import DEFAULT_MAX_WORKERS
 
 logger = ShipyardLogger().get_logger()
 
@@ -39,6 +40,13 @@ def get_args():
     parser.add_argument(
         "--connection-string", dest="connection_string", default=None, required=True
     )
+    parser.add_argument(
+        "--max-workers",
+        dest="max_workers",
+        type=int,
+        default=DEFAULT_MAX_WORKERS,
+        required=False,
+    )
     return parser.parse_args()
 
 
@@ -72,24 +80,26 @@ def main():
             matching_file_names = shipyard.find_all_file_matches(
                 file_names, re.compile(source_file_name)
             )
-            if number_of_matches := len(matching_file_names) == 0:
+            number_of_matches = len(matching_file_names)
+            if number_of_matches == 0:
                 raise exceptions.NoFilesFoundError(
                     f"No files matching {source_file_name} found"
                 )
 
-            logger.info("Preparing to move...")
-            for index, key_name in enumerate(matching_file_names, 1):
-                destination_full_path = shipyard.determine_destination_full_path(
-                    destination_folder_name=destination_folder_name,
-                    destination_file_name=args.destination_file_name,
-                    source_full_path=key_name,
-                    file_number=index if number_of_matches > 1 else None,
-                )
-                logger.info(f"Moving file {index} of {len(matching_file_names)}")
-                client.move(
-                    source_full_path=key_name,
-                    destination_full_path=destination_full_path,
+            logger.info(f"{number_of_matches} files found. Preparing to move...")
+            moves = [
+                (
+                    key_name,
+                    shipyard.determine_destination_full_path(
+                        destination_folder_name=destination_folder_name,
+                        destination_file_name=args.destination_file_name,
+                        source_full_path=key_name,
+                        file_number=index if number_of_matches > 1 else None,
+                    ),
                 )
+                for index, key_name in enumerate(matching_file_names, 1)
+            ]
+            client.move_many(moves, max_workers=args.max_workers)
     except ExitCodeException as e:
         logger.error(e)
         sys.exit(e.exit_code)
@@ -48,14 +48,13 @@ def main():
         matching_file_names = shipyard.find_all_file_matches(
             file_names, re.compile(args.source_file_name)
         )
-        if number_of_matches := len(matching_file_names) == 0:
+        number_of_matches = len(matching_file_names)
+        if number_of_matches == 0:
             logger.error("No file matches found")
             sys.exit(client.EXIT_CODE_FILE_MATCH_ERROR)
 
         logger.info(f"{number_of_matches} files found. Preparing to delete...")
-        for index, file_name in enumerate(matching_file_names, start=1):
-            logger.info(f"Deleting file {index} of {number_of_matches}")
-            client.remove(file_name=file_name)
+        client.remove_many(matching_file_names)
 
 
 if __name__ == "__main__":
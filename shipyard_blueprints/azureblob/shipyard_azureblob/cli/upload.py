@@ -7,6 +7,7 @@ from shipyard_bp_utils import files as shipyard
 from shipyard_templates import ShipyardLogger, ExitCodeException
 
 from shipyard_azureblob import AzureBlobClient, exceptions
+from shipyard_azureblob.azureblob import DEFAULT_MAX_WORKERS
 
 logger = ShipyardLogger().get_logger()
 
@@ -40,9 +41,41 @@ def get_args():
     parser.add_argument(
         "--connection-string", dest="connection_string", default=None, required=True
     )
+    parser.add_argument(
+        "--max-workers",
+        dest="max_workers",
+        type=int,
+        default=DEFAULT_MAX_WORKERS,
+        required=False,
+    )
+    parser.add_argument(
+        "--sync",
+        dest="sync",
+        default="no",
+        choices={"yes", "no"},
+        required=False,
+        help="Only upload files whose content differs from the existing blob",
+    )
     return parser.parse_args()
 
 
+def sync_uploads(client: AzureBlobClient, uploads: list, max_workers: int) -> list:
+    """
+    Returns the (source, destination, md5) uploads whose blob is missing or has a different
+    Content-MD5. The MD5 is recorded on the uploaded blob, as Azure leaves it empty for files
+    sent in blocks, so those blobs are only uploaded again on the first sync.
+    """
+    cache = shipyard.HashCache()
+    changed = shipyard.files_to_sync(
+        uploads, client.blob_md5, cache=cache, max_workers=max_workers
+    )
+    uploads = [
+        (source, destination, cache.get(source)) for source, destination in changed
+    ]
+    cache.save()
+    return uploads
+
+
 def main():
     try:
         args = get_args()
@@ -62,36 +95,40 @@ def main():
                 destination_file_name=args.destination_file_name,
                 source_full_path=source_full_path,
             )
-            client.upload(
-                source_full_path=source_full_path,
-                destination_full_path=destination_full_path,
-            )
+            uploads = [(source_full_path, destination_full_path)]
+            if args.sync == "yes":
+                uploads = sync_uploads(client, uploads, args.max_workers)
+            for upload in uploads:
+                client.upload(*upload)
         elif args.source_file_name_match_type == "regex_match":
             file_names = shipyard.find_all_local_file_names(source_folder_name)
             matching_file_names = shipyard.find_all_file_matches(
                 file_names, re.compile(args.source_file_name)
             )
 
-            if number_of_matches := len(matching_file_names) == 0:
+            number_of_matches = len(matching_file_names)
+            if number_of_matches == 0:
                 raise exceptions.NoFilesFoundError(
                     f"No file matches found for "
                     f"{args.source_file_name} in {source_folder_name}"
                 )
 
             logger.info(f"{number_of_matches} files found. Preparing to upload...")
-
-            for index, key_name in enumerate(matching_file_names, start=1):
-                destination_full_path = shipyard.determine_destination_full_path(
-                    destination_folder_name=destination_folder_name,
-                    destination_file_name=args.destination_file_name,
-                    source_full_path=key_name,
-                    file_number=index if number_of_matches > 1 else None,
-                )
-                logger.info(f"Uploading file {index} of {number_of_matches}")
-                client.upload(
-                    source_full_path=key_name,
-                    destination_full_path=destination_full_path,
+            uploads = [
+                (
+                    key_name,
+                    shipyard.determine_destination_full_path(
+                        destination_folder_name=destination_folder_name,
+                        destination_file_name=args.destination_file_name,
+                        source_full_path=key_name,
+                        file_number=index if number_of_matches > 1 else None,
+                    ),
                 )
+                for index, key_name in enumerate(matching_file_names, start=1)
+            ]
+            if args.sync == "yes":
+                uploads = sync_uploads(client, uploads, args.max_workers)
+            client.upload_many(uploads, max_workers=args.max_workers)
 
     except ExitCodeException as e:
         logger.error(e)
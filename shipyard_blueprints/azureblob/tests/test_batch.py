@@ -0,0 +1,97 @@
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+from azure.core.exceptions import HttpResponseError, ResourceNotFoundError
+
+from shipyard_azureblob import AzureBlobClient, exceptions
+from shipyard_azureblob import azureblob
+
+
+def make_client():
+    client = AzureBlobClient(connection_string="unused", container_name="container")
+    client._container = MagicMock()
+    return client
+
+
+def test_remove_many_batches_deletes():
+    client = make_client()
+    client._container.delete_blobs.side_effect = lambda *names, **kwargs: [
+        SimpleNamespace(status_code=202, reason="Accepted") for _ in names
+    ]
+    file_names = [f"blob_{index}" for index in range(azureblob.DELETE_BATCH_SIZE + 5)]
+
+    client.remove_many(file_names)
+
+    batches = [call.args for call in client._container.delete_blobs.call_args_list]
+    assert [len(batch) for batch in batches] == [azureblob.DELETE_BATCH_SIZE, 5]
+    assert [name for batch in batches for name in batch] == file_names
+
+
+def test_remove_many_reports_failed_blobs():
+    client = make_client()
+    client._container.delete_blobs.return_value = [
+        SimpleNamespace(status_code=202, reason="Accepted"),
+        SimpleNamespace(status_code=404, reason="Not Found"),
+    ]
+
+    with pytest.raises(exceptions.DeleteError, match="1 of 2"):
+        client.remove_many(["a", "b"])
+
+
+def test_remove_many_falls_back_when_batch_is_rejected():
+    client = make_client()
+    client._container.delete_blobs.side_effect = HttpResponseError(
+        message="Batch is not supported"
+    )
+
+    def delete_blob(name):
+        if name == "b":
+            raise ResourceNotFoundError("missing")
+
+    client._container.delete_blob.side_effect = delete_blob
+
+    with pytest.raises(exceptions.DeleteError, match="1 of 3"):
+        client.remove_many(["a", "b", "c"])
+
+    client._container.delete_blobs.assert_called_once()
+    deleted = sorted(
+        call.args[0] for call in client._container.delete_blob.call_args_list
+    )
+    assert deleted == ["a", "b", "c"]
+
+
+def test_move_many_attempts_every_blob(monkeypatch):
+    client = make_client()
+    moved = []
+
+    def move(source_full_path, destination_full_path):
+        if source_full_path == "bad":
+            raise exceptions.MoveError("copy failed")
+        moved.append((source_full_path, destination_full_path))
+
+    monkeypatch.setattr(client, "move", move)
+
+    with pytest.raises(exceptions.MoveError, match="1 of 3"):
+        client.move_many([("a", "x/a"), ("bad", "x/bad"), ("c", "x/c")])
+    assert sorted(moved) == [("a", "x/a"), ("c", "x/c")]
+
+
+def test_move_polls_pending_copy(monkeypatch):
+    monkeypatch.setattr(azureblob, "COPY_POLL_INTERVAL_SECONDS", 0)
+    client = make_client()
+    source, destination = MagicMock(), MagicMock()
+    client._container.get_blob_client.side_effect = [source, destination]
+    destination.start_copy_from_url.return_value = {
+        "copy_status": "pending",
+        "copy_id": "1",
+    }
+    destination.get_blob_properties.side_effect = [
+        SimpleNamespace(copy=SimpleNamespace(status="pending")),
+        SimpleNamespace(copy=SimpleNamespace(status="success")),
+    ]
+
+    client.move("a", "b")
+
+    assert destination.get_blob_properties.call_count == 2
+    source.delete_blob.assert_called_once()
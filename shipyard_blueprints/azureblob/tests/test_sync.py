@@ -0,0 +1,54 @@
+import hashlib
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from azure.core.exceptions import ResourceNotFoundError
+from shipyard_bp_utils.files import HashCache
+
+from shipyard_azureblob import AzureBlobClient
+from shipyard_azureblob.cli import upload
+
+
+def make_client(remote_md5s):
+    client = AzureBlobClient(connection_string="unused", container_name="container")
+    client._container = MagicMock()
+
+    def get_blob_client(name):
+        blob = MagicMock()
+        if name not in remote_md5s:
+            blob.get_blob_properties.side_effect = ResourceNotFoundError("missing")
+        else:
+            blob.get_blob_properties.return_value = SimpleNamespace(
+                content_settings=SimpleNamespace(content_md5=remote_md5s[name])
+            )
+        return blob
+
+    client._container.get_blob_client.side_effect = get_blob_client
+    return client
+
+
+def test_sync_uploads_only_changed_files_with_their_md5(tmp_path, monkeypatch):
+    monkeypatch.setenv("SHIPYARD_HASH_CACHE_PATH", str(tmp_path / "hashes.json"))
+    same, changed, missing = (tmp_path / name for name in ("same", "changed", "new"))
+    for path in (same, changed, missing):
+        path.write_bytes(path.name.encode())
+    client = make_client(
+        {
+            "same": bytearray(hashlib.md5(b"same").digest()),
+            "changed": bytearray(hashlib.md5(b"old").digest()),
+            "unhashed": None,
+        }
+    )
+
+    uploads = upload.sync_uploads(
+        client,
+        [(str(same), "same"), (str(changed), "changed"), (str(missing), "new")],
+        max_workers=2,
+    )
+
+    assert uploads == [
+        (str(changed), "changed", hashlib.md5(b"changed").hexdigest()),
+        (str(missing), "new", hashlib.md5(b"new").hexdigest()),
+    ]
+    assert client.blob_md5("unhashed") is None
+    assert HashCache().get(str(same)) == hashlib.md5(b"same").hexdigest()
@@ -1,8 +1,13 @@
+import contextlib
+import gzip
 import json
+import os
+import shutil
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from google.cloud.bigquery.table import RowIterator
 from google.api_core.exceptions import BadRequest
-import pandas as pd
-from typing import Optional, Dict, Union, List
+from typing import TYPE_CHECKING, Optional, Dict, Union, List
 from google.cloud import bigquery
 from google.oauth2 import service_account, credentials
 from shipyard_templates import GoogleDatabase, ShipyardLogger, ExitCodeException
@@ -16,8 +21,17 @@ from shipyard_bigquery.utils.exceptions import (
     TempTableCreationError,
 )
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 logger = ShipyardLogger.get_logger()
 
+# Number of load jobs that are uploaded and run at the same time by upload_many
+DEFAULT_MAX_CONCURRENT_LOADS = 10
+# Rows requested per page when streaming query results without the Storage Read API
+DEFAULT_PAGE_SIZE = 50_000
+DOWNLOAD_FILE_FORMATS = ("csv", "parquet")
+
 
 class BigQueryClient(GoogleDatabase):
     def __init__(
@@ -84,7 +98,7 @@ class BigQueryClient(GoogleDatabase):
         else:
             return results
 
-    def fetch(self, query: str) -> pd.DataFrame:
+    def fetch(self, query: str) -> "pd.DataFrame":
         """Returns the results of a query to a pandas dataframe
 
         Args:
@@ -100,6 +114,108 @@ class BigQueryClient(GoogleDatabase):
         else:
             return df
 
+    def download(
+        self,
+        query: str,
+        destination_path: str,
+        file_format: str = "csv",
+        page_size: int = DEFAULT_PAGE_SIZE,
+        extract_bucket_name: Optional[str] = None,
+        extract_threshold_bytes: Optional[int] = None,
+    ) -> str:
+        """Runs a query and streams the results to a local CSV or Parquet file
+
+        Results are written one page (or Storage Read API record batch, when the
+        google-cloud-bigquery-storage package is installed) at a time, so memory use does not
+        grow with the size of the result.
+
+        Args:
+            query: The query to execute
+            destination_path: The local file to write the results to
+            file_format: Either 'csv' or 'parquet'
+            page_size: The number of rows requested per page
+            extract_bucket_name: An optional GCS bucket. Results larger than
+                extract_threshold_bytes are extracted there instead of being downloaded
+            extract_threshold_bytes: The result size above which results are extracted to GCS
+
+        Returns: Where the results were written: destination_path, or the GCS URI pattern of
+            the extracted files when they were extracted to GCS instead
+
+        """
+        if file_format not in DOWNLOAD_FILE_FORMATS:
+            raise ValueError(
+                f"File format {file_format} is not supported. Choose from {DOWNLOAD_FILE_FORMATS}"
+            )
+        try:
+            query_job = self.conn.query(query)
+            rows = query_job.result(page_size=page_size)
+        except Exception as e:
+            raise QueryError(f"Error in executing query: {str(e)}")
+
+        # DDL, DML and scripts have no destination table to measure or extract
+        if (
+            extract_bucket_name
+            and extract_threshold_bytes is not None
+            and query_job.destination is not None
+        ):
+            result_bytes = self.conn.get_table(query_job.destination).num_bytes or 0
+            if result_bytes >= extract_threshold_bytes:
+                logger.info(
+                    f"Query results are {result_bytes} bytes, extracting them to GCS instead of downloading"
+                )
+                return self._extract_results(
+                    query_job, extract_bucket_name, destination_path, file_format
+                )
+
+        try:
+            if file_format == "parquet":
+                rows_written = _write_parquet(
+                    rows, destination_path, self._read_client()
+                )
+            else:
+                rows_written = _write_csv(rows, destination_path, self._read_client())
+        except Exception as e:
+            raise FetchError(f"Error in fetching query: {str(e)}")
+        logger.info(f"Wrote {rows_written} rows to {destination_path}")
+        return destination_path
+
+    def _read_client(self):
+        """Returns a BigQuery Storage Read API client if the optional package is installed"""
+        try:
+            from google.cloud import bigquery_storage
+        except ImportError:
+            logger.debug(
+                "google-cloud-bigquery-storage is not installed, paging results over the REST API"
+            )
+            return None
+        return bigquery_storage.BigQueryReadClient(credentials=self.credentials)
+
+    def _extract_results(
+        self, query_job, bucket_name: str, destination_path: str, file_format: str
+    ) -> str:
+        """Extracts the query's result table to sharded files in GCS"""
+        file_name = os.path.splitext(os.path.basename(destination_path))[0]
+        extension = "parquet" if file_format == "parquet" else "csv"
+        dest_uri = f"gs://{bucket_name}/{file_name}-*.{extension}"
+        job_config = bigquery.ExtractJobConfig(
+            destination_format=(
+                bigquery.DestinationFormat.PARQUET
+                if file_format == "parquet"
+                else bigquery.DestinationFormat.CSV
+            )
+        )
+        try:
+            self.conn.extract_table(
+                query_job.destination,
+                dest_uri,
+                location=query_job.location,
+                job_config=job_config,
+            ).result()
+        except Exception as e:
+            raise DownloadToGcsError(f"Error downloading file to GCS: {str(e)}")
+        logger.info(f"Extracted query results to {dest_uri}")
+        return dest_uri
+
     def upload(
         self,
         file: str,
@@ -109,6 +225,7 @@ class BigQueryClient(GoogleDatabase):
         skip_header_rows: Optional[int] = None,
         schema: Optional[Union[List[List], Dict[str, str]]] = None,
         quoted_newline: bool = False,
+        compress: bool = False,
     ):
         """Upload a file to a table in BigQuery
         Args:
@@ -119,31 +236,119 @@ class BigQueryClient(GoogleDatabase):
             schema: The optional schema of the table to be loaded
             skip_header_rows: Whether to skip the header row
             quoted_newline: Whether newline characters should be quoted
+            compress: Whether to gzip the file before sending it to BigQuery
         """
-        try:
-            dataset_ref = self.conn.dataset(dataset)
-            table_ref = dataset_ref.table(table)
-            job_config = bigquery.LoadJobConfig()
+        with self._upload_errors():
+            job_config = self._load_job_config(
+                upload_type, skip_header_rows, schema, quoted_newline
+            )
+            self._load_file(file, dataset, table, job_config, compress)
 
-            if upload_type == "overwrite":
-                job_config.write_disposition = bigquery.WriteDisposition.WRITE_TRUNCATE
-            else:
-                job_config.write_disposition = bigquery.WriteDisposition.WRITE_APPEND
-            job_config.source_format = bigquery.SourceFormat.CSV
-            job_config.autodetect = True  # infer the schema
-            if skip_header_rows:
-                job_config.skip_leading_rows = skip_header_rows
-            if schema:
-                logger.debug(f"Schema is {schema}")
-                job_config.autodetect = False
-                job_config.schema = self._format_schema(schema)
-            if quoted_newline:
-                job_config.allow_quoted_newlines = True
-            with open(file, "rb") as source_file:
-                job = self.conn.load_table_from_file(
-                    source_file, table_ref, job_config=job_config
-                )
-            job.result()
+    def upload_many(
+        self,
+        files: List[str],
+        dataset: str,
+        table: str,
+        upload_type: str,
+        skip_header_rows: Optional[int] = None,
+        schema: Optional[Union[List[List], Dict[str, str]]] = None,
+        quoted_newline: bool = False,
+        compress: bool = False,
+        max_concurrent_loads: int = DEFAULT_MAX_CONCURRENT_LOADS,
+    ):
+        """Upload several files to the same table in BigQuery using concurrent load jobs
+
+        The first file is loaded on its own with the requested upload type so that an overwrite
+        truncates the table (and autodetect creates it) before anything else is written. The
+        remaining files are then uploaded and loaded concurrently as WRITE_APPEND jobs.
+
+        Args:
+            files: The files to load
+            dataset: The name of the dataset in BigQuery to upload to
+            table: The name of the table to write to
+            upload_type: Whether to append to or replace the data. Choices are 'overwrite' and 'append'
+            schema: The optional schema of the table to be loaded
+            skip_header_rows: Whether to skip the header row
+            quoted_newline: Whether newline characters should be quoted
+            compress: Whether to gzip each file before sending it to BigQuery
+            max_concurrent_loads: The maximum number of load jobs running at the same time
+        """
+        if not files:
+            return
+        with self._upload_errors():
+            first_config = self._load_job_config(
+                upload_type, skip_header_rows, schema, quoted_newline
+            )
+            self._load_file(files[0], dataset, table, first_config, compress)
+            logger.info(f"Loaded file 1 of {len(files)}")
+
+            append_config = self._load_job_config(
+                "append", skip_header_rows, schema, quoted_newline
+            )
+
+            def load(file):
+                try:
+                    self._load_file(file, dataset, table, append_config, compress)
+                except Exception as e:
+                    logger.error(f"Failed to load {file}: {e}")
+                    return e
+
+            with ThreadPoolExecutor(max_workers=max_concurrent_loads) as executor:
+                errors = [error for error in executor.map(load, files[1:]) if error]
+
+            logger.info(f"Loaded {len(files) - len(errors)} of {len(files)} files")
+            if errors:
+                raise errors[0]
+
+    def _load_job_config(
+        self,
+        upload_type: str,
+        skip_header_rows: Optional[int] = None,
+        schema: Optional[Union[List[List], Dict[str, str]]] = None,
+        quoted_newline: bool = False,
+    ) -> bigquery.LoadJobConfig:
+        job_config = bigquery.LoadJobConfig()
+
+        if upload_type == "overwrite":
+            job_config.write_disposition = bigquery.WriteDisposition.WRITE_TRUNCATE
+        else:
+            job_config.write_disposition = bigquery.WriteDisposition.WRITE_APPEND
+        job_config.source_format = bigquery.SourceFormat.CSV
+        job_config.autodetect = True  # infer the schema
+        if skip_header_rows:
+            job_config.skip_leading_rows = skip_header_rows
+        if schema:
+            logger.debug(f"Schema is {schema}")
+            job_config.autodetect = False
+            job_config.schema = self._format_schema(schema)
+        if quoted_newline:
+            job_config.allow_quoted_newlines = True
+        return job_config
+
+    def _load_file(
+        self,
+        file: str,
+        dataset: str,
+        table: str,
+        job_config: bigquery.LoadJobConfig,
+        compress: bool = False,
+    ):
+        """Runs a single load job and waits for it to finish"""
+        table_ref = self.conn.dataset(dataset).table(table)
+        with contextlib.ExitStack() as stack:
+            if compress:
+                file = stack.enter_context(_gzipped(file))
+            source_file = stack.enter_context(open(file, "rb"))
+            job = self.conn.load_table_from_file(
+                source_file, table_ref, job_config=job_config
+            )
+        job.result()
+
+    @contextlib.contextmanager
+    def _upload_errors(self):
+        """Translates errors raised while loading files into ExitCodeExceptions"""
+        try:
+            yield
         except SchemaValidationError:
             raise
         except SchemaFormatError:
@@ -235,3 +440,54 @@ class BigQueryClient(GoogleDatabase):
             )
         else:
             return project_id, dataset_id, table_id, location
+
+
+def _write_csv(rows: RowIterator, destination_path: str, bqstorage_client=None) -> int:
+    """Appends each page of results to the CSV, writing the header once"""
+    rows_written = 0
+    with open(destination_path, "w", newline="") as f:
+        for df in rows.to_dataframe_iterable(bqstorage_client=bqstorage_client):
+            df.to_csv(f, index=False, header=rows_written == 0)
+            rows_written += len(df)
+        if rows_written == 0:
+            f.write(",".join(field.name for field in rows.schema) + "\n")
+    return rows_written
+
+
+def _write_parquet(
+    rows: RowIterator, destination_path: str, bqstorage_client=None
+) -> int:
+    """Appends each Arrow record batch of results to the Parquet file as a row group"""
+    import pandas as pd
+
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    rows_written = 0
+    writer = None
+    try:
+        for batch in rows.to_arrow_iterable(bqstorage_client=bqstorage_client):
+            if writer is None:
+                writer = pq.ParquetWriter(destination_path, batch.schema)
+            writer.write_table(pa.Table.from_batches([batch]))
+            rows_written += batch.num_rows
+        if writer is None:
+            empty = pd.DataFrame(columns=[field.name for field in rows.schema])
+            pq.write_table(pa.Table.from_pandas(empty), destination_path)
+    finally:
+        if writer is not None:
+            writer.close()
+    return rows_written
+
+
+@contextlib.contextmanager
+def _gzipped(file: str):
+    """Yields the path of a gzip-compressed temporary copy of the file"""
+    fd, path = tempfile.mkstemp(suffix=".csv.gz")
+    try:
+        with open(file, "rb") as source, os.fdopen(fd, "wb") as raw:
+            with gzip.GzipFile(fileobj=raw, mode="wb", compresslevel=6) as destination:
+                shutil.copyfileobj(source, destination)
+        yield path
+    finally:
+        os.remove(path)
@@ -8,7 +8,6 @@ from shipyard_templates import ShipyardLogger, ExitCodeException
 from shipyard_bigquery import BigQueryClient
 from shipyard_bigquery.utils.creds import get_credentials
 
-
 logger = ShipyardLogger.get_logger()
 
 
@@ -28,6 +27,26 @@ def get_args():
         default="",
         required=False,
     )
+    parser.add_argument(
+        "--file-type",
+        dest="file_type",
+        default="csv",
+        choices={"csv", "parquet"},
+        required=False,
+    )
+    parser.add_argument(
+        "--extract-bucket-name",
+        dest="extract_bucket_name",
+        default=None,
+        required=False,
+    )
+    parser.add_argument(
+        "--extract-threshold-mb",
+        dest="extract_threshold_mb",
+        type=int,
+        default=1024,
+        required=False,
+    )
     return parser.parse_args()
 
 
@@ -44,9 +63,13 @@ def main():
         client.connect()
         logger.info("Successfully connected to BigQuery")
         logger.debug(f"Query is {args.query}")
-        df = client.fetch(args.query)
-        logger.debug(f"Shape of the data is {df.shape}")
-        df.to_csv(target_path, index=False)
+        target_path = client.download(
+            args.query,
+            target_path,
+            file_format=args.file_type,
+            extract_bucket_name=args.extract_bucket_name,
+            extract_threshold_bytes=args.extract_threshold_mb * 1024 * 1024,
+        )
     except ExitCodeException as ec:
         logger.error(ec.message)
         sys.exit(ec.exit_code)
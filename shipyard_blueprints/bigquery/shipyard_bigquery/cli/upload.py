@@ -8,6 +8,7 @@ import shipyard_bp_utils as shipyard
 from shipyard_templates import ShipyardLogger, ExitCodeException
 
 from shipyard_bigquery import BigQueryClient
+from shipyard_bigquery.bigquery import DEFAULT_MAX_CONCURRENT_LOADS
 from shipyard_bigquery.utils.exceptions import InvalidSchema, SchemaFormatError
 from shipyard_bigquery.utils.creds import get_credentials
 
@@ -44,6 +45,14 @@ def get_args():
     parser.add_argument(
         "--quoted-newline", dest="quoted_newline", default="FALSE", required=False
     )
+    parser.add_argument("--compress", dest="compress", default="FALSE", required=False)
+    parser.add_argument(
+        "--max-concurrent-loads",
+        dest="max_concurrent_loads",
+        type=int,
+        default=DEFAULT_MAX_CONCURRENT_LOADS,
+        required=False,
+    )
     return parser.parse_args()
 
 
@@ -62,6 +71,7 @@ def main():
         match_type = args.source_file_name_match_type
         schema = None if args.schema == "" else ast.literal_eval(args.schema)
         quoted_newline = args.quoted_newline.strip().upper() == "TRUE"
+        compress = args.compress.strip().upper() == "TRUE"
 
         skip_header_rows = (
             None if args.skip_header_rows == "" else args.skip_header_rows
@@ -94,18 +104,17 @@ def main():
                 f"{len(matching_file_names)} files found. Preparing to upload..."
             )
 
-            for index, file_name in enumerate(matching_file_names, start=1):
-                logger.info(f"Uploading file {index} of {len(matching_file_names)}")
-                client.upload(
-                    file=file_name,
-                    dataset=dataset,
-                    table=table,
-                    upload_type=upload_type,
-                    skip_header_rows=skip_header_rows,
-                    schema=schema,
-                    quoted_newline=quoted_newline,
-                )
-                upload_type = "append"
+            client.upload_many(
+                files=matching_file_names,
+                dataset=dataset,
+                table=table,
+                upload_type=upload_type,
+                skip_header_rows=skip_header_rows,
+                schema=schema,
+                quoted_newline=quoted_newline,
+                compress=compress,
+                max_concurrent_loads=args.max_concurrent_loads,
+            )
         else:
             client.upload(
                 file=full_path,
@@ -115,6 +124,7 @@ def main():
                 skip_header_rows=skip_header_rows,
                 schema=schema,
                 quoted_newline=quoted_newline,
+                compress=compress,
             )
             logger.info(f"Successfully loaded {full_path} to {dataset}.{table}")
     except FileNotFoundError as fe:
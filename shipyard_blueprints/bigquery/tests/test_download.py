@@ -0,0 +1,102 @@
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+from shipyard_bigquery import BigQueryClient
+
+PAGES = [
+    pd.DataFrame({"id": [1, 2], "name": ["a", "b"]}),
+    pd.DataFrame({"id": [3], "name": ["c"]}),
+]
+
+
+class FakeRows:
+    schema = [SimpleNamespace(name="id"), SimpleNamespace(name="name")]
+
+    def __init__(self, pages):
+        self.pages = pages
+
+    def to_dataframe_iterable(self, bqstorage_client=None):
+        return iter(self.pages)
+
+    def to_arrow_iterable(self, bqstorage_client=None):
+        for page in self.pages:
+            yield pa.RecordBatch.from_pandas(page, preserve_index=False)
+
+
+@pytest.fixture
+def client(monkeypatch):
+    client = BigQueryClient(service_account="{}")
+    client.conn = MagicMock()
+    monkeypatch.setattr(client, "_read_client", lambda: None)
+    return client
+
+
+def set_rows(client, pages, num_bytes=0):
+    query_job = client.conn.query.return_value
+    query_job.result.return_value = FakeRows(pages)
+    client.conn.get_table.return_value.num_bytes = num_bytes
+
+
+def test_download_csv_appends_pages(client, tmp_path):
+    set_rows(client, PAGES)
+    path = tmp_path / "out.csv"
+
+    assert client.download("select 1", str(path)) == str(path)
+
+    assert path.read_text() == "id,name\n1,a\n2,b\n3,c\n"
+
+
+def test_download_empty_csv_writes_header(client, tmp_path):
+    set_rows(client, [])
+    path = tmp_path / "out.csv"
+
+    client.download("select 1", str(path))
+
+    assert path.read_text() == "id,name\n"
+
+
+def test_download_parquet_writes_row_groups(client, tmp_path):
+    set_rows(client, PAGES)
+    path = tmp_path / "out.parquet"
+
+    client.download("select 1", str(path), file_format="parquet")
+
+    parquet_file = pq.ParquetFile(path)
+    assert parquet_file.num_row_groups == 2
+    assert parquet_file.read().to_pydict() == {"id": [1, 2, 3], "name": ["a", "b", "c"]}
+
+
+def test_large_results_are_extracted_to_gcs(client, tmp_path):
+    set_rows(client, PAGES, num_bytes=10)
+
+    uri = client.download(
+        "select 1",
+        str(tmp_path / "out.csv"),
+        extract_bucket_name="bucket",
+        extract_threshold_bytes=10,
+    )
+
+    assert uri == "gs://bucket/out-*.csv"
+    client.conn.extract_table.assert_called_once()
+    assert not (tmp_path / "out.csv").exists()
+
+
+def test_statements_without_destination_are_not_extracted(client, tmp_path):
+    set_rows(client, [])
+    client.conn.query.return_value.destination = None
+
+    written = client.download(
+        "create table dataset.t (id int64)",
+        str(tmp_path / "out.csv"),
+        extract_bucket_name="bucket",
+        extract_threshold_bytes=0,
+    )
+
+    assert written == str(tmp_path / "out.csv")
+    client.conn.get_table.assert_not_called()
+    client.conn.extract_table.assert_not_called()
@@ -0,0 +1,81 @@
+import gzip
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+from google.cloud import bigquery
+from shipyard_templates import ExitCodeException
+
+from shipyard_bigquery import BigQueryClient
+
+
+@pytest.fixture
+def client():
+    client = BigQueryClient(service_account="{}")
+    client.conn = MagicMock()
+    return client
+
+
+@pytest.fixture
+def files(tmp_path):
+    paths = []
+    for index in range(5):
+        path = tmp_path / f"shard_{index}.csv"
+        path.write_text(f"id\n{index}\n")
+        paths.append(str(path))
+    return paths
+
+
+def record_loads(client):
+    loads = []
+    lock = threading.Lock()
+
+    def load_table_from_file(source_file, table_ref, job_config):
+        with lock:
+            loads.append((source_file.name, job_config.write_disposition))
+        return MagicMock()
+
+    client.conn.load_table_from_file.side_effect = load_table_from_file
+    return loads
+
+
+def test_first_file_overwrites_and_rest_append(client, files):
+    loads = record_loads(client)
+
+    client.upload_many(files, "dataset", "table", "overwrite")
+
+    assert loads[0] == (files[0], bigquery.WriteDisposition.WRITE_TRUNCATE)
+    assert sorted(loads[1:]) == [
+        (file, bigquery.WriteDisposition.WRITE_APPEND) for file in files[1:]
+    ]
+
+
+def test_failed_load_raises_after_all_jobs(client, files):
+    loads = record_loads(client)
+    failing_job = MagicMock()
+    failing_job.result.side_effect = RuntimeError("quota exceeded")
+    default = client.conn.load_table_from_file.side_effect
+
+    def load_table_from_file(source_file, table_ref, job_config):
+        job = default(source_file, table_ref, job_config)
+        return failing_job if source_file.name == files[2] else job
+
+    client.conn.load_table_from_file.side_effect = load_table_from_file
+
+    with pytest.raises(ExitCodeException, match="quota exceeded"):
+        client.upload_many(files, "dataset", "table", "append")
+    assert len(loads) == len(files)
+
+
+def test_compress_sends_gzipped_copy(client, files):
+    sent = []
+
+    def load_table_from_file(source_file, table_ref, job_config):
+        sent.append(gzip.decompress(source_file.read()))
+        return MagicMock()
+
+    client.conn.load_table_from_file.side_effect = load_table_from_file
+
+    client.upload(files[0], "dataset", "table", "append", compress=True)
+
+    assert sent == [b"id\n0\n"]
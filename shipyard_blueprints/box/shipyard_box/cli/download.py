@@ -6,6 +6,7 @@ import argparse
 
 from boxsdk import Client, JWTAuth
 from boxsdk.exception import *
+from shipyard_box import folders, transfers
 
 import logging
 
@@ -40,6 +41,9 @@ def get_args():
     parser.add_argument(
         "--service-account", dest="service_account", default=None, required=True
     )
+    parser.add_argument(
+        "--max-workers", dest="max_workers", type=int, default=transfers.MAX_WORKERS
+    )
     return parser.parse_args()
 
 
@@ -129,21 +133,15 @@ def find_box_file_names(client, source_folder_name):
     tuples of file_name to file_id
     """
     try:
-        if not source_folder_name:
-            source_folder_name = "0"
-
-        folders = client.search().query(query=source_folder_name, result_type="folder")
-        search_folder = None
-        for folder in folders:
-            search_folder = folder
-        if not search_folder:
-            search_folder = client.folder("0")
-
-        files = search_folder.get_items()
-        file_names = []
-        for _file in files:
-            file_names.append((_file.name, _file.id))
-        return file_names
+        search_folder = (
+            get_folder(client, source_folder_name) if source_folder_name else None
+        )
+        folder_id = search_folder.id if search_folder else folders.ROOT_FOLDER_ID
+
+        return [
+            (_file.name, _file.id)
+            for _file in folders.list_folder_items(client, folder_id, item_type="file")
+        ]
     except (BoxOAuthException, BoxAPIException) as e:
         print(f"The specified folder {source_folder_name} does not exist")
         raise (e)
@@ -169,8 +167,7 @@ def download_box_file(file_name, file_id, client, destination_file_name=None):
 
     local_path = os.path.normpath(f"{os.getcwd()}/{destination_file_name}")
 
-    with open(local_path, "wb") as new_blob:
-        client.file(file_id).download_to(new_blob)
+    transfers.download_file(client, file_id, local_path)
 
     print(f"{file_name} successfully downloaded to {local_path}")
 
@@ -198,15 +195,22 @@ def get_client(service_account):
 
 def get_folder(client, folder_name):
     """
-    Returns the folder id for the Box client if it exists.
+    Returns the folder for the Box client if it exists. The folder path is resolved by
+    walking the folder tree (cached across runs), falling back to a search for folders
+    that are shared with the app but not reachable from its root folder.
     """
     try:
         print(f"Attempting to find folder {folder_name}")
-        folders = client.search().query(query=folder_name, type="folder")
+        resolver = folders.FolderResolver(client, folders.default_cache_file())
+        folder_id = resolver.resolve(folder_name)
+        if folder_id:
+            return client.folder(folder_id)
+
+        folder_matches = client.search().query(query=folder_name, type="folder")
         base_folder = os.path.basename(os.path.normpath(folder_name))
 
         return next(
-            (folder for folder in folders if folder.name == base_folder),
+            (folder for folder in folder_matches if folder.name == base_folder),
             None,
         )
     except (BoxOAuthException, BoxAPIException) as e:
@@ -226,8 +230,7 @@ def get_file_id(client, source_file_name, source_folder_name=None):
             print(f"Found folder {source_folder_name} with ID {folder_id}")
         if not folder_id:
             raise FileNotFoundError(f"Folder {source_folder_name} not found")
-        files = client.folder(folder_id).get_items()
-        for _file in files:
+        for _file in folders.list_folder_items(client, folder_id, item_type="file"):
             if _file.name == source_file_name:
                 print(f"Found file {source_file_name} with ID {_file.id}")
                 return _file.name, _file.id
@@ -264,6 +267,7 @@ def main():
         )
         print(f"{len(matching_file_names)} files found. Preparing to download...")
 
+        downloads = []
         for index, file_obj in enumerate(matching_file_names):
             file_name, file_id = file_obj
             destination_name = determine_destination_name(
@@ -272,14 +276,18 @@ def main():
                 source_full_path=file_name,
                 file_number=index + 1,
             )
-
-            print(f"Downloading file {index + 1} of {len(matching_file_names)}")
-            download_box_file(
-                file_name=file_name,
-                file_id=file_id,
-                client=client,
-                destination_file_name=destination_name,
+            downloads.append(
+                {
+                    "file_name": file_name,
+                    "file_id": file_id,
+                    "client": client,
+                    "destination_file_name": destination_name,
+                }
             )
+
+        transfers.run_concurrently(
+            download_box_file, downloads, max_workers=args.max_workers
+        )
     else:  # exact_match
         file_name, file_id = None, None
         try:
@@ -7,6 +7,8 @@ import shipyard_utils as shipyard
 
 from boxsdk import Client, JWTAuth
 from boxsdk.exception import *
+from shipyard_bp_utils.files import files_to_sync
+from shipyard_box import folders, transfers
 from shipyard_box.cli import exit_codes as ec
 
 try:
@@ -47,6 +49,17 @@ def get_args():
     parser.add_argument(
         "--service-account", dest="service_account", default=None, required=True
     )
+    parser.add_argument(
+        "--max-workers", dest="max_workers", type=int, default=transfers.MAX_WORKERS
+    )
+    parser.add_argument(
+        "--sync",
+        dest="sync",
+        default="no",
+        choices={"yes", "no"},
+        required=False,
+        help="Only upload files whose content differs from the existing Box file",
+    )
     return parser.parse_args()
 
 
@@ -67,8 +80,8 @@ def upload_box_file(client, source_full_path, destination_full_path, folder_id):
     """
     destination_file_name = destination_full_path.rsplit("/", 1)[-1]
     try:
-        new_file = client.folder(folder_id).upload(
-            source_full_path, file_name=destination_file_name
+        transfers.upload_file(
+            client, source_full_path, folder_id, file_name=destination_file_name
         )
     except FileNotFoundError as e:
         print(
@@ -76,16 +89,35 @@ def upload_box_file(client, source_full_path, destination_full_path, folder_id):
         )
         sys.exit(ec.EXIT_CODE_FILE_DOES_NOT_EXIST)
     except Exception as e:
-        if hasattr(e, "code") and e.code == "item_name_in_use":
-            file_id = e.context_info["conflicts"]["id"]
-            updated_file = client.file(file_id).update_contents(source_full_path)
-        else:
-            print(f"Failed to upload file {source_full_path}")
-            raise (e)
+        print(f"Failed to upload file {source_full_path}")
+        raise (e)
 
     print(f"{source_full_path} successfully uploaded to " f"{destination_full_path}")
 
 
+def sync_uploads(client, uploads, folder_id):
+    """
+    Returns the uploads whose file in the Box folder is missing or has a different SHA-1.
+    The hashes of the whole folder are read with one listing.
+    """
+    sha1s = transfers.file_sha1s(client, folder_id)
+    changed = files_to_sync(
+        [
+            (upload["source_full_path"], upload["destination_full_path"])
+            for upload in uploads
+        ],
+        lambda destination_full_path: sha1s.get(
+            destination_full_path.rsplit("/", 1)[-1]
+        ),
+        algorithm="sha1",
+    )
+    return [
+        upload
+        for upload in uploads
+        if (upload["source_full_path"], upload["destination_full_path"]) in changed
+    ]
+
+
 def get_client(service_account):
     """
     Attempts to create the Box Client with the associated with the credentials.
@@ -126,11 +158,12 @@ def get_single_folder_id(client, folder, folder_filter=None):
     return folder_id
 
 
-def get_folder_id(client, destination_folder_name):
+def search_folder_id(client, destination_folder_name):
     """
-    Loops through the entire folder structure of destination_folder_name to find the right id.
+    Loops through the entire folder structure of destination_folder_name to find the right id
+    using the search API.
     """
-    folder = None
+    folder_id = None
     folder_parts = destination_folder_name.strip("/").rsplit("/")
 
     for index, folder in enumerate(folder_parts):
@@ -138,6 +171,19 @@ def get_folder_id(client, destination_folder_name):
             folder_id = get_single_folder_id(client, folder)
         else:
             folder_id = get_single_folder_id(client, folder, folder_filter=folder_id)
+    return folder_id
+
+
+def get_folder_id(client, destination_folder_name):
+    """
+    Finds the id of destination_folder_name by walking the folder tree (cached across runs),
+    falling back to the search API for folders that are shared with the app but not
+    reachable from its root folder.
+    """
+    resolver = folders.FolderResolver(client, folders.default_cache_file())
+    folder_id = resolver.resolve(destination_folder_name) or search_folder_id(
+        client, destination_folder_name
+    )
 
     if folder_id:
         return folder_id
@@ -169,7 +215,7 @@ def main():
     source_file_name_match_type = args.source_file_name_match_type
 
     client = get_client(service_account=service_account)
-    folder = "0"
+    folder_id = folders.ROOT_FOLDER_ID
     if destination_folder_name:
         folder_id = get_folder_id(
             client, destination_folder_name=destination_folder_name
@@ -182,6 +228,7 @@ def main():
         )
         print(f"{len(matching_file_names)} files found. Preparing to upload...")
 
+        uploads = []
         for index, file_name in enumerate(matching_file_names):
             destination_full_path = shipyard.files.determine_destination_full_path(
                 destination_folder_name=destination_folder_name,
@@ -189,14 +236,20 @@ def main():
                 source_full_path=file_name,
                 file_number=index + 1,
             )
-
-            print(f"Uploading file {index+1} of {len(matching_file_names)}")
-            upload_box_file(
-                source_full_path=file_name,
-                destination_full_path=destination_full_path,
-                client=client,
-                folder_id=folder_id,
+            uploads.append(
+                {
+                    "source_full_path": file_name,
+                    "destination_full_path": destination_full_path,
+                    "client": client,
+                    "folder_id": folder_id,
+                }
             )
+        if args.sync == "yes":
+            uploads = sync_uploads(client, uploads, folder_id)
+
+        transfers.run_concurrently(
+            upload_box_file, uploads, max_workers=args.max_workers
+        )
 
     else:
         destination_full_path = shipyard.files.determine_destination_full_path(
@@ -204,13 +257,17 @@ def main():
             destination_file_name=args.destination_file_name,
             source_full_path=source_full_path,
         )
+        upload = {
+            "source_full_path": source_full_path,
+            "destination_full_path": destination_full_path,
+            "client": client,
+            "folder_id": folder_id,
+        }
+        if args.sync == "yes" and not sync_uploads(client, [upload], folder_id):
+            print(f"{destination_full_path} is already up to date")
+            return
 
-        upload_box_file(
-            source_full_path=source_full_path,
-            destination_full_path=destination_full_path,
-            client=client,
-            folder_id=folder_id,
-        )
+        upload_box_file(**upload)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,98 @@
+import json
+import os
+
+from boxsdk.exception import BoxAPIException
+from shipyard_bp_utils.artifacts import Artifact
+
+ROOT_FOLDER_ID = "0"
+ITEM_FIELDS = ["id", "name", "type", "size"]
+PAGE_SIZE = 1000
+
+
+def default_cache_file():
+    """
+    The folder ID cache lives in the Box artifacts folder so that every vessel in a fleet
+    can reuse folders resolved by earlier ones.
+    """
+    return os.path.join(Artifact("box").variables.path, "folder_ids.json")
+
+
+def list_folder_items(client, folder_id, item_type=None, fields=ITEM_FIELDS):
+    """
+    Yields every item in a folder, following pagination and requesting only the fields
+    the blueprints use.
+    """
+    for item in client.folder(folder_id).get_items(limit=PAGE_SIZE, fields=fields):
+        if item_type is None or item.type == item_type:
+            yield item
+
+
+class FolderResolver:
+    """
+    Resolves a Box folder path such as "reports/2024" to a folder ID by walking the
+    folder tree from the root one level at a time. Unlike the search API, listing a folder
+    is immediately consistent, so folders created moments ago are found. Resolved IDs are
+    cached in memory and in `cache_file`.
+    """
+
+    def __init__(self, client, cache_file=None):
+        self.client = client
+        self.cache_file = cache_file
+        self._ids = self._load()
+
+    def _load(self):
+        if not self.cache_file or not os.path.exists(self.cache_file):
+            return {}
+        try:
+            with open(self.cache_file) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save(self):
+        if not self.cache_file:
+            return
+        os.makedirs(os.path.dirname(self.cache_file), exist_ok=True)
+        temp_file = f"{self.cache_file}.{os.getpid()}.tmp"
+        with open(temp_file, "w") as f:
+            json.dump(self._ids, f)
+        os.replace(temp_file, self.cache_file)
+
+    def _is_valid(self, folder_id, folder_name):
+        """Cheaply confirm a cached ID still points at a folder with the expected name."""
+        try:
+            folder = self.client.folder(folder_id).get(fields=["name"])
+        except BoxAPIException:
+            return False
+        return folder.name == folder_name
+
+    def _find_child(self, parent_id, folder_name):
+        for item in list_folder_items(self.client, parent_id, item_type="folder"):
+            if item.name == folder_name:
+                return item.id
+        return None
+
+    def resolve(self, folder_path):
+        """
+        Returns the ID of the folder at `folder_path`, or None if it does not exist.
+        """
+        folder_parts = [part for part in folder_path.strip("/").split("/") if part]
+        if not folder_parts:
+            return ROOT_FOLDER_ID
+
+        path = "/".join(folder_parts)
+        cached_id = self._ids.get(path)
+        if cached_id and self._is_valid(cached_id, folder_parts[-1]):
+            print(f"Folder ID for {path} is {cached_id} (cached)")
+            return cached_id
+
+        folder_id = ROOT_FOLDER_ID
+        for depth, folder_name in enumerate(folder_parts, start=1):
+            folder_id = self._find_child(folder_id, folder_name)
+            if folder_id is None:
+                return None
+            self._ids["/".join(folder_parts[:depth])] = folder_id
+
+        self._save()
+        print(f"Folder ID for {path} is {folder_id}")
+        return folder_id
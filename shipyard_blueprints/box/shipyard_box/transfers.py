@@ -0,0 +1,75 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from shipyard_box import folders
+
+MAX_WORKERS = 4
+# Box only accepts chunked uploads for files of at least 20 MB and recommends them above 50 MB
+CHUNKED_UPLOAD_THRESHOLD = 50 * 1024 * 1024
+
+
+def upload_file(client, source_full_path, folder_id, file_name):
+    """
+    Uploads a file to a Box folder, using a chunked upload session for large files.
+    If a file with the same name already exists, a new version of it is uploaded instead.
+    """
+    file_size = os.path.getsize(source_full_path)
+    try:
+        if file_size < CHUNKED_UPLOAD_THRESHOLD:
+            return client.folder(folder_id).upload(
+                source_full_path, file_name=file_name
+            )
+        upload_session = client.folder(folder_id).create_upload_session(
+            file_size, file_name
+        )
+        with open(source_full_path, "rb") as content_stream:
+            return upload_session.get_chunked_uploader_for_stream(
+                content_stream, file_size
+            ).start()
+    except Exception as e:
+        if not (hasattr(e, "code") and e.code == "item_name_in_use"):
+            raise
+        file_id = e.context_info["conflicts"]["id"]
+
+    if file_size < CHUNKED_UPLOAD_THRESHOLD:
+        return client.file(file_id).update_contents(source_full_path)
+    return client.file(file_id).get_chunked_uploader(source_full_path).start()
+
+
+def file_sha1s(client, folder_id):
+    """
+    Returns the SHA-1 of every file in a Box folder by name, from a single paged listing.
+    """
+    return {
+        item.name: item.sha1
+        for item in folders.list_folder_items(
+            client, folder_id, item_type="file", fields=folders.ITEM_FIELDS + ["sha1"]
+        )
+    }
+
+
+def download_file(client, file_id, local_path):
+    """
+    Streams a Box file to local storage.
+    """
+    with open(local_path, "wb") as f:
+        client.file(file_id).download_to(f)
+
+
+def run_concurrently(transfer, jobs, max_workers=MAX_WORKERS):
+    """
+    Runs `transfer(**job)` for every job on a bounded pool of workers. Every job is
+    attempted, and the first error encountered is raised once they have all finished.
+    """
+
+    def run(job):
+        try:
+            transfer(**job)
+        except BaseException as e:
+            return e
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        errors = [error for error in executor.map(run, jobs) if error]
+    if errors:
+        print(f"{len(errors)} of {len(jobs)} transfer(s) failed")
+        raise errors[0]
@@ -0,0 +1,71 @@
+from types import SimpleNamespace
+
+from boxsdk.exception import BoxAPIException
+
+from shipyard_box.folders import FolderResolver
+
+
+class FakeFolder:
+    def __init__(self, client, folder_id):
+        self.client = client
+        self.folder_id = folder_id
+
+    def get_items(self, limit=None, fields=None):
+        self.client.listings.append(self.folder_id)
+        return iter(self.client.tree.get(self.folder_id, []))
+
+    def get(self, fields=None):
+        for children in self.client.tree.values():
+            for item in children:
+                if item.id == self.folder_id:
+                    return item
+        raise BoxAPIException(404)
+
+
+class FakeClient:
+    def __init__(self, tree):
+        self.tree = tree
+        self.listings = []
+
+    def folder(self, folder_id):
+        return FakeFolder(self, folder_id)
+
+
+def folder(id, name):
+    return SimpleNamespace(id=id, name=name, type="folder")
+
+
+TREE = {
+    "0": [SimpleNamespace(id="f1", name="a.csv", type="file"), folder("1", "reports")],
+    "1": [folder("2", "2023"), folder("3", "2024")],
+}
+
+
+def test_resolve_walks_tree_and_caches(tmp_path):
+    cache_file = str(tmp_path / "folder_ids.json")
+    client = FakeClient(TREE)
+
+    assert FolderResolver(client, cache_file).resolve("/reports/2024/") == "3"
+    assert client.listings == ["0", "1"]
+
+    client.listings.clear()
+    assert FolderResolver(client, cache_file).resolve("reports/2024") == "3"
+    assert client.listings == []
+
+
+def test_stale_cache_entry_is_re_resolved(tmp_path):
+    cache_file = str(tmp_path / "folder_ids.json")
+    client = FakeClient(TREE)
+    FolderResolver(client, cache_file).resolve("reports/2024")
+
+    client.tree = {"0": [folder("9", "reports")], "9": [folder("10", "2024")]}
+
+    assert FolderResolver(client, cache_file).resolve("reports/2024") == "10"
+
+
+def test_missing_folder_and_root():
+    client = FakeClient(TREE)
+    resolver = FolderResolver(client)
+
+    assert resolver.resolve("reports/2025") is None
+    assert resolver.resolve("") == "0"
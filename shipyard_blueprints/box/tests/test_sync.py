@@ -0,0 +1,48 @@
+import hashlib
+from types import SimpleNamespace
+
+from shipyard_box import transfers
+from shipyard_box.cli import upload
+
+
+class FakeClient:
+    def __init__(self, files):
+        self.files = files
+        self.listings = []
+
+    def folder(self, folder_id):
+        client = self
+
+        class Folder:
+            def get_items(self, limit=None, fields=None):
+                client.listings.append((folder_id, fields))
+                return iter(client.files)
+
+        return Folder()
+
+
+def file(name, content):
+    return SimpleNamespace(
+        name=name, type="file", sha1=hashlib.sha1(content).hexdigest()
+    )
+
+
+def test_sync_uploads_compares_sha1s_from_one_listing(tmp_path, monkeypatch):
+    monkeypatch.setenv("SHIPYARD_HASH_CACHE_PATH", str(tmp_path / "hashes.json"))
+    same, changed, new = (tmp_path / name for name in ("same", "changed", "new"))
+    for path in (same, changed, new):
+        path.write_bytes(path.name.encode())
+    client = FakeClient(
+        [
+            file("same", b"same"),
+            file("changed", b"old"),
+            SimpleNamespace(name="reports", type="folder"),
+        ]
+    )
+    uploads = [
+        {"source_full_path": str(path), "destination_full_path": f"data/{path.name}"}
+        for path in (same, changed, new)
+    ]
+
+    assert upload.sync_uploads(client, uploads, "1") == uploads[1:]
+    assert client.listings == [("1", transfers.folders.ITEM_FIELDS + ["sha1"])]
@@ -1,5 +1,4 @@
-from requests import request
-from shipyard_templates import Etl, ExitCodeException, ShipyardLogger
+from shipyard_templates import Etl, ExitCodeException, HttpClient, ShipyardLogger
 
 logger = ShipyardLogger.get_logger()
 
@@ -14,6 +13,7 @@ class CensusClient(Etl):
         """
         self.access_token = access_token
         self.api_headers = {"Content-Type": "application/json"}
+        self.http = HttpClient(timeout=self.TIMEOUT)
         super().__init__(access_token)
 
     def _request(self, endpoint: str, method: str = "GET") -> dict:
@@ -35,7 +35,10 @@ class CensusClient(Etl):
         # logger.debug(f"Attempting to make request to {endpoint}")
 
         try:
-            response = request(method, url, headers=self.api_headers)
+            if method == "GET":
+                response = self.http.poll(url, headers=self.api_headers)
+            else:
+                response = self.http.request(method, url, headers=self.api_headers)
         except Exception as error:
             logger.exception(f"Request to {url} failed")
             raise ExitCodeException(error, self.EXIT_CODE_UNKNOWN_ERROR) from error
@@ -1,7 +1,6 @@
 import argparse
 import os
 import sys
-import time
 
 from shipyard_bp_utils.artifacts import Artifact
 from shipyard_templates import ExitCodeException, ShipyardLogger
@@ -46,19 +45,18 @@ def main():
             logger.error("Poke interval must be between 1 and 60 minutes")
             sys.exit(census.EXIT_CODE_SYNC_INVALID_POKE_INTERVAL)
 
-        status = None
-        while status != "completed":
-            try:
-                sync_run_data = census.get_sync_status(sync_run_id)
-                status = census.determine_sync_status(sync_run_data)
-                if status != "completed":
-                    logger.info(
-                        f"Waiting {poke_interval} minute(s) to check sync status..."
-                    )
-                    time.sleep(poke_interval * 60)
-            except ExitCodeException as error:
-                logger.error(error)
-                sys.exit(error.exit_code)
+        try:
+            census.wait_for_job(
+                lambda: census.determine_sync_status(
+                    census.get_sync_status(sync_run_id)
+                ),
+                lambda status: status == "completed",
+                description=f"Sync run {sync_run_id}",
+                max_interval=poke_interval * 60,
+            )
+        except ExitCodeException as error:
+            logger.error(error)
+            sys.exit(error.exit_code)
 
     elif not wait and int(os.environ.get("SHIPYARD_FLEET_DOWNSTREAM_COUNT")) > 0:
         artifact = Artifact("census")
@@ -1,5 +1,4 @@
 import sys
-import time
 import argparse
 import shipyard_bp_utils as shipyard
 from shipyard_coalesce import CoalesceClient
@@ -80,17 +79,17 @@ def main():
         response_json = client.trigger_sync(**sync_args)
         if wait and (0 < int(args.poke_interval) <= 60):
             run_id = response_json["runCounter"]
-            status = client.determine_sync_status(run_id)
-
-            while status not in (
+            final_statuses = (
                 client.EXIT_CODE_FINAL_STATUS_COMPLETED,
                 client.EXIT_CODE_FINAL_STATUS_CANCELLED,
                 client.EXIT_CODE_FINAL_STATUS_ERRORED,
-            ):
-                logger.info(f"Waiting {args.poke_interval} minute(s)...")
-                time.sleep(int(args.poke_interval) * 60)
-                status = client.determine_sync_status(run_id)
-
+            )
+            status = client.wait_for_job(
+                lambda: client.determine_sync_status(run_id),
+                lambda status: status in final_statuses,
+                description=f"Run {run_id}",
+                max_interval=int(args.poke_interval) * 60,
+            )
             sys.exit(status)
         elif wait:
             logger.error("Poke interval must be between 1 and 60 minutes")
@@ -1,11 +1,10 @@
-import pandas as pd
 import os
 from pathlib import Path
 from databricks.sql.client import Connection
 from shipyard_templates import DatabricksDatabase, ExitCodeException, ShipyardLogger
 from databricks import sql
 from databricks.sql.client import Connection  # for type hints
-from typing import Optional, Dict, List, Any, Union
+from typing import TYPE_CHECKING, Optional, Dict, List, Any, Union
 from shipyard_databricks_sql.utils import exceptions as errs
 from shipyard_databricks_sql.utils.exceptions import (
     TableDNE,
@@ -16,6 +15,9 @@ from shipyard_databricks_sql.utils.exceptions import (
     RemoveVolumeError,
 )
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 logger = ShipyardLogger.get_logger()
 
 
@@ -163,7 +165,7 @@ class DatabricksSqlClient(DatabricksDatabase):
                 self.EXIT_CODE_UNKNOWN_ERROR,
             )
 
-    def fetch(self, query: str) -> pd.DataFrame:
+    def fetch(self, query: str) -> "pd.DataFrame":
         """Retrieves the results of a Databricks SQL query as a pandas dataframe
 
         Args:
@@ -173,6 +175,8 @@ class DatabricksSqlClient(DatabricksDatabase):
         Returns: a pandas dataframe
 
         """
+        import pandas as pd
+
         try:
             query_results = self.execute_query(query)
             results = query_results.fetchall()
@@ -246,7 +250,7 @@ class DatabricksSqlClient(DatabricksDatabase):
             )
 
     def _replace_table(
-        self, table_name: str, data_types: Dict[str, str], df: pd.DataFrame
+        self, table_name: str, data_types: Dict[str, str], df: "pd.DataFrame"
     ):
         """Helper function to
 
@@ -279,7 +283,7 @@ class DatabricksSqlClient(DatabricksDatabase):
             )
 
     def _append_table(
-        self, table_name: str, data_types: Dict[str, str], df: pd.DataFrame
+        self, table_name: str, data_types: Dict[str, str], df: "pd.DataFrame"
     ):
         """Helper function to append data from a dataframe to an existing table in Databricks
 
@@ -335,7 +339,7 @@ class DatabricksSqlClient(DatabricksDatabase):
         return spark_type
 
     def create_insert_statement(
-        self, table_name: str, df: pd.DataFrame, datatypes: Dict[str, str]
+        self, table_name: str, df: "pd.DataFrame", datatypes: Dict[str, str]
     ) -> str:
         """Helper function to generate the `INSERT` SQL statement
 
@@ -696,6 +700,8 @@ class DatabricksSqlClient(DatabricksDatabase):
         datatypes: Optional[Dict[Any, Any]],
         insert_method: str = "replace",
     ):
+        import pandas as pd
+
         if file_format == "csv":
             data = pd.read_csv(file_path)
         elif file_format == "parquet":
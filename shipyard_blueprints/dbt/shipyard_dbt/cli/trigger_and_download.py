@@ -1,6 +1,5 @@
 import argparse
 import sys
-import time
 
 import shipyard_bp_utils as shipyard
 from shipyard_bp_utils.artifacts import Artifact
@@ -55,17 +54,18 @@ def main():
         run_id = job_run_response["data"]["id"]
         artifact.variables.create_pickle("run_id", run_id)
 
-        is_complete = False
-        while not is_complete:
-            run_details_response = client.get_run_details(run_id)
-            is_complete = run_details_response["data"]["is_complete"]
-            if not is_complete:
-                logger.info(
-                    f"Run {run_id} is not complete. Waiting 60 seconds and trying again."
-                )
-                time.sleep(60)
-            else:
-                exit_code = client.determine_sync_status(run_id)
+        def check_run():
+            run_details = client.get_run_details(run_id)
+            artifact.responses.append(f"run_{run_id}_polls", run_details)
+            return run_details
+
+        run_details_response = client.wait_for_job(
+            check_run,
+            lambda run_details: run_details["data"]["is_complete"],
+            description=f"Run {run_id}",
+        )
+        artifact.responses.write_json(f"run_{run_id}_response", run_details_response)
+        exit_code = client.determine_sync_status(run_id)
 
         if download_logs:
             number_of_steps = len(run_details_response["data"]["run_steps"])
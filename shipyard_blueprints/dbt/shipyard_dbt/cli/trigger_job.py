@@ -1,6 +1,5 @@
 import argparse
 import sys
-import time
 
 import shipyard_bp_utils as shipyard
 from shipyard_bp_utils.artifacts import Artifact
@@ -47,20 +46,21 @@ def main():
         artifact.variables.create_pickle("run_id", run_id)
 
         if wait_for_completion:
-            is_complete = False
-            exit_code = Etl.EXIT_CODE_FINAL_STATUS_INCOMPLETE
-            while not is_complete:
+
+            def check_run():
                 run_details = client.get_run_details(run_id)
-                artifact.responses.write_json(f"run_{run_id}_response", run_details)
-                is_complete = run_details["data"]["is_complete"]
-                if not is_complete:
-                    logger.info(
-                        f"Run {run_id} is not complete. Waiting 60 seconds and trying again."
-                    )
-                    time.sleep(60)
-                else:
-                    exit_code = client.determine_sync_status(run_id)
-            sys.exit(exit_code)
+                artifact.responses.append(f"run_{run_id}_polls", run_details)
+                return run_details
+
+            run_details_response = client.wait_for_job(
+                check_run,
+                lambda run_details: run_details["data"]["is_complete"],
+                description=f"Run {run_id}",
+            )
+            artifact.responses.write_json(
+                f"run_{run_id}_response", run_details_response
+            )
+            sys.exit(client.determine_sync_status(run_id))
     except ExitCodeException as e:
         logger.error(e)
         sys.exit(e.exit_code)
@@ -2,7 +2,7 @@ import os
 import platform
 
 import requests
-from shipyard_templates import Etl, ShipyardLogger, ExitCodeException
+from shipyard_templates import Etl, ShipyardLogger, ExitCodeException, HttpClient
 from shipyard_templates.etl import BadRequestError, UnauthorizedError, UnknownError
 
 logger = ShipyardLogger.get_logger()
@@ -27,6 +27,7 @@ class DbtClient(Etl):
         self.headers = {"Authorization": f"Bearer {access_token}"}
         self.account_url = f"https://cloud.getdbt.com/api/v2/accounts/{account_id}/"
         self.base_url = "https://cloud.getdbt.com/api/v2/"
+        self.http = HttpClient(headers=self.headers)
 
         super().__init__(
             access_token=access_token,
@@ -37,14 +38,17 @@ class DbtClient(Etl):
         )
 
     def _request(self, url, data=None, params=None, method="GET"):
-        request_details = {"headers": self.headers}
+        request_details = {}
         if data:
             request_details["data"] = data
         if params:
             request_details["params"] = params
 
         try:
-            response = requests.request(method, url, **request_details)
+            if method == "GET":
+                response = self.http.poll(url, **request_details)
+            else:
+                response = self.http.request(method, url, **request_details)
             if response.ok:
                 return response.json()
             if response.status_code == 401:
@@ -108,7 +112,7 @@ class DbtClient(Etl):
 
     def connect(self):
         try:
-            response = requests.get(self.account_url, headers=self.headers)
+            response = self.http.get(self.account_url)
             if response.status_code == 200:
                 logger.info("Successfully connected to DBT")
                 return 0
@@ -166,9 +170,7 @@ class DbtClient(Etl):
         filename = os.path.join(destination_fullpath, artifact_file_name)
 
         try:
-            with requests.get(
-                get_artifact_details_url, headers=self.headers, stream=True
-            ) as r:
+            with self.http.get(get_artifact_details_url, stream=True) as r:
                 r.raise_for_status()
                 with open(filename, "wb") as f:
                     for chunk in r.iter_content(chunk_size=CHUNK_SIZE):
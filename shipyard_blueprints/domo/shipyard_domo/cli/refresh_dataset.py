@@ -1,10 +1,9 @@
 import sys
-import time
 import argparse
 import shipyard_bp_utils as shipyard
 from shipyard_domo.utils import exceptions as errs
 from shipyard_domo import DomoClient
-from shipyard_templates import ShipyardLogger, ExitCodeException
+from shipyard_templates import ShipyardLogger, ExitCodeException, JobWaiter
 from shipyard_bp_utils.artifacts import Artifact
 
 logger = ShipyardLogger.get_logger()
@@ -65,16 +64,14 @@ def main():
         )
 
         if wait:
-            execution_data = client.get_execution_details(args.dataset_id, execution_id)
-            exit_code_status = determine_execution_status(execution_data)
             logger.info("Waiting for Domo Refresh to complete")
-            while exit_code_status == errs.EXIT_CODE_STATUS_INCOMPLETE:
-                logger.info("Waiting for 60 seconds before checking again")
-                time.sleep(60)
-                execution_data = client.get_execution_details(
-                    args.dataset_id, execution_id
-                )
-                exit_code_status = determine_execution_status(execution_data)
+            exit_code_status = JobWaiter().wait(
+                lambda: determine_execution_status(
+                    client.get_execution_details(args.dataset_id, execution_id)
+                ),
+                lambda status: status != errs.EXIT_CODE_STATUS_INCOMPLETE,
+                description=f"Execution {execution_id}",
+            )
             logger.info("Dataset refresh complete")
             sys.exit(exit_code_status)
     except ExitCodeException as ec:
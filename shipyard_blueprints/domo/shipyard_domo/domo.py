@@ -2,10 +2,9 @@ from pydomo.datasets.DataSetModel import Schema, DataSetRequest
 from pydomo.streams import CreateStreamRequest, UpdateMethod
 from shipyard_templates import DataVisualization, ExitCodeException, ShipyardLogger
 from pydomo import Domo
-from typing import Optional, List, Dict, Union, Any
+from typing import TYPE_CHECKING, Optional, List, Dict, Union, Any
 import requests
 import os
-import pandas as pd
 import urllib
 from io import StringIO
 from copy import deepcopy
@@ -27,6 +26,9 @@ from shipyard_domo.utils.exceptions import (
 )
 from shipyard_domo.utils import utils
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 logger = ShipyardLogger.get_logger()
 
 
@@ -106,7 +108,7 @@ class DomoClient(DataVisualization):
             logger.error(e)
             raise CannotConnect(e)
 
-    def download_dataset(self, dataset_id: str) -> pd.DataFrame:
+    def download_dataset(self, dataset_id: str) -> "pd.DataFrame":
         """Downloads a domo dataset to a pandas dataframe
 
         Args:
@@ -254,6 +256,7 @@ class DomoClient(DataVisualization):
             dataset_description (str, optional): Optional description of the dataset
             domo_schema (List[Schema], optional): Optional schema of the dataset. If omitted, then the data types will be inferred using sampling
         """
+        import pandas as pd
 
         try:
             streams = self.domo.streams
@@ -383,6 +386,8 @@ class DomoClient(DataVisualization):
         Returns:
             Schema: Schema object of the dataset
         """
+        import pandas as pd
+
         if isinstance(file_name, list):
             dataframes = []
             n_files = len(file_name)
@@ -1,7 +1,6 @@
-import pandas as pd
 import os
 import re
-from typing import List, Dict, Any, Optional, Union
+from typing import TYPE_CHECKING, List, Dict, Any, Optional, Union
 from random import random, randrange
 from itertools import islice
 from io import StringIO
@@ -10,6 +9,9 @@ from pydomo.datasets import Schema, Column, ColumnType
 
 from shipyard_domo.utils.exceptions import ColumnMismatch, InvalidDatatype
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 
 def map_domo_to_pandas(domo_schema: List[Dict[Any, Any]]) -> Dict[str, str]:
     """Maps the domo datatypes to the associated pandas datatype
@@ -37,7 +39,7 @@ def map_domo_to_pandas(domo_schema: List[Dict[Any, Any]]) -> Dict[str, str]:
     return pandas_dtypes
 
 
-def parse_dates(df: pd.DataFrame) -> pd.DataFrame:
+def parse_dates(df: "pd.DataFrame") -> "pd.DataFrame":
     """Helper function to parse dates in a pandas dataframe. This is necessary so that the date and datetime
     fields can be properly inferred by the `infer_schema` function
 
@@ -47,6 +49,8 @@ def parse_dates(df: pd.DataFrame) -> pd.DataFrame:
     Returns: A pandas dataframe
 
     """
+    import pandas as pd
+
     for col in df.columns:
         # Check if the column contains date-like values
         if df[col].apply(lambda x: bool(re.match(r"\d{4}-\d{2}-\d{2}", str(x)))).all():
@@ -145,6 +149,8 @@ def read_csv_and_check_columns(
     Returns:
         List[Column]: List of Column objects representing the schema.
     """
+    import pandas as pd
+
     df = pd.read_csv(file_path, nrows=1)
     cols = list(df.columns)
     if len(cols) != len(data_types):
@@ -2,6 +2,7 @@ import argparse
 import os
 import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
 
 from dropbox import Dropbox
 from dropbox.files import FileMetadata, FolderMetadata
@@ -10,6 +11,12 @@ from shipyard_templates import ShipyardLogger
 
 logger = ShipyardLogger.get_logger()
 
+DOWNLOAD_CHUNK_SIZE = 4 * 1024 * 1024
+MAX_WORKERS = 4
+
+# Folder listings are cached for the duration of the run, keyed by the listed prefix
+_listing_cache = {}
+
 
 def get_args():
     parser = argparse.ArgumentParser()
@@ -37,45 +44,57 @@ def get_args():
         required=False,
     )
     parser.add_argument("--access-key", dest="access_key", default=None, required=True)
+    parser.add_argument(
+        "--max-workers", dest="max_workers", type=int, default=MAX_WORKERS
+    )
     return parser.parse_args()
 
 
-def find_dropbox_file_names(client, prefix=None):
+def find_dropbox_file_names(client, prefix=None, use_cache=True):
     """
-    Fetched all the files in the bucket which are returned in a list as
-    file names
+    Fetches all the files under the prefix, including nested folders, and returns them
+    as a list of file names. The listing is requested recursively and every page is
+    followed with the returned cursor, so large folders are not truncated.
     """
-    result = []
-    folders = []
+    prefix = prefix or ""
     if prefix and not prefix.startswith("/"):
         prefix = f"/{prefix}"
+    if use_cache and prefix in _listing_cache:
+        return list(_listing_cache[prefix])
+
+    result = []
     try:
-        files = client.files_list_folder(prefix)
+        files = client.files_list_folder(prefix, recursive=True)
+        while True:
+            result.extend(
+                f.path_lower for f in files.entries if isinstance(f, FileMetadata)
+            )
+            if not files.has_more:
+                break
+            files = client.files_list_folder_continue(files.cursor)
     except Exception:
         logger.error(f"Failed to search folder {prefix}")
         return []
 
-    for f in files.entries:
-        if isinstance(f, FileMetadata):
-            result.append(f.path_lower)
-        elif isinstance(f, FolderMetadata):
-            folders.append(f.path_lower)
-    for folder in folders:
-        result.extend(find_dropbox_file_names(client, prefix=folder))
-    return result
+    logger.debug(f"Found {len(result)} file(s) under {prefix or 'the root folder'}")
+    _listing_cache[prefix] = result
+    return list(result)
 
 
 def download_dropbox_file(file_name, client, destination_file_name=None):
     """
     Download a selected file from Dropbox to local storage in
-    the current working directory.
+    the current working directory. The body is streamed to disk in chunks rather
+    than held in memory.
     """
     local_path = os.path.normpath(f"{os.getcwd()}/{destination_file_name}")
 
     try:
         with open(local_path, "wb") as f:
-            metadata, _file = client.files_download(path=file_name)
-            f.write(_file.content)
+            metadata, response = client.files_download(path=file_name)
+            with response:
+                for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                    f.write(chunk)
     except Exception as e:
         if "not_found" in str(e):
             print(f"Download failed. Could not find {file_name}")
@@ -89,6 +108,31 @@ def download_dropbox_file(file_name, client, destination_file_name=None):
     logger.info(f"{file_name} successfully downloaded to {local_path}")
 
 
+def download_dropbox_files(client, downloads, max_workers=MAX_WORKERS):
+    """
+    Downloads several files concurrently. `downloads` is a list of
+    (dropbox file name, destination file name) pairs. Every download is attempted,
+    and the first error encountered is raised once they have all finished.
+    """
+
+    def download(item):
+        file_name, destination_name = item
+        try:
+            download_dropbox_file(
+                file_name=file_name,
+                client=client,
+                destination_file_name=destination_name,
+            )
+        except Exception as e:
+            return e
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        errors = [error for error in executor.map(download, downloads) if error]
+    if errors:
+        logger.error(f"{len(errors)} of {len(downloads)} download(s) failed")
+        raise errors[0]
+
+
 def main():
     args = get_args()
     try:
@@ -130,28 +174,25 @@ def main():
                 file_names, re.compile(source_file_name)
             )
 
-            if number_of_matching_files := len(matching_file_names) == 0:
+            if (number_of_matching_files := len(matching_file_names)) == 0:
                 raise ValueError(f"No files found matching {source_file_name}")
             logger.info(
                 f"{number_of_matching_files} files found. Preparing to download..."
             )
 
-            for index, file_name in enumerate(matching_file_names, start=1):
-                destination_name = shipyard.determine_destination_full_path(
-                    destination_folder_name=destination_folder_name,
-                    destination_file_name=args.destination_file_name,
-                    source_full_path=file_name,
-                    file_number=index,
-                )
-
-                logger.info(f"Downloading file {index} of {number_of_matching_files}")
-                download_dropbox_file(
-                    file_name=(
-                        file_name if file_name.startswith("/") else f"/{file_name}"
+            downloads = [
+                (
+                    file_name if file_name.startswith("/") else f"/{file_name}",
+                    shipyard.determine_destination_full_path(
+                        destination_folder_name=destination_folder_name,
+                        destination_file_name=args.destination_file_name,
+                        source_full_path=file_name,
+                        file_number=index,
                     ),
-                    client=client,
-                    destination_file_name=destination_name,
                 )
+                for index, file_name in enumerate(matching_file_names, start=1)
+            ]
+            download_dropbox_files(client, downloads, max_workers=args.max_workers)
     except Exception as e:
         logger.error(
             f"Failed to download {args.source_file_name} from Dropbox due to {e}"
@@ -2,6 +2,7 @@ import argparse
 import os
 import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
 
 from dropbox import Dropbox
 from dropbox.exceptions import *
@@ -40,9 +41,42 @@ def get_args():
         required=False,
     )
     parser.add_argument("--access-key", dest="access_key", default=None, required=True)
+    parser.add_argument(
+        "--sync",
+        dest="sync",
+        default="no",
+        choices={"yes", "no"},
+        required=False,
+        help="Only upload files whose content differs from the existing Dropbox file",
+    )
     return parser.parse_args()
 
 
+def dropbox_content_hash(client, destination_full_path):
+    """
+    Returns the content_hash of a Dropbox file, or None when there is no file at the path.
+    """
+    try:
+        metadata = client.files_get_metadata(destination_full_path)
+    except ApiError as e:
+        if e.error.is_path() and e.error.get_path().is_not_found():
+            return None
+        raise
+    return getattr(metadata, "content_hash", None)
+
+
+def sync_uploads(client, uploads):
+    """
+    Returns the (source, destination) uploads whose Dropbox file is missing or has a
+    different content_hash.
+    """
+    return shipyard.files_to_sync(
+        uploads,
+        lambda destination: dropbox_content_hash(client, destination),
+        algorithm="dropbox",
+    )
+
+
 def upload_dropbox_file(client, source_full_path, destination_full_path):
     """
     Uploads a single file to Dropbox.
@@ -77,6 +111,18 @@ def upload_small_dropbox_file(client, source_full_path, destination_full_path):
             logger.error(f"Failed to upload file {source_full_path} due to {e}")
 
 
+def read_chunks_ahead(f, chunk_size=CHUNK_SIZE):
+    """
+    Yields consecutive chunks of a file while the following chunk is read in the
+    background, so disk reads overlap with sending the previous chunk.
+    """
+    with ThreadPoolExecutor(max_workers=1) as reader:
+        next_chunk = reader.submit(f.read, chunk_size)
+        while chunk := next_chunk.result():
+            next_chunk = reader.submit(f.read, chunk_size)
+            yield chunk
+
+
 def upload_large_dropbox_file(client, source_full_path, destination_full_path):
     """
     Uploads a large (>CHUNK_SIZE) single file to Dropbox.
@@ -84,25 +130,23 @@ def upload_large_dropbox_file(client, source_full_path, destination_full_path):
     file_size = os.path.getsize(source_full_path)
     with open(source_full_path, "rb") as f:
         try:
-            upload_session_start_result = client.files_upload_session_start(
-                f.read(CHUNK_SIZE)
-            )
+            chunks = read_chunks_ahead(f, CHUNK_SIZE)
+            first_chunk = next(chunks)
+            upload_session_start_result = client.files_upload_session_start(first_chunk)
             session_id = upload_session_start_result.session_id
-            cursor = UploadSessionCursor(session_id=session_id, offset=f.tell())
+            cursor = UploadSessionCursor(session_id=session_id, offset=len(first_chunk))
             commit = CommitInfo(path=destination_full_path)
 
-            while f.tell() < file_size:
-                if (file_size - f.tell()) <= CHUNK_SIZE:
+            for chunk in chunks:
+                if cursor.offset + len(chunk) >= file_size:
                     logger.info(
-                        client.files_upload_session_finish(
-                            f.read(CHUNK_SIZE), cursor, commit
-                        )
+                        client.files_upload_session_finish(chunk, cursor, commit)
                     )
                 else:
                     client.files_upload_session_append(
-                        f.read(CHUNK_SIZE), cursor.session_id, cursor.offset
+                        chunk, cursor.session_id, cursor.offset
                     )
-                    cursor.offset = f.tell()
+                    cursor.offset += len(chunk)
         except ApiError as e:
             logger.error(f"Failed to upload file {source_full_path} due to {e}")
 
@@ -145,6 +189,11 @@ def main():
                 destination_file_name=args.destination_file_name,
                 source_full_path=source_full_path,
             )
+            if args.sync == "yes" and not sync_uploads(
+                client, [(source_full_path, destination_full_path)]
+            ):
+                logger.info(f"{destination_full_path} is already up to date")
+                return
             upload_dropbox_file(
                 source_full_path=source_full_path,
                 destination_full_path=destination_full_path,
@@ -165,6 +214,7 @@ def main():
                 f"{len(matching_file_names)} files found. Preparing to upload..."
             )
 
+            uploads = []
             for index, key_name in enumerate(matching_file_names, start=1):
                 destination_full_path = shipyard.determine_destination_full_path(
                     destination_folder_name=destination_folder_name,
@@ -177,7 +227,12 @@ def main():
                         f"File {key_name} does not exist",
                         CloudStorage.EXIT_CODE_FILE_NOT_FOUND,
                     )
-                logger.info(f"Uploading file {index} of {len(matching_file_names)}")
+                uploads.append((key_name, destination_full_path))
+            if args.sync == "yes":
+                uploads = sync_uploads(client, uploads)
+
+            for index, (key_name, destination_full_path) in enumerate(uploads, start=1):
+                logger.info(f"Uploading file {index} of {len(uploads)}")
                 upload_dropbox_file(
                     source_full_path=key_name,
                     destination_full_path=destination_full_path,
@@ -0,0 +1,115 @@
+import hashlib
+import io
+from types import SimpleNamespace
+
+from dropbox.exceptions import ApiError
+from dropbox.files import FileMetadata, FolderMetadata, GetMetadataError
+from dropbox.files import LookupError as PathLookupError
+
+from shipyard_dropbox.cli import download, upload
+
+
+class FakeListingClient:
+    def __init__(self, pages):
+        self.pages = pages
+        self.calls = []
+
+    def files_list_folder(self, path, recursive=False):
+        self.calls.append(("list", path, recursive))
+        return self.pages[0]
+
+    def files_list_folder_continue(self, cursor):
+        self.calls.append(("continue", cursor))
+        return self.pages[int(cursor)]
+
+
+def page(entries, cursor=None):
+    return SimpleNamespace(entries=entries, has_more=cursor is not None, cursor=cursor)
+
+
+def test_find_dropbox_file_names_follows_cursor_and_caches():
+    client = FakeListingClient(
+        [
+            page(
+                [
+                    FolderMetadata(name="a", path_lower="/data/a"),
+                    FileMetadata(name="1.csv", path_lower="/data/1.csv"),
+                ],
+                cursor="1",
+            ),
+            page([FileMetadata(name="2.csv", path_lower="/data/a/2.csv")]),
+        ]
+    )
+
+    files = download.find_dropbox_file_names(client, prefix="data")
+    cached = download.find_dropbox_file_names(client, prefix="data")
+
+    assert files == cached == ["/data/1.csv", "/data/a/2.csv"]
+    assert client.calls == [("list", "/data", True), ("continue", "1")]
+
+
+def test_read_chunks_ahead_yields_whole_file_in_order():
+    data = bytes(range(256)) * 10
+    chunks = list(upload.read_chunks_ahead(io.BytesIO(data), chunk_size=100))
+
+    assert b"".join(chunks) == data
+    assert [len(chunk) for chunk in chunks[:-1]] == [100] * (len(chunks) - 1)
+
+
+def test_upload_large_file_sends_every_chunk(tmp_path, monkeypatch):
+    monkeypatch.setattr(upload, "CHUNK_SIZE", 10)
+    source = tmp_path / "large.bin"
+    source.write_bytes(b"x" * 35)
+    calls = []
+
+    class FakeUploadClient:
+        def files_upload_session_start(self, chunk):
+            calls.append(("start", len(chunk)))
+            return SimpleNamespace(session_id="session")
+
+        def files_upload_session_append(self, chunk, session_id, offset):
+            calls.append(("append", len(chunk), offset))
+
+        def files_upload_session_finish(self, chunk, cursor, commit):
+            calls.append(("finish", len(chunk), cursor.offset))
+
+    upload.upload_large_dropbox_file(FakeUploadClient(), str(source), "/large.bin")
+
+    assert calls == [
+        ("start", 10),
+        ("append", 10, 10),
+        ("append", 10, 20),
+        ("finish", 5, 30),
+    ]
+
+
+class FakeMetadataClient:
+    def __init__(self, hashes):
+        self.hashes = hashes
+
+    def files_get_metadata(self, path):
+        if path not in self.hashes:
+            raise ApiError(
+                "request", GetMetadataError.path(PathLookupError.not_found), None, None
+            )
+        return FileMetadata(name=path, content_hash=self.hashes[path])
+
+
+def test_sync_uploads_compares_dropbox_content_hashes(tmp_path, monkeypatch):
+    monkeypatch.setenv("SHIPYARD_HASH_CACHE_PATH", str(tmp_path / "hashes.json"))
+    same, changed, new = (tmp_path / name for name in ("same", "changed", "new"))
+    for path in (same, changed, new):
+        path.write_bytes(path.name.encode())
+    client = FakeMetadataClient(
+        {
+            "/same": hashlib.sha256(hashlib.sha256(b"same").digest()).hexdigest(),
+            "/changed": hashlib.sha256(hashlib.sha256(b"old").digest()).hexdigest(),
+        }
+    )
+
+    uploads = upload.sync_uploads(
+        client,
+        [(str(same), "/same"), (str(changed), "/changed"), (str(new), "/new")],
+    )
+
+    assert uploads == [(str(changed), "/changed"), (str(new), "/new")]
@@ -1,7 +1,5 @@
-import time
-
-from requests import request, auth
-from shipyard_templates import Etl, ExitCodeException, ShipyardLogger
+from requests import auth
+from shipyard_templates import Etl, ExitCodeException, HttpClient, ShipyardLogger
 
 logger = ShipyardLogger.get_logger()
 
@@ -28,6 +26,14 @@ class FivetranClient(Etl):
         self.api_secret = api_secret
         self.api_key = access_token
         self.auth = auth.HTTPBasicAuth(self.api_key, self.api_secret)
+        self.http = HttpClient(
+            headers={
+                "Content-Type": "application/json",
+                "Accept": "application/json;version=2",
+            },
+            auth=self.auth,
+            timeout=self.TIMEOUT,
+        )
         super().__init__(self.api_key, api_secret=self.api_secret)
         logger.debug("FivetranClient initialized")
 
@@ -49,27 +55,10 @@ class FivetranClient(Etl):
             dict: The JSON response from the Fivetran API
         """
         url = f"https://api.fivetran.com/v1/{endpoint}"
-        if payload:
-            resp = request(
-                method,
-                url,
-                headers={
-                    "Content-Type": "application/json",
-                    "Accept": "application/json;version=2",
-                },
-                json=payload,
-                auth=self.auth,
-            )
+        if method == "GET":
+            resp = self.http.poll(url)
         else:
-            resp = request(
-                method,
-                url,
-                headers={
-                    "Content-Type": "application/json",
-                    "Accept": "application/json;version=2",
-                },
-                auth=self.auth,
-            )
+            resp = self.http.request(method, url, json=payload or None)
         if resp.ok:
             return resp.json()
         logger.error(f"Error: {resp.status_code} - {resp.text}")
@@ -102,7 +91,7 @@ class FivetranClient(Etl):
             connector_id (str): The ID of the connector
             force (bool): Whether to force the sync. Defaults to True.
             wait_for_completion (bool): Whether to wait for the sync to complete. Defaults to False.
-            poke_interval (int): Interval in seconds to check for sync completion. Defaults to 30.
+            poke_interval (int): Longest interval in seconds between checks for sync completion. Defaults to 30.
 
         Raises:
             ExitCodeException: If an error occurs while triggering sync.
@@ -128,13 +117,12 @@ class FivetranClient(Etl):
         else:
             logger.info("Sync triggered successfully")
             if wait_for_completion:
-                new_success, new_failure = prev_success, prev_failure
-                while prev_success == new_success and prev_failure == new_failure:
-                    logger.info("Waiting for sync to complete...")
-                    time.sleep(poke_interval)
-                    new_success, new_failure = self._get_latest_success_and_failure(
-                        connector_id
-                    )
+                new_success, new_failure = self.wait_for_job(
+                    lambda: self._get_latest_success_and_failure(connector_id),
+                    lambda latest: latest != (prev_success, prev_failure),
+                    description=f"Sync of connector {connector_id}",
+                    max_interval=poke_interval,
+                )
                 logger.info("Sync completed")
                 logger.info("Checking for new failure")
                 if (
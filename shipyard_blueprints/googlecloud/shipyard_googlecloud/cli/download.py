@@ -6,7 +6,7 @@ import sys
 from shipyard_bp_utils import files as shipyard
 from shipyard_templates import ShipyardLogger, ExitCodeException, CloudStorage
 
-from shipyard_googlecloud import utils
+from shipyard_googlecloud import transfers, utils
 
 logger = ShipyardLogger().get_logger()
 
@@ -43,6 +43,13 @@ def get_args():
         default=None,
         required=False,
     )
+    parser.add_argument(
+        "--max-workers",
+        dest="max_workers",
+        type=int,
+        default=transfers.DEFAULT_MAX_WORKERS,
+        required=False,
+    )
     return parser.parse_args()
 
 
@@ -104,30 +111,32 @@ def main():
                 blob=blob, destination_file_name=destination_name
             )
         elif args.source_file_name_match_type == "regex_match":
-            blobs = list(bucket.list_blobs(prefix=source_folder_name))
-            file_names = [blob.name for blob in blobs]
-            matching_file_names = shipyard.find_all_file_matches(
-                file_names, re.compile(source_file_name)
+            matching_blobs = list(
+                transfers.iter_matching_blobs(
+                    bucket, prefix=source_folder_name, file_name_re=source_file_name
+                )
             )
-            if not matching_file_names:
+            if not matching_blobs:
                 raise FileNotFoundError(f"No files found matching {source_file_name}")
 
-            logger.info(
-                f"{len(matching_file_names)} files found. Preparing to download..."
-            )
-
-            for index, blob_name in enumerate(matching_file_names, start=1):
-                destination_name = shipyard.determine_destination_full_path(
-                    destination_folder_name=destination_folder_name,
-                    destination_file_name=args.destination_file_name,
-                    source_full_path=blob_name,
-                    file_number=index,
-                )
-
-                logger.info(f"Downloading file {index} of {len(matching_file_names)}")
-                download_google_cloud_storage_file(
-                    blob=bucket.blob(blob_name), destination_file_name=destination_name
+            logger.info(f"{len(matching_blobs)} files found. Preparing to download...")
+
+            downloads = [
+                (
+                    blob,
+                    os.path.join(
+                        os.getcwd(),
+                        shipyard.determine_destination_full_path(
+                            destination_folder_name=destination_folder_name,
+                            destination_file_name=args.destination_file_name,
+                            source_full_path=blob.name,
+                            file_number=index,
+                        ),
+                    ),
                 )
+                for index, blob in enumerate(matching_blobs, start=1)
+            ]
+            transfers.download_blobs(downloads, max_workers=args.max_workers)
     except ExitCodeException as e:
         logger.error(e)
         sys.exit(e.exit_code)
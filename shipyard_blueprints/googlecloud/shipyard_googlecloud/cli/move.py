@@ -6,7 +6,7 @@ import sys
 from shipyard_bp_utils import files as shipyard
 from shipyard_templates import ShipyardLogger, ExitCodeException, CloudStorage
 
-from shipyard_googlecloud import utils
+from shipyard_googlecloud import transfers, utils
 
 logger = ShipyardLogger().get_logger()
 
@@ -48,6 +48,13 @@ def get_args():
         default=None,
         required=False,
     )
+    parser.add_argument(
+        "--max-workers",
+        dest="max_workers",
+        type=int,
+        default=transfers.DEFAULT_MAX_WORKERS,
+        required=False,
+    )
     return parser.parse_args()
 
 
@@ -129,31 +136,38 @@ def main():
                 destination_blob_path=destination_full_path,
             )
         elif source_file_name_match_type == "regex_match":
-            blobs = list(source_bucket.list_blobs(prefix=source_folder_name))
-            file_names = list(map(lambda x: x.name, blobs))
-            matching_file_names = shipyard.find_all_file_matches(
-                file_names, re.compile(source_file_name)
+            matching_blobs = list(
+                transfers.iter_matching_blobs(
+                    source_bucket,
+                    prefix=source_folder_name,
+                    file_name_re=source_file_name,
+                )
             )
 
-            if not matching_file_names:
+            if not matching_blobs:
                 raise FileNotFoundError(f"No files found matching {source_file_name}")
-            number_of_matches = len(matching_file_names)
+            number_of_matches = len(matching_blobs)
             logger.info(f"{number_of_matches} files found. Preparing to move...")
 
-            for index, blob in enumerate(matching_file_names, 1):
-                destination_full_path = shipyard.determine_destination_full_path(
-                    destination_folder_name=destination_folder_name,
-                    destination_file_name=destination_file_name,
-                    source_full_path=blob,
-                    file_number=None if number_of_matches == 1 else index,
-                )
-                logger.info(f"moving file {index} of {number_of_matches}")
-                move_google_cloud_storage_file(
-                    source_bucket=source_bucket,
-                    source_blob_path=blob,
-                    destination_bucket=destination_bucket,
-                    destination_blob_path=destination_full_path,
+            moves = [
+                (
+                    blob,
+                    shipyard.determine_destination_full_path(
+                        destination_folder_name=destination_folder_name,
+                        destination_file_name=destination_file_name,
+                        source_full_path=blob.name,
+                        file_number=None if number_of_matches == 1 else index,
+                    ),
                 )
+                for index, blob in enumerate(matching_blobs, 1)
+            ]
+            transfers.move_blobs(
+                gclient,
+                source_bucket,
+                destination_bucket,
+                moves,
+                max_workers=args.max_workers,
+            )
     except ExitCodeException as e:
         logger.error(e)
         sys.exit(e.exit_code)
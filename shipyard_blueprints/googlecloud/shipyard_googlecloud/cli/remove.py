@@ -6,7 +6,7 @@ import sys
 from shipyard_bp_utils import files as shipyard
 from shipyard_templates import ShipyardLogger, CloudStorage, ExitCodeException
 
-from shipyard_googlecloud import utils
+from shipyard_googlecloud import transfers, utils
 
 logger = ShipyardLogger().get_logger()
 
@@ -31,6 +31,13 @@ def get_args():
         default=None,
         required=True,
     )
+    parser.add_argument(
+        "--max-workers",
+        dest="max_workers",
+        type=int,
+        default=transfers.DEFAULT_MAX_WORKERS,
+        required=False,
+    )
     return parser.parse_args()
 
 
@@ -65,19 +72,18 @@ def main():
             delete_google_cloud_storage_file(blob=blob)
 
         elif args.source_file_name_match_type == "regex_match":
-            blobs = list(bucket.list_blobs(prefix=source_folder_name))
-            file_names = [blob.name for blob in blobs]
-            matching_file_names = shipyard.find_all_file_matches(
-                file_names, re.compile(source_file_name)
-            )
+            matching_file_names = [
+                blob.name
+                for blob in transfers.iter_matching_blobs(
+                    bucket, prefix=source_folder_name, file_name_re=source_file_name
+                )
+            ]
             if not matching_file_names:
                 raise FileNotFoundError(f"No files found matching {source_file_name}")
             number_of_matches = len(matching_file_names)
             logger.info(f"{number_of_matches} files found. Preparing to delete...")
 
-            for index, blob in enumerate(matching_file_names, start=1):
-                logger.info(f"deleting file {index} of {number_of_matches}")
-                delete_google_cloud_storage_file(blob=bucket.blob(blob))
+            transfers.delete_blobs(gclient, bucket, matching_file_names)
     except ExitCodeException as e:
         logger.error(e)
         sys.exit(e.exit_code)
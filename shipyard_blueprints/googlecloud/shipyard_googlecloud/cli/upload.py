@@ -7,7 +7,7 @@ import json
 from shipyard_bp_utils import files as shipyard
 from shipyard_templates import ShipyardLogger, CloudStorage, ExitCodeException
 
-from shipyard_googlecloud import utils
+from shipyard_googlecloud import transfers, utils
 
 logger = ShipyardLogger().get_logger()
 
@@ -44,6 +44,21 @@ def get_args():
         default=None,
         required=False,
     )
+    parser.add_argument(
+        "--max-workers",
+        dest="max_workers",
+        type=int,
+        default=transfers.DEFAULT_MAX_WORKERS,
+        required=False,
+    )
+    parser.add_argument(
+        "--sync",
+        dest="sync",
+        default="no",
+        choices={"yes", "no"},
+        required=False,
+        help="Only upload files whose content differs from the existing object",
+    )
     return parser.parse_args()
 
 
@@ -72,35 +87,48 @@ def main():
                 destination_file_name=args.destination_file_name,
                 source_full_path=source_full_path,
             )
-            utils.upload_file(
-                source_full_path=source_full_path,
-                destination_full_path=destination_full_path,
-                bucket=bucket,
-            )
+            uploads = [(source_full_path, destination_full_path)]
+            if args.sync == "yes":
+                uploads = shipyard.files_to_sync(
+                    uploads, lambda name: transfers.blob_md5(bucket, name)
+                )
+            for source, destination in uploads:
+                utils.upload_file(
+                    source_full_path=source,
+                    destination_full_path=destination,
+                    bucket=bucket,
+                )
         elif args.source_file_name_match_type == "regex_match":
             file_names = shipyard.find_all_local_file_names(args.source_folder_name)
             matching_file_names = shipyard.find_all_file_matches(
                 file_names, re.compile(source_file_name)
             )
 
-            if number_of_matches := len(matching_file_names) == 0:
+            number_of_matches = len(matching_file_names)
+            if number_of_matches == 0:
                 raise FileNotFoundError(f"No files found matching {source_file_name}")
 
             logger.info(f"{number_of_matches} files found. Preparing to upload...")
 
-            for index, key_name in enumerate(matching_file_names, start=1):
-                destination_full_path = shipyard.determine_destination_full_path(
-                    destination_folder_name=destination_folder_name,
-                    destination_file_name=args.destination_file_name,
-                    source_full_path=key_name,
-                    file_number=index,
+            uploads = [
+                (
+                    key_name,
+                    shipyard.determine_destination_full_path(
+                        destination_folder_name=destination_folder_name,
+                        destination_file_name=args.destination_file_name,
+                        source_full_path=key_name,
+                        file_number=index,
+                    ),
                 )
-                logger.info(f"Uploading file {index} of {number_of_matches}")
-                utils.upload_file(
-                    source_full_path=key_name,
-                    destination_full_path=destination_full_path,
-                    bucket=bucket,
+                for index, key_name in enumerate(matching_file_names, start=1)
+            ]
+            if args.sync == "yes":
+                uploads = shipyard.files_to_sync(
+                    uploads,
+                    lambda name: transfers.blob_md5(bucket, name),
+                    max_workers=args.max_workers,
                 )
+            transfers.upload_files(bucket, uploads, max_workers=args.max_workers)
     except ExitCodeException as e:
         logger.error(e)
         sys.exit(e.exit_code)
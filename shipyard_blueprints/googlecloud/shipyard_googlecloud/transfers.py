@@ -0,0 +1,240 @@
+import base64
+import os
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterator, List, Optional, Tuple
+
+from google.api_core.exceptions import NotFound
+from google.cloud.storage import transfer_manager
+from shipyard_templates import ShipyardLogger, ExitCodeException, CloudStorage
+
+from shipyard_googlecloud import utils
+
+logger = ShipyardLogger().get_logger()
+
+DEFAULT_MAX_WORKERS = 8
+# Only the fields the blueprints use are requested when listing a bucket
+LIST_FIELDS = "items(name,size,crc32c),nextPageToken"
+# Objects at least this large are downloaded as concurrent ranged slices
+SLICED_DOWNLOAD_THRESHOLD = 256 * 1024 * 1024
+SLICE_SIZE = 32 * 1024 * 1024
+SLICE_WORKERS = 4
+# Google recommends no more than 100 calls in a single JSON batch request
+DELETE_BATCH_SIZE = 100
+
+EXIT_CODE_MOVE_ERROR = 101
+EXIT_CODE_DELETE_ERROR = 102
+
+
+class TransferStats:
+    """
+    Counts the objects and bytes processed during a run and logs the throughput.
+    """
+
+    def __init__(self, verb: str) -> None:
+        self.verb = verb
+        self.files = 0
+        self.bytes = 0
+        self.started = time.monotonic()
+        self._lock = threading.Lock()
+
+    def add(self, size: int = 0) -> None:
+        with self._lock:
+            self.files += 1
+            self.bytes += size or 0
+
+    def log_summary(self) -> None:
+        elapsed = max(time.monotonic() - self.started, 1e-6)
+        megabytes = self.bytes / (1024 * 1024)
+        logger.info(
+            f"{self.verb} {self.files} files ({megabytes:.1f} MB) in {elapsed:.1f}s "
+            f"({self.files / elapsed:.1f} files/s, {megabytes / elapsed:.1f} MB/s)"
+        )
+
+
+def iter_matching_blobs(bucket, prefix: str, file_name_re: str) -> Iterator:
+    """
+    Streams the bucket listing page by page and yields the blobs whose name matches
+    the regular expression, so the full listing is never held in memory.
+    """
+    pattern = re.compile(file_name_re)
+    for blob in bucket.list_blobs(prefix=prefix, fields=LIST_FIELDS):
+        if pattern.search(blob.name):
+            yield blob
+
+
+def run_concurrently(
+    operation: Callable, jobs: List, max_workers: int = DEFAULT_MAX_WORKERS
+) -> List[Tuple]:
+    """
+    Runs `operation` for every job on a bounded pool of threads. Every job is attempted;
+    the (job, exception) pairs of the ones that failed are returned.
+    """
+
+    def run(job):
+        try:
+            operation(job)
+        except Exception as e:
+            logger.error(f"{job[0]}: {e}")
+            return job, e
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return [failure for failure in executor.map(run, jobs) if failure]
+
+
+def download_blob(blob, local_path: str) -> None:
+    """
+    Downloads a single blob, splitting objects above SLICED_DOWNLOAD_THRESHOLD into
+    ranged slices that are fetched concurrently.
+    """
+    if blob.size and blob.size >= SLICED_DOWNLOAD_THRESHOLD:
+        transfer_manager.download_chunks_concurrently(
+            blob,
+            local_path,
+            chunk_size=SLICE_SIZE,
+            worker_type=transfer_manager.THREAD,
+            max_workers=SLICE_WORKERS,
+        )
+    else:
+        blob.download_to_filename(local_path)
+    logger.debug(
+        f"{blob.bucket.name}/{blob.name} successfully downloaded to {local_path}"
+    )
+
+
+def download_blobs(
+    downloads: List[Tuple], max_workers: int = DEFAULT_MAX_WORKERS
+) -> None:
+    """
+    Downloads (blob, local_path) pairs concurrently.
+    """
+    stats = TransferStats("Downloaded")
+
+    def download(job):
+        blob, local_path = job
+        download_blob(blob, local_path)
+        stats.add(blob.size)
+
+    failures = run_concurrently(download, downloads, max_workers)
+    stats.log_summary()
+    if failures:
+        raise ExitCodeException(
+            f"Failed to download {len(failures)} of {len(downloads)} files",
+            CloudStorage.EXIT_CODE_DOWNLOAD_ERROR,
+        )
+
+
+def upload_files(
+    bucket, uploads: List[Tuple[str, str]], max_workers: int = DEFAULT_MAX_WORKERS
+) -> None:
+    """
+    Uploads (source_full_path, destination_full_path) pairs concurrently.
+    """
+    stats = TransferStats("Uploaded")
+
+    def upload(job):
+        source_full_path, destination_full_path = job
+        utils.upload_file(bucket, source_full_path, destination_full_path)
+        stats.add(os.path.getsize(source_full_path))
+
+    failures = run_concurrently(upload, uploads, max_workers)
+    stats.log_summary()
+    if failures:
+        raise ExitCodeException(
+            f"Failed to upload {len(failures)} of {len(uploads)} files",
+            CloudStorage.EXIT_CODE_UPLOAD_ERROR,
+        )
+
+
+def blob_md5(bucket, blob_name: str) -> Optional[str]:
+    """
+    Returns the MD5 of an object as hex, for comparison with a local file, or None when the
+    object does not exist or has no MD5 (composite objects only have a CRC32C).
+    """
+    blob = bucket.get_blob(blob_name)
+    if blob is None or not blob.md5_hash:
+        return None
+    return base64.b64decode(blob.md5_hash).hex()
+
+
+def rewrite_blob(source_blob, destination_blob) -> None:
+    """
+    Copies a blob server side with the rewrite API. Large or cross-location copies may
+    need several rewrite calls, each continuing from the token returned by the last.
+    """
+    token, _, _ = destination_blob.rewrite(source_blob)
+    while token is not None:
+        token, _, _ = destination_blob.rewrite(source_blob, token=token)
+
+
+def move_blobs(
+    gclient,
+    source_bucket,
+    destination_bucket,
+    moves: List[Tuple],
+    max_workers: int = DEFAULT_MAX_WORKERS,
+) -> None:
+    """
+    Moves (source_blob, destination_blob_path) pairs. Every copy is rewritten server side
+    concurrently, then the sources of the successful copies are deleted in batches.
+    """
+    stats = TransferStats("Moved")
+    copied = []
+
+    def copy(job):
+        source_blob, destination_blob_path = job
+        rewrite_blob(source_blob, destination_bucket.blob(destination_blob_path))
+        copied.append(source_blob.name)
+        stats.add(source_blob.size)
+
+    failures = run_concurrently(copy, moves, max_workers)
+    delete_blobs(gclient, source_bucket, copied)
+    stats.log_summary()
+    if failures:
+        raise ExitCodeException(
+            f"Failed to move {len(failures)} of {len(moves)} files",
+            EXIT_CODE_MOVE_ERROR,
+        )
+
+
+def delete_blobs(gclient, bucket, blob_names: List[str]) -> None:
+    """
+    Deletes blobs with the JSON batch API, sending DELETE_BATCH_SIZE deletes per request.
+    A batch only reports its last failed delete, so when one fails each of its blobs is
+    deleted again on its own. Blobs that no longer exist are counted as deleted.
+    """
+    stats = TransferStats("Deleted")
+    failures = {}
+    for start in range(0, len(blob_names), DELETE_BATCH_SIZE):
+        batch_names = blob_names[start : start + DELETE_BATCH_SIZE]
+        try:
+            with gclient.batch():
+                for blob_name in batch_names:
+                    bucket.delete_blob(blob_name)
+        except Exception as e:
+            logger.debug(
+                f"Batch delete of {batch_names[0]}..{batch_names[-1]} failed, "
+                f"deleting each file on its own: {e}"
+            )
+            for blob_name in batch_names:
+                try:
+                    bucket.delete_blob(blob_name)
+                except NotFound:
+                    logger.debug(f"{blob_name} was already deleted")
+                except Exception as e:
+                    failures[blob_name] = str(e)
+                    continue
+                stats.add()
+            continue
+        for _ in batch_names:
+            stats.add()
+    stats.log_summary()
+    if failures:
+        for blob_name, reason in failures.items():
+            logger.error(f"Failed to delete {blob_name}: {reason}")
+        raise ExitCodeException(
+            f"Failed to delete {len(failures)} of {len(blob_names)} files in {bucket.name}",
+            EXIT_CODE_DELETE_ERROR,
+        )
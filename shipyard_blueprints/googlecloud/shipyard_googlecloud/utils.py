@@ -2,6 +2,7 @@ import json
 import os
 import tempfile
 
+from google.auth.credentials import AnonymousCredentials
 from google.cloud import storage
 from google.cloud.exceptions import *
 from shipyard_templates import ShipyardLogger, ExitCodeException, CloudStorage
@@ -69,9 +70,16 @@ def upload_file(bucket, source_full_path, destination_full_path):
 def get_gclient():
     """
     Attempts to create the Google Cloud Storage Client with the associated
-    environment variables
+    environment variables. When STORAGE_EMULATOR_HOST points at a local fake GCS
+    server, an anonymous client is returned instead.
     """
     try:
+        if os.environ.get("STORAGE_EMULATOR_HOST"):
+            logger.debug("Using the Google Cloud Storage emulator")
+            return storage.Client(
+                project=os.environ.get("GOOGLE_CLOUD_PROJECT", "test"),
+                credentials=AnonymousCredentials(),
+            )
         return storage.Client(credentials=_get_credentials())
     except ExitCodeException:
         raise
@@ -0,0 +1,181 @@
+from contextlib import contextmanager
+from unittest.mock import MagicMock
+
+import pytest
+from google.api_core.exceptions import (
+    Forbidden,
+    GoogleAPICallError,
+    NotFound,
+    ServiceUnavailable,
+)
+from shipyard_templates import ExitCodeException
+
+from shipyard_googlecloud import transfers
+
+
+def make_blob(name, size=10):
+    blob = MagicMock()
+    blob.name = name
+    blob.size = size
+    return blob
+
+
+class FakeClient:
+    """Mimics a storage client whose batches raise only the last failed delete"""
+
+    def __init__(self, statuses=None, fail_batches=()):
+        self.batches = []
+        self.single_deletes = []
+        self.deleted = set()
+        self.statuses = statuses or {}
+        self.fail_batches = set(fail_batches)
+        self.in_batch = False
+
+    @contextmanager
+    def batch(self):
+        names = []
+        self.batches.append(names)
+        self.in_batch = True
+        try:
+            yield
+        finally:
+            self.in_batch = False
+        if len(self.batches) in self.fail_batches:
+            raise ServiceUnavailable("Service Unavailable")
+        error = None
+        for name in names:
+            try:
+                self.delete(name)
+            except GoogleAPICallError as e:
+                error = e
+        if error:
+            raise error
+
+    def delete(self, name):
+        if name in self.deleted or self.statuses.get(name) == 404:
+            raise NotFound(name)
+        if self.statuses.get(name) == 403:
+            raise Forbidden(name)
+        self.deleted.add(name)
+
+    def delete_blob(self, name):
+        if self.in_batch:
+            self.batches[-1].append(name)
+        else:
+            self.single_deletes.append(name)
+            self.delete(name)
+
+
+def make_bucket(client):
+    bucket = MagicMock()
+    bucket.name = "bucket"
+    bucket.delete_blob.side_effect = client.delete_blob
+    return bucket
+
+
+def test_iter_matching_blobs_filters_listing():
+    bucket = MagicMock()
+    bucket.list_blobs.return_value = iter(
+        [make_blob("data/a.csv"), make_blob("data/b.txt"), make_blob("data/c.csv")]
+    )
+
+    names = [
+        blob.name for blob in transfers.iter_matching_blobs(bucket, "data", r"\.csv$")
+    ]
+
+    assert names == ["data/a.csv", "data/c.csv"]
+    assert bucket.list_blobs.call_args.kwargs["fields"] == transfers.LIST_FIELDS
+
+
+def test_delete_blobs_sends_batches(monkeypatch):
+    monkeypatch.setattr(transfers, "DELETE_BATCH_SIZE", 2)
+    client = FakeClient()
+    bucket = make_bucket(client)
+
+    transfers.delete_blobs(client, bucket, ["a", "b", "c"])
+
+    assert client.batches == [["a", "b"], ["c"]]
+
+
+def test_delete_blobs_retries_each_file_after_failed_batch(monkeypatch):
+    monkeypatch.setattr(transfers, "DELETE_BATCH_SIZE", 2)
+    client = FakeClient(fail_batches={1})
+    bucket = make_bucket(client)
+
+    transfers.delete_blobs(client, bucket, ["a", "b", "c"])
+
+    assert client.batches == [["a", "b"], ["c"]]
+    assert client.single_deletes == ["a", "b"]
+    assert client.deleted == {"a", "b", "c"}
+
+
+def test_delete_blobs_reports_files_that_fail_on_their_own():
+    client = FakeClient(statuses={"b": 403})
+    bucket = make_bucket(client)
+
+    with pytest.raises(ExitCodeException, match="1 of 3") as e:
+        transfers.delete_blobs(client, bucket, ["a", "b", "c"])
+
+    assert e.value.exit_code == transfers.EXIT_CODE_DELETE_ERROR
+    assert client.single_deletes == ["a", "b", "c"]
+
+
+def test_delete_blobs_treats_missing_blobs_as_deleted():
+    client = FakeClient(statuses={"b": 404})
+    bucket = make_bucket(client)
+
+    transfers.delete_blobs(client, bucket, ["a", "b", "c"])
+
+    assert client.deleted == {"a", "c"}
+
+
+def test_rewrite_blob_follows_token():
+    destination = MagicMock()
+    destination.rewrite.side_effect = [("token", 5, 10), (None, 10, 10)]
+    source = make_blob("a")
+
+    transfers.rewrite_blob(source, destination)
+
+    assert destination.rewrite.call_args_list[1].kwargs == {"token": "token"}
+
+
+def test_move_blobs_only_deletes_copied_sources():
+    client = FakeClient()
+    source_bucket = make_bucket(client)
+    destination_bucket = MagicMock()
+    good, bad = make_blob("good"), make_blob("bad")
+    failing_destination = MagicMock()
+    failing_destination.rewrite.side_effect = RuntimeError("403 Forbidden")
+    destination_bucket.blob.side_effect = lambda path: (
+        failing_destination
+        if path == "x/bad"
+        else MagicMock(**{"rewrite.return_value": (None, 1, 1)})
+    )
+
+    with pytest.raises(ExitCodeException) as e:
+        transfers.move_blobs(
+            client,
+            source_bucket,
+            destination_bucket,
+            [(good, "x/good"), (bad, "x/bad")],
+        )
+
+    assert e.value.exit_code == transfers.EXIT_CODE_MOVE_ERROR
+    assert client.batches == [["good"]]
+
+
+def test_download_blob_slices_large_objects(monkeypatch):
+    sliced = []
+    monkeypatch.setattr(
+        transfers.transfer_manager,
+        "download_chunks_concurrently",
+        lambda blob, path, **kwargs: sliced.append(blob.name),
+    )
+    small = make_blob("small")
+    large = make_blob("large", size=transfers.SLICED_DOWNLOAD_THRESHOLD)
+
+    transfers.download_blob(small, "small")
+    transfers.download_blob(large, "large")
+
+    assert sliced == ["large"]
+    small.download_to_filename.assert_called_once_with("small")
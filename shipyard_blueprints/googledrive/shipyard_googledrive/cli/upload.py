@@ -2,6 +2,7 @@ import os
 import sys
 import argparse
 import re
+from typing import Optional
 
 from shipyard_templates import ExitCodeException, ShipyardLogger
 from shipyard_googledrive import GoogleDriveClient, drive_utils
@@ -34,9 +35,53 @@ def get_args():
         required=False,
         default="",
     )
+    parser.add_argument(
+        "--sync",
+        dest="sync",
+        default="no",
+        choices={"yes", "no"},
+        required=False,
+        help="Only upload files whose content differs from the existing file in Drive",
+    )
     return parser.parse_args()
 
 
+def sync_uploads(
+    client: GoogleDriveClient,
+    uploads: list,
+    drive_folder: Optional[str],
+    drive_name: Optional[str],
+) -> list:
+    """
+    Returns the (local file, drive file name) uploads whose file in Drive is missing or has a
+    different md5Checksum. Files are compared one at a time, as the Drive service is not
+    thread safe.
+    """
+    drive_id = None
+    if drive_name:
+        drive_id = drive_utils.get_drive_id(drive_id=drive_name, service=client.service)
+    if drive_folder:
+        folder_id = drive_utils.get_folder_id(
+            service=client.service, folder_identifier=drive_folder, drive_id=drive_id
+        )
+        if not folder_id:
+            # The folder is created by the upload, so none of the files exist yet
+            return uploads
+    else:
+        folder_id = drive_id or "root"
+
+    return files.files_to_sync(
+        uploads,
+        lambda drive_file_name: drive_utils.get_file_md5(
+            file_name=drive_file_name,
+            service=client.service,
+            drive_id=drive_id,
+            folder_id=folder_id,
+        ),
+        max_workers=1,
+    )
+
+
 def main():
     args = get_args()
     client = GoogleDriveClient(
@@ -68,12 +113,20 @@ def main():
         if len(file_matches) == 0:
             logger.error(f"No files found matching regex {args.source_file_name}")
             sys.exit(client.EXIT_CODE_FILE_NOT_FOUND)
-        for index, file in enumerate(file_matches, start=1):
-            new_file_name = files.determine_destination_file_name(
-                source_full_path=file,
-                destination_file_name=drive_file_name,
-                file_number=index,
+        uploads = [
+            (
+                file,
+                files.determine_destination_file_name(
+                    source_full_path=file,
+                    destination_file_name=drive_file_name,
+                    file_number=index,
+                ),
             )
+            for index, file in enumerate(file_matches, start=1)
+        ]
+        if args.sync == "yes":
+            uploads = sync_uploads(client, uploads, drive_folder, drive_name)
+        for file, new_file_name in uploads:
             client.upload(
                 file_path=file,
                 drive_folder=drive_folder,
@@ -85,6 +138,14 @@ def main():
     # for single file uploads
     else:  # handles the case for exact_match, any other option will receive an argument error
         try:
+            if args.sync == "yes" and not sync_uploads(
+                client,
+                [(source_path, drive_file_name or os.path.basename(source_path))],
+                drive_folder,
+                drive_name,
+            ):
+                logger.info(f"{source_path} is already up to date in Google Drive")
+                return
             client.upload(
                 file_path=source_path,
                 drive_folder=drive_folder,
@@ -136,6 +136,62 @@ def get_file_id(
         return None
 
 
+def get_file_md5(
+    file_name: str,
+    service,
+    drive_id: Optional[str] = None,
+    folder_id: Optional[str] = None,
+) -> Union[str, None]:
+    """Helper function to retrieve the MD5 checksum of a file in Google Drive
+
+    Args:
+        service (): The Google Drive service connection
+        file_name: The name of the file to lookup in Google Drive
+        drive_id: The Optional ID of the drive
+        folder_id: The optional ID of the folder. This is only necessary if the file resides in a folder
+
+    Raises:
+        ExitCodeException:
+
+    Returns: The md5Checksum of the file as hex, or None if the file does not exist or has no checksum (e.g. Google Docs)
+
+    """
+    # Drive query strings quote values with single quotes, so backslashes and
+    # quotes in the file name have to be escaped.
+    escaped_name = file_name.replace("\\", "\\\\").replace("'", "\\'")
+    query = f"name='{escaped_name}' and trashed=false"
+    if folder_id:
+        query += f" and '{folder_id}' in parents"
+    try:
+        if drive_id:
+            results = (
+                service.files()
+                .list(
+                    q=query,
+                    fields="files(id, md5Checksum)",
+                    includeItemsFromAllDrives=True,
+                    corpora="drive",
+                    driveId=drive_id,
+                    supportsAllDrives=True,
+                )
+                .execute()
+            )
+        else:
+            results = (
+                service.files().list(q=query, fields="files(id, md5Checksum)").execute()
+            )
+
+    except Exception as e:
+        raise ExitCodeException(
+            f"Error in fetching file checksum: {str(e)}", exit_code=203
+        )
+
+    else:
+        if results.get("files"):
+            return results["files"][0].get("md5Checksum")
+        return None
+
+
 def create_remote_folder(
     folder_name: str,
     service,
@@ -0,0 +1,63 @@
+import hashlib
+import re
+from types import SimpleNamespace
+
+from shipyard_googledrive import drive_utils
+from shipyard_googledrive.cli import upload
+
+
+class FakeFiles:
+    def __init__(self, checksums):
+        self.checksums = checksums
+        self.queries = []
+
+    def list(self, q, **kwargs):
+        self.queries.append(q)
+        escaped = re.match(r"name='((?:[^'\\]|\\.)*)'", q).group(1)
+        name = re.sub(r"\\(.)", r"\1", escaped)
+        found = []
+        if name in self.checksums:
+            found.append({"id": name, "md5Checksum": self.checksums[name]})
+        return SimpleNamespace(execute=lambda: {"files": found})
+
+
+def test_get_file_md5_looks_in_the_folder():
+    service = SimpleNamespace(files=lambda: files)
+    files = FakeFiles({"report.csv": "abc"})
+
+    assert drive_utils.get_file_md5("report.csv", service, folder_id="root") == "abc"
+    assert drive_utils.get_file_md5("other.csv", service, folder_id="root") is None
+    assert (
+        files.queries[0] == "name='report.csv' and trashed=false and 'root' in parents"
+    )
+
+
+def test_get_file_md5_escapes_quotes_in_the_name():
+    service = SimpleNamespace(files=lambda: files)
+    files = FakeFiles({"Q1 'final'.csv": "abc"})
+
+    assert drive_utils.get_file_md5("Q1 'final'.csv", service) == "abc"
+    assert files.queries[0] == "name='Q1 \\'final\\'.csv' and trashed=false"
+
+
+def test_sync_uploads_skips_unchanged_files(tmp_path, monkeypatch):
+    monkeypatch.setenv("SHIPYARD_HASH_CACHE_PATH", str(tmp_path / "hashes.json"))
+    same, changed = tmp_path / "same.csv", tmp_path / "changed.csv"
+    same.write_bytes(b"same")
+    changed.write_bytes(b"changed")
+    files = FakeFiles(
+        {
+            "same.csv": hashlib.md5(b"same").hexdigest(),
+            "changed.csv": hashlib.md5(b"old").hexdigest(),
+        }
+    )
+    client = SimpleNamespace(service=SimpleNamespace(files=lambda: files))
+
+    uploads = upload.sync_uploads(
+        client,
+        [(str(same), "same.csv"), (str(changed), "changed.csv")],
+        drive_folder=None,
+        drive_name=None,
+    )
+
+    assert uploads == [(str(changed), "changed.csv")]
@@ -1,11 +1,10 @@
 import re
 import sys
-import time
 import argparse
 import requests
 import shipyard_bp_utils as shipyard
 from shipyard_hex import HexClient
-from shipyard_templates import ExitCodeException, ShipyardLogger
+from shipyard_templates import ExitCodeException, JobWaiter, ShipyardLogger
 from shipyard_bp_utils.artifacts import Artifact
 import shipyard_hex.hex_exceptions as ec
 
@@ -38,22 +37,24 @@ def main():
 
         if wait:
             logger.info("Checking status of run")
-            run_status = client.determine_status(run_status_data)
-            logger.info(
-                f"Hex reports that the project status is {run_status_data['status']}"
-            )
-            while run_status in (ec.EXIT_CODE_RUNNING, ec.EXIT_CODE_PENDING):
-                logger.info("Waiting 60 seconds to check status")
-                time.sleep(60)
+
+            def check_run():
                 run_response = client.get_run_status(project_id, run_id)
                 logger.info(
                     f"Hex reports that the project status is {run_response['status']}"
                 )
-                run_status = client.determine_status(run_response)
+                return client.determine_status(run_response)
+
+            run_status = JobWaiter().wait(
+                check_run,
+                lambda status: status
+                not in (ec.EXIT_CODE_RUNNING, ec.EXIT_CODE_PENDING),
+                description=f"Run {run_id}",
+            )
             sys.exit(run_status)
-    except ExitCodeException as ec:
-        logger.error(ec.message)
-        sys.exit(ec.exit_code)
+    except ExitCodeException as error:
+        logger.error(error.message)
+        sys.exit(error.exit_code)
     except Exception as e:
         logger.error(f"An unexpected error occurred. Message from the API is: {e}")
 
@@ -1,7 +1,7 @@
 import requests
 from typing import Dict, Any
 
-from shipyard_templates import Notebooks, ShipyardLogger
+from shipyard_templates import HttpClient, Notebooks, ShipyardLogger
 from shipyard_hex.hex_exceptions import GetRunStatusError, RunProjectError
 import shipyard_hex.hex_exceptions as exit_codes
 
@@ -13,6 +13,7 @@ class HexClient(Notebooks):
         self.api_token = api_token
         self.headers = {"Authorization": f"Bearer {self.api_token}"}
         self.base_url = f"https://app.hex.tech/api/v1"
+        self.http = HttpClient(headers=self.headers)
         super().__init__()
 
     def connect(self, project_id: str) -> int:
@@ -23,9 +24,8 @@ class HexClient(Notebooks):
         """
 
         try:
-            response = requests.get(
-                url=f"https://app.hex.tech/api/v1/project/{project_id}/runs",
-                headers=self.headers,
+            response = self.http.get(
+                url=f"https://app.hex.tech/api/v1/project/{project_id}/runs"
             )
             response.raise_for_status()
         except Exception as e:
@@ -47,7 +47,7 @@ class HexClient(Notebooks):
         """
         try:
             url = f"{self.base_url}/project/{project_id}/run"
-            response = requests.post(url=url, headers=self.headers)
+            response = self.http.post(url=url)
             logger.debug(f"Status code returned is {response.status_code}")
             response.raise_for_status()
         except Exception as he:
@@ -71,7 +71,7 @@ class HexClient(Notebooks):
         """
         try:
             url = f"{self.base_url}/project/{project_id}/run/{run_id}"
-            response = requests.get(url=url, headers=self.headers)
+            response = self.http.get(url=url)
             logger.debug(f"Status code from response is {response.status_code}")
             logger.debug(f"Content of response is {response.text}")
             response.raise_for_status()
@@ -1,7 +1,6 @@
 import argparse
 import sys
 import requests
-import time
 from shipyard_templates import ExitCodeException
 
 import shipyard_utils as shipyard
@@ -53,19 +52,19 @@ def main():
         sys.exit(error.exit_code)
 
     if args.wait_for_completion == "TRUE" and (0 < int(args.poke_interval) <= 60):
-        sync_detail = hightouch.get_sync_status(sync_id, sync_run_id)
-        status = hightouch.determine_sync_status(sync_detail)
-
-        while status not in (
+        final_statuses = (
             hightouch.EXIT_CODE_FINAL_STATUS_COMPLETED,
             hightouch.EXIT_CODE_FINAL_STATUS_ERRORED,
             hightouch.EXIT_CODE_FINAL_STATUS_INCOMPLETE,
-        ):
-            hightouch.logger.info(f"Waiting {args.poke_interval} minute(s)...")
-            time.sleep(int(args.poke_interval) * 60)
-            sync_detail = hightouch.get_sync_status(sync_id, sync_run_id)
-            status = hightouch.determine_sync_status(sync_detail)
-
+        )
+        status = hightouch.wait_for_job(
+            lambda: hightouch.determine_sync_status(
+                hightouch.get_sync_status(sync_id, sync_run_id)
+            ),
+            lambda status: status in final_statuses,
+            description=f"Sync run {sync_run_id}",
+            max_interval=int(args.poke_interval) * 60,
+        )
         sys.exit(status)
     elif args.wait_for_completion == "TRUE":
         hightouch.logger.error("Poke interval must be between 1 and 60 minutes")
@@ -1,10 +1,9 @@
 import sys
-import time
 import requests
 import argparse
 
 from shipyard_hubspot import HubspotClient
-from shipyard_templates import ExitCodeException
+from shipyard_templates import ExitCodeException, JobWaiter
 
 
 def get_args():
@@ -46,15 +45,12 @@ def export_and_wait(client, args):
         object_properties=object_properties,
     ).get("id")
 
-    export_details = client.get_export(export_id)
-
-    while export_details.get("status") in {"PROCESSING", "PENDING"}:
-        client.logger.info(" Waiting 30 seconds...")
-        time.sleep(30)
-
-        export_details = client.get_export(export_id)
-
-    return export_details
+    return JobWaiter().wait(
+        lambda: client.get_export(export_id),
+        lambda export_details: export_details.get("status")
+        not in {"PROCESSING", "PENDING"},
+        description=f"Export {export_id}",
+    )
 
 
 def main():
@@ -1,11 +1,10 @@
 import os
 import re
 import sys
-import time
 import argparse
 
 from shipyard_hubspot import HubspotClient
-from shipyard_templates import ExitCodeException
+from shipyard_templates import ExitCodeException, JobWaiter
 
 
 def get_args():
@@ -80,16 +79,13 @@ def import_file(
         file_format=file_format,
     ).get("id")
 
-    while client.get_import_status(import_job_id).get("state") not in {
-        "FAILED",
-        "CANCELED",
-        "DONE",
-        None,
-    }:
-        client.logger.info("Waiting for import to complete...")
-        time.sleep(30)
+    import_status = JobWaiter().wait(
+        lambda: client.get_import_status(import_job_id),
+        lambda status: status.get("state") in {"FAILED", "CANCELED", "DONE", None},
+        description=f"Import {import_job_id}",
+    )
 
-    job_metadata = client.get_import_status(import_job_id).get("metadata", {})
+    job_metadata = import_status.get("metadata", {})
     metadata_counters = job_metadata.get("counters", {})
     error_count = metadata_counters.get("ERRORS", 0)
     if error_count > 0:
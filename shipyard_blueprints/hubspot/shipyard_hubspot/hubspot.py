@@ -4,10 +4,13 @@ import json
 from logging import DEBUG
 from typing import Dict, List, Union, Optional
 
-from requests import request
-from shipyard_templates import Crm, ExitCodeException
+from shipyard_templates import Crm, ExitCodeException, HttpClient, truncate
 from shipyard_hubspot.hubspot_utils import HubspotUtility
 
+# Import files are not cut off by the HTTP client's default timeout, as large files can take
+# longer than that to send
+UPLOAD_TIMEOUT = None
+
 
 class HubspotClient(Crm):
     """
@@ -17,6 +20,10 @@ class HubspotClient(Crm):
         access_token (str): The access token used for authentication.
     """
 
+    # Hubspot allows 100 requests every 10 seconds on its lowest API tier
+    MAX_REQUESTS_PER_SECOND = 10
+    MAX_BURST = 100
+
     def __init__(self, access_token: str, verbose: bool = False):
         """
         Initialize the HubspotClient.
@@ -25,6 +32,9 @@ class HubspotClient(Crm):
         :param verbose: If True, sets the logger to debug mode.
         """
         self.access_token = access_token
+        self.http = HttpClient(
+            rate_limit=self.MAX_REQUESTS_PER_SECOND, burst=self.MAX_BURST
+        )
         super().__init__(access_token)
         self.logger.info("HubspotClient initialized")
         if verbose:
@@ -59,24 +69,26 @@ class HubspotClient(Crm):
         else:
             headers["Authorization"] = f"Bearer {self.access_token}"
 
-        self.logger.debug(f"Making {method} request to {endpoint}")
+        self.logger.debug("Making %s request to %s", method, endpoint)
 
-        response = request(
+        response = self.http.request(
             method=method,
             url=f"https://api.hubapi.com/{endpoint}",
             data=json.dumps(payload),
             headers=headers,
         )
 
-        self.logger.debug(f"Response status code: {response.status_code}")
+        self.logger.debug("Response status code: %s", response.status_code)
         try:
             response_details = response.json()
         except json.decoder.JSONDecodeError:
-            self.logger.warning(f"Response body is not JSON: {response.text}")
+            self.logger.warning(
+                "Response body is not JSON: %s", truncate(response.text)
+            )
             response_details = {}
 
         if response.ok:
-            self.logger.debug(response_details)
+            self.logger.debug("Response: %s", truncate(response_details))
             return response_details
         else:
             HubspotUtility.handle_request_errors(response)
@@ -158,18 +170,19 @@ class HubspotClient(Crm):
                 "files": (os.path.basename(filename), file, "text/csv"),
                 "importRequest": (None, json.dumps(import_data), "application/json"),
             }
-            response = request(
+            response = self.http.request(
                 url="https://api.hubapi.com/crm/v3/imports",
                 method="POST",
                 files=files,
                 headers={
                     "Authorization": f"Bearer {self.access_token}",
                 },
+                timeout=UPLOAD_TIMEOUT,
             )
 
         if response.ok:
-            self.logger.debug(response.json())
             response = response.json()
+            self.logger.debug("Response: %s", truncate(response))
             import_job_id = response["id"]
             self.logger.info(
                 f"Successfully triggered import with import id: {import_job_id}"
@@ -216,7 +229,9 @@ class HubspotClient(Crm):
             ],
             "dateFormat": date_format,
         }
-        self.logger.debug(f"The following import data will be sent to Hubspot: {data}")
+        self.logger.debug(
+            "The following import data will be sent to Hubspot: %s", truncate(data)
+        )
         try:
             response = self.import_data(filename, data)
         except ExitCodeException as err:
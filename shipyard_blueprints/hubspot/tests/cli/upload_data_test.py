@@ -0,0 +1,25 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+from shipyard_templates import ExitCodeException
+
+from shipyard_hubspot.cli import upload_data
+
+
+@patch("shipyard_templates.etl.time.sleep")
+def test_import_file_reads_errors_from_the_final_poll(mock_sleep):
+    client = MagicMock()
+    client.import_contact_data.return_value = {"id": "job-1"}
+    client.get_import_status.side_effect = [
+        {"state": "PROCESSING"},
+        {"state": "DONE", "metadata": {"counters": {"ERRORS": 2}}},
+    ]
+
+    with pytest.raises(ExitCodeException) as execinfo:
+        upload_data.import_file(
+            client, "import", "data.csv", "CREATE", "contacts", "CSV"
+        )
+
+    assert execinfo.value.exit_code == client.EXIT_CODE_UPLOAD_FAILED
+    assert client.get_import_status.call_count == 2
+    mock_sleep.assert_called_once()
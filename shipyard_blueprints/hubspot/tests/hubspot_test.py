@@ -75,3 +75,13 @@ def test_handle_import_file_file_not_exists():
     with pytest.raises(ExitCodeException) as e:
         HubspotUtility.handle_import_file("non_existent_file.csv", "contacts")
     assert e.value.exit_code == Crm.EXIT_CODE_FILE_NOT_FOUND
+
+
+def test_import_data_upload_has_no_timeout(client, tmp_path):
+    path = tmp_path / "contacts.csv"
+    path.write_text("email\na@example.com\n")
+    client.http = MagicMock()
+    client.http.request.return_value.json.return_value = {"id": "job-1"}
+
+    assert client.import_data(str(path), {"name": "import"}) == {"id": "job-1"}
+    assert client.http.request.call_args.kwargs["timeout"] is None
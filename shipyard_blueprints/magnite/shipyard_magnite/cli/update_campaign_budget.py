@@ -1,5 +1,6 @@
 import argparse
 import sys
+from concurrent.futures import ThreadPoolExecutor
 
 from shipyard_templates import ShipyardLogger, ExitCodeException
 from shipyard_templates.errors import EXIT_CODE_UNKNOWN_ERROR
@@ -31,12 +32,21 @@ def get_args():
     parser.add_argument(
         "--file", required=True, help="Path to the CSV file containing budget data"
     )
+    parser.add_argument(
+        "--max-workers",
+        type=int,
+        default=MagniteClient.DEFAULT_MAX_WORKERS,
+        help="Number of campaigns to update concurrently",
+    )
     return parser.parse_args()
 
 
-def process_campaign(client, campaign_id, budget_data):
+def process_campaign(client, campaign_id, budget_data, campaign=None):
     """
     Process a single campaign's budget.
+
+    If the campaign was already retrieved (see `process_campaigns`), its prefetched data is
+    used instead of requesting it again.
     """
     try:
         logger.info(f"Processing campaign ID: {campaign_id}...")
@@ -56,9 +66,8 @@ def process_campaign(client, campaign_id, budget_data):
                 f"{chr(10).join(str(budget) for budget in valid_budgets.items)}"
             )
 
-        profile_id = client.get_campaign_by_id(campaign_id)["targeting_spend_profile"][
-            "id"
-        ]
+        campaign = campaign or client.get_campaign_by_id(campaign_id)
+        profile_id = campaign["targeting_spend_profile"]["id"]
         spend_profile = TargetingSpendProfile(id=profile_id, budgets=valid_budgets)
         client.update_campaign_budgets(campaign_id, spend_profile)
 
@@ -82,6 +91,29 @@ def process_campaign(client, campaign_id, budget_data):
         return {"errors": [campaign_id], "report": {campaign_id: f"Error: {str(e)}"}}
 
 
+def process_campaigns(client, campaigns, max_workers=MagniteClient.DEFAULT_MAX_WORKERS):
+    """
+    Process every campaign's budget with a bounded pool of workers sharing one client.
+
+    The campaigns' spend profiles are prefetched up front, then the updates are sent
+    concurrently. Results are returned in the same order as `campaigns`.
+    """
+    prefetched = client.get_campaigns_by_ids(list(campaigns), max_workers=max_workers)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(
+                process_campaign,
+                client,
+                campaign_id,
+                budget_data,
+                prefetched.get(campaign_id),
+            )
+            for campaign_id, budget_data in campaigns.items()
+        ]
+        return [future.result() for future in futures]
+
+
 def main():
     try:
         args = get_args()
@@ -96,8 +128,7 @@ def main():
         errors = []
         reports = []
 
-        for campaign_id, budget_data in campaigns.items():
-            result = process_campaign(client, campaign_id, budget_data)
+        for result in process_campaigns(client, campaigns, args.max_workers):
             errors.extend(result["errors"])
             reports.append(result["report"])
 
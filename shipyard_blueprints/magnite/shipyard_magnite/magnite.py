@@ -1,8 +1,13 @@
 import json
 import os
-import requests
-import pandas as pd
-from shipyard_templates import DigitalAdvertising, ShipyardLogger, ExitCodeException
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from shipyard_templates import (
+    DigitalAdvertising,
+    ShipyardLogger,
+    ExitCodeException,
+    HttpClient,
+)
 from shipyard_templates import InvalidCredentialError
 from shipyard_magnite.errs import (
     ReadError,
@@ -16,14 +21,36 @@ logger = ShipyardLogger.get_logger()
 
 class MagniteClient(DigitalAdvertising):
     API_BASE_URL = "https://console.springserve.com/api/v0"
-
-    def __init__(self, username: str, password: str) -> None:
+    DEFAULT_MAX_WORKERS = 8
+    DEFAULT_MAX_REQUESTS_PER_SECOND = 10
+    MAX_RETRIES = 3
+    MAX_POOL_SIZE = 32
+
+    def __init__(
+        self,
+        username: str,
+        password: str,
+        max_requests_per_second: float = DEFAULT_MAX_REQUESTS_PER_SECOND,
+    ) -> None:
         """
         Initialize the Magnite client with credentials.
+
+        The client is safe to share between threads: requests go through a single pooled
+        session, token refreshes are serialized and all calls share one rate limit.
         """
         self.username = username
         self.password = password
         self._token = None
+        self._token_lock = threading.Lock()
+        # Only idempotent calls (campaign reads and budget PUTs) are retried on server
+        # errors, so the POST to the auth endpoint is never repeated
+        self.session = HttpClient(
+            max_retries=self.MAX_RETRIES,
+            backoff_factor=1,
+            rate_limit=max_requests_per_second,
+            burst=1,
+            pool_size=self.MAX_POOL_SIZE,
+        )
 
     @property
     def token(self) -> str:
@@ -31,19 +58,32 @@ class MagniteClient(DigitalAdvertising):
         Retrieves the access token. Authenticates if the token is not already set.
         """
         if not self._token:
-            url = f"{self.API_BASE_URL}/auth"
-            payload = json.dumps({"email": self.username, "password": self.password})
-            response = requests.post(
-                url, headers={"Content-Type": "application/json"}, data=payload
-            )
-            if response.ok:
-                self._token = response.json().get("token")
-            else:
-                raise InvalidCredentialError(
-                    f"Invalid credentials. HTTP {response.status_code}: {response.reason}. Response: {response.text}"
-                )
+            with self._token_lock:
+                if not self._token:
+                    self._token = self._authenticate()
         return self._token
 
+    def _authenticate(self) -> str:
+        url = f"{self.API_BASE_URL}/auth"
+        payload = json.dumps({"email": self.username, "password": self.password})
+        response = self.session.post(
+            url, headers={"Content-Type": "application/json"}, data=payload
+        )
+        if response.ok:
+            return response.json().get("token")
+        raise InvalidCredentialError(
+            f"Invalid credentials. HTTP {response.status_code}: {response.reason}. Response: {response.text}"
+        )
+
+    def _refresh_token(self, expired_token: str) -> None:
+        """
+        Discards an expired token so the next request re-authenticates. Only the first thread
+        to notice a given expired token clears it; the others reuse the refreshed one.
+        """
+        with self._token_lock:
+            if self._token == expired_token:
+                self._token = None
+
     def _request(self, method: str, endpoint: str, **kwargs):
         """
         Makes a request to the Magnite API
@@ -59,13 +99,20 @@ class MagniteClient(DigitalAdvertising):
 
         url = f"{self.API_BASE_URL}/{endpoint}"
         logger.debug(f"Attempting to make a {method} request to {url}")
-        response = requests.request(
-            method=method,
-            url=url,
-            headers={"Content-Type": "application/json", "Authorization": self.token},
-            **kwargs,
-        )
-        logger.debug(f"Response code: {response.status_code}")
+        for attempt in range(2):
+            token = self.token
+            response = self.session.request(
+                method=method,
+                url=url,
+                headers={"Content-Type": "application/json", "Authorization": token},
+                **kwargs,
+            )
+            logger.debug(f"Response code: {response.status_code}")
+            if response.status_code != 401 or attempt:
+                break
+            logger.debug("Access token rejected. Re-authenticating...")
+            self._refresh_token(token)
+
         logger.debug(f"Response data: {response.text}")
         if response.status_code == 401:
             raise InvalidCredentialError(
@@ -113,7 +160,41 @@ class MagniteClient(DigitalAdvertising):
         logger.debug(f"Successfully retrieved campaign {id}: \n{response}")
         return response
 
+    def get_campaigns_by_ids(
+        self, ids: List[str], max_workers: int = DEFAULT_MAX_WORKERS
+    ) -> Dict[str, Any]:
+        """
+        Retrieves many campaigns at once using a pool of workers sharing this client.
+
+        Campaigns that cannot be retrieved are omitted from the result, so callers can fall
+        back to `get_campaign_by_id` to surface the error for that campaign.
+
+        Args:
+            ids: The campaign IDs to retrieve
+            max_workers: The maximum number of concurrent requests
+
+        Returns:
+            A dictionary of campaign ID to campaign data
+        """
+        logger.debug(f"Attempting to prefetch {len(ids)} campaign(s)...")
+
+        def fetch(campaign_id):
+            try:
+                return campaign_id, self.read(endpoint=f"campaigns/{campaign_id}")
+            except Exception as e:
+                logger.debug(f"Failed to prefetch campaign {campaign_id}: {e}")
+                return campaign_id, None
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = dict(executor.map(fetch, ids))
+
+        campaigns = {key: value for key, value in results.items() if value is not None}
+        logger.debug(f"Prefetched {len(campaigns)} of {len(ids)} campaign(s)")
+        return campaigns
+
     def export_campaign_by_id(self, id: str, filename: str = None):
+        import pandas as pd
+
         logger.debug(f"Attempting to export campaign {id} to {filename}...")
         valid_file_types = ["json", "csv"]
         filename = filename or f"campaign_{id}.json"
@@ -0,0 +1,108 @@
+import threading
+
+from shipyard_magnite import MagniteClient
+from shipyard_magnite.cli.update_campaign_budget import process_campaigns
+
+
+class FakeResponse:
+    def __init__(self, status_code, payload=None, headers=None):
+        self.status_code = status_code
+        self.payload = payload or {}
+        self.headers = headers or {}
+        self.ok = status_code < 400
+        self.reason = "reason"
+        self.text = str(self.payload)
+
+    def json(self):
+        return self.payload
+
+    def raise_for_status(self):
+        if not self.ok:
+            raise Exception(f"HTTP {self.status_code}")
+
+
+class FakeSession:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.auth_calls = 0
+        self.updates = {}
+        self.reads = 0
+
+    def post(self, url, **kwargs):
+        with self.lock:
+            self.auth_calls += 1
+            return FakeResponse(200, {"token": f"token-{self.auth_calls}"})
+
+    def request(self, method, url, headers=None, **kwargs):
+        if headers["Authorization"] == "token-1" and method == "PUT":
+            return FakeResponse(401)
+        campaign_id = url.rsplit("/", 1)[-1]
+        if method == "GET":
+            with self.lock:
+                self.reads += 1
+            return FakeResponse(
+                200, {"targeting_spend_profile": {"id": f"profile-{campaign_id}"}}
+            )
+        with self.lock:
+            self.updates[campaign_id] = kwargs["json"]
+        return FakeResponse(200, {"id": campaign_id})
+
+
+def make_client():
+    client = MagniteClient("user", "password", max_requests_per_second=10_000)
+    client.session = FakeSession()
+    return client
+
+
+def budget(period="day"):
+    return {
+        "budget_value": "100",
+        "budget_period": period,
+        "budget_pacing": "smooth",
+        "budget_metric": "impressions",
+    }
+
+
+def test_process_campaigns_updates_all_campaigns_in_order():
+    client = make_client()
+    campaigns = {str(i): [budget()] for i in range(20)}
+
+    results = process_campaigns(client, campaigns, max_workers=4)
+
+    assert [list(result["report"]) for result in results] == [[c] for c in campaigns]
+    assert all(not result["errors"] for result in results)
+    assert client.session.reads == 20
+    assert client.session.updates["7"] == {
+        "targeting_spend_profile": {
+            "id": "profile-7",
+            "budgets": [
+                {
+                    "budget_value": "100",
+                    "budget_period": "day",
+                    "budget_pacing": "smooth",
+                    "budget_metric": "impressions",
+                }
+            ],
+        }
+    }
+
+
+def test_expired_token_is_refreshed_once_across_workers():
+    client = make_client()
+    campaigns = {str(i): [budget()] for i in range(10)}
+
+    results = process_campaigns(client, campaigns, max_workers=5)
+
+    assert all(not result["errors"] for result in results)
+    assert client.session.auth_calls == 2
+
+
+def test_invalid_budgets_are_reported_without_update():
+    client = make_client()
+    campaigns = {"1": [budget("invalid")], "2": [budget()]}
+
+    results = process_campaigns(client, campaigns, max_workers=2)
+
+    assert results[0]["errors"] == ["1"]
+    assert results[1]["errors"] == []
+    assert list(client.session.updates) == ["2"]
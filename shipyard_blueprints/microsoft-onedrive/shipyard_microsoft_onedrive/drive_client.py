@@ -2,13 +2,22 @@ import re
 from json import JSONDecodeError
 from typing import Optional, List, Dict, Any
 
-import msal
-from requests import request
-from shipyard_templates import CloudStorage, ShipyardLogger, ExitCodeException
+from shipyard_templates import (
+    CloudStorage,
+    ShipyardLogger,
+    ExitCodeException,
+    HttpClient,
+    IdCache,
+    acquire_msal_token,
+)
 from shipyard_templates.errors import InvalidCredentialError, handle_errors
 
 logger = ShipyardLogger.get_logger()
 
+# File uploads and downloads are not cut off by the HTTP client's default timeout, as large
+# files can take longer than that to send or read
+TRANSFER_TIMEOUT = None
+
 
 class OneDriveClient(CloudStorage):
     def __init__(
@@ -27,6 +36,10 @@ class OneDriveClient(CloudStorage):
         self.client_secret = client_secret
         self.tenant = tenant
         self.base_url = "https://graph.microsoft.com/v1.0"
+        self.http = HttpClient()
+        # IDs read from the ID cache, and the IDs that replaced the ones found to be stale
+        self._cached_ids: Dict[str, tuple] = {}
+        self._fresh_ids: Dict[str, str] = {}
 
     @property
     def access_token(self):
@@ -55,24 +68,55 @@ class OneDriveClient(CloudStorage):
         self._access_token = access_token
 
     def _generate_token_from_client(self):
-        result = msal.ConfidentialClientApplication(
-            client_id=self.client_id,
-            client_credential=self.client_secret,
-            authority=f"https://login.microsoftonline.com/{self.tenant}",
-        ).acquire_token_for_client(scopes=["https://graph.microsoft.com/.default"])
+        result = acquire_msal_token(
+            self.tenant,
+            self.client_id,
+            scopes=["https://graph.microsoft.com/.default"],
+            client_secret=self.client_secret,
+        )
         self._set_access_token(result)
 
     def _generate_token_from_un_pw(self):
-        result = msal.PublicClientApplication(
-            client_id=self.client_id,
-            authority=f"https://login.microsoftonline.com/{self.tenant}",
-        ).acquire_token_by_username_password(
+        result = acquire_msal_token(
+            self.tenant,
+            self.client_id,
+            scopes=["https://graph.microsoft.com/.default"],
             username=self.username,
             password=self.password,
-            scopes=["https://graph.microsoft.com/.default"],
         )
         self._set_access_token(result)
 
+    def _cached_id(self, kind: str, name: str, resolve) -> str:
+        """Resolves an ID through the on-disk ID cache when the tenant is known"""
+        if not self.tenant:
+            return resolve()
+        value = IdCache(self.tenant).get_or_resolve(kind, name, resolve)
+        self._cached_ids[value] = (kind, name, resolve)
+        return value
+
+    def _with_fresh_ids(self, endpoint: str) -> str:
+        """Swaps the IDs in `endpoint` that were found to be stale for their new values"""
+        return "/".join(self._fresh_ids.get(part, part) for part in endpoint.split("/"))
+
+    def _refresh_ids(self, endpoint: str) -> Optional[str]:
+        """
+        Looks up the cached IDs in `endpoint` again after it returned 404, as a cached user or
+        drive ID goes stale when the account is recreated. Each ID is looked up at most once.
+        Returns the endpoint with the new IDs when any changed, so the request is worth repeating.
+        """
+        refreshed = endpoint
+        for part in endpoint.split("/"):
+            if part not in self._cached_ids:
+                continue
+            kind, name, resolve = self._cached_ids.pop(part)
+            IdCache(self.tenant).forget(kind, name)
+            fresh_id = IdCache(self.tenant).get_or_resolve(kind, name, resolve)
+            if fresh_id != part:
+                logger.debug(f"The cached {kind} ID for {name} was stale")
+                self._fresh_ids[part] = fresh_id
+                refreshed = self._with_fresh_ids(refreshed)
+        return refreshed if refreshed != endpoint else None
+
     def _set_access_token(self, result):
         if "access_token" not in result:
             raise InvalidCredentialError(
@@ -116,9 +160,13 @@ class OneDriveClient(CloudStorage):
             "Content-Type": "application/json",
         }
 
-        response = request(
+        endpoint = self._with_fresh_ids(endpoint)
+        response = self.http.request(
             method, f"{self.base_url}/{endpoint}", headers=headers, **kwargs
         )
+        if response.status_code == 404:
+            if refreshed := self._refresh_ids(endpoint):
+                return self._request(method, refreshed, headers_override, **kwargs)
         if response.ok:
             try:
                 return response.json()
@@ -146,9 +194,13 @@ class OneDriveClient(CloudStorage):
                 "User email was not provided when initializing the client. Please provide the user email."
             )
 
-        user_info = self._request("GET", f"users/{user_email}")
-        logger.debug(f"User ID: {user_info['id']}")
-        return user_info["id"]
+        user_id = self._cached_id(
+            "onedrive_user",
+            user_email,
+            lambda: self._request("GET", f"users/{user_email}")["id"],
+        )
+        logger.debug(f"User ID: {user_id}")
+        return user_id
 
     def get_drive_id(self, user_id: str) -> str:
         """Get the drive ID of the user with the given ID.
@@ -160,9 +212,13 @@ class OneDriveClient(CloudStorage):
             str: The Drive ID of the user.
         """
         logger.debug(f"Attempting to get drive ID for user ID {user_id}...")
-        drive_info = self._request("GET", f"users/{user_id}/drive")
-        logger.debug(f"Successfully retrieved Drive ID: {drive_info['id']}")
-        return drive_info["id"]
+        drive_id = self._cached_id(
+            "onedrive_drive",
+            user_id,
+            lambda: self._request("GET", f"users/{user_id}/drive")["id"],
+        )
+        logger.debug(f"Successfully retrieved Drive ID: {drive_id}")
+        return drive_id
 
     def upload(self, file_path: str, drive_id: str, drive_path: Optional[str]) -> None:
         """Uploads a file to OneDrive.
@@ -186,6 +242,7 @@ class OneDriveClient(CloudStorage):
                     "Content-Type": "application/octet-stream",
                 },
                 data=file_content,
+                timeout=TRANSFER_TIMEOUT,
             )
             logger.info(
                 f"Successfully uploaded {file_path} to {drive_path} in OneDrive"
@@ -208,14 +265,27 @@ class OneDriveClient(CloudStorage):
             ExitCodeException: If the download fails.
         """
 
-        response = request(
+        endpoint = self._with_fresh_ids(
+            f"drives/{drive_id}/root:/{drive_path}:/content"
+        )
+        headers = {
+            "Authorization": f"Bearer {self.access_token}",
+            "Content-Type": "application/octet-stream",
+        }
+        response = self.http.request(
             "GET",
-            f"{self.base_url}/drives/{drive_id}/root:/{drive_path}:/content",
-            headers={
-                "Authorization": f"Bearer {self.access_token}",
-                "Content-Type": "application/octet-stream",
-            },
+            f"{self.base_url}/{endpoint}",
+            headers=headers,
+            timeout=TRANSFER_TIMEOUT,
         )
+        if response.status_code == 404:
+            if refreshed := self._refresh_ids(endpoint):
+                response = self.http.request(
+                    "GET",
+                    f"{self.base_url}/{refreshed}",
+                    headers=headers,
+                    timeout=TRANSFER_TIMEOUT,
+                )
 
         if response.status_code == 200:
             with open(file_path, "wb") as file:
@@ -426,7 +496,7 @@ class OneDriveClient(CloudStorage):
         Raises:
             ExitCodeException: If the download fails.
         """
-        response = request("GET", download_url)
+        response = self.http.get(download_url, timeout=TRANSFER_TIMEOUT)
         if response.ok:
             with open(file_name, "wb") as file:
                 file.write(response.content)
@@ -0,0 +1,63 @@
+from types import SimpleNamespace
+
+import pytest
+from shipyard_templates import IdCache
+
+from shipyard_microsoft_onedrive import OneDriveClient
+
+
+@pytest.fixture(autouse=True)
+def cache_directory(tmp_path, monkeypatch):
+    monkeypatch.setenv("SHIPYARD_TOKEN_CACHE_DIRECTORY", str(tmp_path))
+
+
+class FakeHttp:
+    def __init__(self, drive_id):
+        self.drive_id = drive_id
+        self.urls = []
+
+    def request(self, method, url, **kwargs):
+        self.urls.append(url)
+        if url.endswith("users/user-id/drive"):
+            return response(200, {"id": self.drive_id})
+        if f"/drives/{self.drive_id}/" in url:
+            return response(200, {"value": []})
+        return response(404, {})
+
+
+def response(status_code, body):
+    return SimpleNamespace(
+        status_code=status_code, ok=status_code < 400, text="", json=lambda: body
+    )
+
+
+def client(http):
+    onedrive = OneDriveClient(access_token="token", tenant="tenant")
+    onedrive.http = http
+    return onedrive
+
+
+def test_a_stale_cached_drive_id_is_looked_up_again_on_404():
+    IdCache("tenant").get_or_resolve("onedrive_drive", "user-id", lambda: "old-id")
+    http = FakeHttp("new-id")
+    onedrive = client(http)
+
+    drive_id = onedrive.get_drive_id("user-id")
+    assert onedrive.get_folder_id("reports", drive_id) is None
+    assert len(http.urls) == 3
+    assert "/drives/new-id/" in http.urls[-1]
+
+    # Later calls with the stale ID go straight to the new one
+    onedrive.get_folder_id("reports", drive_id)
+    assert len(http.urls) == 4
+    assert "/drives/new-id/" in http.urls[-1]
+
+
+def test_a_fresh_drive_id_is_not_looked_up_again():
+    IdCache("tenant").get_or_resolve("onedrive_drive", "user-id", lambda: "new-id")
+    http = FakeHttp("new-id")
+    onedrive = client(http)
+
+    onedrive.get_folder_id("reports", onedrive.get_drive_id("user-id"))
+
+    assert len(http.urls) == 1
@@ -1,9 +1,13 @@
 import json
-import time
 from json import JSONDecodeError
 
-from requests import request
-from shipyard_templates import DataVisualization, ExitCodeException, ShipyardLogger
+from shipyard_templates import (
+    DataVisualization,
+    ExitCodeException,
+    HttpClient,
+    JobWaiter,
+    ShipyardLogger,
+)
 
 from shipyard_microsoft_power_bi import utils
 
@@ -57,6 +61,9 @@ class MicrosoftPowerBiClient(DataVisualization):
         self.client_secret = client_secret
         self.tenant_id = tenant_id
         self._access_token = access_token
+        # Refresh calls keep waiting on the service as they did before the shared client,
+        # without its default timeout
+        self.http = HttpClient(timeout=None)
 
     @property
     def access_token(self):
@@ -117,7 +124,7 @@ class MicrosoftPowerBiClient(DataVisualization):
 
         logger.debug(f"Attempting to {method} {endpoint}")
 
-        response = request(
+        response = self.http.request(
             method=method,
             url=endpoint,
             headers={
@@ -226,7 +233,7 @@ class MicrosoftPowerBiClient(DataVisualization):
         @param group_id: The ID of the group/workspace that the object belongs to.
         @param object_id: Either the ID of the dataset or dataflow to refresh.
         @param wait_for_completion: If True, waits for the refresh job to complete.
-        @param wait_time: Used if wait_for_completion is True.The number of seconds to wait for the refresh job to complete.
+        @param wait_time: Used if wait_for_completion is True.The longest interval, in seconds, between refresh job status checks.
         @return: None
         """
         if object_type == "dataset":
@@ -252,7 +259,7 @@ class MicrosoftPowerBiClient(DataVisualization):
         @param group_id: Group/Workspace ID
         @param dataset_id: Dataset ID
         @param wait_for_completion: If True, waits for the refresh job to complete.
-        @param wait_time: if wait_for_completion is True, the number of seconds to wait for the refresh job to complete.
+        @param wait_time: if wait_for_completion is True, the longest interval, in seconds, between refresh job status checks.
         @return: response from the request or None if wait_for_completion is True.
         """
         logger.info("Triggering dataset refresh...")
@@ -283,7 +290,7 @@ class MicrosoftPowerBiClient(DataVisualization):
         @param group_id: Group/Workspace ID
         @param dataflow_id: Dataflow ID
         @param wait_for_completion: If True, waits for the refresh job to complete.
-        @param wait_time: If wait_for_completion is True, the number of seconds to wait for the refresh job to complete.
+        @param wait_time: If wait_for_completion is True, the longest interval, in seconds, between refresh job status checks.
         @return: response from the request or None if wait_for_completion is True.
         """
 
@@ -405,9 +412,8 @@ class MicrosoftPowerBiClient(DataVisualization):
 
     def wait_for_dataflow_refresh_completion(self, group_id, dataflow_id, wait_time=60):
         logger.info("Waiting for refresh to complete")
-        job_status = "Unknown"
 
-        while job_status in self.ONGOING_JOB_STATUSES:
+        def latest_transaction_status():
             transactions = self.get_dataflow_transactions(group_id, dataflow_id)
             sorted_transactions = sorted(
                 transactions["value"], key=lambda x: x["startTime"], reverse=True
@@ -419,61 +425,50 @@ class MicrosoftPowerBiClient(DataVisualization):
                     self.EXIT_CODE_INVALID_INPUT,
                 )
 
-            job_status = sorted_transactions[0].get(
-                "status"
-            )  # Get the latest transaction status
-
-            if job_status in self.COMPLETE_JOB_STATUSES:
-                logger.info(f"Job completed with status {job_status}")
-                logger.info("Refresh completed")
-                return
-
-            if job_status in self.FAILED_JOB_STATUSES:
-                raise ExitCodeException(
-                    f"Dataflow refresh failed with status {job_status}",
-                    self.EXIT_CODE_FAILED_REFRESH_JOB,
-                )
+            # Get the latest transaction status
+            return self._check_job_status(
+                sorted_transactions[0].get("status"), "Dataflow"
+            )
 
-            elif job_status in self.ONGOING_JOB_STATUSES:
-                logger.info(
-                    f"Job currently in {job_status}. Waiting {wait_time} seconds before checking again."
-                )
-                time.sleep(wait_time)
-            else:
-                raise ExitCodeException(
-                    f"Unknown job status {job_status}",
-                    self.EXIT_CODE_UNKNOWN_REFRESH_JOB_STATUS,
-                )
+        JobWaiter(max_interval=wait_time).wait(
+            latest_transaction_status,
+            lambda job_status: job_status in self.COMPLETE_JOB_STATUSES,
+            description="Refresh",
+        )
+        logger.info("Refresh completed")
 
     def wait_for_dataset_refresh_completion(
         self, group_id, dataset_id, request_id, wait_time=60
     ):
         logger.info("Waiting for refresh to complete")
-        job_status = "Unknown"
 
-        while job_status in self.ONGOING_JOB_STATUSES:
+        def refresh_status():
             job_status = self.check_recent_dataset_refresh_by_request_id(
                 group_id, dataset_id, request_id
             ).get("status")
+            return self._check_job_status(job_status, "Dataset")
 
-            if job_status in self.COMPLETE_JOB_STATUSES:
-                logger.info(f"Job completed with status {job_status}")
-                logger.info("Refresh completed")
-                return
-
-            if job_status in self.FAILED_JOB_STATUSES:
-                raise ExitCodeException(
-                    f"Dataset refresh failed with status {job_status}",
-                    self.EXIT_CODE_FAILED_REFRESH_JOB,
-                )
+        JobWaiter(max_interval=wait_time).wait(
+            refresh_status,
+            lambda job_status: job_status in self.COMPLETE_JOB_STATUSES,
+            description="Refresh",
+        )
+        logger.info("Refresh completed")
 
-            elif job_status in self.ONGOING_JOB_STATUSES:
-                logger.info(
-                    f"Job currently in {job_status}. Waiting {wait_time} seconds before checking again."
-                )
-                time.sleep(wait_time)
-            else:
-                raise ExitCodeException(
-                    f"Unknown job status {job_status}",
-                    self.EXIT_CODE_UNKNOWN_REFRESH_JOB_STATUS,
-                )
+    def _check_job_status(self, job_status, refresh_type):
+        """Returns a complete or ongoing job status and raises for a failed or unknown one"""
+        if job_status in self.COMPLETE_JOB_STATUSES:
+            logger.info(f"Job completed with status {job_status}")
+        elif job_status in self.FAILED_JOB_STATUSES:
+            raise ExitCodeException(
+                f"{refresh_type} refresh failed with status {job_status}",
+                self.EXIT_CODE_FAILED_REFRESH_JOB,
+            )
+        elif job_status in self.ONGOING_JOB_STATUSES:
+            logger.info(f"Job currently in {job_status}")
+        else:
+            raise ExitCodeException(
+                f"Unknown job status {job_status}",
+                self.EXIT_CODE_UNKNOWN_REFRESH_JOB_STATUS,
+            )
+        return job_status
@@ -1,31 +1,23 @@
 import os
 
-import msal
-from shipyard_templates import DataVisualization
+from shipyard_templates import DataVisualization, acquire_msal_token
 from shipyard_templates.exit_code_exception import ExitCodeException
 from shipyard_templates.shipyard_logger import ShipyardLogger
 
 logger = ShipyardLogger.get_logger()
 
+POWER_BI_SCOPES = ["https://analysis.windows.net/powerbi/api/.default"]
+
 
 def generate_access_token_from_client(client_id, tenant_id, client_secret):
-    return msal.ConfidentialClientApplication(
-        client_id=client_id,
-        client_credential=client_secret,
-        authority=f"https://login.microsoftonline.com/{tenant_id}",
-    ).acquire_token_for_client(
-        scopes=["https://analysis.windows.net/powerbi/api/.default"]
+    return acquire_msal_token(
+        tenant_id, client_id, POWER_BI_SCOPES, client_secret=client_secret
     )
 
 
 def generate_token_from_un_pw(client_id, tenant_id, username, password):
-    return msal.PublicClientApplication(
-        client_id=client_id,
-        authority=f"https://login.microsoftonline.com/{tenant_id}",
-    ).acquire_token_by_username_password(
-        username=username,
-        password=password,
-        scopes=["https://analysis.windows.net/powerbi/api/.default"],
+    return acquire_msal_token(
+        tenant_id, client_id, POWER_BI_SCOPES, username=username, password=password
     )
 
 
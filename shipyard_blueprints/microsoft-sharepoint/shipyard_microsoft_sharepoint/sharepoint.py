@@ -2,16 +2,24 @@ import re
 from json import JSONDecodeError
 from typing import Optional, List, Dict, Any
 
-import requests
-from msal import ConfidentialClientApplication, PublicClientApplication
-from requests import request
-from shipyard_templates import ShipyardLogger, CloudStorage, ExitCodeException
+from shipyard_templates import (
+    ShipyardLogger,
+    CloudStorage,
+    ExitCodeException,
+    HttpClient,
+    IdCache,
+    acquire_msal_token,
+)
 from shipyard_templates.errors import InvalidCredentialError, handle_errors
 
 from shipyard_microsoft_sharepoint.errs import SharepointSiteNotFoundError
 
 logger = ShipyardLogger.get_logger()
 
+# File uploads and downloads are not cut off by the HTTP client's default timeout, as large
+# files can take longer than that to send or read
+TRANSFER_TIMEOUT = None
+
 
 class SharePointClient(CloudStorage):
     def __init__(
@@ -31,9 +39,11 @@ class SharePointClient(CloudStorage):
         self.client_secret = client_secret
         self.tenant = tenant
         self.base_url = "https://graph.microsoft.com/v1.0"
+        self.http = HttpClient()
 
         self.site_name = site_name
         self._site_id = None
+        self._site_id_refreshed = False
 
         super().__init__()
 
@@ -72,21 +82,21 @@ class SharePointClient(CloudStorage):
         logger.info("Successfully connected to SharePoint")
 
     def _generate_token_from_client(self):
-        result = ConfidentialClientApplication(
-            client_id=self.client_id,
-            client_credential=self.client_secret,
-            authority=f"https://login.microsoftonline.com/{self.tenant}",
-        ).acquire_token_for_client(scopes=["https://graph.microsoft.com/.default"])
+        result = acquire_msal_token(
+            self.tenant,
+            self.client_id,
+            scopes=["https://graph.microsoft.com/.default"],
+            client_secret=self.client_secret,
+        )
         self._set_access_token(result)
 
     def _generate_token_from_un_pw(self):
-        result = PublicClientApplication(
-            client_id=self.client_id,
-            authority=f"https://login.microsoftonline.com/{self.tenant}",
-        ).acquire_token_by_username_password(
+        result = acquire_msal_token(
+            self.tenant,
+            self.client_id,
+            scopes=["https://graph.microsoft.com/.default"],
             username=self.username,
             password=self.password,
-            scopes=["https://graph.microsoft.com/.default"],
         )
         self._set_access_token(result)
 
@@ -116,9 +126,16 @@ class SharePointClient(CloudStorage):
             "Content-Type": "application/json",
         }
 
-        response = request(
+        response = self.http.request(
             method, f"{self.base_url}/{endpoint}", headers=headers, **kwargs
         )
+        if response.status_code == 404:
+            site_id = self._site_id
+            if site_id and f"sites/{site_id}/" in endpoint and self._refresh_site_id():
+                endpoint = endpoint.replace(
+                    f"sites/{site_id}/", f"sites/{self.site_id}/"
+                )
+                return self._request(method, endpoint, headers_override, **kwargs)
         if response.ok:
             try:
                 return response.json()
@@ -134,7 +151,12 @@ class SharePointClient(CloudStorage):
     def site_id(self):
         try:
             if not self._site_id:
-                self._site_id = self.get_site_id()
+                if self.tenant:
+                    self._site_id = IdCache(self.tenant).get_or_resolve(
+                        "sharepoint_site", self.site_name, self.get_site_id
+                    )
+                else:
+                    self._site_id = self.get_site_id()
 
             return self._site_id
         except ExitCodeException:
@@ -142,6 +164,23 @@ class SharePointClient(CloudStorage):
         except Exception as e:
             raise SharepointSiteNotFoundError(self.site_name) from e
 
+    def _refresh_site_id(self) -> bool:
+        """
+        Looks the site ID up again after a request under the site returned 404, as an ID read
+        from the cache goes stale when the site is recreated. This happens at most once per
+        client, and returns True when the ID changed so the request is worth repeating.
+        """
+        if not self.tenant or self._site_id_refreshed:
+            return False
+        self._site_id_refreshed = True
+        stale_site_id = self._site_id
+        IdCache(self.tenant).forget("sharepoint_site", self.site_name)
+        self._site_id = None
+        if self.site_id == stale_site_id:
+            return False
+        logger.debug(f"The cached ID of site {self.site_name} was stale")
+        return True
+
     def connect(self):
         try:
             self.access_token
@@ -171,6 +210,7 @@ class SharePointClient(CloudStorage):
                 "Content-Type": "application/octet-stream",
             },
             data=file_content,
+            timeout=TRANSFER_TIMEOUT,
         )
 
         logger.info("Successfully uploaded file to SharePoint")
@@ -182,13 +222,16 @@ class SharePointClient(CloudStorage):
             file_path: The path to write to
             drive_path: The path of the file to download in SharePoint
         """
-        url = f"{self.base_url}/sites/{self.site_id}/drive/root:/{drive_path}:/content"
         headers = {
             "Authorization": f"Bearer {self.access_token}",
             "Content-Type": "application/octet-stream",
         }
 
-        response = requests.get(url, headers=headers)
+        url = f"{self.base_url}/sites/{self.site_id}/drive/root:/{drive_path}:/content"
+        response = self.http.get(url, headers=headers, timeout=TRANSFER_TIMEOUT)
+        if response.status_code == 404 and self._refresh_site_id():
+            url = f"{self.base_url}/sites/{self.site_id}/drive/root:/{drive_path}:/content"
+            response = self.http.get(url, headers=headers, timeout=TRANSFER_TIMEOUT)
         logger.debug(f"Download url is {url}")
         logger.debug(
             f"Response: {response.text} and status code is {response.status_code}"
@@ -379,7 +422,7 @@ class SharePointClient(CloudStorage):
         Raises:
             BadRequestError:
         """
-        response = requests.get(download_url)
+        response = self.http.get(download_url, timeout=TRANSFER_TIMEOUT)
         if response.ok:
             with open(file_name, "wb") as file:
                 file.write(response.content)
@@ -0,0 +1,63 @@
+from types import SimpleNamespace
+
+import pytest
+from shipyard_templates import IdCache
+
+from shipyard_microsoft_sharepoint import SharePointClient
+
+
+@pytest.fixture(autouse=True)
+def cache_directory(tmp_path, monkeypatch):
+    monkeypatch.setenv("SHIPYARD_TOKEN_CACHE_DIRECTORY", str(tmp_path))
+
+
+class FakeHttp:
+    def __init__(self, site_id):
+        self.site_id = site_id
+        self.urls = []
+
+    def request(self, method, url, **kwargs):
+        self.urls.append(url)
+        if "sites?search=" in url:
+            return response(200, {"value": [{"id": self.site_id}]})
+        if f"/sites/{self.site_id}/" in url:
+            return response(200, {"value": []})
+        return response(404, {})
+
+
+def response(status_code, body):
+    return SimpleNamespace(
+        status_code=status_code, ok=status_code < 400, text="", json=lambda: body
+    )
+
+
+def client(http):
+    sharepoint = SharePointClient(
+        access_token="token", tenant="tenant", site_name="Finance"
+    )
+    sharepoint.http = http
+    return sharepoint
+
+
+def test_a_stale_cached_site_id_is_looked_up_again_on_404():
+    IdCache("tenant").get_or_resolve("sharepoint_site", "Finance", lambda: "old-id")
+    http = FakeHttp("new-id")
+
+    assert client(http).get_folder_id("reports") is None
+
+    assert len(http.urls) == 3
+    assert "/sites/new-id/" in http.urls[-1]
+    assert (
+        IdCache("tenant").get_or_resolve("sharepoint_site", "Finance", None) == "new-id"
+    )
+
+
+def test_a_fresh_site_id_is_not_looked_up_again():
+    IdCache("tenant").get_or_resolve("sharepoint_site", "Finance", lambda: "new-id")
+    http = FakeHttp("new-id")
+    sharepoint = client(http)
+
+    sharepoint.get_folder_id("reports")
+    sharepoint.get_folder_id("reports")
+
+    assert len(http.urls) == 2
@@ -1,11 +1,10 @@
 import argparse
 import sys
-import time
 
 import requests
 from requests.auth import HTTPBasicAuth
 from shipyard_bp_utils.artifacts import Artifact
-from shipyard_templates import ShipyardLogger
+from shipyard_templates import JobWaiter, ShipyardLogger
 
 from shipyard_mode.cli import exit_codes
 
@@ -85,6 +84,22 @@ def execute_run_report(account_name, report_id, token_id, token_password):
         sys.exit(exit_codes.EXIT_CODE_UNKNOWN_ERROR)
 
 
+def get_report_run(account_name, report_id, run_id, token_id, token_password):
+    """Fetches the current state of a mode report run
+    see: https://mode.com/developer/api-reference/analytics/report-runs/#getReportRun
+    """
+    run_endpoint = (
+        f"https://app.mode.com/api/{account_name}/reports/{report_id}/runs/{run_id}"
+    )
+    response = requests.get(
+        run_endpoint,
+        headers={"Accept": "application/hal+json"},
+        auth=HTTPBasicAuth(token_id, token_password),
+    )
+    response.raise_for_status()
+    return response.json()
+
+
 def handle_run_data(run_report_data):
     run_id = run_report_data["token"]
     state = run_report_data["state"]
@@ -137,14 +152,19 @@ def main():
     artifact.variables.create_variable("report_run_id", report_run_id)
 
     if args.wait_for_completion == "TRUE":
-        exit_code_status = handle_run_data(report_data)
-        while exit_code_status in {
-            exit_codes.EXIT_CODE_FINAL_STATUS_PENDING,
-            exit_codes.EXIT_CODE_FINAL_STATUS_NOT_STARTED,
-        }:
-            logger.info("Waiting 60 seconds to check status again...")
-            time.sleep(60)
-            exit_code_status = handle_run_data(report_data)
+        exit_code_status = JobWaiter().wait(
+            lambda: handle_run_data(
+                get_report_run(
+                    account_name, report_id, report_run_id, token_id, token_password
+                )
+            ),
+            lambda status: status
+            not in {
+                exit_codes.EXIT_CODE_FINAL_STATUS_PENDING,
+                exit_codes.EXIT_CODE_FINAL_STATUS_NOT_STARTED,
+            },
+            description=f"Report run {report_run_id}",
+        )
         sys.exit(exit_code_status)
 
 
@@ -77,7 +77,8 @@ def main():
             matching_file_names = shipyard.files.find_all_file_matches(
                 file_names, re.compile(src_file)
             )
-            if n_matches := len(matching_file_names) == 0:
+            n_matches = len(matching_file_names)
+            if n_matches == 0:
                 logger.error("No files found matching the regex provided")
                 sys.exit(Database.EXIT_CODE_NO_FILE_MATCHES)
 
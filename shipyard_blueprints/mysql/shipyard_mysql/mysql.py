@@ -1,7 +1,10 @@
-import pandas as pd
+import csv
 import os
-from sqlalchemy import create_engine
-from shipyard_templates import Database, ExitCodeException, ShipyardLogger
+from contextlib import contextmanager
+from sqlalchemy import create_engine, inspect
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.pool import NullPool
+from shipyard_templates import Database, ExitCodeException, Metrics, ShipyardLogger
 from shipyard_templates.database import (
     FetchError,
     UploadError,
@@ -9,14 +12,21 @@ from shipyard_templates.database import (
     ConnectionError,
 )
 from sqlalchemy import create_engine, TextClause
-from typing import Optional
+from typing import TYPE_CHECKING, Dict, List, Optional
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 logger = ShipyardLogger.get_logger()
+metrics = Metrics.get_metrics()
+
+# Server errors raised when LOAD DATA LOCAL INFILE is disabled on the client or the server
+LOCAL_INFILE_DISABLED_ERRNOS = {1148, 2068, 3948}
+STAGING_TABLE_SUFFIX = "_shipyard_staging"
 
 
 class MySqlClient(Database):
     CHUNKSIZE = 10_000
-    MAX_FILE_SIZE = 50_000_000  # about 50 MB
 
     def __init__(
         self,
@@ -49,10 +59,13 @@ class MySqlClient(Database):
             self._conn = self.connect()
         return self._conn
 
+    @property
+    def _connection_string(self) -> str:
+        return f"mysql+mysqlconnector://{self.username}:{self.pwd}@{self.host}:{self.port}/{self.database}?{self.url_params}"
+
     def connect(self):
-        con_str = f"mysql+mysqlconnector://{self.username}:{self.pwd}@{self.host}:{self.port}/{self.database}?{self.url_params}"
         try:
-            conn = create_engine(con_str).connect()
+            conn = create_engine(self._connection_string).connect()
         except Exception as e:
             raise ConnectionError(
                 f"Error connecting to MySQL. Message from the server reads: {e}"
@@ -84,11 +97,11 @@ class MySqlClient(Database):
 
     def upload(self, file: str, table_name: str, insert_method: str = "replace"):
         """
-        Uploads data from a file to a PostgreSQL table.
+        Uploads data from a file to a MySQL table using a bulk load.
 
         Args:
             file (str): The path to the file containing the data to be uploaded.
-            table_name (str): The name of the PostgreSQL table to upload the data to.
+            table_name (str): The name of the MySQL table to upload the data to.
             insert_method (str, optional): The method to use for inserting the data into the table.
                 Defaults to "replace".
 
@@ -97,19 +110,15 @@ class MySqlClient(Database):
             Exception: If any other exception occurs during the upload process.
         """
         try:
-            if os.path.getsize(file) < self.MAX_FILE_SIZE:
-                df = pd.read_csv(file)
-                self.upload_df(df, table_name=table_name, insert_method=insert_method)
-            else:
-                self.upload_file(
-                    file, table_name=table_name, insert_method=insert_method
-                )
+            with metrics.timer("load_seconds", vendor="mysql"):
+                self.bulk_load(file, table_name=table_name, insert_method=insert_method)
+            metrics.increment("load_bytes_total", os.path.getsize(file), vendor="mysql")
         except ExitCodeException:
             raise
         except Exception as e:
             raise UploadError(table=table_name, error_msg=e)
 
-    def fetch(self, query: TextClause) -> pd.DataFrame:
+    def fetch(self, query: TextClause) -> "pd.DataFrame":
         """
         Fetches data from the database using the provided SQL query.
 
@@ -122,6 +131,8 @@ class MySqlClient(Database):
         Raises:
             FetchError: If an error occurs while fetching the results.
         """
+        import pandas as pd
+
         try:
             df = pd.read_sql(sql=query, con=self.conn)
             logger.debug("Successfully fetched results")
@@ -131,7 +142,7 @@ class MySqlClient(Database):
             return df
 
     def upload_df(
-        self, df: pd.DataFrame, table_name: str, insert_method: str = "replace"
+        self, df: "pd.DataFrame", table_name: str, insert_method: str = "replace"
     ):
         """
         Uploads a pandas DataFrame to a PostgreSQL table.
@@ -173,6 +184,8 @@ class MySqlClient(Database):
             UploadError: If an error occurs during the upload process.
 
         """
+        import pandas as pd
+
         try:
             for index, chunk in enumerate(
                 pd.read_csv(file_path, chunksize=self.CHUNKSIZE)
@@ -189,6 +202,124 @@ class MySqlClient(Database):
         except Exception as e:
             raise UploadError(table=table_name, error_msg=e)
 
+    def bulk_load(
+        self, file_path: str, table_name: str, insert_method: str = "replace"
+    ):
+        """
+        Loads a CSV file into a MySQL table with LOAD DATA LOCAL INFILE, letting the server
+        parse the file instead of sending rows through INSERT statements.
+
+        CSV columns are mapped to table columns by header name and empty values are loaded
+        as NULL. A table that does not exist yet is created from the types inferred from the
+        whole file, and boolean columns are converted from the CSV's True/False text. When
+        replacing, the file is loaded into a staging table that is atomically renamed over the
+        target once the load succeeds. The file is sent over a separate connection that may
+        only read from the file's folder. If local infile is disabled on the server, the load
+        falls back to batched multi-row INSERTs.
+
+        Args:
+            file_path (str): The path to the CSV file to be loaded.
+            table_name (str): The name of the table to load the file into.
+            insert_method (str, optional): "replace" or "append". Defaults to "replace".
+
+        Raises:
+            UploadError: If an error occurs during the upload process.
+        """
+        replace = insert_method == "replace"
+        load_table = f"{table_name}{STAGING_TABLE_SUFFIX}" if replace else table_name
+        boolean_columns: List[str] = []
+        try:
+            if replace or not inspect(self.conn).has_table(table_name):
+                boolean_columns = self._create_table_from_csv(file_path, load_table)
+            try:
+                self._load_local_infile(file_path, load_table, boolean_columns)
+            except DBAPIError as e:
+                if getattr(e.orig, "errno", None) not in LOCAL_INFILE_DISABLED_ERRNOS:
+                    raise
+                logger.warning(
+                    "LOAD DATA LOCAL INFILE is disabled, falling back to batched INSERT statements"
+                )
+                self.upload_file(
+                    file_path, table_name=load_table, insert_method="append"
+                )
+            if replace:
+                self._swap_table(load_table, table_name)
+        except Exception as e:
+            if replace:
+                self._drop_table(load_table)
+            raise UploadError(table=table_name, error_msg=e)
+        logger.debug(f"Successfully loaded {file_path} to {table_name}")
+
+    @contextmanager
+    def _local_infile_connection(self, file_path: str):
+        """
+        Opens a separate connection that may only send files in the folder of `file_path`
+        with LOAD DATA LOCAL INFILE. The shared connection never allows local files, so a
+        query cannot make the server read arbitrary files from this machine.
+        """
+        folder = os.path.dirname(os.path.abspath(file_path))
+        engine = create_engine(
+            self._connection_string,
+            connect_args={"allow_local_infile_in_path": folder},
+            poolclass=NullPool,
+        )
+        try:
+            with engine.connect() as conn:
+                yield conn
+        finally:
+            engine.dispose()
+
+    def _load_local_infile(
+        self, file_path: str, table_name: str, boolean_columns: List[str] = ()
+    ):
+        """Loads the CSV into an existing table with LOAD DATA LOCAL INFILE"""
+        statement = load_data_statement(
+            os.path.abspath(file_path),
+            table_name,
+            read_csv_header(file_path),
+            boolean_columns,
+        )
+        with self._local_infile_connection(file_path) as conn:
+            conn.exec_driver_sql(statement)
+            conn.commit()
+
+    def _create_table_from_csv(self, file_path: str, table_name: str) -> List[str]:
+        """
+        Creates (or recreates) an empty table with the columns and inferred types of the CSV
+        and returns the names of its boolean columns
+        """
+        import pandas as pd
+
+        dtypes = _infer_csv_dtypes(file_path, self.CHUNKSIZE)
+        empty = pd.DataFrame(
+            {column: pd.Series(dtype=dtype) for column, dtype in dtypes.items()}
+        )
+        empty.to_sql(table_name, con=self.conn, index=False, if_exists="replace")
+        return [column for column, dtype in dtypes.items() if dtype == "bool"]
+
+    def _swap_table(self, staging_table: str, table_name: str):
+        """Atomically renames the staging table over the target table"""
+        if inspect(self.conn).has_table(table_name):
+            old_table = f"{table_name}_shipyard_old"
+            self.conn.exec_driver_sql(f"DROP TABLE IF EXISTS `{old_table}`")
+            self.conn.exec_driver_sql(
+                f"RENAME TABLE `{table_name}` TO `{old_table}`, `{staging_table}` TO `{table_name}`"
+            )
+            self.conn.exec_driver_sql(f"DROP TABLE `{old_table}`")
+        else:
+            self.conn.exec_driver_sql(
+                f"RENAME TABLE `{staging_table}` TO `{table_name}`"
+            )
+        self.conn.commit()
+
+    def _drop_table(self, table_name: str):
+        try:
+            self.conn.rollback()
+            self.conn.exec_driver_sql(f"DROP TABLE IF EXISTS `{table_name}`")
+            self.conn.commit()
+        except Exception as e:
+            logger.warning(f"Could not drop staging table {table_name}: {e}")
+
     def read_chunks(self, query: TextClause, dest_path: str, header: bool = True):
         """
         Reads data from the database in chunks and saves it to a CSV file.
@@ -204,10 +335,13 @@ class MySqlClient(Database):
         Returns:
             None
         """
+        import pandas as pd
+
         try:
             chunksize = self.CHUNKSIZE
             first_write = False
             for chunk in pd.read_sql_query(query, self.conn, chunksize=chunksize):
+                metrics.increment("rows_fetched_total", len(chunk), vendor="mysql")
                 if not first_write:
                     chunk.to_csv(dest_path, mode="w", header=header, index=False)
                     first_write = True
@@ -227,3 +361,59 @@ class MySqlClient(Database):
         if self.conn:
             self.conn.close()
             logger.info("Connection closed")
+
+
+def read_csv_header(file_path: str) -> List[str]:
+    with open(file_path, newline="") as f:
+        return next(csv.reader(f), [])
+
+
+def _infer_csv_dtypes(file_path: str, chunksize: int) -> Dict[str, str]:
+    """
+    Streams the file once and returns the pandas dtype of each column that holds all of
+    its values: integer and float columns widen to float, and any other mix becomes object.
+    """
+    import pandas as pd
+
+    dtypes: Dict[str, str] = {}
+    for chunk in pd.read_csv(file_path, chunksize=chunksize):
+        for column, dtype in chunk.dtypes.items():
+            seen = dtypes.get(column)
+            if seen is None or seen == dtype.name:
+                dtypes[column] = dtype.name
+            elif {seen, dtype.name} <= {"int64", "float64"}:
+                dtypes[column] = "float64"
+            else:
+                dtypes[column] = "object"
+    return dtypes
+
+
+def load_data_statement(
+    file_path: str, table_name: str, columns: List[str], boolean_columns: List[str] = ()
+) -> str:
+    """
+    Builds a LOAD DATA LOCAL INFILE statement for a CSV written with a header row, mapping
+    each CSV column to the table column of the same name and loading empty values as NULL.
+    Values of `boolean_columns` are converted from True/False text, which a BOOL column
+    rejects in strict mode.
+    """
+    with open(file_path, "rb") as f:
+        first_line = f.readline()
+    line_terminator = "\\r\\n" if first_line.endswith(b"\r\n") else "\\n"
+    escaped_path = file_path.replace("\\", "\\\\").replace("'", "\\'")
+    variables = [f"@col{index}" for index in range(len(columns))]
+    assignments = ", ".join(
+        (
+            f"`{column}` = CASE {variable} WHEN 'True' THEN 1 WHEN 'False' THEN 0 END"
+            if column in boolean_columns
+            else f"`{column}` = NULLIF({variable}, '')"
+        )
+        for column, variable in zip(columns, variables)
+    )
+    return (
+        f"LOAD DATA LOCAL INFILE '{escaped_path}' INTO TABLE `{table_name}` "
+        "CHARACTER SET utf8mb4 "
+        "FIELDS TERMINATED BY ',' OPTIONALLY ENCLOSED BY '\"' ESCAPED BY '' "
+        f"LINES TERMINATED BY '{line_terminator}' IGNORE 1 LINES "
+        f"({', '.join(variables)}) SET {assignments}"
+    )
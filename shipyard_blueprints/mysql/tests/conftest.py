@@ -0,0 +1,42 @@
+import os
+import subprocess
+import sys
+from typing import Dict
+
+import pytest
+
+# Import time budgets depend on the machine, so they are only enforced when this is set
+BUDGETS_ENV_VAR = "SHIPYARD_CHECK_IMPORT_BUDGETS"
+
+
+def _import_profile(module: str) -> Dict[str, float]:
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    profile = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        profile[name.strip()] = int(cumulative) / 1_000_000
+    return profile
+
+
+@pytest.fixture
+def import_profile():
+    """
+    Returns a function that imports a module in a fresh interpreter with `python -X importtime`,
+    like a blueprint container cold start, and returns the cumulative import time in seconds
+    of every module that was loaded.
+    """
+    return _import_profile
+
+
+@pytest.fixture
+def import_budgets():
+    """Skips the test unless import time budgets are enabled"""
+    if os.getenv(BUDGETS_ENV_VAR, "").strip().lower() not in ("1", "true", "yes"):
+        pytest.skip(f"set {BUDGETS_ENV_VAR} to check import time budgets")
@@ -0,0 +1,148 @@
+import os
+from unittest.mock import MagicMock
+
+import pandas as pd
+import pytest
+from sqlalchemy import Boolean, Float, create_engine, inspect, text
+from sqlalchemy.exc import DBAPIError
+from shipyard_templates.database import UploadError
+
+from shipyard_mysql import MySqlClient
+from shipyard_mysql import mysql
+
+
+class ServerError(Exception):
+    def __init__(self, errno):
+        super().__init__(f"error {errno}")
+        self.errno = errno
+
+
+@pytest.fixture
+def csv_file(tmp_path):
+    path = tmp_path / "data.csv"
+    path.write_bytes(b"id,name\r\n1,a\r\n2,\r\n")
+    return str(path)
+
+
+@pytest.fixture
+def client(monkeypatch):
+    client = MySqlClient(username="user", pwd="pwd", host="localhost", database="db")
+    client._conn = MagicMock()
+    monkeypatch.setattr(
+        mysql, "inspect", lambda conn: MagicMock(**{"has_table.return_value": True})
+    )
+    monkeypatch.setattr(client, "_create_table_from_csv", MagicMock())
+    monkeypatch.setattr(client, "_swap_table", MagicMock())
+    monkeypatch.setattr(client, "upload_file", MagicMock())
+    monkeypatch.setattr(client, "_load_local_infile", MagicMock())
+    return client
+
+
+def test_load_data_statement_maps_columns(csv_file):
+    statement = mysql.load_data_statement(csv_file, "target", ["id", "name"])
+
+    assert f"LOAD DATA LOCAL INFILE '{csv_file}' INTO TABLE `target`" in statement
+    assert "LINES TERMINATED BY '\\r\\n' IGNORE 1 LINES" in statement
+    assert statement.endswith(
+        "(@col0, @col1) SET `id` = NULLIF(@col0, ''), `name` = NULLIF(@col1, '')"
+    )
+
+
+def test_load_data_statement_converts_boolean_columns(csv_file):
+    statement = mysql.load_data_statement(
+        csv_file, "target", ["id", "name"], boolean_columns=["name"]
+    )
+
+    assert statement.endswith(
+        "SET `id` = NULLIF(@col0, ''), "
+        "`name` = CASE @col1 WHEN 'True' THEN 1 WHEN 'False' THEN 0 END"
+    )
+
+
+def test_table_types_are_inferred_from_the_whole_file(tmp_path):
+    path = tmp_path / "typed.csv"
+    path.write_text("flag,amount\nTrue,1\nFalse,2\nTrue,3\nFalse,4.5\n")
+    client = MySqlClient(username="user", pwd="pwd", host="localhost", database="db")
+    client._conn = create_engine("sqlite://").connect()
+    client.CHUNKSIZE = 2
+
+    boolean_columns = client._create_table_from_csv(str(path), "target")
+
+    types = {
+        column["name"]: column["type"]
+        for column in inspect(client.conn).get_columns("target")
+    }
+    assert boolean_columns == ["flag"]
+    assert isinstance(types["flag"], Boolean)
+    assert isinstance(types["amount"], Float)
+
+
+def test_replace_loads_staging_table_and_swaps(client, csv_file):
+    client.bulk_load(csv_file, "target", "replace")
+
+    staging_table = f"target{mysql.STAGING_TABLE_SUFFIX}"
+    client._create_table_from_csv.assert_called_once_with(csv_file, staging_table)
+    client._load_local_infile.assert_called_once_with(
+        csv_file, staging_table, client._create_table_from_csv.return_value
+    )
+    client._swap_table.assert_called_once_with(staging_table, "target")
+
+
+def test_falls_back_to_inserts_when_local_infile_is_disabled(client, csv_file):
+    client._load_local_infile.side_effect = DBAPIError(
+        "LOAD DATA", None, ServerError(3948)
+    )
+
+    client.bulk_load(csv_file, "target", "append")
+
+    client.upload_file.assert_called_once_with(
+        csv_file, table_name="target", insert_method="append"
+    )
+    client._create_table_from_csv.assert_not_called()
+
+
+def test_other_errors_drop_staging_table(client, csv_file):
+    client._load_local_infile.side_effect = DBAPIError(
+        "LOAD DATA", None, ServerError(1064)
+    )
+    drop_table = MagicMock()
+    client._drop_table = drop_table
+
+    with pytest.raises(UploadError):
+        client.bulk_load(csv_file, "target", "replace")
+
+    drop_table.assert_called_once_with(f"target{mysql.STAGING_TABLE_SUFFIX}")
+    client.upload_file.assert_not_called()
+
+
+def test_only_the_bulk_load_connection_allows_local_files(monkeypatch, csv_file):
+    engines = []
+
+    def fake_create_engine(url, **kwargs):
+        engines.append(kwargs.get("connect_args"))
+        return MagicMock()
+
+    monkeypatch.setattr(mysql, "create_engine", fake_create_engine)
+    client = MySqlClient(username="user", pwd="pwd", host="localhost", database="db")
+
+    client.connect()
+    client._load_local_infile(csv_file, "target")
+
+    assert engines == [None, {"allow_local_infile_in_path": os.path.dirname(csv_file)}]
+
+
+def test_fallback_inserts_rows_into_new_table(monkeypatch, csv_file):
+    client = MySqlClient(username="user", pwd="pwd", host="localhost", database="db")
+    client._conn = create_engine("sqlite://").connect()
+
+    def local_infile_disabled(file_path, table_name, boolean_columns):
+        raise DBAPIError("LOAD DATA", None, ServerError(3948))
+
+    monkeypatch.setattr(client, "_load_local_infile", local_infile_disabled)
+
+    client.bulk_load(csv_file, "target", "append")
+
+    rows = pd.read_sql(text("SELECT * FROM target ORDER BY id"), client.conn)
+    assert rows["id"].tolist() == [1, 2]
+    assert rows["name"].tolist()[0] == "a"
+    assert pd.isna(rows["name"].tolist()[1])
@@ -1,15 +1,16 @@
 import os
 import openai
-import pandas as pd
+
+from shipyard_openai_chatgpt import sampling
 
 
 def main():
     key = os.environ.get("CHATGPT_API_KEY")
     original_text = os.environ.get("CHATGPT_FILE")
     export_file = os.environ.get("CHATGPT_DESTINATION_FILE_NAME")
+    sampling_method = os.environ.get("CHATGPT_SAMPLING_METHOD") or "head"
 
-    df = pd.read_csv(original_text)
-    ten_records = df.head(10)
+    sample = sampling.read_sample(original_text, method=sampling_method)
 
     openai.api_key = key
 
@@ -18,7 +19,7 @@ def main():
         messages=[
             {
                 "role": "user",
-                "content": f"Create a data dictionary for this data: {ten_records}",
+                "content": f"Create a data dictionary for this data:\n{sample.schema_summary()}",
             }
         ],
     )
@@ -2,21 +2,31 @@ import os
 import openai
 import pandas as pd
 
+from shipyard_openai_chatgpt import sampling
+
 
 def main():
     key = os.environ.get("CHATGPT_API_KEY")
     number_of_rows = os.environ.get("CHATGPT_NUMBER_OF_ROWS")
     column_names = os.environ.get("CHATGPT_COLUMNS")
     export_file = os.environ.get("CHATGPT_DESTINATION_FILE_NAME")
+    example_file = os.environ.get("CHATGPT_FILE")
 
     openai.api_key = key
 
+    prompt = f"Generate {number_of_rows} lines of the following fake data: {column_names}. The result should be presented in CSV format with a header row"
+    if example_file:
+        sample = sampling.read_sample(example_file)
+        prompt += (
+            f". Match the schema of this existing data:\n{sample.schema_summary()}"
+        )
+
     completion = openai.ChatCompletion.create(
         model="gpt-3.5-turbo",
         messages=[
             {
                 "role": "user",
-                "content": f"Generate {number_of_rows} lines of the following fake data: {column_names}. The result should be presented in CSV format with a header row",
+                "content": prompt,
             }
         ],
     )
@@ -0,0 +1,190 @@
+import csv
+import io
+import random
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Iterator, List, Optional
+
+DEFAULT_SAMPLE_SIZE = 10
+# Upper bound on how much of the file is scanned for column statistics and reservoir samples
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+# Stop counting distinct values past this many so memory stays bounded on wide/unique columns
+MAX_TRACKED_DISTINCT_VALUES = 1000
+SAMPLING_METHODS = ("head", "reservoir")
+
+
+@dataclass
+class ColumnStats:
+    name: str
+    non_empty: int = 0
+    empty: int = 0
+    types: set = field(default_factory=set)
+    distinct_values: set = field(default_factory=set)
+    distinct_capped: bool = False
+    min_length: Optional[int] = None
+    max_length: Optional[int] = None
+
+    def update(self, value: str) -> None:
+        if value is None or value.strip() == "":
+            self.empty += 1
+            return
+        self.non_empty += 1
+        self.types.add(infer_type(value))
+        length = len(value)
+        self.min_length = (
+            length if self.min_length is None else min(self.min_length, length)
+        )
+        self.max_length = (
+            length if self.max_length is None else max(self.max_length, length)
+        )
+        if not self.distinct_capped:
+            self.distinct_values.add(value)
+            if len(self.distinct_values) > MAX_TRACKED_DISTINCT_VALUES:
+                self.distinct_capped = True
+                self.distinct_values = set()
+
+    @property
+    def type(self) -> str:
+        if not self.types:
+            return "empty"
+        if len(self.types) == 1:
+            return next(iter(self.types))
+        if self.types <= {"integer", "float"}:
+            return "float"
+        return "string"
+
+    def summary(self) -> str:
+        total = self.non_empty + self.empty
+        null_pct = 100 * self.empty / total if total else 0
+        distinct = (
+            f">{MAX_TRACKED_DISTINCT_VALUES}"
+            if self.distinct_capped
+            else str(len(self.distinct_values))
+        )
+        return (
+            f"{self.name}: {self.type}, {null_pct:.0f}% empty, {distinct} distinct, "
+            f"length {self.min_length}-{self.max_length}"
+        )
+
+
+@dataclass
+class CsvSample:
+    columns: List[str]
+    rows: List[List[str]]
+    stats: List[ColumnStats]
+    rows_scanned: int
+    truncated: bool
+
+    def to_csv_text(self) -> str:
+        output = io.StringIO()
+        writer = csv.writer(output, lineterminator="\n")
+        writer.writerow(self.columns)
+        writer.writerows(self.rows)
+        return output.getvalue().rstrip("\n")
+
+    def schema_summary(self) -> str:
+        """A compact, prompt-friendly description of the columns and sample rows."""
+        scanned = (
+            f"first {self.rows_scanned} rows"
+            if self.truncated
+            else f"all {self.rows_scanned} rows"
+        )
+        column_lines = "\n".join(f"- {column.summary()}" for column in self.stats)
+        return (
+            f"Columns (statistics from the {scanned}):\n{column_lines}\n\n"
+            f"Sample rows:\n{self.to_csv_text()}"
+        )
+
+
+def infer_type(value: str) -> str:
+    """Infer a coarse type for a single CSV value."""
+    value = value.strip()
+    if value.lower() in {"true", "false"}:
+        return "boolean"
+    try:
+        int(value)
+        return "integer"
+    except ValueError:
+        pass
+    try:
+        float(value)
+        return "float"
+    except ValueError:
+        pass
+    try:
+        datetime.fromisoformat(value)
+        return "datetime"
+    except ValueError:
+        return "string"
+
+
+def read_sample(
+    file_path: str,
+    sample_size: int = DEFAULT_SAMPLE_SIZE,
+    method: str = "head",
+    max_bytes: int = DEFAULT_MAX_BYTES,
+    seed: Optional[int] = None,
+) -> CsvSample:
+    """
+    Read a small sample of a CSV file without loading the whole file.
+
+    With `head`, only the first `sample_size` rows are read and the statistics describe
+    those rows. With `reservoir`, rows are streamed until `max_bytes` have been read,
+    keeping a uniform random sample of `sample_size` rows and statistics for every row
+    scanned.
+    """
+    if method not in SAMPLING_METHODS:
+        raise ValueError(
+            f"Sampling method {method} is not supported. Choose from {SAMPLING_METHODS}."
+        )
+
+    with open(file_path, newline="", encoding="utf-8", errors="replace") as f:
+        budget = _ByteBudget(f, max_bytes)
+        reader = csv.reader(budget)
+        columns = next(reader, [])
+        stats = [ColumnStats(name) for name in columns]
+        rng = random.Random(seed)
+        rows = []
+        rows_scanned = 0
+        truncated = False
+
+        for row in reader:
+            if method == "head" and rows_scanned >= sample_size:
+                truncated = True
+                break
+            rows_scanned += 1
+            for column_stats, value in zip(stats, row):
+                column_stats.update(value)
+            if len(rows) < sample_size:
+                rows.append(row)
+            else:
+                index = rng.randrange(rows_scanned)
+                if index < sample_size:
+                    rows[index] = row
+
+        truncated = truncated or budget.exhausted
+
+    return CsvSample(
+        columns=columns,
+        rows=rows,
+        stats=stats,
+        rows_scanned=rows_scanned,
+        truncated=truncated,
+    )
+
+
+class _ByteBudget:
+    """Line iterator over a file that stops once `max_bytes` characters have been read."""
+
+    def __init__(self, file, max_bytes: int):
+        self.file = file
+        self.remaining = max_bytes
+        self.exhausted = False
+
+    def __iter__(self) -> Iterator[str]:
+        for line in self.file:
+            yield line
+            self.remaining -= len(line)
+            if self.remaining <= 0:
+                self.exhausted = next(self.file, None) is not None
+                return
@@ -0,0 +1,59 @@
+import pytest
+
+from shipyard_openai_chatgpt.sampling import read_sample
+
+
+@pytest.fixture
+def csv_file(tmp_path):
+    path = tmp_path / "data.csv"
+    lines = ["id,name,score,joined"]
+    lines.extend(
+        f'{i},"Name, {i}",{i * 1.5},2024-01-{i % 28 + 1:02d}' for i in range(100)
+    )
+    lines.append("100,,,")
+    path.write_text("\n".join(lines) + "\n")
+    return str(path)
+
+
+def test_head_reads_only_sample_rows(csv_file):
+    sample = read_sample(csv_file, sample_size=5)
+
+    assert sample.columns == ["id", "name", "score", "joined"]
+    assert [row[0] for row in sample.rows] == ["0", "1", "2", "3", "4"]
+    assert sample.rows_scanned == 5
+    assert sample.truncated
+    assert [column.type for column in sample.stats] == [
+        "integer",
+        "string",
+        "float",
+        "datetime",
+    ]
+
+
+def test_reservoir_scans_whole_file_within_budget(csv_file):
+    sample = read_sample(csv_file, sample_size=5, method="reservoir", seed=1)
+
+    assert len(sample.rows) == 5
+    assert sample.rows_scanned == 101
+    assert not sample.truncated
+    assert sample.stats[1].empty == 1
+    assert sample.stats[0].type == "integer"
+
+
+def test_reservoir_stops_at_byte_budget(csv_file):
+    sample = read_sample(csv_file, sample_size=5, method="reservoir", max_bytes=200)
+
+    assert sample.rows_scanned < 101
+    assert sample.truncated
+
+
+def test_schema_summary_keeps_quoting(csv_file):
+    summary = read_sample(csv_file, sample_size=2).schema_summary()
+
+    assert "- score: float, 0% empty, 2 distinct" in summary
+    assert '0,"Name, 0",0.0,2024-01-01' in summary
+
+
+def test_invalid_method(csv_file):
+    with pytest.raises(ValueError):
+        read_sample(csv_file, method="tail")
@@ -0,0 +1,235 @@
+import json
+import math
+import os
+import shutil
+import subprocess
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+
+MODEL = "whisper-1"
+# The Whisper API rejects uploads larger than 25 MB
+MAX_UPLOAD_BYTES = 25 * 1024 * 1024
+# 10 minutes of 16 kHz mono 16-bit PCM is ~19 MB, safely under the upload limit
+DEFAULT_SEGMENT_SECONDS = 600
+DEFAULT_OVERLAP_SECONDS = 2
+DEFAULT_MAX_WORKERS = 4
+DEFAULT_MAX_RETRIES = 5
+
+
+@dataclass
+class AudioChunk:
+    index: int
+    start: float
+    end: float
+    path: str
+
+
+def plan_chunks(
+    duration: float,
+    segment_seconds: float = DEFAULT_SEGMENT_SECONDS,
+    overlap_seconds: float = DEFAULT_OVERLAP_SECONDS,
+) -> List[Tuple[float, float]]:
+    """
+    Return the (start, end) offsets in seconds of each chunk. Every chunk after the
+    first starts `segment_seconds` after the previous one, and every chunk runs
+    `overlap_seconds` past the start of the next so words at a boundary are not cut.
+    """
+    if segment_seconds <= 0:
+        raise ValueError("segment_seconds must be greater than 0")
+    if overlap_seconds < 0 or overlap_seconds >= segment_seconds:
+        raise ValueError("overlap_seconds must be between 0 and segment_seconds")
+
+    chunk_count = max(1, math.ceil(duration / segment_seconds))
+    return [
+        (
+            index * segment_seconds,
+            min((index + 1) * segment_seconds + overlap_seconds, duration),
+        )
+        for index in range(chunk_count)
+    ]
+
+
+def get_audio_duration(audio_path: str) -> float:
+    """Read the duration of an audio file in seconds with ffprobe."""
+    output = subprocess.run(
+        [
+            _require_executable("ffprobe"),
+            "-v",
+            "error",
+            "-show_entries",
+            "format=duration",
+            "-of",
+            "default=noprint_wrappers=1:nokey=1",
+            audio_path,
+        ],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return float(output.strip())
+
+
+def split_audio(
+    audio_path: str,
+    output_dir: str,
+    segment_seconds: float = DEFAULT_SEGMENT_SECONDS,
+    overlap_seconds: float = DEFAULT_OVERLAP_SECONDS,
+) -> List[AudioChunk]:
+    """
+    Split an audio file into overlapping 16 kHz mono WAV chunks with ffmpeg. Whisper
+    resamples to 16 kHz mono anyway, so this loses nothing and keeps chunks small.
+    Each chunk is seeked and decoded independently, so the full recording is never
+    held in memory.
+    """
+    ffmpeg = _require_executable("ffmpeg")
+    duration = get_audio_duration(audio_path)
+    chunks = []
+    for index, (start, end) in enumerate(
+        plan_chunks(duration, segment_seconds, overlap_seconds)
+    ):
+        chunk_path = os.path.join(output_dir, f"chunk_{index:05d}.wav")
+        subprocess.run(
+            [
+                ffmpeg,
+                "-v",
+                "error",
+                "-y",
+                "-ss",
+                str(start),
+                "-t",
+                str(end - start),
+                "-i",
+                audio_path,
+                "-ac",
+                "1",
+                "-ar",
+                "16000",
+                chunk_path,
+            ],
+            check=True,
+        )
+        chunks.append(AudioChunk(index=index, start=start, end=end, path=chunk_path))
+    return chunks
+
+
+def transcribe_chunk(
+    client,
+    chunk: AudioChunk,
+    task: str = "transcribe",
+    language: str = None,
+    response_format: Optional[str] = "verbose_json",
+) -> dict:
+    """
+    Send one chunk to the Whisper API. Retries on rate limits, timeouts and server errors
+    are handled by the OpenAI client itself (see `max_retries`). Chunks of a split file
+    ask for `verbose_json` so their segment timestamps can be stitched together, and
+    `response_format=None` keeps the API default.
+    """
+    options = {"model": MODEL}
+    if response_format:
+        options["response_format"] = response_format
+    if task == "translate":
+        endpoint = client.audio.translations
+    else:
+        endpoint = client.audio.transcriptions
+        if language:
+            options["language"] = language
+
+    with open(chunk.path, "rb") as audio_file:
+        response = endpoint.create(file=audio_file, **options)
+    return response.model_dump() if hasattr(response, "model_dump") else dict(response)
+
+
+def stitch_transcripts(chunks: List[AudioChunk], transcripts: List[dict]) -> dict:
+    """
+    Combine the per-chunk transcripts into one, shifting segment timestamps by the chunk
+    offset. Segments that start inside the overlap at the end of a chunk are left to the
+    next chunk, which hears them in full, and segments that end before the last kept
+    segment are dropped as already transcribed. Whisper segments span several seconds,
+    so a boundary segment may repeat at most `overlap_seconds` of speech rather than
+    losing it.
+    """
+    segments = []
+    last_end = -math.inf
+    for position, (chunk, transcript) in enumerate(zip(chunks, transcripts)):
+        next_start = (
+            chunks[position + 1].start if position + 1 < len(chunks) else math.inf
+        )
+        chunk_segments = transcript.get("segments") or [
+            {"start": 0.0, "end": chunk.end - chunk.start, "text": transcript["text"]}
+        ]
+        for segment in chunk_segments:
+            start = chunk.start + segment["start"]
+            end = chunk.start + segment["end"]
+            if start >= next_start or end <= last_end:
+                continue
+            segments.append(
+                {
+                    "id": len(segments),
+                    "start": start,
+                    "end": end,
+                    "text": segment["text"],
+                }
+            )
+            last_end = end
+
+    text = " ".join(segment["text"].strip() for segment in segments)
+    return {"text": text, "segments": segments}
+
+
+def transcribe_audio(
+    client,
+    audio_path: str,
+    task: str = "transcribe",
+    language: Optional[str] = None,
+    segment_seconds: float = DEFAULT_SEGMENT_SECONDS,
+    overlap_seconds: float = DEFAULT_OVERLAP_SECONDS,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+) -> dict:
+    """
+    Transcribe (or translate) an audio file of any length. Files under the upload limit
+    are sent as-is in a single request; larger files are split into overlapping chunks
+    that are sent concurrently and stitched back together in order.
+
+    Returns:
+        dict: The API response for files under the upload limit, otherwise the combined
+        transcript with `text` and timestamped `segments`.
+    """
+    if os.path.getsize(audio_path) <= MAX_UPLOAD_BYTES:
+        chunk = AudioChunk(index=0, start=0.0, end=math.inf, path=audio_path)
+        return transcribe_chunk(client, chunk, task, language, response_format=None)
+
+    with tempfile.TemporaryDirectory() as output_dir:
+        chunks = split_audio(audio_path, output_dir, segment_seconds, overlap_seconds)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            transcripts = list(
+                executor.map(
+                    lambda chunk: transcribe_chunk(client, chunk, task, language),
+                    chunks,
+                )
+            )
+    return stitch_transcripts(chunks, transcripts)
+
+
+def write_transcript(transcript: dict, file_name: str) -> None:
+    """
+    Write the transcript text. A stitched transcript of a split file is written in full,
+    with its segments, when `file_name` ends in .json.
+    """
+    with open(file_name, "w") as f:
+        if file_name.lower().endswith(".json") and "segments" in transcript:
+            json.dump(transcript, f, ensure_ascii=False)
+        else:
+            f.write(transcript["text"])
+
+
+def _require_executable(name: str) -> str:
+    path = shutil.which(name)
+    if not path:
+        raise RuntimeError(
+            f"{name} is required to split audio files larger than "
+            f"{MAX_UPLOAD_BYTES // (1024 * 1024)} MB but was not found on the PATH."
+        )
+    return path
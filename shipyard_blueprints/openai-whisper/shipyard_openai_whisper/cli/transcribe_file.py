@@ -1,5 +1,7 @@
 import os
-import openai
+from openai import OpenAI
+
+from shipyard_openai_whisper import chunked_transcription
 
 
 def main():
@@ -7,13 +9,17 @@ def main():
     audio = os.environ.get("WHISPER_FILE")
     file_name = os.environ.get("WHISPER_DESTINATION_FILE_NAME")
     lang = os.environ.get("WHISPER_LANGUAGE")
+    max_workers = int(
+        os.environ.get("WHISPER_MAX_WORKERS")
+        or chunked_transcription.DEFAULT_MAX_WORKERS
+    )
 
-    openai.api_key = key
-    audio_file = open(audio, "rb")
-    transcript = openai.Audio.transcribe("whisper-1", audio_file, language=lang)
+    client = OpenAI(api_key=key, max_retries=chunked_transcription.DEFAULT_MAX_RETRIES)
+    transcript = chunked_transcription.transcribe_audio(
+        client, audio, task="transcribe", language=lang, max_workers=max_workers
+    )
 
-    with open(file_name, "w") as f:
-        f.write(transcript.text)
+    chunked_transcription.write_transcript(transcript, file_name)
 
 
 if __name__ == "__main__":
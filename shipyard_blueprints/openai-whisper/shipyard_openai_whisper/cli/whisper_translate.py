@@ -1,18 +1,24 @@
 import os
-import openai
+from openai import OpenAI
+
+from shipyard_openai_whisper import chunked_transcription
 
 
 def main():
     key = os.environ.get("WHISPER_API_KEY")
     audio = os.environ.get("WHISPER_FILE")
     export_file = os.environ.get("WHISPER_DESTINATION_FILE_NAME")
+    max_workers = int(
+        os.environ.get("WHISPER_MAX_WORKERS")
+        or chunked_transcription.DEFAULT_MAX_WORKERS
+    )
 
-    openai.api_key = key
-    audio_file = open(audio, "rb")
-    transcript = openai.Audio.translate("whisper-1", audio_file)
+    client = OpenAI(api_key=key, max_retries=chunked_transcription.DEFAULT_MAX_RETRIES)
+    transcript = chunked_transcription.transcribe_audio(
+        client, audio, task="translate", max_workers=max_workers
+    )
 
-    with open(export_file, "w") as f:
-        f.write(transcript.text)
+    chunked_transcription.write_transcript(transcript, export_file)
 
 
 if __name__ == "__main__":
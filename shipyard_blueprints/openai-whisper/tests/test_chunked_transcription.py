@@ -0,0 +1,158 @@
+import json
+
+import pytest
+
+from shipyard_openai_whisper import chunked_transcription
+from shipyard_openai_whisper.chunked_transcription import (
+    AudioChunk,
+    plan_chunks,
+    stitch_transcripts,
+    transcribe_audio,
+    write_transcript,
+)
+
+
+def test_plan_chunks_overlaps_each_boundary():
+    assert plan_chunks(25, segment_seconds=10, overlap_seconds=2) == [
+        (0, 12),
+        (10, 22),
+        (20, 25),
+    ]
+
+
+def test_plan_chunks_short_audio_is_single_chunk():
+    assert plan_chunks(5, segment_seconds=10, overlap_seconds=2) == [(0, 5)]
+
+
+@pytest.mark.parametrize("overlap", [-1, 10, 11])
+def test_plan_chunks_rejects_invalid_overlap(overlap):
+    with pytest.raises(ValueError):
+        plan_chunks(25, segment_seconds=10, overlap_seconds=overlap)
+
+
+def test_stitch_transcripts_hands_overlap_to_next_chunk():
+    chunks = [AudioChunk(0, 0, 12, "a"), AudioChunk(1, 10, 20, "b")]
+    transcripts = [
+        {
+            "text": "one two",
+            "segments": [
+                {"start": 0.0, "end": 8.0, "text": " one"},
+                {"start": 10.5, "end": 12.0, "text": " two"},
+            ],
+        },
+        {
+            "text": "two three",
+            "segments": [
+                {"start": 0.5, "end": 2.0, "text": " two"},
+                {"start": 2.0, "end": 9.0, "text": " three"},
+            ],
+        },
+    ]
+
+    result = stitch_transcripts(chunks, transcripts)
+
+    assert result["text"] == "one two three"
+    assert [segment["start"] for segment in result["segments"]] == [0.0, 10.5, 12.0]
+    assert result["segments"][2]["end"] == 19.0
+
+
+def test_stitch_transcripts_skips_segments_already_covered():
+    chunks = [AudioChunk(0, 0, 12, "a"), AudioChunk(1, 10, 20, "b")]
+    transcripts = [
+        {"text": "one", "segments": [{"start": 0.0, "end": 11.5, "text": "one"}]},
+        {
+            "text": "one two",
+            "segments": [
+                {"start": 0.0, "end": 1.0, "text": "one"},
+                {"start": 1.0, "end": 9.0, "text": "two"},
+            ],
+        },
+    ]
+
+    result = stitch_transcripts(chunks, transcripts)
+
+    assert result["text"] == "one two"
+
+
+class FakeEndpoint:
+    def __init__(self):
+        self.calls = []
+
+    def create(self, file, **options):
+        self.calls.append((file.name, options))
+        return {
+            "text": file.name,
+            "segments": [{"start": 0.0, "end": 1.0, "text": file.name}],
+        }
+
+
+class FakeClient:
+    def __init__(self):
+        self.audio = type(
+            "Audio",
+            (),
+            {"transcriptions": FakeEndpoint(), "translations": FakeEndpoint()},
+        )()
+
+
+def test_transcribe_audio_sends_small_files_as_is(tmp_path):
+    audio = tmp_path / "audio.mp3"
+    audio.write_bytes(b"audio")
+    client = FakeClient()
+
+    result = transcribe_audio(client, str(audio), language="en")
+
+    assert result == {
+        "text": str(audio),
+        "segments": [{"start": 0.0, "end": 1.0, "text": str(audio)}],
+    }
+    assert client.audio.transcriptions.calls == [
+        (str(audio), {"model": "whisper-1", "language": "en"})
+    ]
+
+
+def test_write_transcript_keeps_text_for_single_request_json(tmp_path):
+    destination = tmp_path / "transcript.json"
+
+    write_transcript({"text": "hello"}, str(destination))
+
+    assert destination.read_text() == "hello"
+
+
+def test_write_transcript_writes_segments_of_split_files_to_json(tmp_path):
+    destination = tmp_path / "transcript.json"
+    transcript = {"text": "hello", "segments": [{"start": 0.0, "text": "hello"}]}
+
+    write_transcript(transcript, str(destination))
+
+    assert json.loads(destination.read_text()) == transcript
+
+
+def test_transcribe_audio_splits_large_files_and_keeps_order(tmp_path, monkeypatch):
+    audio = tmp_path / "audio.mp3"
+    audio.write_bytes(b"audio")
+    monkeypatch.setattr(chunked_transcription, "MAX_UPLOAD_BYTES", 1)
+
+    def fake_split(audio_path, output_dir, segment_seconds, overlap_seconds):
+        chunks = []
+        for index in range(5):
+            path = tmp_path / f"chunk_{index}.wav"
+            path.write_bytes(b"chunk")
+            start = index * segment_seconds
+            chunks.append(AudioChunk(index, start, start + segment_seconds, str(path)))
+        return chunks
+
+    monkeypatch.setattr(chunked_transcription, "split_audio", fake_split)
+    client = FakeClient()
+
+    result = transcribe_audio(client, str(audio), task="translate", max_workers=3)
+
+    assert result["text"] == " ".join(
+        str(tmp_path / f"chunk_{i}.wav") for i in range(5)
+    )
+    assert len(client.audio.translations.calls) == 5
+    assert all(
+        options["response_format"] == "verbose_json"
+        for _, options in client.audio.translations.calls
+    )
+    assert not client.audio.transcriptions.calls
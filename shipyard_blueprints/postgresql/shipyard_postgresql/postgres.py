@@ -1,6 +1,5 @@
-import pandas as pd
 import os
-from shipyard_templates import Database, ExitCodeException, ShipyardLogger
+from shipyard_templates import Database, ExitCodeException, Metrics, ShipyardLogger
 from shipyard_templates.database import (
     FetchError,
     UploadError,
@@ -8,9 +7,13 @@ from shipyard_templates.database import (
     ConnectionError,
 )
 from sqlalchemy import create_engine, TextClause
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 logger = ShipyardLogger.get_logger()
+metrics = Metrics.get_metrics()
 
 
 class PostgresClient(Database):
@@ -98,20 +101,27 @@ class PostgresClient(Database):
             ExitCodeException: If an exit code exception occurs during the upload process.
             Exception: If any other exception occurs during the upload process.
         """
+        import pandas as pd
+
         try:
-            if os.path.getsize(file) < self.MAX_FILE_SIZE:
-                df = pd.read_csv(file)
-                self.upload_df(df, table_name=table_name, insert_method=insert_method)
-            else:
-                self.upload_file(
-                    file, table_name=table_name, insert_method=insert_method
-                )
+            size = os.path.getsize(file)
+            with metrics.timer("load_seconds", vendor="postgresql"):
+                if size < self.MAX_FILE_SIZE:
+                    df = pd.read_csv(file)
+                    self.upload_df(
+                        df, table_name=table_name, insert_method=insert_method
+                    )
+                else:
+                    self.upload_file(
+                        file, table_name=table_name, insert_method=insert_method
+                    )
+            metrics.increment("load_bytes_total", size, vendor="postgresql")
         except ExitCodeException:
             raise
         except Exception:
             raise
 
-    def fetch(self, query: TextClause) -> pd.DataFrame:
+    def fetch(self, query: TextClause) -> "pd.DataFrame":
         """
         Fetches data from the database using the provided SQL query.
 
@@ -124,6 +134,8 @@ class PostgresClient(Database):
         Raises:
             FetchError: If an error occurs while fetching the results.
         """
+        import pandas as pd
+
         try:
             df = pd.read_sql(sql=query, con=self.conn)
             logger.debug("Successfully fetched results")
@@ -133,7 +145,7 @@ class PostgresClient(Database):
             return df
 
     def upload_df(
-        self, df: pd.DataFrame, table_name: str, insert_method: str = "replace"
+        self, df: "pd.DataFrame", table_name: str, insert_method: str = "replace"
     ):
         """
         Uploads a pandas DataFrame to a PostgreSQL table.
@@ -176,6 +188,8 @@ class PostgresClient(Database):
             UploadError: If an error occurs during the upload process.
 
         """
+        import pandas as pd
+
         try:
             for index, chunk in enumerate(
                 pd.read_csv(file_path, chunksize=self.CHUNKSIZE)
@@ -208,10 +222,13 @@ class PostgresClient(Database):
         Returns:
             None
         """
+        import pandas as pd
+
         try:
             chunksize = self.CHUNKSIZE
             first_write = False
             for chunk in pd.read_sql_query(query, self.conn, chunksize=chunksize):
+                metrics.increment("rows_fetched_total", len(chunk), vendor="postgresql")
                 if not first_write:
                     chunk.to_csv(dest_path, mode="w", header=header, index=False)
                     first_write = True
@@ -2,7 +2,6 @@ import argparse
 import re
 import sys
 import shipyard_bp_utils as shipyard
-import pandas as pd
 from shipyard_templates import ShipyardLogger, Database, ExitCodeException
 from shipyard_redshift import RedshiftClient
 
@@ -42,6 +41,22 @@ def get_args():
         required=False,
     )
     parser.add_argument("--schema", dest="schema", required=False, default="")
+    parser.add_argument(
+        "--s3-bucket-name", dest="s3_bucket_name", required=False, default=""
+    )
+    parser.add_argument(
+        "--iam-role-arn", dest="iam_role_arn", required=False, default=""
+    )
+    parser.add_argument(
+        "--aws-access-key-id", dest="aws_access_key_id", required=False, default=""
+    )
+    parser.add_argument(
+        "--aws-secret-access-key",
+        dest="aws_secret_access_key",
+        required=False,
+        default="",
+    )
+    parser.add_argument("--aws-region", dest="aws_region", required=False, default="")
     args = parser.parse_args()
 
     if args.host and not (args.database or args.username):
@@ -71,6 +86,11 @@ def main():
         "port": args.port,
         "schema": args.schema if args.schema != "" else None,
         "url_params": args.url_parameters if args.url_parameters != "" else None,
+        "s3_bucket": args.s3_bucket_name or None,
+        "iam_role": args.iam_role_arn or None,
+        "aws_access_key_id": args.aws_access_key_id or None,
+        "aws_secret_access_key": args.aws_secret_access_key or None,
+        "aws_region": args.aws_region or None,
     }
 
     redshift = None
@@ -81,7 +101,8 @@ def main():
             matching_file_names = shipyard.files.find_all_file_matches(
                 file_names, re.compile(src_file)
             )
-            if n_matches := len(matching_file_names) == 0:
+            n_matches = len(matching_file_names)
+            if n_matches == 0:
                 logger.error(f"No matches found for pattern {src_file}")
                 sys.exit(Database.EXIT_CODE_NO_FILE_MATCHES)
             logger.info(
@@ -1,7 +1,8 @@
 import redshift_connector
-import pandas as pd
 import os
-from sqlalchemy import create_engine, text
+import tempfile
+import uuid
+from sqlalchemy import create_engine, inspect, text
 from sqlalchemy.engine.url import URL
 from shipyard_templates import Database, ShipyardLogger, ExitCodeException
 from shipyard_templates.database import (
@@ -10,7 +11,12 @@ from shipyard_templates.database import (
     QueryError,
     ConnectionError,
 )
-from typing import Optional
+from typing import TYPE_CHECKING, Dict, List, Optional
+
+from shipyard_redshift import s3_staging
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 logger = ShipyardLogger.get_logger()
 
@@ -18,6 +24,7 @@ logger = ShipyardLogger.get_logger()
 class RedshiftClient(Database):
     CHUNKSIZE = 10_000
     MAX_FILE_SIZE = 50_000_000
+    STAGING_TABLE_SUFFIX = "_shipyard_staging"
 
     def __init__(
         self,
@@ -28,6 +35,12 @@ class RedshiftClient(Database):
         schema: Optional[str] = None,
         port: Optional[int] = 5439,
         url_params: Optional[str] = None,
+        s3_bucket: Optional[str] = None,
+        s3_prefix: str = "shipyard-redshift-staging",
+        iam_role: Optional[str] = None,
+        aws_access_key_id: Optional[str] = None,
+        aws_secret_access_key: Optional[str] = None,
+        aws_region: Optional[str] = None,
     ) -> None:
         self.user = user
         self.pwd = pwd
@@ -36,7 +49,14 @@ class RedshiftClient(Database):
         self.schema = schema
         self.port = port
         self.url_params = url_params
+        self.s3_bucket = s3_bucket
+        self.s3_prefix = s3_prefix
+        self.iam_role = iam_role
+        self.aws_access_key_id = aws_access_key_id
+        self.aws_secret_access_key = aws_secret_access_key
+        self.aws_region = aws_region
         self._conn = None
+        self._s3_client = None
         super().__init__(
             user, pwd, host=host, database=database, port=port, url_params=url_params
         )
@@ -97,7 +117,7 @@ class RedshiftClient(Database):
         else:
             logger.info("Successfully executed query")
 
-    def fetch(self, query: str) -> pd.DataFrame:
+    def fetch(self, query: str) -> "pd.DataFrame":
         """
         Executes the given SQL query and returns the results as a pandas DataFrame.
 
@@ -110,6 +130,8 @@ class RedshiftClient(Database):
         Raises:
             FetchError: If an error occurs while fetching the results.
         """
+        import pandas as pd
+
         try:
             query_text = text(query)
             df = pd.read_sql(sql=query_text, con=self.conn)
@@ -121,7 +143,8 @@ class RedshiftClient(Database):
 
     def upload(self, file: str, table_name: str, insert_method: str = "replace"):
         """
-        Uploads data from a file to a Redshift table.
+        Uploads data from a file to a Redshift table. Files larger than MAX_FILE_SIZE are
+        loaded with a staged S3 COPY when an S3 bucket is configured.
 
         Args:
             file (str): The path to the file containing the data to be uploaded.
@@ -134,11 +157,18 @@ class RedshiftClient(Database):
             UploadError: If an error occurs during the upload process.
 
         """
+        import pandas as pd
+
         try:
             if self.schema:
                 logger.info("Creating schema if it does not already exist")
                 self.execute_query(f"CREATE SCHEMA IF NOT EXISTS {self.schema}")
-            if os.path.getsize(file) < self.MAX_FILE_SIZE:
+            file_size = os.path.getsize(file)
+            if self.s3_bucket and file_size >= self.MAX_FILE_SIZE:
+                self.copy_upload(
+                    file, table_name=table_name, insert_method=insert_method
+                )
+            elif file_size < self.MAX_FILE_SIZE:
                 df = pd.read_csv(file)
                 self.upload_df(df, table_name=table_name, insert_method=insert_method)
             else:
@@ -165,6 +195,8 @@ class RedshiftClient(Database):
         Returns:
             None
         """
+        import pandas as pd
+
         try:
             chunksize = self.CHUNKSIZE
             first_write = False
@@ -178,7 +210,7 @@ class RedshiftClient(Database):
             raise FetchError(e)
 
     def upload_df(
-        self, df: pd.DataFrame, table_name: str, insert_method: str = "replace"
+        self, df: "pd.DataFrame", table_name: str, insert_method: str = "replace"
     ):
         """
         Uploads a pandas DataFrame to a PostgreSQL table.
@@ -221,6 +253,8 @@ class RedshiftClient(Database):
             UploadError: If an error occurs during the upload process.
 
         """
+        import pandas as pd
+
         try:
             for chunk in pd.read_csv(file_path, chunksize=self.CHUNKSIZE):
                 chunk.to_sql(
@@ -236,6 +270,156 @@ class RedshiftClient(Database):
         except Exception as e:
             raise UploadError(table=table_name, error_msg=e)
 
+    @property
+    def s3_client(self):
+        if self._s3_client is None:
+            import boto3
+
+            # boto3 honours AWS_ENDPOINT_URL, which allows staging to a local S3 stand-in
+            self._s3_client = boto3.client(
+                "s3",
+                region_name=self.aws_region,
+                aws_access_key_id=self.aws_access_key_id,
+                aws_secret_access_key=self.aws_secret_access_key,
+            )
+        return self._s3_client
+
+    def copy_upload(self, file: str, table_name: str, insert_method: str = "replace"):
+        """
+        Loads a CSV file into Redshift with a single COPY from S3.
+
+        The file is split into gzip-compressed parts, a multiple of the number of slices in the
+        cluster so every slice loads in parallel, which are uploaded to S3 concurrently and
+        loaded with a manifest. When replacing, the data is copied into a staging table that
+        is swapped in for the target in one transaction. Staged files are always removed.
+
+        Args:
+            file (str): The path to the CSV file to be loaded.
+            table_name (str): The name of the Redshift table to load the data into.
+            insert_method (str, optional): "replace" or "append". Defaults to "replace".
+
+        Raises:
+            UploadError: If an error occurs during the upload process.
+        """
+        replace = insert_method == "replace"
+        load_table = (
+            f"{table_name}{self.STAGING_TABLE_SUFFIX}" if replace else table_name
+        )
+        prefix = f"{self.s3_prefix}/{table_name}/{uuid.uuid4().hex}"
+        staged_keys = []
+        try:
+            if replace or not self._table_exists(table_name):
+                self._create_table_from_csv(file, load_table)
+
+            with tempfile.TemporaryDirectory() as output_dir:
+                parts = s3_staging.count_parts(
+                    os.path.getsize(file), self._slice_count()
+                )
+                header, part_paths = s3_staging.split_csv(file, output_dir, parts)
+                staged_keys = s3_staging.stage_parts(
+                    self.s3_client, self.s3_bucket, prefix, part_paths
+                )
+            manifest_key = f"{prefix}/load.manifest"
+            manifest_url = s3_staging.write_manifest(
+                self.s3_client, self.s3_bucket, manifest_key, staged_keys
+            )
+            staged_keys.append(manifest_key)
+
+            with self._begin():
+                self.conn.exec_driver_sql(
+                    self._copy_statement(load_table, header, manifest_url)
+                )
+                if replace:
+                    self.conn.exec_driver_sql(
+                        f"DROP TABLE IF EXISTS {self._qualify(table_name)}"
+                    )
+                    self.conn.exec_driver_sql(
+                        f"ALTER TABLE {self._qualify(load_table)} RENAME TO {table_name}"
+                    )
+            logger.info(f"Copied {parts} staged parts into {table_name}")
+        except Exception as e:
+            if replace:
+                self._drop_table(load_table)
+            # SQLAlchemy errors quote the COPY statement, which holds the AWS credentials
+            error = getattr(e, "orig", None) or e
+            raise UploadError(
+                table=table_name, error_msg=self._redact_credentials(str(error))
+            ) from None
+        finally:
+            if staged_keys:
+                s3_staging.delete_staged(self.s3_client, self.s3_bucket, staged_keys)
+
+    def _copy_statement(
+        self, table_name: str, columns: List[str], manifest_url: str
+    ) -> str:
+        if self.iam_role:
+            authorization = f"IAM_ROLE '{self.iam_role}'"
+        elif self.aws_access_key_id:
+            authorization = (
+                f"ACCESS_KEY_ID '{self.aws_access_key_id}' "
+                f"SECRET_ACCESS_KEY '{self.aws_secret_access_key}'"
+            )
+        else:
+            authorization = "IAM_ROLE default"
+        column_list = ", ".join(f'"{column}"' for column in columns)
+        region = f" REGION '{self.aws_region}'" if self.aws_region else ""
+        return (
+            f"COPY {self._qualify(table_name)} ({column_list}) FROM '{manifest_url}' "
+            f"{authorization} MANIFEST CSV GZIP EMPTYASNULL{region}"
+        )
+
+    def _redact_credentials(self, message: str) -> str:
+        for secret in (self.aws_secret_access_key, self.aws_access_key_id):
+            if secret:
+                message = message.replace(secret, "****")
+        return message
+
+    def _begin(self):
+        """Begins a transaction, first committing any implicit one left open by earlier statements"""
+        if self.conn.in_transaction():
+            self.conn.get_transaction().commit()
+        return self.conn.begin()
+
+    def _qualify(self, table_name: str) -> str:
+        return f"{self.schema}.{table_name}" if self.schema else table_name
+
+    def _slice_count(self) -> int:
+        try:
+            return int(
+                self.conn.exec_driver_sql("SELECT COUNT(*) FROM stv_slices").scalar()
+            )
+        except Exception as e:
+            logger.debug(f"Could not read the number of slices, assuming 1: {e}")
+            return 1
+
+    def _table_exists(self, table_name: str) -> bool:
+        return inspect(self.conn).has_table(table_name, schema=self.schema)
+
+    def _create_table_from_csv(self, file: str, table_name: str):
+        """Creates (or recreates) an empty table with the columns and inferred types of the CSV"""
+        import pandas as pd
+
+        dtypes = _infer_csv_dtypes(file, self.CHUNKSIZE)
+        empty = pd.DataFrame(
+            {column: pd.Series(dtype=dtype) for column, dtype in dtypes.items()}
+        )
+        empty.to_sql(
+            table_name,
+            con=self.conn,
+            index=False,
+            if_exists="replace",
+            schema=self.schema,
+        )
+
+    def _drop_table(self, table_name: str):
+        try:
+            with self._begin():
+                self.conn.exec_driver_sql(
+                    f"DROP TABLE IF EXISTS {self._qualify(table_name)}"
+                )
+        except Exception as e:
+            logger.warning(f"Could not drop staging table {table_name}: {e}")
+
     def close(self):
         """
         Closes the connection to the Redshift database.
@@ -245,3 +429,23 @@ class RedshiftClient(Database):
         if self._conn is not None:
             logger.info("Closing connection")
             self._conn.close()
+
+
+def _infer_csv_dtypes(file: str, chunksize: int) -> Dict[str, str]:
+    """
+    Streams the file once and returns the pandas dtype of each column that holds all of
+    its values: integer and float columns widen to float, and any other mix becomes object.
+    """
+    import pandas as pd
+
+    dtypes: Dict[str, str] = {}
+    for chunk in pd.read_csv(file, chunksize=chunksize):
+        for column, dtype in chunk.dtypes.items():
+            seen = dtypes.get(column)
+            if seen is None or seen == dtype.name:
+                dtypes[column] = dtype.name
+            elif {seen, dtype.name} <= {"int64", "float64"}:
+                dtypes[column] = "float64"
+            else:
+                dtypes[column] = "object"
+    return dtypes
@@ -0,0 +1,108 @@
+import csv
+import gzip
+import json
+import math
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Tuple
+
+from shipyard_templates import ShipyardLogger
+
+logger = ShipyardLogger.get_logger()
+
+# Target uncompressed size of each staged part; Redshift recommends 1 MB - 1 GB compressed
+TARGET_PART_BYTES = 256 * 1024 * 1024
+MAX_UPLOAD_WORKERS = 8
+# S3 DeleteObjects accepts at most 1000 keys per request
+DELETE_BATCH_SIZE = 1000
+
+
+def count_parts(file_size: int, slices: int) -> int:
+    """
+    Returns a number of parts that is a multiple of the number of slices in the cluster,
+    so every slice loads the same number of files in parallel during the COPY.
+    """
+    slices = max(slices, 1)
+    return slices * max(1, math.ceil(file_size / (slices * TARGET_PART_BYTES)))
+
+
+def split_csv(
+    file_path: str, output_dir: str, parts: int
+) -> Tuple[List[str], List[str]]:
+    """
+    Splits a CSV file with a header row into `parts` gzip-compressed CSV files without a
+    header, distributing rows round robin. Rows are re-serialized with the csv module so
+    quoted values containing newlines stay intact.
+
+    Returns:
+        The header columns and the paths of the part files
+    """
+    base_name = os.path.splitext(os.path.basename(file_path))[0]
+    part_paths = [
+        os.path.join(output_dir, f"{base_name}.part{index:04d}.csv.gz")
+        for index in range(parts)
+    ]
+    part_files = [
+        gzip.open(path, "wt", newline="", compresslevel=6) for path in part_paths
+    ]
+    try:
+        writers = [csv.writer(part_file) for part_file in part_files]
+        with open(file_path, newline="") as f:
+            reader = csv.reader(f)
+            header = next(reader, [])
+            for index, row in enumerate(reader):
+                writers[index % parts].writerow(row)
+    finally:
+        for part_file in part_files:
+            part_file.close()
+    return header, part_paths
+
+
+def stage_parts(
+    s3_client,
+    bucket: str,
+    prefix: str,
+    part_paths: List[str],
+    max_workers: int = MAX_UPLOAD_WORKERS,
+) -> List[str]:
+    """
+    Uploads the part files to S3 concurrently and returns their keys. If any upload fails,
+    the parts that were already staged are removed.
+    """
+    keys = [f"{prefix}/{os.path.basename(path)}" for path in part_paths]
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            list(
+                executor.map(
+                    lambda job: s3_client.upload_file(job[0], bucket, job[1]),
+                    zip(part_paths, keys),
+                )
+            )
+    except Exception:
+        delete_staged(s3_client, bucket, keys)
+        raise
+    logger.debug(f"Staged {len(keys)} parts to s3://{bucket}/{prefix}")
+    return keys
+
+
+def write_manifest(s3_client, bucket: str, key: str, part_keys: List[str]) -> str:
+    """
+    Writes a COPY manifest listing every part as mandatory and returns its S3 URL.
+    """
+    manifest = {
+        "entries": [
+            {"url": f"s3://{bucket}/{part_key}", "mandatory": True}
+            for part_key in part_keys
+        ]
+    }
+    s3_client.put_object(Bucket=bucket, Key=key, Body=json.dumps(manifest).encode())
+    return f"s3://{bucket}/{key}"
+
+
+def delete_staged(s3_client, bucket: str, keys: List[str]) -> None:
+    for start in range(0, len(keys), DELETE_BATCH_SIZE):
+        batch = keys[start : start + DELETE_BATCH_SIZE]
+        s3_client.delete_objects(
+            Bucket=bucket,
+            Delete={"Objects": [{"Key": key} for key in batch], "Quiet": True},
+        )
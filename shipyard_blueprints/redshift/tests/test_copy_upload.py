@@ -0,0 +1,187 @@
+import csv
+import gzip
+import io
+import json
+from contextlib import nullcontext
+from unittest.mock import MagicMock
+
+import pytest
+from shipyard_templates.database import UploadError
+from sqlalchemy import Float, Integer, create_engine, inspect
+from sqlalchemy.exc import ProgrammingError
+
+from shipyard_redshift import RedshiftClient
+from shipyard_redshift import s3_staging
+
+
+class FakeS3:
+    def __init__(self):
+        self.objects = {}
+        self.uploaded = {}
+        self.manifests = {}
+
+    def upload_file(self, path, bucket, key):
+        with open(path, "rb") as f:
+            self.objects[key] = f.read()
+        self.uploaded[key] = self.objects[key]
+
+    def put_object(self, Bucket, Key, Body):
+        self.objects[Key] = Body
+        self.manifests[Key] = json.loads(Body)
+
+    def delete_objects(self, Bucket, Delete):
+        for item in Delete["Objects"]:
+            self.objects.pop(item["Key"], None)
+
+
+class StubConnection:
+    def __init__(self, slices=2, fail_on=None):
+        self.statements = []
+        self.slices = slices
+        self.fail_on = fail_on
+
+    def exec_driver_sql(self, statement):
+        self.statements.append(statement)
+        if self.fail_on and statement.startswith(self.fail_on):
+            raise ProgrammingError(
+                statement, None, RuntimeError("Load into table failed")
+            )
+        return MagicMock(**{"scalar.return_value": self.slices})
+
+    def in_transaction(self):
+        return False
+
+    def begin(self):
+        return nullcontext()
+
+
+@pytest.fixture
+def csv_file(tmp_path):
+    path = tmp_path / "data.csv"
+    path.write_text('id,note\n1,"multi\nline"\n2,b\n3,\n')
+    return str(path)
+
+
+def make_client(connection, s3):
+    client = RedshiftClient(
+        user="user",
+        pwd="pwd",
+        host="localhost",
+        database="dev",
+        schema="analytics",
+        s3_bucket="bucket",
+        iam_role="arn:aws:iam::123456789012:role/copy",
+    )
+    client._conn = connection
+    client._s3_client = s3
+    client._create_table_from_csv = MagicMock()
+    client._table_exists = MagicMock(return_value=True)
+    return client
+
+
+def read_part(data):
+    return list(csv.reader(io.StringIO(gzip.decompress(data).decode())))
+
+
+def test_split_csv_keeps_quoted_newlines(csv_file, tmp_path):
+    header, part_paths = s3_staging.split_csv(csv_file, str(tmp_path), 2)
+
+    assert header == ["id", "note"]
+    with open(part_paths[0], "rb") as f:
+        assert read_part(f.read()) == [["1", "multi\nline"], ["3", ""]]
+
+
+def test_count_parts_is_a_multiple_of_slices():
+    assert s3_staging.count_parts(10, slices=4) == 4
+    assert s3_staging.count_parts(3 * s3_staging.TARGET_PART_BYTES, slices=2) == 4
+
+
+def test_copy_upload_replace_copies_manifest_and_swaps(csv_file):
+    connection, s3 = StubConnection(slices=2), FakeS3()
+    client = make_client(connection, s3)
+
+    client.copy_upload(csv_file, "events", "replace")
+
+    copy, drop, rename = connection.statements[-3:]
+    assert copy.startswith('COPY analytics.events_shipyard_staging ("id", "note") FROM')
+    assert "IAM_ROLE 'arn:aws:iam::123456789012:role/copy' MANIFEST CSV GZIP" in copy
+    assert drop == "DROP TABLE IF EXISTS analytics.events"
+    assert rename == "ALTER TABLE analytics.events_shipyard_staging RENAME TO events"
+
+    ((manifest_key, manifest),) = s3.manifests.items()
+    assert f"FROM 's3://bucket/{manifest_key}'" in copy
+    parts = list(s3.uploaded)
+    assert len(parts) == 2
+    assert [entry["url"] for entry in manifest["entries"]] == [
+        f"s3://bucket/{key}" for key in parts
+    ]
+    assert sorted(row for key in parts for row in read_part(s3.uploaded[key])) == [
+        ["1", "multi\nline"],
+        ["2", "b"],
+        ["3", ""],
+    ]
+    assert s3.objects == {}
+
+
+def test_failed_copy_drops_staging_table_and_staged_files(csv_file):
+    connection, s3 = StubConnection(fail_on="COPY"), FakeS3()
+    client = make_client(connection, s3)
+
+    with pytest.raises(UploadError):
+        client.copy_upload(csv_file, "events", "replace")
+
+    assert connection.statements[-1] == (
+        "DROP TABLE IF EXISTS analytics.events_shipyard_staging"
+    )
+    assert s3.objects == {}
+
+
+def test_failed_copy_does_not_leak_credentials(csv_file):
+    connection, s3 = StubConnection(fail_on="COPY"), FakeS3()
+    client = make_client(connection, s3)
+    client.iam_role = None
+    client.aws_access_key_id = "AKIAEXAMPLE"
+    client.aws_secret_access_key = "secret/EXAMPLE+key"
+
+    with pytest.raises(UploadError) as e:
+        client.copy_upload(csv_file, "events", "replace")
+
+    assert "SECRET_ACCESS_KEY" in next(
+        statement for statement in connection.statements if statement.startswith("COPY")
+    )
+    assert "Load into table failed" in e.value.message
+    assert "EXAMPLE" not in e.value.message
+    assert e.value.__cause__ is None and e.value.__suppress_context__
+
+
+def test_large_files_use_copy_when_bucket_is_configured(csv_file, monkeypatch):
+    client = make_client(StubConnection(), FakeS3())
+    client.copy_upload = MagicMock()
+    client.upload_df = MagicMock()
+    monkeypatch.setattr(RedshiftClient, "MAX_FILE_SIZE", 1)
+    client.schema = None
+
+    client.upload(csv_file, "events", "append")
+
+    client.copy_upload.assert_called_once_with(
+        csv_file, table_name="events", insert_method="append"
+    )
+    client.upload_df.assert_not_called()
+
+
+def test_table_types_are_inferred_from_the_whole_file(tmp_path):
+    path = tmp_path / "typed.csv"
+    path.write_text("id,amount\n1,1\n2,2\n3,3\n4,4.5\n")
+    client = RedshiftClient(user="user", pwd="pwd", host="localhost", database="dev")
+    client._conn = create_engine("sqlite://").connect()
+    client.schema = None
+    client.CHUNKSIZE = 2
+
+    client._create_table_from_csv(str(path), "events")
+
+    types = {
+        column["name"]: column["type"]
+        for column in inspect(client.conn).get_columns("events")
+    }
+    assert isinstance(types["id"], Integer)
+    assert isinstance(types["amount"], Float)
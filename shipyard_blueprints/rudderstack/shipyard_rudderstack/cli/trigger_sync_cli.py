@@ -1,5 +1,4 @@
 import argparse
-import time
 import sys
 import os
 
@@ -61,15 +60,14 @@ def main():
             rudderstack.logger.error("Poke interval must be between 1 and 60 minutes")
             sys.exit(rudderstack.EXIT_CODE_INVALID_POKE_INTERVAL)
 
-        status = rudderstack.determine_sync_status(source_id)
         try:
-            while status == "processing":
-                rudderstack.logger.info(
-                    f"Waiting {poke_interval} {'minutes' if poke_interval > 1 else 'minute'} to check sync status..."
-                )
-                time.sleep(poke_interval * 60)
-                status = rudderstack.determine_sync_status(source_id)
-                rudderstack.logger.info(f"Sync status: {status}")
+            status = rudderstack.wait_for_job(
+                lambda: rudderstack.determine_sync_status(source_id),
+                lambda status: status != "processing",
+                description=f"Sync of source {source_id}",
+                max_interval=poke_interval * 60,
+            )
+            rudderstack.logger.info(f"Sync status: {status}")
         except ExitCodeException as e:
             sys.exit(e.exit_code)
 
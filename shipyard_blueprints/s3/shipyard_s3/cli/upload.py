@@ -50,9 +50,30 @@ def get_args():
         "--aws-default-region", dest="aws_default_region", required=False
     )
     parser.add_argument("--extra-args", dest="extra_args", required=False)
+    parser.add_argument(
+        "--sync",
+        dest="sync",
+        default="no",
+        choices={"yes", "no"},
+        required=False,
+        help="Only upload files whose content differs from the existing object",
+    )
     return parser.parse_args()
 
 
+def sync_uploads(client: S3Client, bucket_name: str, uploads: list) -> list:
+    """
+    Returns the (source, key) pairs whose object is missing or has a different ETag.
+    Objects encrypted with SSE-KMS or uploaded with another part size have an ETag that is
+    not derived from the content this way, so they are always uploaded.
+    """
+    return shipyard.files.files_to_sync(
+        uploads,
+        lambda s3_path: client.get_etag(bucket_name, s3_path),
+        algorithm="s3_etag",
+    )
+
+
 def main():
     try:
         args = get_args()
@@ -88,6 +109,7 @@ def main():
             else:
                 logger.info(f"{n_matches} files found. Preparing to upload...")
 
+            uploads = []
             for index, key_name in enumerate(matching_file_names, start=1):
                 if args.destination_folder_name:
                     s3_folder = shipyard.files.clean_folder_name(
@@ -105,7 +127,12 @@ def main():
                         destination_file_name=dest_file,
                         file_number=index,
                     )
-                logger.info(f"Uploading file {index} of {len(matching_file_names)}")
+                uploads.append((key_name, s3_path))
+            if args.sync == "yes":
+                uploads = sync_uploads(client, bucket_name, uploads)
+
+            for index, (key_name, s3_path) in enumerate(uploads, start=1):
+                logger.info(f"Uploading file {index} of {len(uploads)}")
                 client.upload(
                     bucket_name=bucket_name,
                     source_file=key_name,
@@ -131,15 +158,20 @@ def main():
                     source_full_path=source_path, destination_file_name=dest_file
                 )
                 logger.debug(f"S3 path is {s3_path}")
-            client.upload(
-                bucket_name=bucket_name,
-                source_file=source_path,
-                destination_path=s3_path,
-                extra_args=extra_args,
-            )
-            logger.info(
-                f"Successfully loaded {source_path} to s3://{bucket_name}/{s3_path}"
-            )
+            if args.sync == "yes" and not sync_uploads(
+                client, bucket_name, [(source_path, s3_path)]
+            ):
+                logger.info(f"s3://{bucket_name}/{s3_path} is already up to date")
+            else:
+                client.upload(
+                    bucket_name=bucket_name,
+                    source_file=source_path,
+                    destination_path=s3_path,
+                    extra_args=extra_args,
+                )
+                logger.info(
+                    f"Successfully loaded {source_path} to s3://{bucket_name}/{s3_path}"
+                )
     except ExitCodeException as ue:
         logger.error(ue.message)
         sys.exit(ue.exit_code)
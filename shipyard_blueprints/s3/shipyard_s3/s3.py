@@ -3,7 +3,13 @@ from typing import Optional, Dict, Any, List
 
 import boto3
 from boto3.exceptions import S3UploadFailedError
-from shipyard_templates import CloudStorage, ExitCodeException, ShipyardLogger
+from shipyard_templates import (
+    CloudStorage,
+    ExitCodeException,
+    Metrics,
+    ShipyardLogger,
+    truncate,
+)
 
 from shipyard_s3.utils import utils
 from shipyard_s3.utils.exceptions import (
@@ -19,6 +25,7 @@ from shipyard_s3.utils.exceptions import (
 )
 
 logger = ShipyardLogger.get_logger()
+metrics = Metrics.get_metrics()
 
 
 class S3Client(CloudStorage):
@@ -145,7 +152,7 @@ class S3Client(CloudStorage):
                 raise InvalidRegion(region=self.region)
             raise RemoveError(message=str(e))
         else:
-            logger.debug(f"Response from s3: {s3_response}")
+            logger.debug("Response from s3: %s", truncate(s3_response))
 
     def upload(
         self,
@@ -172,8 +179,15 @@ class S3Client(CloudStorage):
             s3_transfer = boto3.s3.transfer.S3Transfer(
                 client=self.s3_conn, config=s3_upload_config
             )
-            s3_transfer.upload_file(
-                source_file, bucket_name, destination_path, extra_args=extra_args
+            with metrics.timer("transfer_seconds", vendor="s3", direction="upload"):
+                s3_transfer.upload_file(
+                    source_file, bucket_name, destination_path, extra_args=extra_args
+                )
+            metrics.increment(
+                "transfer_bytes_total",
+                os.path.getsize(source_file),
+                vendor="s3",
+                direction="upload",
             )
         except (BucketDoesNotExist, InvalidBucketAccess):
             raise
@@ -197,7 +211,14 @@ class S3Client(CloudStorage):
         try:
             # check the access to the bucket
             self.check_bucket(bucket_name)
-            self.s3_conn.download_file(bucket_name, s3_path, dest_path)
+            with metrics.timer("transfer_seconds", vendor="s3", direction="download"):
+                self.s3_conn.download_file(bucket_name, s3_path, dest_path)
+            metrics.increment(
+                "transfer_bytes_total",
+                os.path.getsize(dest_path),
+                vendor="s3",
+                direction="download",
+            )
         except (BucketDoesNotExist, InvalidBucketAccess):
             raise
         except Exception as e:
@@ -205,6 +226,21 @@ class S3Client(CloudStorage):
                 f"Error in downloading s3 file to {dest_path}: {str(e)}"
             )
 
+    def get_etag(self, bucket_name: str, s3_path: str) -> Optional[str]:
+        """Returns the ETag of an object without its quotes, or None if it does not exist
+
+        Args:
+            bucket_name: The bucket of the object
+            s3_path: The key of the object
+        """
+        try:
+            response = self.s3_conn.head_object(Bucket=bucket_name, Key=s3_path)
+        except self.s3_conn.exceptions.ClientError as e:
+            if e.response.get("Error", {}).get("Code") in {"404", "NoSuchKey"}:
+                return None
+            raise
+        return response["ETag"].strip('"')
+
     def list_files(self, bucket_name: str, s3_folder: Optional[str]) -> List[str]:
         """Returns the list of all the files (objects) in in a bucket and folder
 
@@ -220,7 +256,8 @@ class S3Client(CloudStorage):
                 s3_conn=self.s3_conn, bucket_name=bucket_name, prefix=s3_folder
             )
             logger.debug(
-                f"Response from S3 when attempting to list objects: {response}"
+                "Response from S3 when attempting to list objects: %s",
+                truncate(response),
             )
             file_names = utils.get_files(response)
             continuation_token = response.get("NextContinuationToken")
@@ -232,7 +269,8 @@ class S3Client(CloudStorage):
                     prefix=s3_folder,
                     continuation_token=continuation_token,
                 )
-                file_names = file_names.append(utils.get_files(response))
+                logger.debug("Next page of objects: %s", truncate(response))
+                file_names.extend(utils.get_files(response))
                 continuation_token = response.get("NextContinuationToken")
             return file_names
         except Exception as e:
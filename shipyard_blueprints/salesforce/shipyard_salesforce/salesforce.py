@@ -2,9 +2,9 @@ import json
 import os
 from typing import Optional, Any, Dict, List
 
-from requests import request
 from shipyard_templates import (
     Crm,
+    HttpClient,
     standardize_errors,
     ExitCodeException,
 )
@@ -52,6 +52,7 @@ class SalesforceClient(Crm):
             f"https://{domain}.my.salesforce.com/services/data/{api_version}"
         )
         self.domain = domain
+        self.http = HttpClient()
 
         self.username = username
         self.password = password
@@ -94,12 +95,9 @@ class SalesforceClient(Crm):
             "Content-Type": "application/json",
         }
 
-        if data:
-            response = request(
-                method, f"{self.base_url}/{endpoint}", headers=headers, data=data
-            )
-        else:
-            response = request(method, f"{self.base_url}/{endpoint}", headers=headers)
+        response = self.http.request(
+            method, f"{self.base_url}/{endpoint}", headers=headers, data=data or None
+        )
         if response.ok:
             if (
                 response.status_code != 204
@@ -136,7 +134,7 @@ class SalesforceClient(Crm):
         if self.security_token:
             password += self.security_token
 
-        response = request(
+        response = self.http.request(
             "POST",
             f"https://{self.domain}.my.salesforce.com/services/oauth2/token",
             data={
@@ -1,60 +1,254 @@
+import json
 import os
 import pickle
-from shipyard_templates import ShipyardLogger
+import tempfile
+import threading
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Iterator
 
-from . import files
+from shipyard_templates import ShipyardLogger, truncate
 
 logger = ShipyardLogger.get_logger()
 
+# Hidden so it can never clash with an artifact named "index"
+INDEX_FILE_NAME = ".index.json"
+COMPRESSED_EXTENSION = "zst"
+
+
+class Serializer(ABC):
+    """Converts artifact data to and from bytes. Register new formats with `register_serializer`."""
+
+    extension = ""
+
+    @abstractmethod
+    def dumps(self, data: Any) -> bytes:
+        pass
+
+    @abstractmethod
+    def loads(self, raw: bytes) -> Any:
+        pass
+
+
+class JsonSerializer(Serializer):
+    """Compact JSON, written with orjson when it is installed"""
+
+    extension = "json"
+
+    def dumps(self, data: Any) -> bytes:
+        try:
+            import orjson
+        except ImportError:
+            return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode()
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+
+    def loads(self, raw: bytes) -> Any:
+        try:
+            import orjson
+        except ImportError:
+            return json.loads(raw)
+        return orjson.loads(raw)
+
+
+class PickleSerializer(Serializer):
+    extension = "pickle"
+
+    def dumps(self, data: Any) -> bytes:
+        return pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def loads(self, raw: bytes) -> Any:
+        return pickle.loads(raw)
+
+
+class MsgpackSerializer(Serializer):
+    """Binary MessagePack, which requires the optional msgpack package"""
+
+    extension = "msgpack"
+
+    def dumps(self, data: Any) -> bytes:
+        return _import_optional("msgpack").packb(data, use_bin_type=True)
+
+    def loads(self, raw: bytes) -> Any:
+        return _import_optional("msgpack").unpackb(raw, raw=False)
+
+
+SERIALIZERS: Dict[str, Serializer] = {
+    "json": JsonSerializer(),
+    "pickle": PickleSerializer(),
+    "msgpack": MsgpackSerializer(),
+}
+
+
+def register_serializer(file_type: str, serializer: Serializer) -> None:
+    """Makes `file_type` available to `Artifact.SubFolder.read` and `write`"""
+    SERIALIZERS[file_type] = serializer
+
+
+def get_serializer(file_type: str) -> Serializer:
+    try:
+        return SERIALIZERS[file_type]
+    except KeyError:
+        raise ValueError(f"Unsupported file type: {file_type}") from None
+
+
+def atomic_write(path: str, raw: bytes) -> None:
+    """
+    Writes to a temporary file in the same folder and renames it over `path`, so readers
+    never see a partially written file.
+    """
+    folder = os.path.dirname(path) or "."
+    descriptor, temp_path = tempfile.mkstemp(dir=folder, prefix=".tmp-")
+    try:
+        with os.fdopen(descriptor, "wb") as f:
+            f.write(raw)
+        # mkstemp creates the file readable by its owner only
+        os.chmod(temp_path, 0o644)
+        os.replace(temp_path, path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+
+def _import_optional(module_name: str):
+    try:
+        return __import__(module_name)
+    except ImportError:
+        raise ImportError(
+            f"The optional {module_name} package is required for this artifact format. "
+            f"Install it with `pip install {module_name}`."
+        ) from None
+
+
+def _compress(raw: bytes) -> bytes:
+    return _import_optional("zstandard").ZstdCompressor().compress(raw)
+
+
+def _decompress(raw: bytes) -> bytes:
+    return _import_optional("zstandard").ZstdDecompressor().decompress(raw)
+
 
 class Artifact:
     class SubFolder:
+        """
+        A folder of named artifacts. Each write is serialized once and replaces its file
+        atomically, and `.index.json` records the file, format and size of every artifact so
+        a downstream vessel can read a single one without scanning the folder.
+        """
+
         def __init__(self, path):
             self.path = path
+            self.index_path = os.path.join(path, INDEX_FILE_NAME)
+            self._lock = threading.Lock()
+            self._appended = set()
 
-        def read(self, filename, file_type):
-            if file_type == "json":
-                return self.read_json(filename)
-            elif file_type == "pickle":
-                return self.read_pickle(filename)
+        def read(self, filename, file_type=None):
+            """Reads an artifact. The format is looked up in the index when `file_type` is omitted."""
+            entry = self.index().get(filename)
+            if entry and file_type in (None, entry["file_type"]):
+                file_path = os.path.join(self.path, entry["file"])
+                compressed = entry["compressed"]
+                file_type = entry["file_type"]
+            elif file_type is None:
+                raise FileNotFoundError(f"No artifact named {filename} in {self.path}")
             else:
-                raise ValueError(f"Unsupported file type: {file_type}")
+                file_path = self._file_path(filename, file_type, compressed=False)
+                compressed = False
+            if file_type == "jsonl":
+                return list(self.read_records(filename))
 
-        def write(self, filename, file_type, data):
-            if file_type == "json":
-                return self.write_json(filename, data)
-            elif file_type == "pickle":
-                return self.create_pickle(filename, data)
-            else:
-                raise ValueError(f"Unsupported file type: {file_type}")
+            logger.debug(f"Reading {file_type} artifact: {file_path}...")
+            with open(file_path, "rb") as f:
+                raw = f.read()
+            if compressed:
+                raw = _decompress(raw)
+            data = get_serializer(file_type).loads(raw)
+            logger.debug("Artifact read. Data: %s", truncate(data))
+            return data
+
+        def write(self, filename, file_type, data, compress=False):
+            """
+            Serializes `data` with the `file_type` serializer and writes it atomically. With
+            `compress`, the file is zstd compressed, which requires the zstandard package.
+            """
+            raw = get_serializer(file_type).dumps(data)
+            if compress:
+                raw = _compress(raw)
+            file_path = self._file_path(filename, file_type, compress)
+            logger.debug(f"Writing {file_type} artifact: {file_path}...")
+            atomic_write(file_path, raw)
+            self._update_index(
+                filename,
+                {
+                    "file": os.path.basename(file_path),
+                    "file_type": file_type,
+                    "compressed": compress,
+                    "bytes": len(raw),
+                },
+            )
+            return file_path
+
+        def append(self, filename, record):
+            """
+            Appends `record` as one line of `{filename}.jsonl`. Use this for response logs
+            that grow over a run, rather than rewriting the whole list on every response.
+            """
+            file_path = os.path.join(self.path, f"{filename}.jsonl")
+            line = get_serializer("json").dumps(record) + b"\n"
+            with self._lock:
+                with open(file_path, "ab") as f:
+                    f.write(line)
+                if filename in self._appended:
+                    return
+                self._appended.add(filename)
+            if filename not in self.index():
+                self._update_index(
+                    filename,
+                    {
+                        "file": os.path.basename(file_path),
+                        "file_type": "jsonl",
+                        "compressed": False,
+                    },
+                )
+
+        def read_records(self, filename) -> Iterator[Any]:
+            """Yields the records appended to `{filename}.jsonl` one at a time"""
+            serializer = get_serializer("json")
+            with open(os.path.join(self.path, f"{filename}.jsonl"), "rb") as f:
+                for line in f:
+                    if line.strip():
+                        yield serializer.loads(line)
+
+        def index(self) -> Dict[str, Dict[str, Any]]:
+            """Returns the index entry of every artifact in the folder, keyed by name"""
+            try:
+                with open(self.index_path, "rb") as f:
+                    return json.loads(f.read())
+            except FileNotFoundError:
+                return {}
 
         def create_pickle(self, filename, data):
-            logger.debug(f"Creating pickle file: {filename}...")
-            pickle_file_name = os.path.join(self.path, f"{filename}.pickle")
-            with open(pickle_file_name, "wb") as f:
-                pickle.dump(data, f)
-            logger.debug("Pickle file created.")
+            self.write(filename, "pickle", data)
 
         def write_json(self, filename, data):
-            logger.debug(f"Writing JSON file: {filename}...")
-            json_file_name = os.path.join(self.path, f"{filename}.json")
-            files.write_json_to_file(data, json_file_name)
-            logger.debug("JSON file written.")
+            self.write(filename, "json", data)
 
         def read_pickle(self, filename):
-            logger.debug(f"Reading pickle file: {filename}...")
-            pickle_file_name = os.path.join(self.path, f"{filename}.pickle")
-            with open(pickle_file_name, "rb") as f:
-                data = pickle.load(f)
-            logger.debug(f"Pickle file read. Data: {data}")
-            return data
+            return self.read(filename, "pickle")
 
         def read_json(self, filename):
-            logger.debug(f"Reading JSON file: {filename}...")
-            json_file_name = os.path.join(self.path, f"{filename}.json")
-            data = files.read_json_file(json_file_name)
-            logger.debug(f"JSON file read. Data: {data}")
-            return data
+            return self.read(filename, "json")
+
+        def _file_path(self, filename, file_type, compressed):
+            extension = get_serializer(file_type).extension
+            if compressed:
+                extension = f"{extension}.{COMPRESSED_EXTENSION}"
+            return os.path.join(self.path, f"{filename}.{extension}")
+
+        def _update_index(self, filename, entry: Dict[str, Any]):
+            with self._lock:
+                index = self.index()
+                index[filename] = entry
+                atomic_write(self.index_path, json.dumps(index, indent=2).encode())
 
     def __init__(self, vendor):
         self.vendor = vendor
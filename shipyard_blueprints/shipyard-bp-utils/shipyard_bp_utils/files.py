@@ -1,17 +1,28 @@
 import csv
 import fnmatch
 import glob
+import hashlib
 import json
 import os
 import re
 import tarfile
-from typing import List
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Tuple
 from zipfile import ZipFile, ZIP_DEFLATED
 
-from shipyard_templates import ShipyardLogger
+from shipyard_templates import ShipyardLogger, truncate
 
 logger = ShipyardLogger.get_logger()
 
+HASH_CHUNK_SIZE = 1024 * 1024
+# boto3's default multipart threshold and part size, which determine an S3 object's ETag
+S3_MULTIPART_CHUNK_SIZE = 8 * 1024 * 1024
+# Dropbox content_hash is the SHA-256 of the SHA-256 of each 4 MiB block
+DROPBOX_BLOCK_SIZE = 4 * 1024 * 1024
+SYNC_WORKERS = 8
+
 
 def enumerate_destination_file_name(destination_file_name: str, file_number: int = 1):
     """
@@ -234,7 +245,7 @@ def find_all_local_file_names(source_folder_name: str = None) -> List[str]:
     Returns:
     list: A list of all files that exist in the current working directory.
     """
-    logger.debug(f"Finding all local file names in {source_folder_name}...")
+    logger.debug("Finding all local file names in %s...", source_folder_name)
 
     cwd = os.getcwd()
     cwd_extension = os.path.normpath(f"{cwd}/{source_folder_name}/**")
@@ -275,8 +286,8 @@ def find_all_file_matches(file_names: list, file_name_re: str) -> list:
         if re.search(file_name_re, file):
             matching_file_names.append(file)
 
-    logger.debug(f"Found {len(matching_file_names)} file matches.")
-    logger.debug(matching_file_names)
+    logger.debug("Found %d file matches.", len(matching_file_names))
+    logger.debug("Matches: %s", truncate(matching_file_names))
     return matching_file_names
 
 
@@ -321,7 +332,9 @@ def write_json_to_file(json_object: dict, file_name: str) -> None:
     Returns:
     None
     """
-    logger.debug(f"Writing JSON file: {file_name}, JSON Object: {json_object}...")
+    logger.debug(
+        "Writing JSON file: %s, JSON Object: %s...", file_name, truncate(json_object)
+    )
     with open(file_name, "w") as f:
         f.write(json.dumps(json_object, ensure_ascii=False, indent=4))
     logger.info(f"JSON data stored at {file_name}")
@@ -460,7 +473,7 @@ def file_match(
     source_directory = clean_folder_name(source_directory)
 
     if match_type == "exact_match":
-        logger.debug(f"Searching for files in {files}...")
+        logger.debug("Searching for files in %s...", truncate(files))
         if search_term not in files:
             raise FileNotFoundError(f"File {search_term} not found in {files}")
 
@@ -500,3 +513,175 @@ def file_match(
             f"'regex_match'."
         )
     return matches
+
+
+def _hash_blocks(file_path: str, block_size: int) -> List[bytes]:
+    """Returns the MD5 digest of each `block_size` block of a file"""
+    digests = []
+    with open(file_path, "rb") as f:
+        while block := f.read(block_size):
+            digests.append(hashlib.md5(block).digest())
+    return digests
+
+
+def file_hash(file_path: str, algorithm: str = "md5") -> str:
+    """
+    Computes a content hash of a file as lowercase hex, reading it in chunks so large files
+    are never held in memory.
+
+    Args:
+    file_path (str): The path of the file to hash.
+    algorithm (str): One of the hashes storage providers report for their objects:
+        'md5', 'sha1', 'sha256' or 'crc32c' (which requires the google-crc32c package),
+        's3_etag' for the ETag S3 assigns to an object uploaded by boto3, or 'dropbox'
+        for Dropbox's content_hash.
+
+    Returns:
+    str: The hex digest. An 's3_etag' of a multipart upload ends with '-<parts>'.
+    """
+    if algorithm == "s3_etag":
+        if os.path.getsize(file_path) < S3_MULTIPART_CHUNK_SIZE:
+            return file_hash(file_path, "md5")
+        digests = _hash_blocks(file_path, S3_MULTIPART_CHUNK_SIZE)
+        return f"{hashlib.md5(b''.join(digests)).hexdigest()}-{len(digests)}"
+
+    if algorithm == "dropbox":
+        digests = []
+        with open(file_path, "rb") as f:
+            while block := f.read(DROPBOX_BLOCK_SIZE):
+                digests.append(hashlib.sha256(block).digest())
+        return hashlib.sha256(b"".join(digests)).hexdigest()
+
+    if algorithm == "crc32c":
+        try:
+            import google_crc32c
+        except ImportError:
+            raise ImportError(
+                "The google-crc32c package is required for crc32c hashes"
+            ) from None
+        hasher = google_crc32c.Checksum()
+    elif algorithm in {"md5", "sha1", "sha256"}:
+        hasher = hashlib.new(algorithm)
+    else:
+        raise ValueError(f"Hash algorithm {algorithm} is not supported")
+
+    with open(file_path, "rb") as f:
+        while chunk := f.read(HASH_CHUNK_SIZE):
+            hasher.update(chunk)
+    return hasher.digest().hex()
+
+
+class HashCache:
+    """
+    Remembers the hashes of local files between runs, keyed by absolute path and only valid
+    while the file's size and modification time are unchanged, so an unchanged file is
+    not read again to compare it with its remote copy.
+
+    The cache is stored at `cache_path`, SHIPYARD_HASH_CACHE_PATH or a file in the temporary
+    directory, and written by `save`.
+    """
+
+    def __init__(self, cache_path: Optional[str] = None) -> None:
+        self.cache_path = cache_path or os.getenv(
+            "SHIPYARD_HASH_CACHE_PATH",
+            os.path.join(tempfile.gettempdir(), "shipyard-file-hashes.json"),
+        )
+        self._lock = threading.Lock()
+        self._changed = False
+        try:
+            with open(self.cache_path) as f:
+                self._entries: Dict[str, Dict] = json.load(f)
+        except (OSError, ValueError):
+            self._entries = {}
+
+    def get(self, file_path: str, algorithm: str = "md5") -> str:
+        """Returns the file's hash, computing it only if the file changed since it was cached"""
+        key = os.path.abspath(file_path)
+        stat = os.stat(key)
+        with self._lock:
+            entry = self._entries.get(key)
+            if (
+                entry
+                and entry["size"] == stat.st_size
+                and entry["mtime_ns"] == stat.st_mtime_ns
+                and algorithm in entry["hashes"]
+            ):
+                return entry["hashes"][algorithm]
+
+        value = file_hash(key, algorithm)
+        with self._lock:
+            entry = self._entries.get(key)
+            if (
+                not entry
+                or entry["size"] != stat.st_size
+                or entry["mtime_ns"] != stat.st_mtime_ns
+            ):
+                entry = self._entries[key] = {
+                    "size": stat.st_size,
+                    "mtime_ns": stat.st_mtime_ns,
+                    "hashes": {},
+                }
+            entry["hashes"][algorithm] = value
+            self._changed = True
+        return value
+
+    def save(self) -> None:
+        if not self._changed:
+            return
+        from shipyard_bp_utils.artifacts import atomic_write
+
+        with self._lock:
+            raw = json.dumps(self._entries).encode()
+            self._changed = False
+        try:
+            atomic_write(self.cache_path, raw)
+        except OSError as e:
+            # Without the cache the next run only re-reads the files
+            logger.warning(f"Could not save the file hash cache: {e}")
+
+
+def files_to_sync(
+    uploads: List[Tuple[str, str]],
+    remote_hash: Callable[[str], Optional[str]],
+    algorithm: str = "md5",
+    cache: Optional[HashCache] = None,
+    max_workers: int = SYNC_WORKERS,
+) -> List[Tuple[str, str]]:
+    """
+    Filters (source path, destination path) pairs down to the files whose remote copy is
+    missing or differs, so a sync only transfers changed files.
+
+    Args:
+    uploads (list): The (source path, destination path) pairs to consider.
+    remote_hash (Callable): Returns the hash the provider reports for a destination path,
+        as lowercase hex in the same `algorithm`, or None when there is no remote copy.
+    algorithm (str): The hash algorithm to compare with. See `file_hash`.
+    cache (HashCache, optional): The local hash cache. A new one is used and saved if omitted.
+    max_workers (int): The number of files compared at once.
+
+    Returns:
+    list: The pairs that need to be transferred, in their original order.
+    """
+    own_cache = cache is None
+    cache = cache or HashCache()
+
+    def changed(upload: Tuple[str, str]) -> bool:
+        source, destination = upload
+        try:
+            remote = remote_hash(destination)
+        except Exception as e:
+            logger.debug(f"Could not read the remote hash of {destination}: {e}")
+            return True
+        return remote is None or remote.lower() != cache.get(source, algorithm)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        needed = list(executor.map(changed, uploads))
+    if own_cache:
+        cache.save()
+
+    changed_uploads = [upload for upload, need in zip(uploads, needed) if need]
+    logger.info(
+        f"{len(changed_uploads)} of {len(uploads)} files changed. "
+        f"Skipping {len(uploads) - len(changed_uploads)} unchanged files."
+    )
+    return changed_uploads
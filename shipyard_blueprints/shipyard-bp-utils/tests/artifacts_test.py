@@ -0,0 +1,98 @@
+import json
+import os
+
+import pytest
+
+from shipyard_bp_utils import artifacts
+from shipyard_bp_utils.artifacts import Artifact
+
+
+@pytest.fixture
+def artifact(tmp_path, monkeypatch):
+    monkeypatch.setenv("SHIPYARD_ARTIFACTS_DIRECTORY", str(tmp_path))
+    return Artifact("test")
+
+
+def test_write_json_is_compact_and_indexed(artifact):
+    artifact.responses.write_json("run", {"id": 1, "steps": [1, 2]})
+
+    with open(os.path.join(artifact.responses.path, "run.json")) as f:
+        assert f.read() == '{"id":1,"steps":[1,2]}'
+    assert artifact.responses.index()["run"]["file_type"] == "json"
+    assert artifact.responses.read_json("run") == {"id": 1, "steps": [1, 2]}
+
+
+def test_read_looks_up_format_in_index(artifact):
+    artifact.variables.create_pickle("run_id", 42)
+    artifact.variables.write("settings", "json", {"a": "b"})
+
+    assert artifact.variables.read("run_id") == 42
+    assert artifact.variables.read("settings") == {"a": "b"}
+    with pytest.raises(FileNotFoundError):
+        artifact.variables.read("missing")
+
+
+def test_artifacts_written_before_the_index_can_still_be_read(artifact):
+    with open(os.path.join(artifact.responses.path, "legacy.json"), "w") as f:
+        json.dump({"legacy": True}, f, indent=4)
+
+    assert artifact.responses.read_json("legacy") == {"legacy": True}
+
+
+def test_failed_write_keeps_the_previous_file(artifact, monkeypatch):
+    artifact.variables.write_json("state", {"version": 1})
+
+    def fail(*args):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(artifacts.os, "replace", fail)
+    with pytest.raises(OSError):
+        artifact.variables.write_json("state", {"version": 2})
+
+    assert artifact.variables.read_json("state") == {"version": 1}
+    assert not [
+        name for name in os.listdir(artifact.variables.path) if name.startswith(".tmp")
+    ]
+
+
+def test_append_writes_jsonl_records(artifact):
+    for step in range(3):
+        artifact.responses.append("steps", {"step": step})
+
+    assert list(artifact.responses.read_records("steps")) == [
+        {"step": 0},
+        {"step": 1},
+        {"step": 2},
+    ]
+    assert artifact.responses.read("steps") == [{"step": 0}, {"step": 1}, {"step": 2}]
+
+
+def test_registered_serializer(artifact, monkeypatch):
+    class Text(artifacts.Serializer):
+        extension = "txt"
+
+        def dumps(self, data):
+            return data.encode()
+
+        def loads(self, raw):
+            return raw.decode()
+
+    monkeypatch.setattr(artifacts, "SERIALIZERS", dict(artifacts.SERIALIZERS))
+    artifacts.register_serializer("text", Text())
+
+    artifact.logs.write("note", "text", "hello")
+    assert artifact.logs.read("note") == "hello"
+
+
+def test_serializer_requires_dumps_and_loads():
+    class DumpsOnly(artifacts.Serializer):
+        def dumps(self, data):
+            return b""
+
+    with pytest.raises(TypeError):
+        DumpsOnly()
+
+
+def test_unsupported_file_type(artifact):
+    with pytest.raises(ValueError):
+        artifact.variables.write("x", "yaml", {})
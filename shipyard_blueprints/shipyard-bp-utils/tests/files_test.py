@@ -1,3 +1,5 @@
+import hashlib
+
 import pytest
 
 from shipyard_bp_utils import files
@@ -109,3 +111,64 @@ def test_clean_folder_name():
     folder_name = "/"
     result = files.clean_folder_name(folder_name)
     assert result == "", f"Expected '', got {result}"
+
+
+def test_file_hash_matches_provider_formats(tmp_path, monkeypatch):
+    path = tmp_path / "data.csv"
+    path.write_bytes(b"a" * 10)
+
+    assert files.file_hash(str(path)) == hashlib.md5(b"a" * 10).hexdigest()
+    assert files.file_hash(str(path), "s3_etag") == hashlib.md5(b"a" * 10).hexdigest()
+
+    monkeypatch.setattr(files, "S3_MULTIPART_CHUNK_SIZE", 4)
+    parts = b"".join(hashlib.md5(part).digest() for part in (b"aaaa", b"aaaa", b"aa"))
+    assert (
+        files.file_hash(str(path), "s3_etag") == f"{hashlib.md5(parts).hexdigest()}-3"
+    )
+
+    with pytest.raises(ValueError):
+        files.file_hash(str(path), "md4")
+
+
+def test_hash_cache_rehashes_only_modified_files(tmp_path, monkeypatch):
+    path = tmp_path / "data.csv"
+    path.write_text("v1")
+    calls = []
+    original = files.file_hash
+    monkeypatch.setattr(
+        files, "file_hash", lambda *args: calls.append(args) or original(*args)
+    )
+
+    cache = files.HashCache(str(tmp_path / "hashes.json"))
+    cache.get(str(path))
+    cache.save()
+    files.HashCache(str(tmp_path / "hashes.json")).get(str(path))
+    assert len(calls) == 1
+
+    path.write_text("version 2")
+    assert (
+        files.HashCache(str(tmp_path / "hashes.json")).get(str(path))
+        == hashlib.md5(b"version 2").hexdigest()
+    )
+    assert len(calls) == 2
+
+
+def test_files_to_sync_skips_unchanged_files(tmp_path):
+    for name in ("same.csv", "changed.csv", "new.csv"):
+        (tmp_path / name).write_text(name)
+    remote = {
+        "dest/same.csv": hashlib.md5(b"same.csv").hexdigest(),
+        "dest/changed.csv": hashlib.md5(b"old").hexdigest(),
+    }
+    uploads = [
+        (str(tmp_path / n), f"dest/{n}") for n in ("same.csv", "changed.csv", "new.csv")
+    ]
+
+    result = files.files_to_sync(
+        uploads, remote.get, cache=files.HashCache(str(tmp_path / "hashes.json"))
+    )
+
+    assert [destination for _, destination in result] == [
+        "dest/changed.csv",
+        "dest/new.csv",
+    ]
@@ -2,10 +2,8 @@ import io
 import json
 from typing import Optional, Dict, Any
 
-import pandas
-import requests
 import yaml
-from shipyard_templates import ShipyardLogger, ExitCodeException
+from shipyard_templates import ShipyardLogger, ExitCodeException, HttpClient
 
 from shipyard_api.errors import (
     EXIT_CODE_LIST_FLEET_RUNS_ERROR,
@@ -28,6 +26,7 @@ class ShipyardClient:
         self.base_url = f"https://api.app.shipyardapp.com/orgs/{org_id}"
         self.headers = {"X-Shipyard-API-Key": self.api_key}
         self.project_id = project_id
+        self.http = HttpClient()
 
     def _request(
         self,
@@ -60,7 +59,7 @@ class ShipyardClient:
             request_args["data"] = data
         response = None
         try:
-            response = requests.request(**request_args)
+            response = self.http.request(**request_args)
             if response.ok:
                 logger.debug(f"Request successful: {response.status_code}")
                 return response  # return the response object since not all responses are JSON
@@ -87,7 +86,7 @@ class ShipyardClient:
             raise MissingProjectID
         url = f"{self.base_url}/projects/{self.project_id}/fleets/{fleet_id}/runs"
         try:
-            response = requests.get(url, headers=self.headers)
+            response = self.http.get(url, headers=self.headers)
             logger.debug(f"Status code for fleet runs {response.status_code}")
             response.raise_for_status()
         except ExitCodeException:
@@ -158,7 +157,7 @@ class ShipyardClient:
             url += f"?days={num_of_days}"
 
         try:
-            response = requests.get(url, headers=self.headers)
+            response = self.http.get(url, headers=self.headers)
             logger.debug(f"Status code for fleet runs {response.status_code}")
 
             response.raise_for_status()
@@ -289,6 +288,8 @@ class ShipyardClient:
         Raises:
             ExitCodeException: If an exit code exception occurs.
         """
+        import pandas
+
         try:
             response = self._request(
                 "GET",
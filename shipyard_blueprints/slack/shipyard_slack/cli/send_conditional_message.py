@@ -10,6 +10,7 @@ from shipyard_slack import SlackClient
 from shipyard_slack.slack_utils import (
     format_user_list,
     create_name_tags,
+    fan_out_message,
     send_slack_message_with_file,
 )
 
@@ -148,23 +149,14 @@ def main():
         else:
             user_id_list = []
 
-        if args.destination_type == "dm" and file_upload:
-            for user_id in user_id_list:
-                logger.info(f"Sending message with file to {user_id}...")
-                response = send_slack_message_with_file(
-                    slack_client=slack_client,
-                    message=message,
-                    file=upload,
-                    channel=user_id,
-                    include_in_thread=include_in_thread,
-                )
-                responses.append(response.data)
-        elif args.destination_type == "dm" and not file_upload:
-            for user_id in user_id_list:
-                logger.info(f"Sending message to {user_id}...")
-                response = slack_client.send_message(
-                    message=message, channel_name=user_id
-                )
+        if args.destination_type == "dm":
+            for response in fan_out_message(
+                slack_client,
+                message,
+                user_id_list,
+                file=upload if file_upload else None,
+                include_in_thread=include_in_thread,
+            ):
                 responses.append(response.data)
         elif file_upload and args.destination_type == "channel":
             logger.info(f"Sending message with file to {args.channel_name}...")
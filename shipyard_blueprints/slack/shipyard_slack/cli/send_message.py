@@ -6,7 +6,11 @@ from shipyard_bp_utils.artifacts import Artifact
 from shipyard_templates import ShipyardLogger, ExitCodeException, Messaging
 
 from shipyard_slack import SlackClient
-from shipyard_slack.slack_utils import create_user_id_list, create_name_tags
+from shipyard_slack.slack_utils import (
+    create_user_id_list,
+    create_name_tags,
+    fan_out_message,
+)
 
 logger = ShipyardLogger().get_logger()
 
@@ -108,10 +112,7 @@ def main():
             user_id_list = []
 
         if destination_type == "dm":
-            for user_id in user_id_list:
-                response = slack_client.send_message(
-                    message=message, channel_name=user_id
-                )
+            for response in fan_out_message(slack_client, message, user_id_list):
                 responses.append(response.data)
 
         elif destination_type == "channel":
@@ -10,6 +10,7 @@ from shipyard_slack import SlackClient
 from shipyard_slack.slack_utils import (
     format_user_list,
     create_name_tags,
+    fan_out_message,
     send_slack_message_with_file,
 )
 
@@ -132,14 +133,13 @@ def main():
             user_id_list = []
 
         if args.destination_type == "dm":
-            for user_id in user_id_list:
-                response = send_slack_message_with_file(
-                    slack_client=slack_client,
-                    message=message,
-                    file=upload,
-                    channel=user_id,
-                    include_in_thread=include_in_thread,
-                )
+            for response in fan_out_message(
+                slack_client,
+                message,
+                user_id_list,
+                file=upload,
+                include_in_thread=include_in_thread,
+            ):
                 responses.append(response.data)
 
         elif args.destination_type == "channel":
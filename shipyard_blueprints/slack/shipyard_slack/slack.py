@@ -1,4 +1,5 @@
-from typing import Optional, Dict
+import threading
+from typing import Dict, List, Optional, Union
 
 from shipyard_templates import Messaging, ShipyardLogger, ExitCodeException
 from slack_sdk import WebClient
@@ -18,6 +19,8 @@ class SlackClient(Messaging):
     """
 
     TIMEOUT = 120
+    # Rate limited calls wait for Slack's Retry-After this many times before failing
+    MAX_RATE_LIMIT_RETRIES = 5
     EXIT_CODE_USER_NOT_FOUND = 100
     EXIT_CODE_CONDITIONAL_SEND_NOT_MET = 101
     EXIT_CODE_APP_NOT_IN_CHANNEL = 102
@@ -31,8 +34,12 @@ class SlackClient(Messaging):
         """
         self.slack_token = slack_token
         self.web_client = WebClient(token=self.slack_token, timeout=self.TIMEOUT)
+        self._members = None
+        self._members_lock = threading.Lock()
 
-        rate_limit_handler = RateLimitErrorRetryHandler(max_retry_count=1)
+        rate_limit_handler = RateLimitErrorRetryHandler(
+            max_retry_count=self.MAX_RATE_LIMIT_RETRIES
+        )
         self.web_client.retry_handlers.append(rate_limit_handler)
 
     def _handle_slack_error(self, slack_error: SlackApiError) -> None:
@@ -185,8 +192,7 @@ class SlackClient(Messaging):
         """
         logger.debug(f"Attempting to look up user {name} by real name...")
         try:
-            response = self.web_client.users_list()
-            for user in response.data["members"]:
+            for user in self._list_members():
                 if user.get("real_name") == name:
                     logger.debug("User found by real name")
                     return user
@@ -211,9 +217,7 @@ class SlackClient(Messaging):
         """
         logger.debug("Attempting to look up user by display name...")
         try:
-            response = self.web_client.users_list()
-
-            for user in response.data["members"]:
+            for user in self._list_members():
                 if user["profile"]["display_name"] == display_name:
                     logger.debug("User found by display name")
                     return user
@@ -258,26 +262,49 @@ class SlackClient(Messaging):
             self._handle_slack_error(e)
 
     def upload_file(
-        self, filename: str, channels: str, thread_ts: Optional[str] = None
+        self,
+        filename: str,
+        channels: Union[str, List[str]],
+        thread_ts: Optional[str] = None,
     ) -> SlackResponse:
         """
-        Uploads a file to a Slack channel, optionally in a thread.
+        Uploads a file to one or more Slack channels, optionally in a thread.
+
+        The file is uploaded once and shared to every channel in the list, so sending the same
+        file to many conversations does not upload a copy per conversation.
 
         Args:
             filename (str): The path to the file to upload.
-            channels (str): The channel IDs where the file should be uploaded, separated by commas.
-            thread_ts (Optional[str]): The thread timestamp to upload the file into, if any.
+            channels (Union[str, List[str]]): The channel ID, or a list of channel IDs, where the file should be shared.
+            thread_ts (Optional[str]): The thread timestamp to upload the file into, if any. Only valid for a single channel.
 
         Returns:
         SlackResponse: The response from the Slack API after uploading the file.
         """
         logger.debug(f"Attempting to upload file {filename} to Slack...")
         try:
-            message_args = {"file": filename, "channels": channels}
+            message_args = {"file": filename}
+            if isinstance(channels, str):
+                message_args["channel"] = channels
+            else:
+                message_args["channels"] = list(channels)
             if thread_ts:
-                message_args[thread_ts] = thread_ts
+                message_args["thread_ts"] = thread_ts
             logger.debug(f"Uploading file to channel(s) {channels}")
             return self.web_client.files_upload_v2(**message_args)
 
         except SlackApiError as e:
             self._handle_slack_error(e)
+
+    def _list_members(self) -> List[Dict]:
+        """
+        Returns every member of the workspace, fetched once per client so that looking up
+        many users by name does not list the workspace for each of them.
+        """
+        with self._members_lock:
+            if self._members is None:
+                members = []
+                for page in self.web_client.users_list(limit=200):
+                    members.extend(page.data["members"])
+                self._members = members
+        return self._members
@@ -1,11 +1,22 @@
-from typing import List, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from slack_sdk.web import SlackResponse
 from shipyard_templates import Messaging
 from shipyard_templates import ShipyardLogger
+from shipyard_templates.http_client import TokenBucket
 from shipyard_bp_utils.args import create_shipyard_link
 
 logger = ShipyardLogger.get_logger()
 
+FAN_OUT_WORKERS = 8
+# Requests per second and burst size kept under Slack's rate limit tiers. chat.postMessage
+# allows about one message per second per conversation, so messages to different
+# conversations can be sent in parallel. chat.update and users.lookupByEmail are Tier 3/4.
+# Anything above these limits is retried by the client's rate limit handler.
+SEND_RATE = (5, 20)
+UPDATE_RATE = (1, 50)
+LOOKUP_RATE = (2, 50)
+
 
 def create_user_id_list(
     slack_client, users_to_notify: str, user_lookup_method: str
@@ -22,15 +33,17 @@ def create_user_id_list(
         List[str]: A list of user IDs to be notified.
     """
     users_to_notify = [x.strip() for x in users_to_notify.split(",")]
-    user_id_list = []
-    for user in users_to_notify:
+
+    def lookup(user: str) -> str:
         if user in ["@here", "@channel", "@everyone"]:
-            user_id_list.append(user.replace("@", ""))
-        else:
-            logger.info(f"Looking up {user}")
-            user_id = slack_client.user_lookup(user, user_lookup_method).get("id")
-            user_id_list.append(user_id)
-    return user_id_list
+            return user.replace("@", "")
+        logger.info(f"Looking up {user}")
+        return slack_client.user_lookup(user, user_lookup_method).get("id")
+
+    user_ids, errors = run_concurrently(lookup, users_to_notify, LOOKUP_RATE)
+    if errors:
+        raise next(iter(errors.values()))
+    return [user_ids[user] for user in users_to_notify]
 
 
 def create_name_tags(user_id_list: List[str]) -> str:
@@ -122,6 +135,128 @@ def send_slack_message_with_file(
         return response
 
 
+def run_concurrently(
+    func: Callable[[str], Any],
+    items: List[str],
+    rate: Tuple[float, float],
+    max_workers: int = FAN_OUT_WORKERS,
+) -> Tuple[Dict[str, Any], Dict[str, Exception]]:
+    """
+    Calls `func` for each item on a thread pool, starting at most `rate` (requests per
+    second, burst) calls so the fan-out stays within Slack's rate limit tier.
+
+    Args:
+        func (Callable[[str], Any]): The function to call with each item.
+        items (List[str]): The items, such as channel or user IDs. Duplicates are called once.
+        rate (Tuple[float, float]): The requests per second and burst size to allow.
+        max_workers (int, optional): The number of calls in flight at once.
+
+    Returns:
+        Tuple[Dict[str, Any], Dict[str, Exception]]: The result of each successful item and the error of each failed one.
+    """
+    bucket = TokenBucket(*rate)
+
+    def call(item):
+        bucket.acquire()
+        return func(item)
+
+    unique_items = list(dict.fromkeys(items))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {item: executor.submit(call, item) for item in unique_items}
+
+    results, errors = {}, {}
+    for item, future in futures.items():
+        try:
+            results[item] = future.result()
+        except Exception as e:
+            logger.error(f"Failed for {item}: {getattr(e, 'message', e)}")
+            errors[item] = e
+    return results, errors
+
+
+def fan_out_message(
+    slack_client,
+    message: str,
+    channels: List[str],
+    file: Optional[str] = None,
+    include_in_thread: bool = False,
+) -> List[SlackResponse]:
+    """
+    Sends the same message, and optionally file, to many conversations such as user DMs.
+
+    Messages are sent concurrently within Slack's rate limits and the file is uploaded once
+    and shared to every conversation, instead of once per recipient. With `include_in_thread`,
+    each message shows an uploading status and is then updated with a download button for
+    the shared file. A failure for one conversation does not stop the others; the first
+    error is raised once every conversation has been attempted.
+
+    Args:
+        slack_client (SlackClient): The Slack client instance used for sending messages and files.
+        message (str): The message content.
+        channels (List[str]): The channel or user IDs to send to.
+        file (Optional[str]): The path of the file to share, if any.
+        include_in_thread (bool, optional): Whether to link the file from each message. Defaults to False.
+
+    Returns:
+        List[SlackResponse]: The responses of the messages, followed by the file upload response.
+    """
+    logger.info(f"Sending message to {len(channels)} conversation(s)...")
+    posted_message = message
+    if file and include_in_thread:
+        posted_message += "\n\n _(File is currently uploading...)_"
+    sent, errors = run_concurrently(
+        lambda channel: slack_client.send_message(posted_message, channel),
+        channels,
+        SEND_RATE,
+    )
+    responses = list(sent.values())
+
+    if file and sent:
+        conversation_ids = [response["channel"] for response in responses]
+        logger.info(
+            f"Uploading {file} once for {len(conversation_ids)} conversation(s)"
+        )
+        try:
+            file_response = slack_client.upload_file(file, conversation_ids)
+        except Exception:
+            if include_in_thread:
+                failed_message = (
+                    message
+                    + "\n\n _(File could not be uploaded. Check log for details)_"
+                )
+                run_concurrently(
+                    lambda channel: slack_client.update_message(
+                        failed_message, sent[channel]["channel"], sent[channel]["ts"]
+                    ),
+                    list(sent),
+                    UPDATE_RATE,
+                )
+            raise
+
+        if include_in_thread:
+            download_link = file_response["file"]["url_private_download"]
+            updated, update_errors = run_concurrently(
+                lambda channel: slack_client.update_message(
+                    message,
+                    sent[channel]["channel"],
+                    sent[channel]["ts"],
+                    download_link,
+                ),
+                list(sent),
+                UPDATE_RATE,
+            )
+            responses = list(updated.values())
+            errors.update(update_errors)
+        responses.append(file_response)
+
+    if errors:
+        logger.error(
+            f"Failed to send to {len(errors)} of {len(set(channels))} conversation(s)"
+        )
+        raise next(iter(errors.values()))
+    return responses
+
+
 def _create_blocks(message: str, download_link: str = "") -> List[dict]:
     """
     Creates a list of block elements for a Slack message, optionally including a download button.
@@ -0,0 +1,77 @@
+import threading
+
+import pytest
+from shipyard_templates import ExitCodeException
+
+from shipyard_slack.slack_utils import create_user_id_list, fan_out_message
+
+
+class FakeSlackClient:
+    """Records calls in place of the Slack API. Sending to a user opens a D<user> DM."""
+
+    def __init__(self, failing=()):
+        self.failing = set(failing)
+        self.sent = []
+        self.uploads = []
+        self.updates = []
+        self._lock = threading.Lock()
+
+    def send_message(self, message, channel_name):
+        if channel_name in self.failing:
+            raise ExitCodeException("channel_not_found", 1)
+        with self._lock:
+            self.sent.append((channel_name, message))
+        return {"channel": f"D{channel_name}", "ts": "1.0"}
+
+    def upload_file(self, filename, channels, thread_ts=None):
+        self.uploads.append((filename, channels))
+        return {"file": {"url_private_download": "https://files.slack.com/report"}}
+
+    def update_message(self, message, channel_id, timestamp, download_link=""):
+        with self._lock:
+            self.updates.append((channel_id, download_link))
+        return {"channel": channel_id, "ts": timestamp}
+
+    def user_lookup(self, lookup, lookup_method):
+        return {"id": lookup.upper()}
+
+
+def test_file_is_uploaded_once_for_every_recipient():
+    client = FakeSlackClient()
+    users = [f"U{i}" for i in range(30)]
+
+    responses = fan_out_message(client, "Report", users, file="report.csv")
+
+    assert sorted(channel for channel, _ in client.sent) == sorted(users)
+    assert client.uploads == [("report.csv", [f"D{user}" for user in users])]
+    assert len(responses) == 31
+
+
+def test_thread_mode_links_the_shared_file_from_each_message():
+    client = FakeSlackClient()
+
+    fan_out_message(
+        client, "Report", ["U1", "U2"], file="report.csv", include_in_thread=True
+    )
+
+    assert all("uploading" in message for _, message in client.sent)
+    assert sorted(client.updates) == [
+        ("DU1", "https://files.slack.com/report"),
+        ("DU2", "https://files.slack.com/report"),
+    ]
+
+
+def test_one_failed_recipient_does_not_stop_the_others():
+    client = FakeSlackClient(failing={"U2"})
+
+    with pytest.raises(ExitCodeException):
+        fan_out_message(client, "Report", ["U1", "U2", "U3"], file="report.csv")
+
+    assert sorted(channel for channel, _ in client.sent) == ["U1", "U3"]
+    assert client.uploads == [("report.csv", ["DU1", "DU3"])]
+
+
+def test_user_ids_keep_the_requested_order():
+    user_ids = create_user_id_list(FakeSlackClient(), "a, @here, b", "email")
+
+    assert user_ids == ["A", "here", "B"]
@@ -0,0 +1,67 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from urllib.parse import parse_qs
+
+import pytest
+
+from shipyard_slack import SlackClient
+
+
+class SlackApiHandler(BaseHTTPRequestHandler):
+    """Answers the three calls files_upload_v2 makes and records each request body"""
+
+    requests = []
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        self.requests.append((self.path, body))
+        port = self.server.server_address[1]
+        if self.path.endswith("files.getUploadURLExternal"):
+            payload = {
+                "ok": True,
+                "file_id": "F1",
+                "upload_url": f"http://127.0.0.1:{port}/upload/F1",
+            }
+        elif self.path.endswith("files.completeUploadExternal"):
+            payload = {"ok": True, "files": [{"id": "F1", "title": "report.csv"}]}
+        else:
+            payload = {"ok": True}
+        raw = json.dumps(payload).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(raw)))
+        self.end_headers()
+        self.wfile.write(raw)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def slack_api():
+    SlackApiHandler.requests = []
+    server = HTTPServer(("127.0.0.1", 0), SlackApiHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/api/"
+    server.shutdown()
+
+
+def test_upload_file_shares_one_upload_with_every_channel(slack_api, tmp_path):
+    report = tmp_path / "report.csv"
+    report.write_text("a,b\n1,2\n")
+    client = SlackClient("xoxb-test")
+    client.web_client.base_url = slack_api
+
+    response = client.upload_file(str(report), ["D1", "D2", "D3"])
+
+    paths = [path for path, _ in SlackApiHandler.requests]
+    assert paths == [
+        "/api/files.getUploadURLExternal",
+        "/upload/F1",
+        "/api/files.completeUploadExternal",
+    ]
+    completion = parse_qs(SlackApiHandler.requests[-1][1].decode())
+    assert completion["channels"] == ["D1,D2,D3"]
+    assert response["file"]["id"] == "F1"
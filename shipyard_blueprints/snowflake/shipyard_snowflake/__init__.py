@@ -1,5 +1,25 @@
-from .snowflake import (
-    SnowflakeClient,
-)
-from shipyard_snowflake.utils import utils, exceptions
-from .snowpark import SnowparkClient
+from importlib import import_module
+
+# Exports are imported on first access so a CLI only pays for the SDKs it actually uses,
+# e.g. authtest never loads snowpark, pandas or dask.
+_LAZY_EXPORTS = {
+    "SnowflakeClient": "shipyard_snowflake.snowflake",
+    "SnowparkClient": "shipyard_snowflake.snowpark",
+    "utils": "shipyard_snowflake.utils.utils",
+    "exceptions": "shipyard_snowflake.utils.exceptions",
+}
+
+__all__ = list(_LAZY_EXPORTS)
+
+
+def __getattr__(name):
+    if name not in _LAZY_EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = import_module(_LAZY_EXPORTS[name])
+    value = module if module.__name__.endswith(f".{name}") else getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
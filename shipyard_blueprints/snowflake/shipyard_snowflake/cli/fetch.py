@@ -39,6 +39,17 @@ def get_args():
         "--file-header", dest="file_header", default="True", required=False
     )
     parser.add_argument("--user-role", dest="user_role", required=False, default="")
+    parser.add_argument(
+        "--file-type",
+        dest="file_type",
+        choices=["csv", "parquet"],
+        default="csv",
+        required=False,
+    )
+    parser.add_argument(
+        "--max-workers", dest="max_workers", type=int, default=4, required=False
+    )
+    parser.add_argument("--unload", dest="unload", default="False", required=False)
     return parser.parse_args()
 
 
@@ -79,14 +90,20 @@ def main():
 
         client.connect()
         logger.debug(f"Provided query is {args.query}")
-        df = client.fetch(args.query)
+        rows_written = client.download(
+            args.query,
+            destination_full_path,
+            file_format=args.file_type,
+            file_header=file_header,
+            max_workers=args.max_workers,
+            unload=shipyard.args.convert_to_boolean(args.unload),
+        )
 
-        if df.empty:
+        if rows_written == 0:
             logger.error("No results returned from query")
             sys.exit(client.EXIT_CODE_NO_RESULTS)
 
-        logger.debug(f"Shape of dataframe is {df.shape}")
-        df.to_csv(destination_full_path, index=False, header=file_header)
+        logger.debug(f"Wrote {rows_written} rows")
         logger.info(f"Successfully saved query results to {destination_full_path}")
     except ExitCodeException as e:
         logger.error(e.message)
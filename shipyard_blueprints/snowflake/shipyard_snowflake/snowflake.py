@@ -1,7 +1,12 @@
+import gzip
 import os
-from typing import Dict, List, Union
+import shutil
+import tempfile
+import uuid
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Callable, Dict, Iterator, List, Union
 
-import pandas as pd
 import snowflake.connector
 from shipyard_templates import Database, ExitCodeException, ShipyardLogger
 
@@ -13,8 +18,18 @@ from shipyard_snowflake.utils.exceptions import (
     CreateTableError,
 )
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 logger = ShipyardLogger.get_logger()
 
+FILE_FORMATS = ("csv", "parquet")
+# Number of result chunks downloaded ahead of the one being written
+DEFAULT_MAX_WORKERS = 4
+# Unloads are written to a unique prefix of the user stage and removed afterwards
+UNLOAD_STAGE = "@~/shipyard_unload"
+UNLOAD_MAX_FILE_SIZE = 256 * 1024 * 1024
+
 
 # TODO: Refactor the exit codes and exceptions to confrom to the new standard by the other databases
 class SnowflakeClient(Database):
@@ -188,7 +203,7 @@ class SnowflakeClient(Database):
         except Exception as e:
             raise ExitCodeException(str(e), self.EXIT_CODE_INVALID_QUERY)
 
-    def fetch(self, query: str) -> pd.DataFrame:
+    def fetch(self, query: str) -> "pd.DataFrame":
         """Fetches the results of a Snowflake SQL query as a pandas dataframe
 
         Args:
@@ -214,6 +229,112 @@ class SnowflakeClient(Database):
         else:
             return results
 
+    def download(
+        self,
+        query: str,
+        destination_path: str,
+        file_format: str = "csv",
+        file_header: bool = True,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        unload: bool = False,
+    ) -> int:
+        """Streams the results of a query to a local CSV or Parquet file without holding the full result in memory
+
+        Result chunks are downloaded up to `max_workers` at a time and appended to the file in order. With `unload`,
+        the results are instead unloaded to the user stage with COPY INTO and fetched with a parallel GET, which is
+        faster for very large extracts.
+
+        Args:
+            query: The query to send to Snowflake
+            destination_path: The local file to write the results to
+            file_format: Either csv or parquet. Defaults to csv
+            file_header: Whether to write a header row to CSV files. Defaults to True
+            max_workers: The number of result chunks or staged files to download concurrently
+            unload: Whether to unload the results through a stage instead of fetching them. Defaults to False
+
+        Returns: The number of rows written
+        """
+        if file_format not in FILE_FORMATS:
+            raise ExitCodeException(
+                f"Invalid file format: {file_format}. Choose between {' or '.join(FILE_FORMATS)}",
+                self.EXIT_CODE_INVALID_ARGUMENTS,
+            )
+        try:
+            if unload:
+                rows_written = self._unload(
+                    query, destination_path, file_format, file_header, max_workers
+                )
+            else:
+                cursor = self.execute_query(query)
+                if file_format == "parquet":
+                    rows_written = _write_parquet(cursor, destination_path, max_workers)
+                else:
+                    rows_written = _write_csv(
+                        cursor, destination_path, file_header, max_workers
+                    )
+        except ExitCodeException as ec:
+            raise DownloadError(
+                f"Error in downloading query results. Message from snowflake includes: {ec.message}",
+                exit_code=self.EXIT_CODE_DOWNLOAD_ERROR,
+            )
+        except Exception as e:
+            raise DownloadError(
+                f"Error in downloading query results. Message from snowflake includes: {str(e)}",
+                exit_code=self.EXIT_CODE_DOWNLOAD_ERROR,
+            )
+        logger.debug(f"Wrote {rows_written} rows to {destination_path}")
+        return rows_written
+
+    def _unload(
+        self,
+        query: str,
+        destination_path: str,
+        file_format: str,
+        file_header: bool,
+        max_workers: int,
+    ) -> int:
+        """Unloads the query results to a unique user stage prefix, downloads the files with a parallel GET and
+        combines them into the destination file. The staged files are removed afterwards.
+        """
+        stage_path = f"{UNLOAD_STAGE}/{uuid.uuid4().hex}/"
+        if file_format == "parquet":
+            format_options = "TYPE=PARQUET"
+            header = True
+        else:
+            format_options = "TYPE=CSV COMPRESSION=GZIP FIELD_OPTIONALLY_ENCLOSED_BY='\"' NULL_IF=('')"
+            header = file_header
+        copy_statement = (
+            f"COPY INTO '{stage_path}' FROM ({query.strip().rstrip(';')}) "
+            f"FILE_FORMAT=({format_options}) HEADER={header} "
+            f"MAX_FILE_SIZE={UNLOAD_MAX_FILE_SIZE}"
+        )
+        local_dir = tempfile.mkdtemp(
+            dir=os.path.dirname(os.path.abspath(destination_path))
+        )
+        try:
+            rows_unloaded = self.execute_query(copy_statement).fetchone()[0]
+            logger.debug(f"Unloaded {rows_unloaded} rows to {stage_path}")
+            parallel = min(max(max_workers, 1), 99)
+            self.execute_query(
+                f"GET '{stage_path}' 'file://{local_dir}' PARALLEL={parallel}"
+            )
+            part_paths = sorted(
+                os.path.join(local_dir, name) for name in os.listdir(local_dir)
+            )
+            if file_format == "parquet":
+                _combine_parquet(part_paths, destination_path)
+            else:
+                _combine_csv(part_paths, destination_path, header)
+        finally:
+            shutil.rmtree(local_dir, ignore_errors=True)
+            try:
+                self.execute_query(f"REMOVE '{stage_path}'")
+            except ExitCodeException as ec:
+                logger.warning(
+                    f"Could not remove unloaded files in {stage_path}: {ec.message}"
+                )
+        return rows_unloaded
+
     def put(
         self,
         file_path: str,
@@ -321,3 +442,113 @@ class SnowflakeClient(Database):
         Closes the database connection
         """
         self.conn.close()
+
+
+def _iter_result_batches(
+    cursor, convert: Callable, max_workers: int = DEFAULT_MAX_WORKERS
+) -> Iterator:
+    """Yields each result chunk of an executed query converted with `convert`, in order.
+
+    Up to `max_workers` chunks are downloaded ahead of the one being consumed, so memory is bounded by a handful
+    of chunks rather than the full result.
+    """
+    batches = cursor.get_result_batches() or []
+    if max_workers <= 1:
+        for batch in batches:
+            yield convert(batch)
+        return
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending = deque()
+        for batch in batches:
+            pending.append(executor.submit(convert, batch))
+            if len(pending) >= max_workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def _column_names(cursor) -> List[str]:
+    return [column[0] for column in cursor.description or []]
+
+
+def _write_csv(
+    cursor,
+    destination_path: str,
+    file_header: bool = True,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+) -> int:
+    """Appends each result chunk to the CSV, writing the header once"""
+    rows_written = 0
+    with open(destination_path, "w", newline="") as f:
+        for df in _iter_result_batches(
+            cursor, lambda batch: batch.to_pandas(), max_workers
+        ):
+            df.to_csv(f, index=False, header=file_header and rows_written == 0)
+            rows_written += len(df)
+        if rows_written == 0 and file_header:
+            f.write(",".join(_column_names(cursor)) + "\n")
+    return rows_written
+
+
+def _write_parquet(
+    cursor, destination_path: str, max_workers: int = DEFAULT_MAX_WORKERS
+) -> int:
+    """Appends each result chunk to the Parquet file as a row group"""
+    import pandas as pd
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    rows_written = 0
+    writer = None
+    try:
+        for table in _iter_result_batches(
+            cursor, lambda batch: batch.to_arrow(), max_workers
+        ):
+            if table.num_rows == 0:
+                continue
+            if writer is None:
+                writer = pq.ParquetWriter(destination_path, table.schema)
+            elif table.schema != writer.schema:
+                table = table.cast(writer.schema)
+            writer.write_table(table)
+            rows_written += table.num_rows
+        if writer is None:
+            empty = pd.DataFrame(columns=_column_names(cursor))
+            pq.write_table(pa.Table.from_pandas(empty), destination_path)
+    finally:
+        if writer is not None:
+            writer.close()
+    return rows_written
+
+
+def _combine_csv(part_paths: List[str], destination_path: str, header: bool) -> None:
+    """Concatenates gzip-compressed CSV parts into one file, keeping only the first part's header"""
+    with open(destination_path, "wb") as destination:
+        for index, part_path in enumerate(part_paths):
+            with gzip.open(part_path, "rb") as part:
+                if header and index > 0:
+                    part.readline()
+                shutil.copyfileobj(part, destination)
+
+
+def _combine_parquet(part_paths: List[str], destination_path: str) -> None:
+    """Rewrites the row groups of every Parquet part into one file"""
+    import pyarrow.parquet as pq
+
+    writer = None
+    try:
+        for part_path in part_paths:
+            part = pq.ParquetFile(part_path)
+            if writer is None:
+                writer = pq.ParquetWriter(destination_path, part.schema_arrow)
+            for index in range(part.num_row_groups):
+                table = part.read_row_group(index)
+                if table.schema != writer.schema:
+                    table = table.cast(writer.schema)
+                writer.write_table(table)
+        if writer is None:
+            open(destination_path, "wb").close()
+    finally:
+        if writer is not None:
+            writer.close()
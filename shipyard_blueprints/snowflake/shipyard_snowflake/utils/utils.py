@@ -5,16 +5,15 @@ from io import StringIO
 from itertools import islice
 from math import exp, log, floor, ceil
 from random import random, randrange
-from typing import Dict, List, Optional, Union
-
-import pandas as pd
-import psutil
-from cryptography.hazmat.backends import default_backend
-from cryptography.hazmat.primitives import serialization
-from dask import dataframe as dd
+from typing import TYPE_CHECKING, Dict, List, Optional, Union
 
 from shipyard_snowflake.utils.exceptions import RSAKeyDecodeError
 
+# pandas, dask, psutil and cryptography are imported by the helpers that need them,
+# keeping them off the startup path of CLIs that never touch a dataframe or RSA key
+if TYPE_CHECKING:
+    import pandas as pd
+
 
 def _get_file_size(file: str) -> int:
     """Helper function to get the size of a given file
@@ -33,6 +32,8 @@ def _get_memory() -> int:
     Returns: The amount of memory in bytes
 
     """
+    import psutil
+
     return psutil.virtual_memory().total
 
 
@@ -51,6 +52,9 @@ def _file_fits_in_memory(file: str) -> bool:
 
 
 def _decode_rsa(rsa_key: str):
+    from cryptography.hazmat.backends import default_backend
+    from cryptography.hazmat.primitives import serialization
+
     try:
         if rsa_key.startswith("-----BEGIN"):
             key_data = format_newlines(rsa_key).encode()
@@ -72,7 +76,7 @@ def _decode_rsa(rsa_key: str):
 
 
 def map_snowflake_to_pandas(
-    snowflake_data_types: Optional[Union[List[List], Dict[str, str]]]
+    snowflake_data_types: Optional[Union[List[List], Dict[str, str]]],
 ) -> Union[Dict, None]:
     # TODO: modify this to accept a list of lists (old way) and a JSON representation of datatypes (new way)
     """Helper function to map a snowflake data type to the associated pandas data type
@@ -162,7 +166,7 @@ def get_pandas_dates(pandas_datatypes: dict) -> tuple:
 
 def read_file(
     file: str, snowflake_dtypes: Union[List, None] = None, file_type: str = "csv"
-) -> pd.DataFrame:
+) -> "pd.DataFrame":
     """Helper function to read in a file to a pandas dataframe. This will be build out in the future to allow for more file types like parquet, arrow, tsv, etc.
     Args:
         file (str): The file to be read in as a dataframe
@@ -172,6 +176,9 @@ def read_file(
     Returns:
         pd.DataFrame: The dataframe output of the file
     """
+    import pandas as pd
+    from dask import dataframe as dd
+
     if snowflake_dtypes:
         pandas_dtypes = map_snowflake_to_pandas(snowflake_dtypes)
         dates, pandas_dtypes = get_pandas_dates(
@@ -227,7 +234,9 @@ def reservoir_sample(iterable, k=1):
             return values
 
 
-def _parse_dates(df: pd.DataFrame) -> pd.DataFrame:
+def _parse_dates(df: "pd.DataFrame") -> "pd.DataFrame":
+    import pandas as pd
+
     for col in df.columns:
         # Check if the column contains date-like values
         if df[col].apply(lambda x: bool(re.match(r"\d{4}-\d{2}-\d{2}", str(x)))).all():
@@ -246,6 +255,8 @@ def infer_schema(file_name: str, k=10000) -> Dict[str, str]:
     Returns:
         dict: The dictionary of inferred pandas datatypes data types
     """
+    import pandas as pd
+
     if isinstance(file_name, list):
         dataframes = []
         n_files = len(file_name)
@@ -0,0 +1,132 @@
+import gzip
+import os
+import re
+from unittest.mock import MagicMock
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+from shipyard_snowflake import SnowflakeClient
+from shipyard_snowflake.utils.exceptions import DownloadError
+
+CHUNKS = [
+    pd.DataFrame({"ID": [1, 2], "NAME": ["a", "b"]}),
+    pd.DataFrame({"ID": [3], "NAME": ["c"]}),
+    pd.DataFrame({"ID": [4, 5], "NAME": ["d", "e"]}),
+]
+
+
+class FakeBatch:
+    def __init__(self, df):
+        self.df = df
+
+    def to_pandas(self):
+        return self.df
+
+    def to_arrow(self):
+        return pa.Table.from_pandas(self.df, preserve_index=False)
+
+
+class FakeCursor:
+    description = [("ID",), ("NAME",)]
+
+    def __init__(self, chunks):
+        self.chunks = chunks
+
+    def get_result_batches(self):
+        return [FakeBatch(chunk) for chunk in self.chunks]
+
+
+@pytest.fixture
+def client():
+    return SnowflakeClient(username="user", password="password")
+
+
+@pytest.mark.parametrize("max_workers", [1, 2, 8])
+def test_download_csv_preserves_chunk_order(client, tmp_path, max_workers):
+    client.execute_query = MagicMock(return_value=FakeCursor(CHUNKS))
+    destination = tmp_path / "out.csv"
+
+    rows = client.download("select 1", str(destination), max_workers=max_workers)
+
+    assert rows == 5
+    expected = pd.concat(CHUNKS, ignore_index=True)
+    pd.testing.assert_frame_equal(pd.read_csv(destination), expected)
+
+
+def test_download_csv_without_header(client, tmp_path):
+    client.execute_query = MagicMock(return_value=FakeCursor(CHUNKS))
+    destination = tmp_path / "out.csv"
+
+    client.download("select 1", str(destination), file_header=False)
+
+    assert destination.read_text().splitlines()[0] == "1,a"
+
+
+def test_download_empty_result_writes_header(client, tmp_path):
+    client.execute_query = MagicMock(return_value=FakeCursor([]))
+    destination = tmp_path / "out.csv"
+
+    assert client.download("select 1", str(destination)) == 0
+    assert destination.read_text() == "ID,NAME\n"
+
+
+def test_download_parquet(client, tmp_path):
+    client.execute_query = MagicMock(return_value=FakeCursor(CHUNKS))
+    destination = tmp_path / "out.parquet"
+
+    rows = client.download("select 1", str(destination), file_format="parquet")
+
+    assert rows == 5
+    parquet_file = pq.ParquetFile(destination)
+    assert parquet_file.num_row_groups == 3
+    assert parquet_file.read().to_pandas()["ID"].tolist() == [1, 2, 3, 4, 5]
+
+
+def test_download_invalid_format(client, tmp_path):
+    with pytest.raises(Exception) as e:
+        client.download("select 1", str(tmp_path / "out.json"), file_format="json")
+    assert e.value.exit_code == client.EXIT_CODE_INVALID_ARGUMENTS
+
+
+def test_download_error_is_wrapped(client, tmp_path):
+    cursor = MagicMock()
+    cursor.get_result_batches.side_effect = RuntimeError("chunk expired")
+    client.execute_query = MagicMock(return_value=cursor)
+
+    with pytest.raises(DownloadError) as e:
+        client.download("select 1", str(tmp_path / "out.csv"))
+    assert e.value.exit_code == client.EXIT_CODE_DOWNLOAD_ERROR
+
+
+def test_unload_combines_staged_parts(client, tmp_path):
+    parts = ["ID,NAME\n1,a\n2,b\n", "ID,NAME\n3,c\n"]
+    statements = []
+
+    def execute_query(query):
+        statements.append(query)
+        cursor = MagicMock()
+        cursor.fetchone.return_value = (3, 100, 50)
+        if query.startswith("GET"):
+            local_dir = re.search(r"'file://(.+?)'", query).group(1)
+            for index, part in enumerate(parts):
+                with gzip.open(
+                    os.path.join(local_dir, f"data_0_0_{index}.csv.gz"), "wt"
+                ) as f:
+                    f.write(part)
+        return cursor
+
+    client.execute_query = execute_query
+    destination = tmp_path / "out.csv"
+
+    rows = client.download("select * from t;", str(destination), unload=True)
+
+    assert rows == 3
+    assert destination.read_text() == "ID,NAME\n1,a\n2,b\n3,c\n"
+    assert statements[0].startswith("COPY INTO '@~/shipyard_unload/")
+    assert "FROM (select * from t)" in statements[0]
+    assert "PARALLEL=4" in statements[1]
+    assert statements[2].startswith("REMOVE '@~/shipyard_unload/")
+    assert os.listdir(tmp_path) == ["out.csv"]
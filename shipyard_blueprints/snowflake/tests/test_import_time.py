@@ -0,0 +1,34 @@
+import pytest
+
+ENTRY_POINTS = [
+    "shipyard_snowflake.cli.authtest",
+    "shipyard_snowflake.cli.execute_sql",
+    "shipyard_snowflake.cli.fetch",
+    "shipyard_snowflake.cli.upload",
+]
+# Heavy modules that must only be imported when a command actually needs them
+DEFERRED_MODULES = ("snowflake.snowpark", "dask", "psutil")
+# Cumulative import time of each entry point in a fresh interpreter. Wall clock time
+# depends on the machine, so it is only checked when SHIPYARD_CHECK_IMPORT_BUDGETS is set
+IMPORT_BUDGET_SECONDS = 3.0
+
+
+@pytest.mark.parametrize("entry_point", ENTRY_POINTS)
+def test_entry_point_defers_heavy_modules(entry_point, import_profile):
+    profile = import_profile(entry_point)
+
+    assert entry_point in profile
+    deferred = sorted(
+        name
+        for name in profile
+        if any(
+            name == module or name.startswith(f"{module}.")
+            for module in DEFERRED_MODULES
+        )
+    )
+    assert not deferred, f"{entry_point} imports {deferred[:5]} at startup"
+
+
+@pytest.mark.parametrize("entry_point", ENTRY_POINTS)
+def test_entry_point_import_budget(entry_point, import_profile, import_budgets):
+    assert import_profile(entry_point)[entry_point] < IMPORT_BUDGET_SECONDS
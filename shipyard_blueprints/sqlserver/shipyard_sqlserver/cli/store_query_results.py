@@ -1,7 +1,6 @@
 import argparse
 import os
 import sys
-import pandas as pd
 import shipyard_bp_utils as shipyard
 from shipyard_sqlserver import SqlServerClient
 from shipyard_templates import ExitCodeException, ShipyardLogger, Database
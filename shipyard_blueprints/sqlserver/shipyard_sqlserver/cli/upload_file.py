@@ -2,9 +2,9 @@ import argparse
 import os
 import re
 import sys
-import pandas as pd
 import shipyard_bp_utils as shipyard
 from shipyard_sqlserver import SqlServerClient
+from shipyard_sqlserver.sqlserver import DEFAULT_BATCH_SIZE, DEFAULT_CHUNKSIZE
 from shipyard_templates import ExitCodeException, ShipyardLogger, Database
 
 logger = ShipyardLogger.get_logger()
@@ -42,6 +42,20 @@ def get_args():
         default="append",
         required=False,
     )
+    parser.add_argument(
+        "--chunk-size",
+        dest="chunk_size",
+        type=int,
+        default=DEFAULT_CHUNKSIZE,
+        required=False,
+    )
+    parser.add_argument(
+        "--batch-size",
+        dest="batch_size",
+        type=int,
+        default=DEFAULT_BATCH_SIZE,
+        required=False,
+    )
     args = parser.parse_args()
 
     if args.host and not (args.database or args.username):
@@ -84,18 +98,23 @@ def main():
                 f"{len(matching_file_names)} files found. Preparing to upload..."
             )
 
-            for index, file in enumerate(matching_file_names):
-                df = pd.read_csv(file)
-                if index > 0:
-                    insert_method = "append"
-                client.upload(df=df, table_name=table_name, insert_method=insert_method)
-                logger.info(f"Upload of {file} complete")
-
+            client.upload_files(
+                matching_file_names,
+                table_name=table_name,
+                insert_method=insert_method,
+                chunksize=args.chunk_size,
+                batch_size=args.batch_size,
+            )
             logger.info(f"Successfully loaded all files to {table_name}")
 
         else:
-            df = pd.read_csv(file_path)
-            client.upload(df=df, table_name=table_name, insert_method=insert_method)
+            client.upload_files(
+                [file_path],
+                table_name=table_name,
+                insert_method=insert_method,
+                chunksize=args.chunk_size,
+                batch_size=args.batch_size,
+            )
             logger.info(f"Successfully loaded {file_path} to {table_name}")
 
     except FileNotFoundError:
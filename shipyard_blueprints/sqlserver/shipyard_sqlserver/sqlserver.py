@@ -1,14 +1,22 @@
 import pyodbc
-import pandas as pd
-from sqlalchemy import create_engine, TextClause
+from sqlalchemy import create_engine, text, TextClause
 from shipyard_templates import Database, ShipyardLogger
 from shipyard_templates.database import QueryError, FetchError, UploadError
-from typing import Optional
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 
 from shipyard_sqlserver.exceptions import SqlServerConnectionError
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 logger = ShipyardLogger.get_logger()
 
+# Rows read from a CSV into memory at a time
+DEFAULT_CHUNKSIZE = 100_000
+# Rows sent per executemany call; with fast_executemany each call is a single bulk round trip
+DEFAULT_BATCH_SIZE = 10_000
+STAGING_TABLE_SUFFIX = "_shipyard_staging"
+
 
 class SqlServerClient(Database):
     def __init__(
@@ -87,7 +95,7 @@ class SqlServerClient(Database):
         except Exception as e:
             raise QueryError(e)
 
-    def fetch(self, query: TextClause) -> pd.DataFrame:
+    def fetch(self, query: TextClause) -> "pd.DataFrame":
         """
         Fetches data from the SQL server using the provided query.
 
@@ -100,6 +108,8 @@ class SqlServerClient(Database):
         Raises:
             FetchError: If an error occurs while fetching the results.
         """
+        import pandas as pd
+
         try:
             df = pd.read_sql(sql=query, con=self.conn)
             logger.debug("Successfully fetched results")
@@ -110,9 +120,10 @@ class SqlServerClient(Database):
 
     def upload(
         self,
-        df: pd.DataFrame,
+        df: "pd.DataFrame",
         table_name: str,
         insert_method: Optional[str] = "replace",
+        batch_size: int = DEFAULT_BATCH_SIZE,
     ):
         """
         Uploads a pandas DataFrame to a SQL Server table.
@@ -122,6 +133,7 @@ class SqlServerClient(Database):
             table_name (str): The name of the SQL Server table.
             insert_method (str, optional): The method to use when inserting the data into the table.
                 Defaults to "replace", which replaces the existing table if it already exists.
+            batch_size (int, optional): The number of rows sent to the server per batch.
 
         Raises:
             UploadError: If an error occurs during the upload process.
@@ -130,12 +142,114 @@ class SqlServerClient(Database):
             None
         """
         try:
-            df.to_sql(table_name, con=self.conn, index=False, if_exists=insert_method)
+            df.to_sql(
+                table_name,
+                con=self.conn,
+                index=False,
+                if_exists=insert_method,
+                chunksize=batch_size,
+            )
             logger.debug(f"Successfully loaded data to {table_name}")
         except Exception as e:
             raise UploadError(table_name, e)
 
+    def upload_files(
+        self,
+        file_paths: List[str],
+        table_name: str,
+        insert_method: Optional[str] = "replace",
+        chunksize: int = DEFAULT_CHUNKSIZE,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ):
+        """
+        Bulk loads one or more CSV files into a SQL Server table without reading a whole file into memory.
+
+        Each file is streamed in chunks of `chunksize` rows, and every chunk is sent with
+        pyodbc's fast_executemany in batches of `batch_size` rows. When replacing, the files
+        are loaded into a staging table that is swapped in for the target only once every
+        file has loaded, so the existing table stays intact if the load fails.
+
+        The column types are inferred from every row of every file in a first streaming
+        pass, so a column whose first rows look like integers is not created as an integer
+        column when later rows hold decimals or text.
+
+        Args:
+            file_paths (List[str]): The CSV files to load.
+            table_name (str): The name of the SQL Server table, optionally schema qualified.
+            insert_method (str, optional): "replace" or "append". Defaults to "replace".
+            chunksize (int, optional): The number of rows read from a file at a time.
+            batch_size (int, optional): The number of rows sent to the server per batch.
+
+        Raises:
+            FileNotFoundError: If one of the files does not exist.
+            UploadError: If an error occurs during the upload process.
+
+        Returns:
+            None
+        """
+        import pandas as pd
+
+        if not file_paths:
+            return
+        schema, name = _split_table_name(table_name)
+        replace = insert_method == "replace"
+        staging_name = f"{name}{STAGING_TABLE_SUFFIX}"
+        load_name = staging_name if replace else name
+        if_exists = "replace" if replace else "append"
+        rows_loaded = 0
+        try:
+            dtypes = _infer_csv_dtypes(file_paths, chunksize)
+            for file_path in file_paths:
+                for chunk in pd.read_csv(file_path, chunksize=chunksize, dtype=dtypes):
+                    chunk.to_sql(
+                        load_name,
+                        con=self.conn,
+                        schema=schema,
+                        index=False,
+                        if_exists=if_exists,
+                        chunksize=batch_size,
+                    )
+                    if_exists = "append"
+                    rows_loaded += len(chunk)
+                    logger.debug(f"Loaded {rows_loaded} rows to {load_name}")
+                logger.info(f"Upload of {file_path} complete")
+            if replace:
+                self._swap_table(schema, staging_name, name)
+        except FileNotFoundError:
+            self._drop_staging_table(_quote_table_name(schema, staging_name), replace)
+            raise
+        except Exception as e:
+            self._drop_staging_table(_quote_table_name(schema, staging_name), replace)
+            raise UploadError(table_name, e)
+        logger.debug(f"Successfully loaded {rows_loaded} rows to {table_name}")
+
+    def _swap_table(self, schema: Optional[str], staging_name: str, name: str):
+        """Replaces the target table with the fully loaded staging table in one transaction"""
+        # sp_rename takes the new name without a schema, the table stays in its schema
+        self.conn.execute(
+            text(
+                "SET XACT_ABORT ON; BEGIN TRANSACTION; "
+                f"DROP TABLE IF EXISTS {_quote_table_name(schema, name)}; "
+                f"EXEC sp_rename '{_quote_table_name(schema, staging_name)}', '{name}'; "
+                "COMMIT TRANSACTION;"
+            )
+        )
+        self.conn.commit()
+        logger.debug(f"Swapped {staging_name} in for {name}")
+
+    def _drop_staging_table(self, staging_table: str, replace: bool):
+        if not replace:
+            return
+        try:
+            self.conn.rollback()
+            self.conn.execute(text(f"DROP TABLE IF EXISTS {staging_table}"))
+            self.conn.commit()
+        except Exception as e:
+            logger.warning(f"Could not drop staging table {staging_table}: {e}")
+
     def download_chunks(self, query: TextClause, dest_path: str, header: bool = True):
+        import pandas as pd
+
         chunksize = 10_000
         first_write = False
         for chunk in pd.read_sql_query(query, self.conn, chunksize=chunksize):
@@ -144,3 +258,34 @@ class SqlServerClient(Database):
                 first_write = True
             else:
                 chunk.to_csv(dest_path, mode="a", header=False, index=False)
+
+
+def _split_table_name(table_name: str) -> Tuple[Optional[str], str]:
+    """Splits "schema.table" (or "[schema].[table]") into its schema and table name"""
+    schema, _, name = table_name.rpartition(".")
+    return schema.strip("[]") or None, name.strip("[]")
+
+
+def _quote_table_name(schema: Optional[str], name: str) -> str:
+    return f"[{schema}].[{name}]" if schema else f"[{name}]"
+
+
+def _infer_csv_dtypes(file_paths: List[str], chunksize: int) -> Dict[str, str]:
+    """
+    Streams every file once and returns the pandas dtype of each column that holds all of
+    its values: integer and float columns widen to float, and any other mix becomes object.
+    """
+    import pandas as pd
+
+    dtypes: Dict[str, str] = {}
+    for file_path in file_paths:
+        for chunk in pd.read_csv(file_path, chunksize=chunksize):
+            for column, dtype in chunk.dtypes.items():
+                seen = dtypes.get(column)
+                if seen is None or seen == dtype.name:
+                    dtypes[column] = dtype.name
+                elif {seen, dtype.name} <= {"int64", "float64"}:
+                    dtypes[column] = "float64"
+                else:
+                    dtypes[column] = "object"
+    return dtypes
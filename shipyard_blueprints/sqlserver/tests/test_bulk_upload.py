@@ -0,0 +1,107 @@
+from unittest.mock import MagicMock
+
+import pandas as pd
+import pytest
+from sqlalchemy import create_engine, text
+from shipyard_templates.database import UploadError
+
+from shipyard_sqlserver import SqlServerClient
+from shipyard_sqlserver import sqlserver
+
+
+@pytest.fixture
+def client(monkeypatch):
+    client = SqlServerClient(user="user", pwd="pwd", host="localhost")
+    client._conn = create_engine("sqlite://").connect()
+
+    def swap_table(schema, staging_name, name):
+        # sp_rename is SQL Server specific, emulate the swap for SQLite
+        prefix = f"{schema}." if schema else ""
+        client.conn.execute(text(f"DROP TABLE IF EXISTS {prefix}{name}"))
+        client.conn.execute(
+            text(f"ALTER TABLE {prefix}{staging_name} RENAME TO {name}")
+        )
+        client.conn.commit()
+
+    monkeypatch.setattr(client, "_swap_table", swap_table)
+    return client
+
+
+@pytest.fixture
+def csv_files(tmp_path):
+    paths = []
+    for index in range(2):
+        path = tmp_path / f"part_{index}.csv"
+        pd.DataFrame({"id": range(index * 5, index * 5 + 5)}).to_csv(path, index=False)
+        paths.append(str(path))
+    return paths
+
+
+def table_ids(client, table_name):
+    return client.fetch(text(f"SELECT id FROM {table_name} ORDER BY id"))["id"].tolist()
+
+
+def test_replace_streams_files_through_staging_table(client, csv_files):
+    pd.DataFrame({"id": [100]}).to_sql("target", client.conn, index=False)
+
+    client.upload_files(csv_files, "target", "replace", chunksize=2, batch_size=2)
+
+    assert table_ids(client, "target") == list(range(10))
+    assert not client.conn.execute(
+        text("SELECT name FROM sqlite_master WHERE name LIKE '%staging%'")
+    ).fetchall()
+
+
+def test_append_loads_into_existing_table(client, csv_files):
+    pd.DataFrame({"id": [100]}).to_sql("target", client.conn, index=False)
+
+    client.upload_files(csv_files[:1], "target", "append", chunksize=2)
+
+    assert table_ids(client, "target") == [0, 1, 2, 3, 4, 100]
+
+
+def test_failed_replace_keeps_existing_table(client, csv_files, tmp_path):
+    pd.DataFrame({"id": [100]}).to_sql("target", client.conn, index=False)
+    bad_file = tmp_path / "bad.csv"
+    bad_file.write_text("other\nx\n")
+
+    with pytest.raises(UploadError):
+        client.upload_files(
+            [csv_files[0], str(bad_file)], "target", "replace", chunksize=2
+        )
+
+    assert table_ids(client, "target") == [100]
+    assert not client.conn.execute(
+        text(
+            f"SELECT name FROM sqlite_master WHERE name = 'target{sqlserver.STAGING_TABLE_SUFFIX}'"
+        )
+    ).fetchall()
+
+
+def test_column_types_cover_every_file(client, tmp_path):
+    first, second = tmp_path / "first.csv", tmp_path / "second.csv"
+    first.write_text("id,amount,code\n1,1,1\n2,2,2\n")
+    second.write_text("id,amount,code\n3,2.5,A7\n")
+
+    client.upload_files([str(first), str(second)], "target", chunksize=1)
+
+    rows = client.fetch(text("SELECT * FROM target ORDER BY id"))
+    assert rows["amount"].tolist() == [1.0, 2.0, 2.5]
+    assert rows["code"].tolist() == ["1", "2", "A7"]
+
+
+def test_replace_keeps_schema_qualified_tables_in_their_schema(client, csv_files):
+    client.upload_files(csv_files, "main.target", "replace")
+
+    assert table_ids(client, "main.target") == list(range(10))
+
+
+def test_swap_table_renames_within_schema():
+    client = SqlServerClient(user="user", pwd="pwd", host="localhost")
+    client._conn = MagicMock()
+
+    client._swap_table("sales", "orders_shipyard_staging", "orders")
+
+    statement = str(client._conn.execute.call_args.args[0])
+    assert "DROP TABLE IF EXISTS [sales].[orders];" in statement
+    assert "EXEC sp_rename '[sales].[orders_shipyard_staging]', 'orders';" in statement
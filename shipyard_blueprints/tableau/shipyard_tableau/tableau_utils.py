@@ -1,4 +1,9 @@
+import json
+import os
+import time
+
 import tableauserverclient as TSC
+from shipyard_bp_utils.artifacts import Artifact
 from shipyard_templates import ShipyardLogger, ExitCodeException, DataVisualization
 
 EXIT_CODE_FILE_WRITE_ERROR = 100
@@ -67,30 +72,191 @@ def connect_to_tableau(
             ) from e
 
 
-def get_project_id(server, project_name):
+class TableauCatalog:
     """
-    Looks up and returns the project_id of the project_name that was specified.
+    Per-run cache of Tableau object IDs keyed by project and name.
+
+    Each lookup is a single name-filtered sweep through `TSC.Pager`, so every page of
+    matches is considered, and every match found is cached, not only the one asked for.
+    When `cache_file` is set, resolved IDs are also persisted as JSON for `ttl_seconds`
+    so later vessels in the same fleet can skip the lookups entirely.
     """
-    try:
-        req_option = TSC.RequestOptions()
+
+    def __init__(self, server, cache_file: str = None, ttl_seconds: int = 0):
+        self.server = server
+        self.cache_file = cache_file
+        self.ttl_seconds = ttl_seconds
+        self._namespace = (
+            f"{getattr(server, 'server_address', '')}|{getattr(server, 'site_id', '')}"
+        )
+        self._ids = self._load()
+
+    def _load(self) -> dict:
+        if not self.cache_file or not os.path.exists(self.cache_file):
+            return {}
+        try:
+            with open(self.cache_file) as f:
+                cached = json.load(f).get(self._namespace, {})
+        except (OSError, ValueError) as e:
+            logger.debug(f"Ignoring unreadable Tableau catalog cache: {e}")
+            return {}
+        now = time.time()
+        return {
+            key: entry
+            for key, entry in cached.items()
+            if now - entry["cached_at"] < self.ttl_seconds
+        }
+
+    def _save(self) -> None:
+        if not self.cache_file:
+            return
+        try:
+            with open(self.cache_file) as f:
+                contents = json.load(f)
+        except (OSError, ValueError):
+            contents = {}
+        contents[self._namespace] = self._ids
+        temp_file = f"{self.cache_file}.{os.getpid()}.tmp"
+        with open(temp_file, "w") as f:
+            json.dump(contents, f)
+        os.replace(temp_file, self.cache_file)
+
+    def _lookup(self, key: str):
+        entry = self._ids.get(key)
+        if entry:
+            logger.debug(f"Resolved {key} from the Tableau catalog cache")
+            return entry["id"]
+        return None
+
+    def _store(self, entries: dict) -> None:
+        now = time.time()
+        self._ids.update(
+            {key: {"id": value, "cached_at": now} for key, value in entries.items()}
+        )
+        self._save()
+
+    def _sweep(self, endpoint, name: str) -> list:
+        req_option = TSC.RequestOptions(pagesize=1000)
         req_option.filter.add(
             TSC.Filter(
                 TSC.RequestOptions.Field.Name,
                 TSC.RequestOptions.Operator.Equals,
-                project_name,
+                name,
             )
         )
+        return list(TSC.Pager(endpoint, req_option))
 
-        project_matches = server.projects.get(req_options=req_option)
-        if len(project_matches[0]) == 1:
-            return project_matches[0][0].id
-        else:
+    def project_id(self, project_name: str) -> str:
+        key = f"project|{project_name}"
+        if project_id := self._lookup(key):
+            return project_id
+
+        project_matches = self._sweep(self.server.projects, project_name)
+        if len(project_matches) != 1:
             raise ExitCodeException(
                 f"{project_name} could not be found. Please check for typos and ensure that the name you provide "
                 f"matches"
                 f"exactly (case sensitive)",
                 EXIT_CODE_INVALID_PROJECT,
             )
+        self._store({key: project_matches[0].id})
+        return project_matches[0].id
+
+    def datasource_id(self, project_id: str, datasource_name: str) -> str:
+        key = f"datasource|{project_id}|{datasource_name}"
+        if datasource_id := self._lookup(key):
+            return datasource_id
+
+        # We can't filter by project_id or project_name in the initial request,
+        # so we have to find all name matches and look for a project_id match.
+        matches = self._sweep(self.server.datasources, datasource_name)
+        self._store(
+            {
+                f"datasource|{datasource.project_id}|{datasource_name}": datasource.id
+                for datasource in matches
+            }
+        )
+        if not (datasource_id := self._lookup(key)):
+            raise ExitCodeException(
+                f"{datasource_name} could not be found that lives in the project you specified. Please check for typos "
+                f"and ensure that the name(s) you provide match exactly (case sensitive)",
+                EXIT_CODE_INVALID_DATASOURCE,
+            )
+        return datasource_id
+
+    def workbook_id(self, project_id: str, workbook_name: str) -> str:
+        key = f"workbook|{project_id}|{workbook_name}"
+        if workbook_id := self._lookup(key):
+            return workbook_id
+
+        # We can't filter by project_id in the initial request,
+        # so we have to find all name matches and look for a project_id match.
+        matches = self._sweep(self.server.workbooks, workbook_name)
+        self._store(
+            {
+                f"workbook|{workbook.project_id}|{workbook_name}": workbook.id
+                for workbook in matches
+            }
+        )
+        if not (workbook_id := self._lookup(key)):
+            raise ExitCodeException(
+                f"{workbook_name} could not be found in the project you specified. Please check for typos and ensure that "
+                f"the name(s) you provide match exactly (case sensitive)",
+                EXIT_CODE_INVALID_WORKBOOK,
+            )
+        return workbook_id
+
+    def view_id(self, project_id: str, workbook_id: str, view_name: str) -> str:
+        key = f"view|{project_id}|{workbook_id}|{view_name}"
+        if view_id := self._lookup(key):
+            return view_id
+
+        # We can't filter by project_id or workbook_id in the initial request,
+        # so we have to find all name matches and look for those matches.
+        matches = self._sweep(self.server.views, view_name)
+        self._store(
+            {
+                f"view|{view.project_id}|{view.workbook_id}|{view_name}": view.id
+                for view in matches
+            }
+        )
+        if not (view_id := self._lookup(key)):
+            raise ExitCodeException(
+                f"{view_name} could not be found that lives in the project and workbook you specified. Please check for "
+                f"typos and ensure that the name(s) you provide match exactly (case sensitive)",
+                EXIT_CODE_INVALID_VIEW,
+            )
+        return view_id
+
+
+_catalogs = {}
+
+
+def get_catalog(server) -> TableauCatalog:
+    """
+    Returns the catalog shared by every lookup against this server. Setting the
+    TABLEAU_CATALOG_CACHE_TTL environment variable (in seconds) also persists resolved IDs
+    to the Tableau artifacts folder so other vessels can reuse them.
+    """
+    catalog = _catalogs.get(id(server))
+    if catalog is None or catalog.server is not server:
+        ttl_seconds = int(os.getenv("TABLEAU_CATALOG_CACHE_TTL") or 0)
+        cache_file = (
+            os.path.join(Artifact("tableau").variables.path, "catalog_cache.json")
+            if ttl_seconds > 0
+            else None
+        )
+        catalog = TableauCatalog(server, cache_file=cache_file, ttl_seconds=ttl_seconds)
+        _catalogs[id(server)] = catalog
+    return catalog
+
+
+def get_project_id(server, project_name):
+    """
+    Looks up and returns the project_id of the project_name that was specified.
+    """
+    try:
+        return get_catalog(server).project_id(project_name)
     except Exception as e:
         raise ExitCodeException(
             f"An error occurred while trying to get the project_id for {project_name}. {e}",
@@ -103,30 +269,7 @@ def get_datasource_id(server, project_id, datasource_name):
     Looks up and returns the datasource_id of the datasource_name that was specified, filtered by project_id matches.
     """
     try:
-        req_option = TSC.RequestOptions()
-        req_option.filter.add(
-            TSC.Filter(
-                TSC.RequestOptions.Field.Name,
-                TSC.RequestOptions.Operator.Equals,
-                datasource_name,
-            )
-        )
-
-        datasource_matches = server.datasources.get(req_options=req_option)
-
-        # We can't filter by project_id or project_name in the initial request,
-        # so we have to find all name matches and look for a project_id match.
-        datasource_id = None
-        for datasource in datasource_matches[0]:
-            if datasource.project_id == project_id:
-                datasource_id = datasource.id
-        if datasource_id is None:
-            raise ExitCodeException(
-                f"{datasource_name} could not be found that lives in the project you specified. Please check for typos "
-                f"and ensure that the name(s) you provide match exactly (case sensitive)",
-                EXIT_CODE_INVALID_DATASOURCE,
-            )
-        return datasource_id
+        return get_catalog(server).datasource_id(project_id, datasource_name)
     except Exception as e:
         raise ExitCodeException(
             f"An error occurred while trying to get the datasource_id for {datasource_name}. {e}",
@@ -139,29 +282,7 @@ def get_workbook_id(server, project_id, workbook_name):
     Looks up and returns the workbook_id of the workbook_name that was specified, filtered by project_id matches.
     """
     try:
-        req_option = TSC.RequestOptions()
-        req_option.filter.add(
-            TSC.Filter(
-                TSC.RequestOptions.Field.Name,
-                TSC.RequestOptions.Operator.Equals,
-                workbook_name,
-            )
-        )
-
-        workbook_matches = server.workbooks.get(req_options=req_option)
-        # We can't filter by project_id in the initial request,
-        # so we have to find all name matches and look for a project_id match.
-        workbook_id = None
-        for workbook in workbook_matches[0]:
-            if workbook.project_id == project_id:
-                workbook_id = workbook.id
-        if workbook_id is None:
-            raise ExitCodeException(
-                f"{workbook_name} could not be found in the project you specified. Please check for typos and ensure that "
-                f"the name(s) you provide match exactly (case sensitive)",
-                EXIT_CODE_INVALID_WORKBOOK,
-            )
-        return workbook_id
+        return get_catalog(server).workbook_id(project_id, workbook_name)
     except Exception as e:
         raise ExitCodeException(
             f"An error occurred while trying to get the workbook_id for {workbook_name}. {e}",
@@ -174,29 +295,7 @@ def get_view_id(server, project_id, workbook_id, view_name):
     Looks up and returns the view_id of the view_name that was specified, filtered by project_id AND workbook_id matches.
     """
     try:
-        req_option = TSC.RequestOptions()
-        req_option.filter.add(
-            TSC.Filter(
-                TSC.RequestOptions.Field.Name,
-                TSC.RequestOptions.Operator.Equals,
-                view_name,
-            )
-        )
-
-        view_matches = server.views.get(req_options=req_option)
-        # We can't filter by project_id or workbook_id in the initial request,
-        # so we have to find all name matches and look for those matches.
-        view_id = None
-        for view in view_matches[0]:
-            if view.project_id == project_id and view.workbook_id == workbook_id:
-                view_id = view.id
-        if view_id is None:
-            raise ExitCodeException(
-                f"{view_name} could not be found that lives in the project and workbook you specified. Please check for "
-                f"typos and ensure that the name(s) you provide match exactly (case sensitive)",
-                EXIT_CODE_INVALID_VIEW,
-            )
-        return view_id
+        return get_catalog(server).view_id(project_id, workbook_id, view_name)
     except Exception as e:
         raise ExitCodeException(
             f"An error occurred while trying to get the view_id for {view_name}. {e}",
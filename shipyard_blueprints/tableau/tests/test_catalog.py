@@ -0,0 +1,97 @@
+from types import SimpleNamespace
+
+import pytest
+from shipyard_templates import ExitCodeException
+
+from shipyard_tableau import tableau_utils
+from shipyard_tableau.tableau_utils import TableauCatalog
+
+
+class FakeEndpoint:
+    """Mimics a TSC endpoint that returns name-filtered results across several pages."""
+
+    def __init__(self, items):
+        self.items = items
+        self.calls = 0
+
+    def get(self, req_options=None):
+        self.calls += 1
+        name = next(iter(req_options.filter)).value
+        matches = [item for item in self.items if item.name == name]
+        page_size = 2
+        start = (req_options.pagenumber - 1) * page_size
+        pagination = SimpleNamespace(
+            page_number=req_options.pagenumber,
+            page_size=page_size,
+            total_available=len(matches),
+        )
+        return matches[start : start + page_size], pagination
+
+
+def item(id, name, project_id=None, workbook_id=None):
+    return SimpleNamespace(
+        id=id, name=name, project_id=project_id, workbook_id=workbook_id
+    )
+
+
+@pytest.fixture
+def server():
+    return SimpleNamespace(
+        server_address="https://tableau.example.com",
+        site_id="site",
+        projects=FakeEndpoint([item("p1", "Sales")]),
+        datasources=FakeEndpoint(
+            [item(f"d{i}", "Orders", project_id=f"p{i}") for i in range(5)]
+        ),
+        workbooks=FakeEndpoint([item("w1", "Revenue", project_id="p1")]),
+        views=FakeEndpoint(
+            [
+                item("v0", "Summary", project_id="p1", workbook_id="w0"),
+                item("v1", "Summary", project_id="p1", workbook_id="w1"),
+            ]
+        ),
+    )
+
+
+def test_lookups_follow_pagination_and_are_cached(server):
+    catalog = TableauCatalog(server)
+
+    assert catalog.datasource_id("p4", "Orders") == "d4"
+    assert catalog.datasource_id("p2", "Orders") == "d2"
+    assert server.datasources.calls == 3
+
+
+def test_resolves_project_workbook_and_view(server):
+    catalog = TableauCatalog(server)
+
+    project_id = catalog.project_id("Sales")
+    workbook_id = catalog.workbook_id(project_id, "Revenue")
+
+    assert catalog.view_id(project_id, workbook_id, "Summary") == "v1"
+    assert catalog.project_id("Sales") == "p1"
+    assert server.projects.calls == 1
+
+
+def test_missing_resource_raises(server):
+    catalog = TableauCatalog(server)
+
+    with pytest.raises(ExitCodeException) as error:
+        catalog.workbook_id("p2", "Revenue")
+    assert error.value.exit_code == tableau_utils.EXIT_CODE_INVALID_WORKBOOK
+
+
+def test_disk_cache_is_shared_and_expires(server, tmp_path):
+    cache_file = str(tmp_path / "catalog.json")
+    TableauCatalog(server, cache_file=cache_file, ttl_seconds=60).project_id("Sales")
+
+    TableauCatalog(server, cache_file=cache_file, ttl_seconds=60).project_id("Sales")
+    assert server.projects.calls == 1
+
+    TableauCatalog(server, cache_file=cache_file, ttl_seconds=-1).project_id("Sales")
+    assert server.projects.calls == 2
+
+
+def test_module_helpers_share_catalog_per_server(server):
+    assert tableau_utils.get_project_id(server, "Sales") == "p1"
+    assert tableau_utils.get_project_id(server, "Sales") == "p1"
+    assert server.projects.calls == 1
@@ -1,5 +1,4 @@
 import requests
-import pandas as pd
 import typing
 import sys
 
@@ -43,6 +42,8 @@ class ThoughtSpotClient(DataVisualization):
             runtime_sort:  A column sort to sort the output. Example: {"col1": "column_name", "asc1" : "true", "col2": "column_name", "asc2": "false"}
             file_name: The name of the output file
         """
+        import pandas as pd
+
         url = "https://my2.thoughtspot.cloud/api/rest/2.0/report/liveboard"
         payload = {
             "metadata_identifier": metadata_identifier,
@@ -106,6 +107,8 @@ class ThoughtSpotClient(DataVisualization):
         Returns:  The HTTP response from the api call
 
         """
+        import pandas as pd
+
         url = "https://my2.thoughtspot.cloud/api/rest/2.0/report/answer"
         payload = {
             "metadata_identifier": metadata_identifier,
@@ -167,6 +170,8 @@ class ThoughtSpotClient(DataVisualization):
             A pandas dataframe if the file_format is set to csv or json otherwise
 
         """
+        import pandas as pd
+
         url = "https://my2.thoughtspot.cloud/api/rest/2.0/searchdata"
         headers = deepcopy(self.headers)
         headers["Accept"] = "application/json"